@@ -22,6 +22,7 @@ from aiq.data_models.retry_mixin import RetryMixin
 from aiq.llm.nim_llm import NIMModelConfig
 from aiq.llm.openai_llm import OpenAIModelConfig
 from aiq.utils.exception_handlers.automatic_retries import patch_with_retry
+from aiq.utils.exception_handlers.rate_limiter import get_rate_limiter
 
 
 @register_llm_client(config_type=NIMModelConfig, wrapper_type=LLMFrameworkEnum.CREWAI)
@@ -54,7 +55,8 @@ async def nim_crewai(llm_config: NIMModelConfig, builder: Builder):
         client = patch_with_retry(client,
                                   retries=llm_config.num_retries,
                                   retry_codes=llm_config.retry_on_status_codes,
-                                  retry_on_messages=llm_config.retry_on_errors)
+                                  retry_on_messages=llm_config.retry_on_errors,
+                                  rate_limiter=get_rate_limiter(llm_config))
 
     yield client
 
@@ -75,6 +77,7 @@ async def openai_crewai(llm_config: OpenAIModelConfig, builder: Builder):
         client = patch_with_retry(client,
                                   retries=llm_config.num_retries,
                                   retry_codes=llm_config.retry_on_status_codes,
-                                  retry_on_messages=llm_config.retry_on_errors)
+                                  retry_on_messages=llm_config.retry_on_errors,
+                                  rate_limiter=get_rate_limiter(llm_config))
 
     yield client
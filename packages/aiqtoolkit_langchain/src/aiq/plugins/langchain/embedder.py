@@ -19,6 +19,7 @@ from aiq.cli.register_workflow import register_embedder_client
 from aiq.data_models.retry_mixin import RetryMixin
 from aiq.embedder.openai_embedder import OpenAIEmbedderModelConfig
 from aiq.utils.exception_handlers.automatic_retries import patch_with_retry
+from aiq.utils.exception_handlers.rate_limiter import get_rate_limiter
 
 
 @register_embedder_client(config_type=OpenAIEmbedderModelConfig, wrapper_type=LLMFrameworkEnum.LANGCHAIN)
@@ -32,6 +33,7 @@ async def openai_langchain(embedder_config: OpenAIEmbedderModelConfig, builder:
         client = patch_with_retry(client,
                                   retries=embedder_config.num_retries,
                                   retry_codes=embedder_config.retry_on_status_codes,
-                                  retry_on_messages=embedder_config.retry_on_errors)
+                                  retry_on_messages=embedder_config.retry_on_errors,
+                                  rate_limiter=get_rate_limiter(embedder_config))
 
     yield client
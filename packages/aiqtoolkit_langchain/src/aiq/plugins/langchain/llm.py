@@ -21,6 +21,7 @@ from aiq.llm.aws_bedrock_llm import AWSBedrockModelConfig
 from aiq.llm.nim_llm import NIMModelConfig
 from aiq.llm.openai_llm import OpenAIModelConfig
 from aiq.utils.exception_handlers.automatic_retries import patch_with_retry
+from aiq.utils.exception_handlers.rate_limiter import get_rate_limiter
 
 
 @register_llm_client(config_type=NIMModelConfig, wrapper_type=LLMFrameworkEnum.LANGCHAIN)
@@ -34,7 +35,8 @@ async def nim_langchain(llm_config: NIMModelConfig, builder: Builder):
         client = patch_with_retry(client,
                                   retries=llm_config.num_retries,
                                   retry_codes=llm_config.retry_on_status_codes,
-                                  retry_on_messages=llm_config.retry_on_errors)
+                                  retry_on_messages=llm_config.retry_on_errors,
+                                  rate_limiter=get_rate_limiter(llm_config))
 
     yield client
 
@@ -56,7 +58,8 @@ async def openai_langchain(llm_config: OpenAIModelConfig, builder: Builder):
         client = patch_with_retry(client,
                                   retries=llm_config.num_retries,
                                   retry_codes=llm_config.retry_on_status_codes,
-                                  retry_on_messages=llm_config.retry_on_errors)
+                                  retry_on_messages=llm_config.retry_on_errors,
+                                  rate_limiter=get_rate_limiter(llm_config))
 
     yield client
 
@@ -72,6 +75,7 @@ async def aws_bedrock_langchain(llm_config: AWSBedrockModelConfig, builder: Buil
         client = patch_with_retry(client,
                                   retries=llm_config.num_retries,
                                   retry_codes=llm_config.retry_on_status_codes,
-                                  retry_on_messages=llm_config.retry_on_errors)
+                                  retry_on_messages=llm_config.retry_on_errors,
+                                  rate_limiter=get_rate_limiter(llm_config))
 
     yield client
@@ -21,6 +21,7 @@ from aiq.llm.aws_bedrock_llm import AWSBedrockModelConfig
 from aiq.llm.nim_llm import NIMModelConfig
 from aiq.llm.openai_llm import OpenAIModelConfig
 from aiq.utils.exception_handlers.automatic_retries import patch_with_retry
+from aiq.utils.exception_handlers.rate_limiter import get_rate_limiter
 
 
 @register_llm_client(config_type=NIMModelConfig, wrapper_type=LLMFrameworkEnum.LLAMA_INDEX)
@@ -39,7 +40,8 @@ async def nim_llama_index(llm_config: NIMModelConfig, builder: Builder):
         llm = patch_with_retry(llm,
                                retries=llm_config.num_retries,
                                retry_codes=llm_config.retry_on_status_codes,
-                               retry_on_messages=llm_config.retry_on_errors)
+                               retry_on_messages=llm_config.retry_on_errors,
+                               rate_limiter=get_rate_limiter(llm_config))
 
     yield llm
 
@@ -60,7 +62,8 @@ async def openai_llama_index(llm_config: OpenAIModelConfig, builder: Builder):
         llm = patch_with_retry(llm,
                                retries=llm_config.num_retries,
                                retry_codes=llm_config.retry_on_status_codes,
-                               retry_on_messages=llm_config.retry_on_errors)
+                               retry_on_messages=llm_config.retry_on_errors,
+                               rate_limiter=get_rate_limiter(llm_config))
 
     yield llm
 
@@ -78,6 +81,7 @@ async def aws_bedrock_llama_index(llm_config: AWSBedrockModelConfig, builder: Bu
         llm = patch_with_retry(llm,
                                retries=llm_config.num_retries,
                                retry_codes=llm_config.retry_on_status_codes,
-                               retry_on_messages=llm_config.retry_on_errors)
+                               retry_on_messages=llm_config.retry_on_errors,
+                               rate_limiter=get_rate_limiter(llm_config))
 
     yield llm
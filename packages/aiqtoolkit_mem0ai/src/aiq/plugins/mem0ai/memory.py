@@ -18,6 +18,7 @@ from aiq.cli.register_workflow import register_memory
 from aiq.data_models.memory import MemoryBaseConfig
 from aiq.data_models.retry_mixin import RetryMixin
 from aiq.utils.exception_handlers.automatic_retries import patch_with_retry
+from aiq.utils.exception_handlers.rate_limiter import get_rate_limiter
 
 
 class Mem0MemoryClientConfig(MemoryBaseConfig, RetryMixin, name="mem0_memory"):
@@ -52,6 +53,7 @@ async def mem0_memory_client(config: Mem0MemoryClientConfig, builder: Builder):
         memory_editor = patch_with_retry(memory_editor,
                                          retries=config.num_retries,
                                          retry_codes=config.retry_on_status_codes,
-                                         retry_on_messages=config.retry_on_errors)
+                                         retry_on_messages=config.retry_on_errors,
+                                         rate_limiter=get_rate_limiter(config))
 
     yield memory_editor
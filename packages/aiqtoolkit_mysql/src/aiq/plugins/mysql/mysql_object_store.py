@@ -13,8 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import logging
 import pickle
+import struct
+from collections.abc import AsyncIterator
 from urllib.parse import urlparse
 
 import aiomysql
@@ -22,17 +25,81 @@ from aiomysql.pool import Pool
 
 from aiq.data_models.object_store import KeyAlreadyExistsError
 from aiq.data_models.object_store import NoSuchKeyError
+from aiq.object_store.interfaces import DEFAULT_CHUNK_SIZE
 from aiq.object_store.interfaces import ObjectStore
 from aiq.object_store.models import ObjectStoreItem
+from aiq.object_store.models import ObjectStoreStreamItem
 from aiq.plugins.mysql.object_store import MySQLObjectStoreClientConfig
 from aiq.utils.type_utils import override
 
 logger = logging.getLogger(__name__)
 
+# Stored objects start with the magic bytes and the length of a JSON header holding the content type and the metadata,
+# followed by the raw data. Objects written by earlier versions are pickled `ObjectStoreItem`s.
+_MAGIC = b"AIQ\x01"
+_HEADER_LENGTH = struct.Struct(">I")
+_PREFIX_SIZE = len(_MAGIC) + _HEADER_LENGTH.size
+
+# Size of the part of an object read to decode its header before streaming its data
+_HEADER_READ_SIZE = 64 * 1024
+
+# Maximum number of keys in a single `IN (...)` clause
+_MAX_KEYS_PER_QUERY = 1000
+
+
+def _encode_item(item: ObjectStoreItem) -> bytes:
+    header = {}
+    if item.content_type is not None:
+        header["content_type"] = item.content_type
+    if item.metadata is not None:
+        header["metadata"] = item.metadata
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8") if header else b""
+    return b"".join((_MAGIC, _HEADER_LENGTH.pack(len(header_bytes)), header_bytes, item.data))
+
+
+def _decode_header(blob: bytes) -> tuple[dict, int] | None:
+    """
+    Decode the header of an encoded object from a prefix of it.
+
+    Returns:
+        tuple[dict, int] | None: The header and the offset of the data, None if the prefix does not hold the whole
+            header.
+    """
+    (header_length, ) = _HEADER_LENGTH.unpack_from(blob, len(_MAGIC))
+    data_offset = _PREFIX_SIZE + header_length
+    if len(blob) < data_offset:
+        return None
+
+    header = json.loads(blob[_PREFIX_SIZE:data_offset]) if header_length else {}
+    return header, data_offset
+
+
+def _decode_item(blob: bytes) -> ObjectStoreItem:
+    if not blob.startswith(_MAGIC):
+        return pickle.loads(blob)
+
+    header, data_offset = _decode_header(blob)
+    return ObjectStoreItem(data=blob[data_offset:],
+                           content_type=header.get("content_type"),
+                           metadata=header.get("metadata"))
+
+
+def _chunked(keys: list[str]) -> list[list[str]]:
+    return [keys[start:start + _MAX_KEYS_PER_QUERY] for start in range(0, len(keys), _MAX_KEYS_PER_QUERY)]
+
+
+def _placeholders(keys: list[str]) -> str:
+    return ", ".join(["%s"] * len(keys))
+
 
 class MySQLObjectStore(ObjectStore):
     """
     Implementation of ObjectStore that stores objects in a MySQL database.
+
+    Each bucket is a schema, which every pooled connection is bound to when it is opened. Objects are stored as their
+    raw data preceded by a small JSON header, bulk operations run in a single transaction with multi-row statements, and
+    streamed reads fetch the data of large objects in chunks.
     """
 
     def __init__(self, config: MySQLObjectStoreClientConfig):
@@ -42,7 +109,8 @@ class MySQLObjectStore(ObjectStore):
         self._config = config
         self._conn_pool: Pool | None = None
 
-        self._schema = f"`bucket_{self._config.bucket_name}`"
+        self._schema_name = f"bucket_{self._config.bucket_name}"
+        self._schema = f"`{self._schema_name}`"
 
     def _get_host_and_port(self):
 
@@ -60,18 +128,11 @@ class MySQLObjectStore(ObjectStore):
 
         # Split the endpoint url into host and port using URL parse
         host, port = self._get_host_and_port()
+        connect_args = {"host": host, "port": port, "user": self._config.user, "password": self._config.password}
 
-        self._conn_pool = await aiomysql.create_pool(
-            host=host,
-            port=port,
-            user=self._config.user,
-            password=self._config.password,
-            autocommit=False,  # disable autocommit for transactions
-        )
-
-        logger.info(f"Created connection pool for {self._config.bucket_name} at {self._config.endpoint_url}")
-
-        async with self._conn_pool.acquire() as conn:
+        # The schema must exist before connections can be bound to it
+        conn = await aiomysql.connect(**connect_args)
+        try:
             async with conn.cursor() as cur:
 
                 # Create schema (database) if doesn't exist
@@ -98,9 +159,19 @@ class MySQLObjectStore(ObjectStore):
                 """)
 
             await conn.commit()
+        finally:
+            conn.close()
 
         logger.info(f"Created schema and tables for {self._config.bucket_name} at {self._config.endpoint_url}")
 
+        self._conn_pool = await aiomysql.create_pool(
+            **connect_args,
+            db=self._schema_name,
+            autocommit=False,  # disable autocommit for transactions
+        )
+
+        logger.info(f"Created connection pool for {self._config.bucket_name} at {self._config.endpoint_url}")
+
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
@@ -123,23 +194,79 @@ class MySQLObjectStore(ObjectStore):
 
         async with self._conn_pool.acquire() as conn:
             async with conn.cursor() as cur:
-                await cur.execute(f"USE {self._schema};")
                 try:
-                    await cur.execute("START TRANSACTION;")
                     await cur.execute("INSERT IGNORE INTO object_meta (path, size) VALUES (%s, %s)",
                                       (key, len(item.data)))
                     if cur.rowcount == 0:
                         raise KeyAlreadyExistsError(key=key)
-                    await cur.execute("SELECT id FROM object_meta WHERE path=%s FOR UPDATE;", (key, ))
-                    (obj_id, ) = await cur.fetchone()
 
-                    blob = pickle.dumps(item)
-                    await cur.execute("INSERT INTO object_data (id, data) VALUES (%s, %s)", (obj_id, blob))
+                    await cur.execute("INSERT INTO object_data (id, data) VALUES (%s, %s)",
+                                      (cur.lastrowid, _encode_item(item)))
                     await conn.commit()
                 except Exception:
                     await conn.rollback()
                     raise
 
+    @override
+    async def put_objects(self, items: dict[str, ObjectStoreItem]) -> None:
+
+        if not self._conn_pool:
+            raise RuntimeError("Connection not established")
+
+        if not items:
+            return
+
+        keys = list(items)
+
+        async with self._conn_pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                try:
+                    # Multi-row inserts, the rows of existing keys are ignored
+                    await cur.executemany("INSERT IGNORE INTO object_meta (path, size) VALUES (%s, %s)",
+                                          [(key, len(item.data)) for key, item in items.items()])
+                    inserted = cur.rowcount
+
+                    if inserted < len(keys):
+                        existing_key = await self._find_existing_key(cur, keys)
+                        if existing_key is None:
+                            raise KeyAlreadyExistsError(key=", ".join(keys),
+                                                        additional_message="One of the keys is being written.")
+                        raise KeyAlreadyExistsError(key=existing_key)
+
+                    ids = {}
+                    for chunk in _chunked(keys):
+                        await cur.execute(f"SELECT path, id FROM object_meta WHERE path IN ({_placeholders(chunk)})",
+                                          chunk)
+                        ids.update(await cur.fetchall())
+
+                    await cur.executemany("INSERT INTO object_data (id, data) VALUES (%s, %s)",
+                                          [(ids[key], _encode_item(item)) for key, item in items.items()])
+                    await conn.commit()
+                except Exception:
+                    await conn.rollback()
+                    raise
+
+    @staticmethod
+    async def _find_existing_key(cur, keys: list[str]) -> str | None:
+        """
+        The first of `keys` stored before the current transaction, which did not insert a data row for it. The keys are
+        looked up again with a locking read, which sees the latest committed rows, if the transaction snapshot has none.
+        """
+        for lock_clause in ("", " LOCK IN SHARE MODE"):
+            existing = set()
+            for chunk in _chunked(keys):
+                await cur.execute(
+                    "SELECT path FROM object_meta m JOIN object_data d USING(id) "
+                    f"WHERE m.path IN ({_placeholders(chunk)}){lock_clause}",
+                    chunk)
+                existing.update(path for (path, ) in await cur.fetchall())
+
+            existing_key = next((key for key in keys if key in existing), None)
+            if existing_key is not None:
+                return existing_key
+
+        return None
+
     @override
     async def upsert_object(self, key: str, item: ObjectStoreItem):
 
@@ -148,20 +275,18 @@ class MySQLObjectStore(ObjectStore):
 
         async with self._conn_pool.acquire() as conn:
             async with conn.cursor() as cur:
-                await cur.execute(f"USE {self._schema};")
                 try:
-                    await cur.execute("START TRANSACTION;")
+                    # LAST_INSERT_ID(id) makes the id of an existing row available as the last inserted id
                     await cur.execute(
                         """
                         INSERT INTO object_meta (path, size)
                         VALUES (%s, %s)
-                        ON DUPLICATE KEY UPDATE size=VALUES(size), created_at=CURRENT_TIMESTAMP
+                        ON DUPLICATE KEY UPDATE id=LAST_INSERT_ID(id), size=VALUES(size), created_at=CURRENT_TIMESTAMP
                         """, (key, len(item.data)))
-                    await cur.execute("SELECT id FROM object_meta WHERE path=%s FOR UPDATE;", (key, ))
-                    (obj_id, ) = await cur.fetchone()
 
-                    blob = pickle.dumps(item)
-                    await cur.execute("REPLACE INTO object_data (id, data) VALUES (%s, %s)", (obj_id, blob))
+                    await cur.execute(
+                        "INSERT INTO object_data (id, data) VALUES (%s, %s) ON DUPLICATE KEY UPDATE data=VALUES(data)",
+                        (cur.lastrowid, _encode_item(item)))
                     await conn.commit()
                 except Exception:
                     await conn.rollback()
@@ -175,7 +300,6 @@ class MySQLObjectStore(ObjectStore):
 
         async with self._conn_pool.acquire() as conn:
             async with conn.cursor() as cur:
-                await cur.execute(f"USE {self._schema};")
                 await cur.execute(
                     """
                     SELECT d.data
@@ -184,9 +308,118 @@ class MySQLObjectStore(ObjectStore):
                     WHERE m.path=%s
                 """, (key, ))
                 row = await cur.fetchone()
-                if not row:
-                    raise NoSuchKeyError(key=key)
-                return pickle.loads(row[0])
+                # End the read-only transaction so that the next reads see new objects
+                await conn.commit()
+
+        if not row:
+            raise NoSuchKeyError(key=key)
+        return _decode_item(row[0])
+
+    @override
+    async def get_objects(self, keys: list[str]) -> dict[str, ObjectStoreItem]:
+
+        if not self._conn_pool:
+            raise RuntimeError("Connection not established")
+
+        keys = list(dict.fromkeys(keys))
+        blobs = {}
+
+        async with self._conn_pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                for chunk in _chunked(keys):
+                    await cur.execute(
+                        f"""
+                        SELECT m.path, d.data
+                        FROM object_data d
+                        JOIN object_meta m USING(id)
+                        WHERE m.path IN ({_placeholders(chunk)})
+                    """,
+                        chunk)
+                    blobs.update(await cur.fetchall())
+                await conn.commit()
+
+        for key in keys:
+            if key not in blobs:
+                raise NoSuchKeyError(key=key)
+
+        return {key: _decode_item(blobs[key]) for key in keys}
+
+    @override
+    async def get_object_stream(self, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ObjectStoreStreamItem:
+
+        if not self._conn_pool:
+            raise RuntimeError("Connection not established")
+
+        # Read the header only, the data is read as the chunks are iterated
+        async with self._conn_pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    """
+                    SELECT d.id, SUBSTRING(d.data, 1, %s), m.size
+                    FROM object_data d
+                    JOIN object_meta m USING(id)
+                    WHERE m.path=%s
+                """, (_HEADER_READ_SIZE, key))
+                row = await cur.fetchone()
+
+                if row and row[1].startswith(_MAGIC) and _decode_header(row[1]) is None:
+                    # The header is larger than the part read
+                    (header_length, ) = _HEADER_LENGTH.unpack_from(row[1], len(_MAGIC))
+                    await cur.execute("SELECT SUBSTRING(data, 1, %s) FROM object_data WHERE id=%s",
+                                      (_PREFIX_SIZE + header_length, row[0]))
+                    row = (row[0], (await cur.fetchone())[0], row[2])
+
+                await conn.commit()
+
+        if not row:
+            raise NoSuchKeyError(key=key)
+
+        obj_id, prefix, size = row
+        if not prefix.startswith(_MAGIC):
+            # Pickled objects can only be read whole
+            return await super().get_object_stream(key, chunk_size)
+
+        header, data_offset = _decode_header(prefix)
+        return ObjectStoreStreamItem(chunks=self._read_chunks(key, obj_id, prefix[:data_offset], size, chunk_size),
+                                     content_type=header.get("content_type"),
+                                     metadata=header.get("metadata"),
+                                     size=size)
+
+    async def _read_chunks(self, key: str, obj_id: int, header_prefix: bytes, size: int,
+                           chunk_size: int) -> AsyncIterator[bytes]:
+        """
+        Read the data of an object in chunks of at most `chunk_size` bytes, from a consistent snapshot of the database
+        so that a concurrent update of the object does not mix two versions of its data.
+
+        Raises:
+            NoSuchKeyError: If the object was deleted since its header was read.
+            IOError: If the object was updated since its header was read, its data no longer matches the header and
+                size returned with the stream.
+        """
+        async with self._conn_pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                try:
+                    await cur.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT;")
+
+                    data_offset = len(header_prefix)
+                    await cur.execute("SELECT SUBSTRING(data, 1, %s), LENGTH(data) FROM object_data WHERE id=%s",
+                                      (data_offset, obj_id))
+                    row = await cur.fetchone()
+                    if not row:
+                        raise NoSuchKeyError(key=key, additional_message="The object was deleted while it was read.")
+
+                    prefix, length = row
+                    if prefix != header_prefix or length - data_offset != size:
+                        raise IOError(f"Object {key} was updated while it was read")
+
+                    # SUBSTRING positions are 1-based
+                    for offset in range(data_offset, length, chunk_size):
+                        await cur.execute("SELECT SUBSTRING(data, %s, %s) FROM object_data WHERE id=%s",
+                                          (offset + 1, chunk_size, obj_id))
+                        (chunk, ) = await cur.fetchone()
+                        yield chunk
+                finally:
+                    await conn.rollback()
 
     @override
     async def delete_object(self, key: str):
@@ -197,7 +430,6 @@ class MySQLObjectStore(ObjectStore):
         async with self._conn_pool.acquire() as conn:
             async with conn.cursor() as cur:
                 try:
-                    await cur.execute(f"USE {self._schema};")
                     await cur.execute(
                         """
                         DELETE m, d
@@ -213,3 +445,35 @@ class MySQLObjectStore(ObjectStore):
                 except Exception:
                     await conn.rollback()
                     raise
+
+    @override
+    async def delete_objects(self, keys: list[str]) -> None:
+
+        if not self._conn_pool:
+            raise RuntimeError("Connection not established")
+
+        keys = list(dict.fromkeys(keys))
+
+        async with self._conn_pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                try:
+                    existing = set()
+                    for chunk in _chunked(keys):
+                        await cur.execute(
+                            "SELECT m.path FROM object_meta m JOIN object_data d USING(id) "
+                            f"WHERE m.path IN ({_placeholders(chunk)}) FOR UPDATE",
+                            chunk)
+                        existing.update(path for (path, ) in await cur.fetchall())
+
+                    for key in keys:
+                        if key not in existing:
+                            raise NoSuchKeyError(key=key)
+
+                    # The data rows are deleted by the foreign key cascade
+                    for chunk in _chunked(keys):
+                        await cur.execute(f"DELETE FROM object_meta WHERE path IN ({_placeholders(chunk)})", chunk)
+
+                    await conn.commit()
+                except Exception:
+                    await conn.rollback()
+                    raise
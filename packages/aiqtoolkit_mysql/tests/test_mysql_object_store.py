@@ -13,11 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import uuid
 from contextlib import asynccontextmanager
 
 import pytest
 
 from aiq.builder.workflow_builder import WorkflowBuilder
+from aiq.data_models.object_store import NoSuchKeyError
+from aiq.object_store.interfaces import ObjectStore
+from aiq.object_store.models import ObjectStoreItem
 from aiq.plugins.mysql.object_store import MySQLObjectStoreClientConfig
 from aiq.test.object_store_tests import ObjectStoreTests
 
@@ -37,3 +41,20 @@ class TestMySQLObjectStore(ObjectStoreTests):
                 MySQLObjectStoreClientConfig(bucket_name="test", user="root", password="my-secret-pw"))
 
             yield await builder.get_object_store_client("object_store_name")
+
+    async def test_get_object_stream_changed_while_read(self, store: ObjectStore):
+
+        key = f"test_key_{uuid.uuid4()}"
+        await store.put_object(key, ObjectStoreItem(data=b"a" * 100000, content_type="text/plain"))
+
+        # Updated after the header and size were returned
+        stream = await store.get_object_stream(key, chunk_size=10000)
+        await store.upsert_object(key, ObjectStoreItem(data=b"b" * 10, content_type="text/plain"))
+        with pytest.raises(IOError):
+            _ = [chunk async for chunk in stream.chunks]
+
+        # Deleted after the header and size were returned
+        stream = await store.get_object_stream(key, chunk_size=10000)
+        await store.delete_object(key)
+        with pytest.raises(NoSuchKeyError):
+            _ = [chunk async for chunk in stream.chunks]
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel
+from pydantic import Field
+
+
+class OTLPExportConfig(BaseModel):
+    """Settings of the export worker which sends batches of spans to an OTLP collector off the event loop."""
+    compression: Literal["gzip", "none"] = Field(default="gzip",
+                                                 description="The compression of the OTLP/HTTP protobuf requests.")
+    timeout: float = Field(default=10.0, gt=0, description="The timeout in seconds of each export request.")
+    max_retries: int = Field(default=3, ge=0, description="The number of retries of a failed export request.")
+    retry_backoff: float = Field(default=0.5,
+                                 gt=0,
+                                 description="The delay in seconds before the first retry, doubled at each retry.")
+    max_retry_backoff: float = Field(default=30.0,
+                                     gt=0,
+                                     description="The maximum delay in seconds between retries. It is also the delay "
+                                     "before the collector is tried again once a batch has exhausted its retries.")
+    max_pending_batches: int = Field(default=100,
+                                     gt=0,
+                                     description="The maximum number of batches waiting in memory for the export "
+                                     "worker. The oldest batches are spilled to disk, or dropped without a spill "
+                                     "directory, when the collector cannot keep up.")
+    spill_dir: Path | None = Field(default=None,
+                                   description="The directory where batches are spilled while the collector is slow or "
+                                   "down, to be replayed once it recovers, including by a later process. Batches are "
+                                   "dropped instead when it is not set.")
+    max_spill_size_mb: float = Field(default=256.0,
+                                     gt=0,
+                                     description="The maximum size of the spilled batches, the oldest are dropped "
+                                     "beyond it.")
+    shutdown_timeout: float = Field(default=10.0,
+                                    ge=0,
+                                    description="The maximum time in seconds to export the pending batches at "
+                                    "shutdown, the remaining batches are spilled or dropped.")
+
+
+class OTLPExportConfigMixin(BaseModel):
+    """Mixin for telemetry exporters that send spans to an OTLP collector with an export worker."""
+    otlp_export: OTLPExportConfig = Field(default_factory=OTLPExportConfig,
+                                          description="The settings of the OTLP export worker.")
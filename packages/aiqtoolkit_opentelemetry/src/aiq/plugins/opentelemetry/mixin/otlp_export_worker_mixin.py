@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+
+from aiq.plugins.opentelemetry.otel_span import OtelSpan
+from aiq.plugins.opentelemetry.otlp_export_worker import OTLPExportStats
+from aiq.plugins.opentelemetry.otlp_export_worker import OTLPExportWorker
+
+logger = logging.getLogger(__name__)
+
+
+class OTLPExportWorkerMixin:
+    """Mixin for OpenTelemetry span exporters which export their batches with an OTLPExportWorker.
+
+    Exporting a batch only queues it for the worker thread, which sends it, retries it and spills it to disk when the
+    collector is slow or down, so that the event loop is never blocked by the collector. The worker is shared with the
+    isolated instances of the exporter and shut down with the original instance.
+
+    Subclasses set `self._export_worker` before calling `super().__init__()`.
+    """
+
+    _export_worker: OTLPExportWorker
+
+    async def export_otel_spans(self, spans: list[OtelSpan]) -> None:
+        """Queue a list of OtelSpans for export by the export worker.
+
+        Args:
+            spans (list[OtelSpan]): The list of spans to export.
+        """
+        self._export_worker.submit(spans)
+
+    @property
+    def export_stats(self) -> OTLPExportStats:
+        """The counters of the export worker: exported, spilled, replayed and dropped spans, pending batches and lag."""
+        return self._export_worker.stats()
+
+    async def _wait_for_tasks(self, timeout: float = 5.0):
+        """Wait for the export tasks, then for the export worker to process the batches they queued."""
+        await super()._wait_for_tasks(timeout)  # type: ignore[misc]
+
+        if not await asyncio.to_thread(self._export_worker.wait_idle, timeout):
+            logger.warning("The OTLP export worker did not process the pending batches within %s seconds", timeout)
+
+    async def _cleanup(self):
+        """Shut the export worker down, exporting the batches it holds within its shutdown timeout."""
+        await super()._cleanup()  # type: ignore[misc]
+
+        if not self.is_isolated_instance:  # type: ignore[attr-defined]
+            await asyncio.to_thread(self._export_worker.shutdown)
@@ -13,25 +13,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import logging
+from aiq.plugins.opentelemetry.mixin.otlp_export_config_mixin import OTLPExportConfig
+from aiq.plugins.opentelemetry.mixin.otlp_export_worker_mixin import OTLPExportWorkerMixin
+from aiq.plugins.opentelemetry.otlp_export_worker import OTLPExportWorker
 
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 
-from aiq.plugins.opentelemetry.otel_span import OtelSpan
-
-logger = logging.getLogger(__name__)
-
-
-class OTLPSpanExporterMixin:
+class OTLPSpanExporterMixin(OTLPExportWorkerMixin):
     """Mixin for OTLP span exporters.
 
     This mixin provides OTLP-specific functionality for OpenTelemetry span exporters.
-    It handles OTLP protocol transmission using the standard OpenTelemetry OTLP HTTP exporter.
+    It sends the spans to the collector with the OTLP/HTTP protobuf protocol.
 
     Key Features:
     - Standard OTLP HTTP protocol support for span export
     - Configurable endpoint and headers for authentication/routing
-    - Integration with OpenTelemetry's OTLPSpanExporter for reliable transmission
+    - Compressed export from a worker thread, with retries and an on-disk spill queue (see OTLPExportWorker)
     - Works with any OTLP-compatible collector or service
 
     This mixin is designed to be used with OtelSpanExporter as a base class:
@@ -42,28 +38,20 @@ class OTLPSpanExporterMixin:
                 super().__init__(endpoint=endpoint, headers=headers, **kwargs)
     """
 
-    def __init__(self, *args, endpoint: str, headers: dict[str, str] | None = None, **kwargs):
+    def __init__(self,
+                 *args,
+                 endpoint: str,
+                 headers: dict[str, str] | None = None,
+                 export_config: OTLPExportConfig | None = None,
+                 **kwargs):
         """Initialize the OTLP span exporter.
 
         Args:
             endpoint: OTLP service endpoint URL.
             headers: HTTP headers for authentication and metadata.
+            export_config: Settings of the export worker, compression, retries and spilling.
         """
-        # Initialize exporter before super().__init__() to ensure it's available
+        # Initialize the worker before super().__init__() to ensure it's available
         # if parent class initialization potentially calls export_otel_spans()
-        self._exporter = OTLPSpanExporter(endpoint=endpoint, headers=headers)
+        self._export_worker = OTLPExportWorker(endpoint=endpoint, headers=headers, config=export_config)
         super().__init__(*args, **kwargs)
-
-    async def export_otel_spans(self, spans: list[OtelSpan]) -> None:
-        """Export a list of OtelSpans using the OTLP exporter.
-
-        Args:
-            spans (list[OtelSpan]): The list of spans to export.
-
-        Raises:
-            Exception: If there's an error during span export (logged but not re-raised).
-        """
-        try:
-            self._exporter.export(spans)  # type: ignore[arg-type]
-        except Exception as e:
-            logger.error("Error exporting spans: %s", e, exc_info=True)
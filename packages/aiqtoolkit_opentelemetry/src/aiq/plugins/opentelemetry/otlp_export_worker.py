@@ -0,0 +1,476 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import contextlib
+import gzip
+import itertools
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from pydantic import BaseModel
+
+from aiq.plugins.opentelemetry.mixin.otlp_export_config_mixin import OTLPExportConfig
+from aiq.plugins.opentelemetry.otel_span import OtelSpan
+
+logger = logging.getLogger(__name__)
+
+# Status codes of OTLP/HTTP responses after which an export request is retried, other errors are permanent
+_RETRYABLE_STATUS_CODES = {408, 429, 502, 503, 504}
+
+_SPILL_SUFFIX = ".otlp.gz"
+
+# A batch of spans with the time it was submitted at
+_Batch = tuple[float, list[OtelSpan]]
+
+
+class _PermanentExportError(Exception):
+    """The collector rejected a request which would be rejected again if retried."""
+
+
+class OTLPExportStats(BaseModel):
+    """
+    Counters of an OTLP export worker.
+    """
+    exported_spans: int = 0
+    failed_attempts: int = 0
+    spilled_spans: int = 0
+    replayed_spans: int = 0
+    dropped_spans: int = 0
+    pending_batches: int = 0
+    spilled_batches: int = 0
+    # Age of the oldest batch not exported yet, in memory or spilled
+    export_lag_seconds: float = 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.exported_spans} spans exported, {self.replayed_spans} replayed, "
+                f"{self.spilled_spans} spilled, {self.dropped_spans} dropped, {self.failed_attempts} failed attempts, "
+                f"{self.pending_batches} batches pending, {self.spilled_batches} spilled, "
+                f"lag {self.export_lag_seconds:.1f}s")
+
+
+class _SpillQueue:
+    """
+    Bounded queue of encoded batches of spans, one file each in a directory so that it survives restarts. The oldest
+    batches are dropped when the files exceed the maximum size.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self._directory = directory
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+        # Path, submission time, number of spans and size of each file, oldest first
+        self._files: deque[tuple[Path, float, int, int]] = deque()
+        self._size = 0
+
+        for path in sorted(directory.glob(f"*{_SPILL_SUFFIX}")):
+            try:
+                submitted_ns, _, span_count = path.name.removesuffix(_SPILL_SUFFIX).split("-")
+                self._files.append((path, int(submitted_ns) / 1e9, int(span_count), path.stat().st_size))
+                self._size += self._files[-1][3]
+            except (ValueError, OSError):
+                logger.warning("Ignoring unexpected file in the span spill directory: %s", path)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    @property
+    def oldest_submitted_at(self) -> float | None:
+        with self._lock:
+            return self._files[0][1] if self._files else None
+
+    def push(self, payload: bytes, span_count: int, submitted_at: float) -> int:
+        """
+        Returns:
+            int: The number of spans dropped to keep the queue within its maximum size.
+        """
+        name = f"{int(submitted_at * 1e9):020d}-{os.getpid()}.{next(self._sequence)}-{span_count}{_SPILL_SUFFIX}"
+        path = self._directory / name
+
+        # Written under a temporary name so that a partial file is never replayed
+        temp_path = path.with_name(name + ".tmp")
+        temp_path.write_bytes(payload)
+        temp_path.replace(path)
+
+        dropped = 0
+        with self._lock:
+            self._files.append((path, submitted_at, span_count, len(payload)))
+            self._size += len(payload)
+
+            while self._size > self._max_bytes and len(self._files) > 1:
+                dropped += self._pop_locked()
+
+        return dropped
+
+    def peek(self) -> tuple[bytes, int] | None:
+        """
+        Returns:
+            tuple[bytes, int] | None: The payload and the number of spans of the oldest batch, None if it is empty.
+        """
+        with self._lock:
+            if not self._files:
+                return None
+            path, _, span_count, _ = self._files[0]
+
+        try:
+            return path.read_bytes(), span_count
+        except FileNotFoundError:
+            # Removed by another process sharing the directory
+            self.pop()
+            return self.peek()
+
+    def pop(self) -> int:
+        """Remove the oldest batch, returning its number of spans."""
+        with self._lock:
+            return self._pop_locked() if self._files else 0
+
+    def _pop_locked(self) -> int:
+        path, _, span_count, size = self._files.popleft()
+        self._size -= size
+        path.unlink(missing_ok=True)
+        return span_count
+
+
+class OTLPExportWorker:
+    """
+    Exports batches of spans to an OTLP/HTTP endpoint from a dedicated thread, so that export requests, their retries
+    and a slow or unavailable collector never block the event loop serving requests.
+
+    Failed exports are retried with an exponential backoff, except for the requests rejected by the collector, whose
+    batches are dropped. A batch which exhausts its retries is spilled to a bounded on-disk queue when a spill
+    directory is configured, and dropped otherwise. The worker then waits for
+    `max_retry_backoff` before trying the collector again, spilling the batches submitted meanwhile. The spilled
+    batches are replayed, oldest first, whenever no new batch is waiting, including batches spilled by an earlier
+    process.
+    """
+
+    def __init__(self,
+                 *,
+                 endpoint: str,
+                 headers: dict[str, str] | None = None,
+                 config: OTLPExportConfig | None = None,
+                 export_context: Callable[[], contextlib.AbstractContextManager] | None = None):
+        """
+        Args:
+            endpoint (str): The OTLP/HTTP endpoint the batches are sent to.
+            headers (dict[str, str] | None): The headers of the export requests.
+            config (OTLPExportConfig | None): The settings of the worker.
+            export_context (Callable[[], AbstractContextManager] | None): Context entered around the encoding of each
+                batch.
+        """
+        self._endpoint = endpoint
+        self._headers = dict(headers or {})
+        self._config = config or OTLPExportConfig()
+        self._export_context = export_context or contextlib.nullcontext
+
+        self._spill = None
+        if self._config.spill_dir is not None:
+            self._spill = _SpillQueue(Path(self._config.spill_dir), int(self._config.max_spill_size_mb * 1024 * 1024))
+
+        # Guards the pending batches, the batch being exported and the counters
+        self._condition = threading.Condition()
+        self._pending: deque[_Batch] = deque()
+        self._in_flight_since: float | None = None
+        self._stats = OTLPExportStats()
+
+        self._down_until = 0.0
+        self._stopping = False
+        self._closed = False
+        self._abort = threading.Event()
+
+        self._thread: threading.Thread | None = None
+        self._http_client: httpx.Client | None = None
+
+        # Batches spilled by an earlier process are replayed without waiting for new spans
+        if self._spill is not None and len(self._spill):
+            self._start()
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="aiq-otlp-export", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def submit(self, spans: list[OtelSpan]) -> None:
+        """
+        Queue a batch of spans for export. Never blocks: when more than `max_pending_batches` batches are waiting, the
+        oldest one is dropped.
+        """
+        with self._condition:
+            if self._closed:
+                self._stats.dropped_spans += len(spans)
+                logger.warning("Dropping %d spans submitted after the OTLP export worker was shut down", len(spans))
+                return
+
+            if self._thread is None:
+                self._start()
+
+            self._pending.append((time.time(), spans))
+            while len(self._pending) > self._config.max_pending_batches:
+                _, dropped = self._pending.popleft()
+                self._stats.dropped_spans += len(dropped)
+                logger.warning("Dropping %d spans, the OTLP export worker is falling behind", len(dropped))
+
+            self._condition.notify_all()
+
+    def stats(self) -> OTLPExportStats:
+        with self._condition:
+            submitted = [self._pending[0][0]] if self._pending else []
+            if self._in_flight_since is not None:
+                submitted.append(self._in_flight_since)
+            spilled_batches = 0
+            if self._spill is not None:
+                spilled_batches = len(self._spill)
+                if (oldest_spilled := self._spill.oldest_submitted_at) is not None:
+                    submitted.append(oldest_spilled)
+
+            return self._stats.model_copy(
+                update={
+                    "pending_batches": len(self._pending) + (self._in_flight_since is not None),
+                    "spilled_batches": spilled_batches,
+                    "export_lag_seconds": max(time.time() - min(submitted), 0.0) if submitted else 0.0,
+                })
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every submitted batch is exported, spilled or dropped.
+
+        Returns:
+            bool: False if the timeout expired first.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and self._in_flight_since is None, timeout)
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """
+        Export the pending batches for at most `timeout` seconds, defaulting to `shutdown_timeout`, then spill or drop
+        the remaining ones and stop the worker thread.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._stopping = True
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join(self._config.shutdown_timeout if timeout is None else timeout)
+            if self._thread.is_alive():
+                # Stops the retries, the request in progress completes within the request timeout
+                self._abort.set()
+                self._thread.join()
+
+        with self._condition:
+            remaining = list(self._pending)
+            self._pending.clear()
+        self._spill_or_drop(remaining)
+
+        if self._http_client is not None:
+            self._http_client.close()
+
+        logger.info("OTLP export worker stopped: %s", self.stats())
+
+    def _run(self) -> None:
+        while True:
+            action = self._next_action()
+            if action is None:
+                return
+
+            kind, batches = action
+            if kind == "export":
+                self._export_batch(*batches[0])
+            elif kind == "spill":
+                self._spill_or_drop(batches)
+                with self._condition:
+                    self._condition.notify_all()
+            else:
+                self._replay_spilled_batch()
+
+    def _next_action(self) -> tuple[str, list[_Batch]] | None:
+        """
+        Wait for the next batch to export, batches to spill or spilled batches to replay.
+
+        Returns:
+            tuple[str, list[_Batch]] | None: The action and the batches it applies to, None when the worker stops.
+        """
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                collector_down = now < self._down_until
+
+                if self._stopping and (collector_down or not self._pending):
+                    return None
+
+                if collector_down:
+                    # Batches wait for the collector on disk when possible
+                    if self._spill is not None and self._pending:
+                        batches = list(self._pending)
+                        self._pending.clear()
+                        return "spill", batches
+                    self._condition.wait(self._down_until - now)
+                    continue
+
+                if self._spill is not None and len(self._pending) > self._config.max_pending_batches // 2:
+                    # The collector is falling behind, the oldest batches are spilled before they are dropped
+                    batches = [self._pending.popleft() for _ in range(len(self._pending) // 2)]
+                    return "spill", batches
+
+                if self._pending:
+                    batch = self._pending.popleft()
+                    self._in_flight_since = batch[0]
+                    return "export", [batch]
+
+                if self._spill is not None and len(self._spill):
+                    return "replay", []
+
+                self._condition.wait()
+
+    def _export_batch(self, submitted_at: float, spans: list[OtelSpan]) -> None:
+        error = self._with_retries(lambda: self._send_spans(spans))
+
+        if error is None:
+            with self._condition:
+                self._stats.exported_spans += len(spans)
+        elif isinstance(error, _PermanentExportError):
+            # Only this batch is at fault, the collector is not down
+            logger.error("Dropping a batch of %d spans rejected by the collector: %s", len(spans), error)
+            with self._condition:
+                self._stats.dropped_spans += len(spans)
+        else:
+            logger.error("Error exporting spans: %s", error)
+            self._mark_collector_down()
+            self._spill_or_drop([(submitted_at, spans)])
+
+        with self._condition:
+            self._in_flight_since = None
+            self._condition.notify_all()
+
+    def _replay_spilled_batch(self) -> None:
+        spilled = self._spill.peek()
+        if spilled is None:
+            return
+
+        payload, span_count = spilled
+        error = self._with_retries(lambda: self._send_payload(payload))
+
+        if error is None:
+            self._spill.pop()
+            with self._condition:
+                self._stats.replayed_spans += span_count
+        elif isinstance(error, _PermanentExportError):
+            logger.error("Dropping a spilled batch of %d spans rejected by the collector: %s", span_count, error)
+            self._spill.pop()
+            with self._condition:
+                self._stats.dropped_spans += span_count
+        else:
+            logger.warning("Unable to replay the spilled spans, retrying later: %s", error)
+            self._mark_collector_down()
+
+    def _with_retries(self, send: Callable[[], None]) -> Exception | None:
+        """
+        Call `send` until it succeeds or the retries are exhausted.
+
+        Returns:
+            Exception | None: The error of the last attempt, None if an attempt succeeded.
+        """
+        delay = self._config.retry_backoff
+        for attempt in range(self._config.max_retries + 1):
+            try:
+                send()
+                return None
+            except _PermanentExportError as e:
+                return e
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                error = e
+
+            with self._condition:
+                self._stats.failed_attempts += 1
+
+            if attempt == self._config.max_retries:
+                break
+
+            logger.debug("OTLP export attempt %d failed, retrying in %.1fs: %s", attempt + 1, delay, error)
+            if self._abort.wait(delay * random.uniform(0.5, 1.0)):
+                break
+            delay = min(delay * 2, self._config.max_retry_backoff)
+
+        return error
+
+    def _send_spans(self, spans: list[OtelSpan]) -> None:
+        try:
+            with self._export_context():
+                payload = encode_spans(spans).SerializeToString()  # type: ignore[arg-type]
+        except Exception as e:
+            raise _PermanentExportError(f"Unable to encode the spans: {e}") from e
+
+        if self._config.compression == "gzip":
+            self._send_payload(gzip.compress(payload))
+        else:
+            self._send_payload(payload, compressed=False)
+
+    def _send_payload(self, payload: bytes, compressed: bool = True) -> None:
+        """
+        Send an encoded batch of spans.
+
+        Raises:
+            _PermanentExportError: If the collector rejected the request, retrying it would not succeed.
+        """
+        if self._http_client is None:
+            self._http_client = httpx.Client(timeout=self._config.timeout)
+
+        headers = {**self._headers, "Content-Type": "application/x-protobuf"}
+        if compressed:
+            headers["Content-Encoding"] = "gzip"
+
+        response = self._http_client.post(self._endpoint, content=payload, headers=headers)
+        if response.is_success:
+            return
+
+        message = f"HTTP {response.status_code}: {response.text[:200]}"
+        if response.status_code in _RETRYABLE_STATUS_CODES or response.status_code >= 500:
+            raise RuntimeError(message)
+        raise _PermanentExportError(message)
+
+    def _mark_collector_down(self) -> None:
+        with self._condition:
+            self._down_until = time.monotonic() + self._config.max_retry_backoff
+
+    def _spill_or_drop(self, batches: list[_Batch]) -> None:
+        for submitted_at, spans in batches:
+            dropped = len(spans)
+            if self._spill is not None:
+                try:
+                    with self._export_context():
+                        payload = gzip.compress(encode_spans(spans).SerializeToString())  # type: ignore[arg-type]
+                    dropped = self._spill.push(payload, len(spans), submitted_at)
+                    with self._condition:
+                        self._stats.spilled_spans += len(spans)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error("Failed to spill a batch of %d spans: %s", len(spans), e)
+
+            if dropped:
+                logger.warning("Dropping %d spans which could not be exported", dropped)
+                with self._condition:
+                    self._stats.dropped_spans += dropped
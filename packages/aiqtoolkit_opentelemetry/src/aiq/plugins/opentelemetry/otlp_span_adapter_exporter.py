@@ -16,6 +16,7 @@
 import logging
 
 from aiq.builder.context import AIQContextState
+from aiq.plugins.opentelemetry.mixin.otlp_export_config_mixin import OTLPExportConfig
 from aiq.plugins.opentelemetry.mixin.otlp_span_exporter_mixin import OTLPSpanExporterMixin
 from aiq.plugins.opentelemetry.otel_span_exporter import OtelSpanExporter
 
@@ -35,7 +36,7 @@ class OTLPSpanAdapterExporter(OTLPSpanExporterMixin, OtelSpanExporter):  # pylin
     - OTLP HTTP protocol for maximum compatibility
     - Configurable authentication via headers
     - Resource attribute management
-    - Error handling and retry logic
+    - Export off the event loop, with retries and an optional on-disk spill queue
 
     This exporter is commonly used with services like:
     - OpenTelemetry Collector
@@ -66,6 +67,7 @@ class OTLPSpanAdapterExporter(OTLPSpanExporterMixin, OtelSpanExporter):  # pylin
             # OTLPSpanExporterMixin args
             endpoint: str,
             headers: dict[str, str] | None = None,
+            export_config: OTLPExportConfig | None = None,
             **otlp_kwargs):
         """Initialize the OTLP span exporter.
 
@@ -79,6 +81,7 @@ class OTLPSpanAdapterExporter(OTLPSpanExporterMixin, OtelSpanExporter):  # pylin
             resource_attributes: Additional resource attributes for spans.
             endpoint: The endpoint for the OTLP service.
             headers: The headers for the OTLP service.
+            export_config: The settings of the export worker, compression, retries and spilling.
             **otlp_kwargs: Additional keyword arguments for the OTLP service.
         """
         super().__init__(context_state=context_state,
@@ -90,4 +93,5 @@ class OTLPSpanAdapterExporter(OTLPSpanExporterMixin, OtelSpanExporter):  # pylin
                          resource_attributes=resource_attributes,
                          endpoint=endpoint,
                          headers=headers,
+                         export_config=export_config,
                          **otlp_kwargs)
@@ -23,11 +23,12 @@ from aiq.cli.register_workflow import register_telemetry_exporter
 from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
 from aiq.observability.mixin.batch_config_mixin import BatchConfigMixin
 from aiq.observability.mixin.collector_config_mixin import CollectorConfigMixin
+from aiq.plugins.opentelemetry.mixin.otlp_export_config_mixin import OTLPExportConfigMixin
 
 logger = logging.getLogger(__name__)
 
 
-class LangfuseTelemetryExporter(BatchConfigMixin, TelemetryExporterBaseConfig, name="langfuse"):
+class LangfuseTelemetryExporter(BatchConfigMixin, OTLPExportConfigMixin, TelemetryExporterBaseConfig, name="langfuse"):
     """A telemetry exporter to transmit traces to externally hosted langfuse service."""
 
     endpoint: str = Field(description="The langfuse OTEL endpoint (/api/public/otel/v1/traces)")
@@ -59,10 +60,15 @@ async def langfuse_telemetry_exporter(config: LangfuseTelemetryExporter, builder
                                   flush_interval=config.flush_interval,
                                   max_queue_size=config.max_queue_size,
                                   drop_on_overflow=config.drop_on_overflow,
-                                  shutdown_timeout=config.shutdown_timeout)
+                                  shutdown_timeout=config.shutdown_timeout,
+                                  export_config=config.otlp_export)
 
 
-class LangsmithTelemetryExporter(BatchConfigMixin, CollectorConfigMixin, TelemetryExporterBaseConfig, name="langsmith"):
+class LangsmithTelemetryExporter(BatchConfigMixin,
+                                 CollectorConfigMixin,
+                                 OTLPExportConfigMixin,
+                                 TelemetryExporterBaseConfig,
+                                 name="langsmith"):
     """A telemetry exporter to transmit traces to externally hosted langsmith service."""
 
     endpoint: str = Field(
@@ -91,11 +97,13 @@ async def langsmith_telemetry_exporter(config: LangsmithTelemetryExporter, build
                                   flush_interval=config.flush_interval,
                                   max_queue_size=config.max_queue_size,
                                   drop_on_overflow=config.drop_on_overflow,
-                                  shutdown_timeout=config.shutdown_timeout)
+                                  shutdown_timeout=config.shutdown_timeout,
+                                  export_config=config.otlp_export)
 
 
 class OtelCollectorTelemetryExporter(BatchConfigMixin,
                                      CollectorConfigMixin,
+                                     OTLPExportConfigMixin,
                                      TelemetryExporterBaseConfig,
                                      name="otelcollector"):
     """A telemetry exporter to transmit traces to externally hosted otel collector service."""
@@ -128,10 +136,15 @@ async def otel_telemetry_exporter(config: OtelCollectorTelemetryExporter, builde
                                   flush_interval=config.flush_interval,
                                   max_queue_size=config.max_queue_size,
                                   drop_on_overflow=config.drop_on_overflow,
-                                  shutdown_timeout=config.shutdown_timeout)
+                                  shutdown_timeout=config.shutdown_timeout,
+                                  export_config=config.otlp_export)
 
 
-class PatronusTelemetryExporter(BatchConfigMixin, CollectorConfigMixin, TelemetryExporterBaseConfig, name="patronus"):
+class PatronusTelemetryExporter(BatchConfigMixin,
+                                CollectorConfigMixin,
+                                OTLPExportConfigMixin,
+                                TelemetryExporterBaseConfig,
+                                name="patronus"):
     """A telemetry exporter to transmit traces to Patronus service."""
 
     api_key: str = Field(description="The Patronus API key", default="")
@@ -159,11 +172,16 @@ async def patronus_telemetry_exporter(config: PatronusTelemetryExporter, builder
                                   flush_interval=config.flush_interval,
                                   max_queue_size=config.max_queue_size,
                                   drop_on_overflow=config.drop_on_overflow,
-                                  shutdown_timeout=config.shutdown_timeout)
+                                  shutdown_timeout=config.shutdown_timeout,
+                                  export_config=config.otlp_export)
 
 
 # pylint: disable=W0613
-class GalileoTelemetryExporter(BatchConfigMixin, CollectorConfigMixin, TelemetryExporterBaseConfig, name="galileo"):
+class GalileoTelemetryExporter(BatchConfigMixin,
+                               CollectorConfigMixin,
+                               OTLPExportConfigMixin,
+                               TelemetryExporterBaseConfig,
+                               name="galileo"):
     """A telemetry exporter to transmit traces to externally hosted galileo service."""
 
     endpoint: str = Field(description="The galileo endpoint to export telemetry traces.",
@@ -192,4 +210,5 @@ async def galileo_telemetry_exporter(config: GalileoTelemetryExporter, builder:
         max_queue_size=config.max_queue_size,
         drop_on_overflow=config.drop_on_overflow,
         shutdown_timeout=config.shutdown_timeout,
+        export_config=config.otlp_export,
     )
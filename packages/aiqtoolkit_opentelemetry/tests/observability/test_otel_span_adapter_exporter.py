@@ -19,7 +19,6 @@ from unittest.mock import Mock
 from unittest.mock import patch
 
 import pytest
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 
 from aiq.builder.context import AIQContextState
 from aiq.builder.framework_enum import LLMFrameworkEnum
@@ -28,7 +27,9 @@ from aiq.data_models.intermediate_step import IntermediateStepPayload
 from aiq.data_models.intermediate_step import IntermediateStepType
 from aiq.data_models.intermediate_step import StreamEventData
 from aiq.data_models.invocation_node import InvocationNode
+from aiq.plugins.opentelemetry.mixin.otlp_export_config_mixin import OTLPExportConfig
 from aiq.plugins.opentelemetry.otel_span import OtelSpan
+from aiq.plugins.opentelemetry.otlp_export_worker import OTLPExportWorker
 from aiq.plugins.opentelemetry.otlp_span_adapter_exporter import OTLPSpanAdapterExporter
 
 
@@ -105,8 +106,7 @@ class TestOTLPSpanAdapterExporter:
                                            headers=basic_exporter_config["headers"])
 
         assert exporter is not None
-        assert hasattr(exporter, '_exporter')
-        assert isinstance(exporter._exporter, OTLPSpanExporter)
+        assert isinstance(exporter._export_worker, OTLPExportWorker)
 
     def test_initialization_with_all_params(self, mock_context_state, basic_exporter_config):
         """Test OTLPSpanAdapterExporter initialization with all parameters."""
@@ -123,8 +123,7 @@ class TestOTLPSpanAdapterExporter:
                                            resource_attributes=resource_attributes)
 
         assert exporter is not None
-        assert hasattr(exporter, '_exporter')
-        assert isinstance(exporter._exporter, OTLPSpanExporter)
+        assert isinstance(exporter._export_worker, OTLPExportWorker)
         assert exporter._resource.attributes["service.name"] == "test-service"
         assert exporter._resource.attributes["service.version"] == "1.0"
 
@@ -134,14 +133,14 @@ class TestOTLPSpanAdapterExporter:
                                            headers=basic_exporter_config["headers"])
 
         assert exporter is not None
-        assert isinstance(exporter._exporter, OTLPSpanExporter)
+        assert isinstance(exporter._export_worker, OTLPExportWorker)
 
     def test_initialization_without_headers(self, basic_exporter_config):
         """Test OTLPSpanAdapterExporter initialization without headers."""
         exporter = OTLPSpanAdapterExporter(endpoint=basic_exporter_config["endpoint"])
 
         assert exporter is not None
-        assert isinstance(exporter._exporter, OTLPSpanExporter)
+        assert isinstance(exporter._export_worker, OTLPExportWorker)
 
     def test_initialization_with_empty_resource_attributes(self, basic_exporter_config):
         """Test OTLPSpanAdapterExporter initialization with empty resource attributes."""
@@ -150,14 +149,9 @@ class TestOTLPSpanAdapterExporter:
         assert exporter is not None
         assert exporter._resource.attributes == {}
 
-    @patch('aiq.plugins.opentelemetry.mixin.otlp_span_exporter_mixin.OTLPSpanExporter')
-    async def test_export_otel_spans_success(self, mock_otlp_exporter_class, basic_exporter_config, mock_otel_span):
+    @patch.object(OTLPExportWorker, '_send_spans')
+    async def test_export_otel_spans_success(self, mock_send_spans, basic_exporter_config, mock_otel_span):
         """Test successful export of OtelSpans."""
-        # Setup mock
-        mock_otlp_exporter = Mock()
-        mock_otlp_exporter.export = Mock()
-        mock_otlp_exporter_class.return_value = mock_otlp_exporter
-
         exporter = OTLPSpanAdapterExporter(endpoint=basic_exporter_config["endpoint"],
                                            headers=basic_exporter_config["headers"])
 
@@ -165,43 +159,41 @@ class TestOTLPSpanAdapterExporter:
 
         # Test export
         await exporter.export_otel_spans(spans)
+        await exporter._wait_for_tasks()
 
-        # Verify the OTLP exporter was called
-        mock_otlp_exporter.export.assert_called_once_with(spans)
+        # Verify the export worker sent the spans
+        mock_send_spans.assert_called_once_with(spans)
 
-    @patch('aiq.plugins.opentelemetry.mixin.otlp_span_exporter_mixin.OTLPSpanExporter')
-    @patch('aiq.plugins.opentelemetry.mixin.otlp_span_exporter_mixin.logger')
+    @patch.object(OTLPExportWorker, '_send_spans')
+    @patch('aiq.plugins.opentelemetry.otlp_export_worker.logger')
     async def test_export_otel_spans_with_exception(self,
                                                     mock_logger,
-                                                    mock_otlp_exporter_class,
+                                                    mock_send_spans,
                                                     basic_exporter_config,
                                                     mock_otel_span):
         """Test export of OtelSpans with exception handling."""
         # Setup mock to raise exception
-        mock_otlp_exporter = Mock()
-        mock_otlp_exporter.export = Mock(side_effect=Exception("Network error"))
-        mock_otlp_exporter_class.return_value = mock_otlp_exporter
+        mock_send_spans.side_effect = Exception("Network error")
 
         exporter = OTLPSpanAdapterExporter(endpoint=basic_exporter_config["endpoint"],
-                                           headers=basic_exporter_config["headers"])
+                                           headers=basic_exporter_config["headers"],
+                                           export_config=OTLPExportConfig(max_retries=1, retry_backoff=0.01))
 
         spans = [mock_otel_span]
 
         # Test export - should not raise exception
         await exporter.export_otel_spans(spans)
+        await exporter._wait_for_tasks()
 
-        # Verify error was logged
+        # Verify the export was retried and the error logged once
+        assert mock_send_spans.call_count == 2
+        assert exporter.export_stats.dropped_spans == 1
         mock_logger.error.assert_called_once()
         assert "Error exporting spans" in str(mock_logger.error.call_args)
 
-    @patch('aiq.plugins.opentelemetry.mixin.otlp_span_exporter_mixin.OTLPSpanExporter')
-    async def test_export_multiple_spans(self, mock_otlp_exporter_class, basic_exporter_config):
+    @patch.object(OTLPExportWorker, '_send_spans')
+    async def test_export_multiple_spans(self, mock_send_spans, basic_exporter_config):
         """Test export of multiple OtelSpans."""
-        # Setup mock
-        mock_otlp_exporter = Mock()
-        mock_otlp_exporter.export = Mock()
-        mock_otlp_exporter_class.return_value = mock_otlp_exporter
-
         exporter = OTLPSpanAdapterExporter(endpoint=basic_exporter_config["endpoint"],
                                            headers=basic_exporter_config["headers"])
 
@@ -211,19 +203,14 @@ class TestOTLPSpanAdapterExporter:
 
         # Test export
         await exporter.export_otel_spans(spans)
+        await exporter._wait_for_tasks()
 
-        # Verify the OTLP exporter was called with all spans
-        mock_otlp_exporter.export.assert_called_once_with(spans)
+        # Verify the export worker sent all spans
+        mock_send_spans.assert_called_once_with(spans)
 
     async def test_end_to_end_span_processing(self, basic_exporter_config, sample_start_event, sample_end_event):
         """Test end-to-end span processing from IntermediateStep to export."""
-        with patch('aiq.plugins.opentelemetry.mixin.otlp_span_exporter_mixin.OTLPSpanExporter') \
-                as mock_otlp_exporter_class:
-            # Setup mock
-            mock_otlp_exporter = Mock()
-            mock_otlp_exporter.export = Mock()
-            mock_otlp_exporter_class.return_value = mock_otlp_exporter
-
+        with patch.object(OTLPExportWorker, '_send_spans') as mock_send_spans:
             exporter = OTLPSpanAdapterExporter(
                 endpoint=basic_exporter_config["endpoint"],
                 headers=basic_exporter_config["headers"],
@@ -244,22 +231,17 @@ class TestOTLPSpanAdapterExporter:
                 await exporter._wait_for_tasks()
 
             # Verify that export was called (span was processed and exported)
-            mock_otlp_exporter.export.assert_called()
+            mock_send_spans.assert_called()
 
             # Verify the exported spans have the correct structure
-            call_args = mock_otlp_exporter.export.call_args
+            call_args = mock_send_spans.call_args
             exported_spans = call_args[0][0]  # First positional argument
             assert len(exported_spans) >= 1
             assert all(hasattr(span, 'set_resource') for span in exported_spans)
 
-    @patch('aiq.plugins.opentelemetry.mixin.otlp_span_exporter_mixin.OTLPSpanExporter')
-    async def test_batching_behavior(self, mock_otlp_exporter_class, basic_exporter_config):
+    @patch.object(OTLPExportWorker, '_send_spans')
+    async def test_batching_behavior(self, mock_send_spans, basic_exporter_config):
         """Test that batching works correctly with the OTLP exporter."""
-        # Setup mock
-        mock_otlp_exporter = Mock()
-        mock_otlp_exporter.export = Mock()
-        mock_otlp_exporter_class.return_value = mock_otlp_exporter
-
         batch_size = 3
         exporter = OTLPSpanAdapterExporter(
             endpoint=basic_exporter_config["endpoint"],
@@ -298,7 +280,7 @@ class TestOTLPSpanAdapterExporter:
             await exporter._wait_for_tasks()
 
         # Verify that export was called (batching should trigger export)
-        mock_otlp_exporter.export.assert_called()
+        mock_send_spans.assert_called()
 
     def test_inheritance_structure(self, basic_exporter_config):
         """Test that OTLPSpanAdapterExporter has the correct inheritance structure."""
@@ -312,52 +294,46 @@ class TestOTLPSpanAdapterExporter:
         assert hasattr(exporter, 'export_otel_spans')
         assert hasattr(exporter, 'export_processed')
 
-    @patch('aiq.plugins.opentelemetry.mixin.otlp_span_exporter_mixin.OTLPSpanExporter')
-    def test_otlp_exporter_initialization_with_headers(self, mock_otlp_exporter_class, basic_exporter_config):
-        """Test that the internal OTLP exporter is initialized with correct headers."""
+    @patch('aiq.plugins.opentelemetry.mixin.otlp_span_exporter_mixin.OTLPExportWorker')
+    def test_export_worker_initialization_with_headers(self, mock_worker_class, basic_exporter_config):
+        """Test that the export worker is initialized with correct headers."""
         headers = basic_exporter_config["headers"]
         endpoint = basic_exporter_config["endpoint"]
+        export_config = OTLPExportConfig(compression="none")
 
-        OTLPSpanAdapterExporter(endpoint=endpoint, headers=headers)
+        OTLPSpanAdapterExporter(endpoint=endpoint, headers=headers, export_config=export_config)
 
-        # Verify OTLPSpanExporter was initialized with correct parameters
-        mock_otlp_exporter_class.assert_called_once_with(endpoint=endpoint, headers=headers)
+        # Verify OTLPExportWorker was initialized with correct parameters
+        mock_worker_class.assert_called_once_with(endpoint=endpoint, headers=headers, config=export_config)
 
-    @patch('aiq.plugins.opentelemetry.mixin.otlp_span_exporter_mixin.OTLPSpanExporter')
-    def test_otlp_exporter_initialization_without_headers(self, mock_otlp_exporter_class, basic_exporter_config):
-        """Test that the internal OTLP exporter is initialized correctly without headers."""
+    @patch('aiq.plugins.opentelemetry.mixin.otlp_span_exporter_mixin.OTLPExportWorker')
+    def test_export_worker_initialization_without_headers(self, mock_worker_class, basic_exporter_config):
+        """Test that the export worker is initialized correctly without headers."""
         endpoint = basic_exporter_config["endpoint"]
 
         OTLPSpanAdapterExporter(endpoint=endpoint)
 
-        # Verify OTLPSpanExporter was initialized with correct parameters
-        mock_otlp_exporter_class.assert_called_once_with(endpoint=endpoint, headers=None)
+        # Verify OTLPExportWorker was initialized with correct parameters
+        mock_worker_class.assert_called_once_with(endpoint=endpoint, headers=None, config=None)
 
     def test_missing_endpoint_parameter(self):
         """Test that missing endpoint parameter raises appropriate error."""
         with pytest.raises(TypeError, match="missing 1 required keyword-only argument: 'endpoint'"):
             OTLPSpanAdapterExporter()  # pylint: disable=missing-kwoa # type: ignore[call-arg]
 
-    @patch('aiq.plugins.opentelemetry.mixin.otlp_span_exporter_mixin.OTLPSpanExporter')
-    async def test_resource_attributes_applied_to_spans(self,
-                                                        mock_otlp_exporter_class,
-                                                        basic_exporter_config,
-                                                        mock_otel_span):
+    @patch.object(OTLPExportWorker, '_send_spans')
+    async def test_resource_attributes_applied_to_spans(self, mock_send_spans, basic_exporter_config, mock_otel_span):
         """Test that resource attributes are properly applied to spans before export."""
-        # Setup mock
-        mock_otlp_exporter = Mock()
-        mock_otlp_exporter.export = Mock()
-        mock_otlp_exporter_class.return_value = mock_otlp_exporter
-
         resource_attributes = {"service.name": "test-service"}
         exporter = OTLPSpanAdapterExporter(endpoint=basic_exporter_config["endpoint"],
                                            resource_attributes=resource_attributes)
 
         # Test export_processed method (which sets resource attributes)
         await exporter.export_processed(mock_otel_span)
+        await exporter._wait_for_tasks()
 
         # Verify resource was set on the span
         mock_otel_span.set_resource.assert_called_once_with(exporter._resource)
 
         # Verify export was called
-        mock_otlp_exporter.export.assert_called_once()
+        mock_send_spans.assert_called_once()
@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+from unittest.mock import Mock
+
+import pytest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+
+from aiq.plugins.opentelemetry.mixin.otlp_export_config_mixin import OTLPExportConfig
+from aiq.plugins.opentelemetry.otel_span import OtelSpan
+from aiq.plugins.opentelemetry.otlp_export_worker import OTLPExportWorker
+
+# A port nothing listens on
+UNREACHABLE_ENDPOINT = "http://127.0.0.1:9/v1/traces"
+
+
+def create_spans(count: int, prefix: str = "span") -> list[OtelSpan]:
+    now = time.time_ns()
+    return [OtelSpan(name=f"{prefix}_{i}", context=None, start_time=now, end_time=now + 1000) for i in range(count)]
+
+
+@pytest.fixture(name="collector")
+def collector_fixture():
+    """
+    A local OTLP/HTTP collector recording the span names of the requests it accepts. It answers the first requests with
+    the status codes appended to its list of failures.
+    """
+    received: list[str] = []
+    failures: list[int] = []
+
+    class _Handler(BaseHTTPRequestHandler):
+
+        def do_POST(self):  # pylint: disable=invalid-name
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            status = failures.pop(0) if failures else 200
+
+            if status == 200:
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+
+                request = ExportTraceServiceRequest.FromString(body)
+                for resource_spans in request.resource_spans:
+                    for scope_spans in resource_spans.scope_spans:
+                        received.extend(span.name for span in scope_spans.spans)
+
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_port}/v1/traces", received, failures
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_export_runs_on_worker_thread(collector):
+    endpoint, received, _ = collector
+    worker = OTLPExportWorker(endpoint=endpoint)
+
+    threads = []
+    send_payload = worker._send_payload
+
+    def record_thread(*args):
+        threads.append(threading.current_thread())
+        send_payload(*args)
+
+    worker._send_payload = Mock(side_effect=record_thread)
+
+    worker.submit(create_spans(2))
+
+    assert worker.wait_idle(timeout=5)
+    assert received == ["span_0", "span_1"]
+    assert threads[0] is not threading.current_thread()
+
+    stats = worker.stats()
+    assert stats.exported_spans == 2
+    assert stats.pending_batches == 0
+    worker.shutdown()
+
+
+def test_uncompressed_export(collector):
+    endpoint, received, _ = collector
+    worker = OTLPExportWorker(endpoint=endpoint, config=OTLPExportConfig(compression="none"))
+
+    worker.submit(create_spans(1))
+    assert worker.wait_idle(timeout=5)
+    worker.shutdown()
+
+    assert received == ["span_0"]
+
+
+def test_failed_batch_is_spilled_and_replayed(tmp_path, collector):
+    endpoint, received, failures = collector
+    config = OTLPExportConfig(max_retries=1, retry_backoff=0.01, spill_dir=tmp_path)
+    failures.extend([503, 503])
+
+    worker = OTLPExportWorker(endpoint=endpoint, config=config)
+    worker.submit(create_spans(3))
+    assert worker.wait_idle(timeout=5)
+    worker.shutdown(timeout=0)
+
+    stats = worker.stats()
+    assert stats.failed_attempts == 2
+    assert stats.spilled_spans == 3
+    assert stats.spilled_batches == 1
+    assert stats.dropped_spans == 0
+    assert len(list(tmp_path.glob("*.otlp.gz"))) == 1
+    assert not received
+
+    # A new process replays the spilled batch as soon as it starts
+    worker = OTLPExportWorker(endpoint=endpoint, config=config)
+    deadline = time.monotonic() + 5
+    while worker.stats().spilled_batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    worker.shutdown()
+
+    assert received == ["span_0", "span_1", "span_2"]
+    assert worker.stats().replayed_spans == 3
+    assert not list(tmp_path.glob("*.otlp.gz"))
+
+
+def test_transient_failure_is_retried(collector):
+    endpoint, received, failures = collector
+    failures.append(429)
+
+    worker = OTLPExportWorker(endpoint=endpoint, config=OTLPExportConfig(max_retries=1, retry_backoff=0.01))
+    worker.submit(create_spans(1))
+    assert worker.wait_idle(timeout=5)
+    worker.shutdown()
+
+    stats = worker.stats()
+    assert received == ["span_0"]
+    assert stats.failed_attempts == 1
+    assert stats.exported_spans == 1
+
+
+def test_rejected_batch_is_dropped_without_retries(tmp_path, collector):
+    endpoint, received, failures = collector
+    failures.append(400)
+
+    worker = OTLPExportWorker(endpoint=endpoint,
+                              config=OTLPExportConfig(max_retries=3, max_retry_backoff=60, spill_dir=tmp_path))
+    worker.submit(create_spans(2, prefix="rejected"))
+    assert worker.wait_idle(timeout=5)
+
+    # The collector is not considered down, the next batch is exported right away
+    worker.submit(create_spans(1))
+    assert worker.wait_idle(timeout=5)
+    worker.shutdown()
+
+    stats = worker.stats()
+    assert received == ["span_0"]
+    assert not failures
+    assert stats.failed_attempts == 0
+    assert stats.dropped_spans == 2
+    assert stats.spilled_spans == 0
+    assert stats.exported_spans == 1
+
+
+def test_batches_are_dropped_without_spill_dir():
+    worker = OTLPExportWorker(endpoint=UNREACHABLE_ENDPOINT,
+                              config=OTLPExportConfig(max_retries=0, max_retry_backoff=60))
+    worker.submit(create_spans(1))
+    assert worker.wait_idle(timeout=5)
+
+    # The collector is considered down, the next batches wait for it in memory
+    worker.submit(create_spans(2))
+    assert not worker.wait_idle(timeout=0.1)
+    assert worker.stats().failed_attempts == 1
+
+    worker.shutdown(timeout=0)
+    assert worker.stats().dropped_spans == 3
+
+
+def test_oldest_batches_are_dropped_when_pending_batches_overflow():
+    release = threading.Event()
+
+    worker = OTLPExportWorker(endpoint=UNREACHABLE_ENDPOINT, config=OTLPExportConfig(max_pending_batches=2))
+    worker._send_spans = Mock(side_effect=lambda spans: release.wait(5))
+    for _ in range(5):
+        worker.submit(create_spans(1))
+
+    release.set()
+    assert worker.wait_idle(timeout=5)
+    worker.shutdown()
+
+    stats = worker.stats()
+    assert stats.exported_spans + stats.dropped_spans == 5
+    assert stats.dropped_spans >= 2
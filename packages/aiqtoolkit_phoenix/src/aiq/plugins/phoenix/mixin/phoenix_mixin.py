@@ -13,17 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import logging
-
 from phoenix.otel import HTTPSpanExporter
 from phoenix.trace.projects import using_project
 
-from aiq.plugins.opentelemetry.otel_span import OtelSpan
-
-logger = logging.getLogger(__name__)
+from aiq.plugins.opentelemetry.mixin.otlp_export_config_mixin import OTLPExportConfig
+from aiq.plugins.opentelemetry.mixin.otlp_export_worker_mixin import OTLPExportWorkerMixin
+from aiq.plugins.opentelemetry.otlp_export_worker import OTLPExportWorker
 
 
-class PhoenixMixin:
+class PhoenixMixin(OTLPExportWorkerMixin):
     """Mixin for Phoenix exporters.
 
     This mixin provides Phoenix-specific functionality for OpenTelemetry span exporters.
@@ -32,7 +30,8 @@ class PhoenixMixin:
     Key Features:
     - Automatic Phoenix project name injection into resource attributes
     - Phoenix project scoping via using_project() context manager
-    - Integration with Phoenix's HTTPSpanExporter for telemetry transmission
+    - Endpoint and authentication headers resolved by Phoenix's HTTPSpanExporter
+    - Export from a worker thread, with retries and an optional on-disk spill queue (see OTLPExportWorker)
 
     This mixin is designed to be used with OtelSpanExporter as a base class:
 
@@ -42,33 +41,27 @@ class PhoenixMixin:
                 super().__init__(endpoint=endpoint, project=project, **kwargs)
     """
 
-    def __init__(self, *args, endpoint: str, project: str, **kwargs):
+    def __init__(self, *args, endpoint: str, project: str, export_config: OTLPExportConfig | None = None, **kwargs):
         """Initialize the Phoenix exporter.
 
         Args:
             endpoint: Phoenix service endpoint URL.
             project: Phoenix project name for trace grouping.
+            export_config: Settings of the export worker, retries and spilling.
         """
-        self._exporter = HTTPSpanExporter(endpoint=endpoint)
         self._project = project
 
+        # The Phoenix exporter resolves the endpoint and the headers, including the authentication header of
+        # PHOENIX_API_KEY, the worker sends the spans with them
+        exporter = HTTPSpanExporter(endpoint=endpoint)
+        self._export_worker = OTLPExportWorker(
+            endpoint=exporter._endpoint,  # pylint: disable=protected-access
+            headers=exporter._headers,  # pylint: disable=protected-access
+            config=export_config,
+            export_context=lambda: using_project(project))
+
         # Add Phoenix project name to resource attributes
         kwargs.setdefault('resource_attributes', {})
         kwargs['resource_attributes'].update({'openinference.project.name': project})
 
         super().__init__(*args, **kwargs)
-
-    async def export_otel_spans(self, spans: list[OtelSpan]) -> None:
-        """Export a list of OtelSpans using the Phoenix exporter.
-
-        Args:
-            spans (list[OtelSpan]): The list of spans to export.
-
-        Raises:
-            Exception: If there's an error during span export (logged but not re-raised).
-        """
-        try:
-            with using_project(self._project):
-                self._exporter.export(spans)  # type: ignore
-        except Exception as e:
-            logger.error("Error exporting spans: %s", e, exc_info=True)
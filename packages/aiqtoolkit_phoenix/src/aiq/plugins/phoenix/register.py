@@ -22,11 +22,16 @@ from aiq.cli.register_workflow import register_telemetry_exporter
 from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
 from aiq.observability.mixin.batch_config_mixin import BatchConfigMixin
 from aiq.observability.mixin.collector_config_mixin import CollectorConfigMixin
+from aiq.plugins.opentelemetry.mixin.otlp_export_config_mixin import OTLPExportConfigMixin
 
 logger = logging.getLogger(__name__)
 
 
-class PhoenixTelemetryExporter(BatchConfigMixin, CollectorConfigMixin, TelemetryExporterBaseConfig, name="phoenix"):
+class PhoenixTelemetryExporter(BatchConfigMixin,
+                               CollectorConfigMixin,
+                               OTLPExportConfigMixin,
+                               TelemetryExporterBaseConfig,
+                               name="phoenix"):
     """A telemetry exporter to transmit traces to externally hosted phoenix service."""
 
     endpoint: str = Field(
@@ -47,7 +52,8 @@ async def phoenix_telemetry_exporter(config: PhoenixTelemetryExporter, builder:
                                   flush_interval=config.flush_interval,
                                   max_queue_size=config.max_queue_size,
                                   drop_on_overflow=config.drop_on_overflow,
-                                  shutdown_timeout=config.shutdown_timeout)
+                                  shutdown_timeout=config.shutdown_timeout,
+                                  export_config=config.otlp_export)
 
     except ConnectionError as ex:
         logger.warning("Unable to connect to Phoenix at port 6006. Are you sure Phoenix is running?\n %s",
@@ -30,6 +30,9 @@ class RedisMemoryClientConfig(MemoryBaseConfig, name="redis_memory"):
     key_prefix: str | None = Field(default="aiq", description="Key prefix to use for redis keys")
     embedder: EmbedderRef = Field(description=("Instance name of the memory client instance from the workflow "
                                                "configuration object."))
+    batch_size: int = Field(default=64, gt=0, description="Number of memory items embedded and written per pipeline")
+    max_concurrency: int = Field(default=4, gt=0, description="Maximum number of batches written concurrently")
+    verify_writes: bool = Field(default=False, description="Read back every stored memory item to verify the write")
 
 
 @register_memory(config_type=RedisMemoryClientConfig)
@@ -52,6 +55,11 @@ async def redis_memory_client(config: RedisMemoryClientConfig, builder: Builder)
     embedding_dim = len(test_embedding)
     await ensure_index_exists(client=redis_client, key_prefix=config.key_prefix, embedding_dim=embedding_dim)
 
-    memory_editor = RedisEditor(redis_client=redis_client, key_prefix=config.key_prefix, embedder=embedder)
+    memory_editor = RedisEditor(redis_client=redis_client,
+                                key_prefix=config.key_prefix,
+                                embedder=embedder,
+                                batch_size=config.batch_size,
+                                max_concurrency=config.max_concurrency,
+                                verify_writes=config.verify_writes)
 
     yield memory_editor
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 import secrets
 
@@ -35,7 +36,13 @@ class RedisEditor(MemoryEditor):
     Wrapper class that implements AIQ Toolkit Interfaces for Redis memory storage.
     """
 
-    def __init__(self, redis_client: redis.Redis, key_prefix: str, embedder: Embeddings):
+    def __init__(self,
+                 redis_client: redis.Redis,
+                 key_prefix: str,
+                 embedder: Embeddings,
+                 batch_size: int = 64,
+                 max_concurrency: int = 4,
+                 verify_writes: bool = False):
         """
         Initialize Redis client for memory storage.
 
@@ -43,64 +50,102 @@ class RedisEditor(MemoryEditor):
             redis_client: (redis.Redis) Redis client
             key_prefix: (str) Redis key prefix
             embedder: (Embeddings) Embedder for semantic search functionality
+            batch_size: (int) Number of items embedded and written per pipeline
+            max_concurrency: (int) Maximum number of batches in flight at once
+            verify_writes: (bool) Read back every stored item to verify the write
         """
 
         self._client: redis.Redis = redis_client
         self._key_prefix: str = key_prefix
         self._embedder: Embeddings = embedder
+        self._batch_size: int = max(batch_size, 1)
+        self._max_concurrency: int = max(max_concurrency, 1)
+        self._verify_writes: bool = verify_writes
 
     async def add_items(self, items: list[MemoryItem]) -> None:
         """
         Insert Multiple MemoryItems into Redis.
         Each MemoryItem is stored with its metadata and tags.
+
+        Items are processed in batches: the memory texts of a batch are embedded with a single call to the embedder and
+        the batch is written through a non-transactional pipeline, at most `max_concurrency` batches at a time.
         """
         logger.debug(f"Attempting to add {len(items)} items to Redis")
 
-        for memory_item in items:
-            item_meta = memory_item.metadata
-            conversation = memory_item.conversation
-            user_id = memory_item.user_id
-            tags = memory_item.tags
-            memory_id = secrets.token_hex(4)  # e.g. 02ba3fe9
-
-            # Create a unique key for this memory item
-            memory_key = f"{self._key_prefix}:memory:{memory_id}"
-            logger.debug(f"Generated memory key: {memory_key}")
-
-            # Prepare memory data
-            memory_data = {
-                "conversation": conversation,
-                "user_id": user_id,
-                "tags": tags,
-                "metadata": item_meta,
-                "memory": memory_item.memory or ""
-            }
-            logger.debug(f"Prepared memory data for key {memory_key}")
-
-            # If we have memory, compute and store the embedding
-            if memory_item.memory:
-                logger.debug("Computing embedding for memory text")
-                search_vector = await self._embedder.aembed_query(memory_item.memory)
-                logger.debug(f"Generated embedding vector of length: {len(search_vector)}")
-                memory_data["embedding"] = search_vector
+        if not items:
+            return
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        batches = [items[i:i + self._batch_size] for i in range(0, len(items), self._batch_size)]
+
+        await asyncio.gather(*(self._add_batch(batch, semaphore) for batch in batches))
+
+    async def _add_batch(self, batch: list[MemoryItem], semaphore: asyncio.Semaphore) -> None:
+        """
+        Embed and store a single batch of MemoryItems.
+        """
+        async with semaphore:
+            # Only items with a memory text are embedded
+            texts = [memory_item.memory for memory_item in batch if memory_item.memory]
+            embeddings = iter(await self._embedder.aembed_documents(texts) if texts else [])
+            logger.debug(f"Computed {len(texts)} embeddings for a batch of {len(batch)} items")
+
+            pipe = self._client.pipeline(transaction=False)
+            memory_keys = []
+
+            for memory_item in batch:
+                memory_id = secrets.token_hex(4)  # e.g. 02ba3fe9
+
+                # Create a unique key for this memory item
+                memory_key = f"{self._key_prefix}:memory:{memory_id}"
+
+                # Prepare memory data
+                memory_data = {
+                    "conversation": memory_item.conversation,
+                    "user_id": memory_item.user_id,
+                    "tags": memory_item.tags,
+                    "metadata": memory_item.metadata,
+                    "memory": memory_item.memory or ""
+                }
+
+                if memory_item.memory:
+                    memory_data["embedding"] = next(embeddings)
+
+                pipe.json().set(memory_key, "$", memory_data)
+                memory_keys.append(memory_key)
 
             try:
-                # Store as JSON in Redis
-                logger.debug(f"Attempting to store memory data in Redis for key: {memory_key}")
-                await self._client.json().set(memory_key, "$", memory_data)
-                logger.debug(f"Successfully stored memory data for key: {memory_key}")
+                # Store as JSON in Redis, in a single round trip for the whole batch
+                logger.debug(f"Attempting to store {len(memory_keys)} memory items in Redis")
+                await pipe.execute()
+                logger.debug(f"Successfully stored {len(memory_keys)} memory items")
 
-                # Verify the data was stored
-                stored_data = await self._client.json().get(memory_key)
-                logger.debug(f"Verified data storage for key {memory_key}: {bool(stored_data)}")
+                if self._verify_writes:
+                    await self._verify_batch(memory_keys)
 
             except redis_exceptions.ResponseError as e:
-                logger.error(f"Failed to store memory item: {str(e)}")
+                logger.error(f"Failed to store memory items: {str(e)}")
                 raise
             except redis_exceptions.ConnectionError as e:
-                logger.error(f"Redis connection error while storing memory item: {str(e)}")
+                logger.error(f"Redis connection error while storing memory items: {str(e)}")
                 raise
 
+    async def _verify_batch(self, memory_keys: list[str]) -> None:
+        """
+        Read back the given keys in a single pipeline and log any which were not stored.
+        """
+        pipe = self._client.pipeline(transaction=False)
+        for memory_key in memory_keys:
+            pipe.json().get(memory_key)
+
+        stored_data = await pipe.execute()
+
+        missing_keys = [key for key, data in zip(memory_keys, stored_data) if not data]
+        if missing_keys:
+            logger.warning(f"Failed to verify data storage for keys: {missing_keys}")
+        else:
+            logger.debug(f"Verified data storage for {len(memory_keys)} keys")
+
     async def search(self, query: str, top_k: int = 5, **kwargs) -> list[MemoryItem]:
         """
         Retrieve items relevant to the given query.
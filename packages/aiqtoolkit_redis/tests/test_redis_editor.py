@@ -48,13 +48,17 @@ def mock_redis_client_fixture() -> AsyncMock:
     """Fixture to provide a mocked AsyncMemoryClient."""
     mock_client = AsyncMock()
 
-    # Create a mock for the JSON commands
-    mock_json = AsyncMock()
-    mock_json.set = AsyncMock()
-    mock_json.get = AsyncMock()
+    # Create a mock for the JSON commands, these are queued on a pipeline rather than awaited
+    mock_json = MagicMock()
 
-    # Set up the json() method to return our mock
+    # Create a mock for the pipeline sharing the JSON commands mock
+    mock_pipeline = MagicMock()
+    mock_pipeline.json = MagicMock(return_value=mock_json)
+    mock_pipeline.execute = AsyncMock(return_value=[])
+
+    # Set up the json() and pipeline() methods to return our mocks
     mock_client.json = MagicMock(return_value=mock_json)
+    mock_client.pipeline = MagicMock(return_value=mock_pipeline)
 
     return mock_client
 
@@ -121,6 +125,46 @@ async def test_add_items_success(redis_editor: RedisEditor,
     assert memory_data["memory"] == sample_memory_item.memory
 
 
+async def test_add_items_batched(mock_redis_client: AsyncMock, sample_memory_item: MemoryItem):
+    """Test that items are embedded in batches and written through one pipeline per batch."""
+    embedder = TestEmbeddings()
+    embedder.aembed_documents = AsyncMock(side_effect=lambda texts: embedder.embed_documents(texts))
+    embedder.aembed_query = AsyncMock()
+
+    editor = RedisEditor(redis_client=mock_redis_client, key_prefix="pytest", embedder=embedder, batch_size=2)
+
+    items = [sample_memory_item.model_copy(update={"memory": f"Sample memory {i}"}) for i in range(5)]
+    items.append(sample_memory_item.model_copy(update={"memory": None}))
+    await editor.add_items(items)
+
+    # 6 items in batches of 2, items without a memory text are not embedded
+    assert embedder.aembed_documents.await_count == 3
+    embedder.aembed_query.assert_not_called()
+    assert mock_redis_client.pipeline.call_count == 3
+    mock_redis_client.pipeline.assert_called_with(transaction=False)
+    assert mock_redis_client.pipeline().execute.await_count == 3
+
+    stored = [call.args[2] for call in mock_redis_client.json().set.call_args_list]
+    assert sorted(data["memory"] for data in stored) == sorted(item.memory or "" for item in items)
+    assert all(("embedding" in data) == bool(data["memory"]) for data in stored)
+
+    # Verification is disabled by default
+    mock_redis_client.json().get.assert_not_called()
+
+
+async def test_add_items_verify_writes(mock_redis_client: AsyncMock, sample_memory_item: MemoryItem):
+    """Test that stored items are read back when write verification is enabled."""
+    editor = RedisEditor(redis_client=mock_redis_client,
+                         key_prefix="pytest",
+                         embedder=TestEmbeddings(),
+                         verify_writes=True)
+
+    await editor.add_items([sample_memory_item, sample_memory_item])
+
+    assert mock_redis_client.json().get.call_count == 2
+    assert mock_redis_client.pipeline().execute.await_count == 2
+
+
 async def test_add_items_empty_list(redis_editor: RedisEditor, mock_redis_client: AsyncMock):
     """Test adding an empty list of MemoryItem objects."""
     await redis_editor.add_items([])
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from pydantic import Field
+
 from aiq.builder.builder import Builder
 from aiq.cli.register_workflow import register_object_store
 from aiq.data_models.object_store import ObjectStoreBaseConfig
@@ -24,6 +26,14 @@ class S3ObjectStoreClientConfig(ObjectStoreBaseConfig, name="s3"):
     access_key: str | None = None
     secret_key: str | None = None
     region: str | None = None
+    part_size: int = Field(default=8 * 1024 * 1024,
+                           ge=5 * 1024 * 1024,
+                           description="Size of the parts of multipart uploads and of the ranges of concurrent "
+                           "downloads, in bytes. Objects larger than a part are uploaded in parts.")
+    max_concurrency: int = Field(default=4,
+                                 gt=0,
+                                 description="Maximum number of parts uploaded or ranges downloaded concurrently for "
+                                 "an object. Streamed transfers buffer about `max_concurrency + 2` parts in memory.")
 
 
 @register_object_store(config_type=S3ObjectStoreClientConfig)
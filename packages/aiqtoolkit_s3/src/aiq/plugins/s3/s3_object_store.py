@@ -13,7 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import logging
 import os
+from collections import deque
+from collections.abc import AsyncIterator
 
 import aioboto3
 from botocore.client import BaseClient
@@ -21,14 +25,43 @@ from botocore.exceptions import ClientError
 
 from aiq.data_models.object_store import KeyAlreadyExistsError
 from aiq.data_models.object_store import NoSuchKeyError
+from aiq.object_store.interfaces import DEFAULT_CHUNK_SIZE
 from aiq.object_store.interfaces import ObjectStore
 from aiq.object_store.models import ObjectStoreItem
+from aiq.object_store.models import ObjectStoreStreamItem
 from aiq.plugins.s3.object_store import S3ObjectStoreClientConfig
 
+logger = logging.getLogger(__name__)
+
+
+def _status_code(error: ClientError) -> int | None:
+    return error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", None)
+
+
+async def _read_parts(chunks: AsyncIterator[bytes], part_size: int) -> AsyncIterator[bytes]:
+    """Regroup chunks of any size into parts of `part_size` bytes, the last part may be smaller."""
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= part_size:
+            yield bytes(buffer[:part_size])
+            del buffer[:part_size]
+
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _split_parts(data: bytes, part_size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), part_size):
+        yield data[start:start + part_size]
+
 
 class S3ObjectStore(ObjectStore):
     """
     S3ObjectStore is an ObjectStore implementation that uses S3 as the underlying storage.
+
+    Objects larger than a part are uploaded with multipart uploads, and streamed reads download ranges of the object
+    concurrently. At most `max_concurrency` parts or ranges are transferred at once for an object.
     """
 
     def __init__(self, config: S3ObjectStoreClientConfig):
@@ -40,6 +73,9 @@ class S3ObjectStore(ObjectStore):
         self._client: BaseClient | None = None
         self._client_context = None
 
+        self._part_size = config.part_size
+        self._max_concurrency = config.max_concurrency
+
         access_key = config.access_key or os.environ.get("AIQ_S3_OBJECT_STORE_ACCESS_KEY")
         if not access_key:
             raise ValueError("Access key is not set. "
@@ -88,6 +124,14 @@ class S3ObjectStore(ObjectStore):
         if self._client is None:
             raise RuntimeError("Connection not established")
 
+        if len(item.data) > self._part_size:
+            await self._upload_parts(key,
+                                     _split_parts(item.data, self._part_size),
+                                     item.content_type,
+                                     item.metadata,
+                                     overwrite=False)
+            return
+
         put_args = {
             "Bucket": self.bucket_name,
             "Key": key,
@@ -119,6 +163,14 @@ class S3ObjectStore(ObjectStore):
         if self._client is None:
             raise RuntimeError("Connection not established")
 
+        if len(item.data) > self._part_size:
+            await self._upload_parts(key,
+                                     _split_parts(item.data, self._part_size),
+                                     item.content_type,
+                                     item.metadata,
+                                     overwrite=True)
+            return
+
         put_args = {
             "Bucket": self.bucket_name,
             "Key": key,
@@ -132,6 +184,124 @@ class S3ObjectStore(ObjectStore):
 
         await self._client.put_object(**put_args)
 
+    async def put_object_stream(self, key: str, item: ObjectStoreStreamItem) -> None:
+        await self._upload_stream(key, item, overwrite=False)
+
+    async def upsert_object_stream(self, key: str, item: ObjectStoreStreamItem) -> None:
+        await self._upload_stream(key, item, overwrite=True)
+
+    async def _upload_stream(self, key: str, item: ObjectStoreStreamItem, overwrite: bool) -> None:
+
+        if self._client is None:
+            raise RuntimeError("Connection not established")
+
+        parts = _read_parts(item.chunks, self._part_size)
+        first_part = await anext(parts, b"")
+        second_part = await anext(parts, None)
+
+        if second_part is None:
+            # Objects of a single part are uploaded with a single request
+            single_item = ObjectStoreItem(data=first_part, content_type=item.content_type, metadata=item.metadata)
+            if overwrite:
+                await self.upsert_object(key, single_item)
+            else:
+                await self.put_object(key, single_item)
+            return
+
+        async def all_parts():
+            yield first_part
+            yield second_part
+            async for part in parts:
+                yield part
+
+        await self._upload_parts(key, all_parts(), item.content_type, item.metadata, overwrite)
+
+    async def _exists(self, key: str) -> bool:
+        try:
+            await self._client.head_object(Bucket=self.bucket_name, Key=key)
+            return True
+        except ClientError as e:
+            if _status_code(e) == 404:
+                return False
+            raise
+
+    async def _upload_parts(self,
+                            key: str,
+                            parts: AsyncIterator[bytes],
+                            content_type: str | None,
+                            metadata: dict[str, str] | None,
+                            overwrite: bool) -> None:
+        """
+        Upload an object with a multipart upload, with at most `max_concurrency` parts uploaded at once. The next part
+        is read only when an upload slot is free, which bounds the memory used by the upload.
+        """
+        if not overwrite and await self._exists(key):
+            # Checked before uploading the parts, the upload is only completed if the key still does not exist
+            raise KeyAlreadyExistsError(key=key,
+                                        additional_message=f"S3 object {self.bucket_name}/{key} already exists")
+
+        create_args = {"Bucket": self.bucket_name, "Key": key}
+        if content_type:
+            create_args["ContentType"] = content_type
+
+        if metadata:
+            create_args["Metadata"] = metadata
+
+        upload_id = (await self._client.create_multipart_upload(**create_args))["UploadId"]
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        tasks: list[asyncio.Task] = []
+        errors: list[Exception] = []
+
+        async def upload_part(part_number: int, data: bytes) -> dict:
+            try:
+                response = await self._client.upload_part(Bucket=self.bucket_name,
+                                                          Key=key,
+                                                          UploadId=upload_id,
+                                                          PartNumber=part_number,
+                                                          Body=data)
+                return {"ETag": response["ETag"], "PartNumber": part_number}
+            except Exception as e:
+                errors.append(e)
+                raise
+            finally:
+                semaphore.release()
+
+        try:
+            async for data in parts:
+                await semaphore.acquire()
+
+                # Stop reading the parts as soon as an upload fails
+                if errors:
+                    raise errors[0]
+
+                tasks.append(asyncio.create_task(upload_part(len(tasks) + 1, data)))
+
+            completed_parts = await asyncio.gather(*tasks)
+
+            complete_args = {} if overwrite else {"IfNoneMatch": "*"}
+            try:
+                await self._client.complete_multipart_upload(Bucket=self.bucket_name,
+                                                             Key=key,
+                                                             UploadId=upload_id,
+                                                             MultipartUpload={"Parts": completed_parts},
+                                                             **complete_args)
+            except ClientError as e:
+                if _status_code(e) == 412:
+                    raise KeyAlreadyExistsError(
+                        key=key, additional_message=f"S3 object {self.bucket_name}/{key} already exists") from e
+                raise
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            try:
+                await self._client.abort_multipart_upload(Bucket=self.bucket_name, Key=key, UploadId=upload_id)
+            except ClientError as e:
+                logger.warning("Failed to abort the multipart upload of S3 object %s/%s: %s", self.bucket_name, key, e)
+            raise
+
     async def get_object(self, key: str) -> ObjectStoreItem:
         if self._client is None:
             raise RuntimeError("Connection not established")
@@ -162,3 +332,55 @@ class S3ObjectStore(ObjectStore):
 
         if results.get('DeleteMarker', False):
             raise NoSuchKeyError(key, "Object was a delete marker")
+
+    async def get_object_stream(self, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ObjectStoreStreamItem:
+        if self._client is None:
+            raise RuntimeError("Connection not established")
+
+        try:
+            head = await self._client.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if _status_code(e) == 404:
+                raise NoSuchKeyError(key, str(e))
+            raise
+
+        size = head["ContentLength"]
+        return ObjectStoreStreamItem(chunks=self._read_ranges(key, head["ETag"], size, chunk_size),
+                                     content_type=head.get("ContentType"),
+                                     metadata=head.get("Metadata"),
+                                     size=size)
+
+    async def _read_range(self, key: str, etag: str, start: int, end: int) -> bytes:
+        # Matching the ETag makes the read fail, rather than mix two versions of an object updated during the download
+        response = await self._client.get_object(Bucket=self.bucket_name,
+                                                 Key=key,
+                                                 Range=f"bytes={start}-{end}",
+                                                 IfMatch=etag)
+        return await response["Body"].read()
+
+    async def _read_ranges(self, key: str, etag: str, size: int, chunk_size: int) -> AsyncIterator[bytes]:
+        """
+        Download an object in ranges of `chunk_size` bytes, with at most `max_concurrency` ranges downloaded at once,
+        yielding them in order.
+        """
+        starts = iter(range(0, size, chunk_size))
+        pending: deque[asyncio.Task] = deque()
+
+        def download_next():
+            start = next(starts, None)
+            if start is not None:
+                end = min(start + chunk_size, size) - 1
+                pending.append(asyncio.create_task(self._read_range(key, etag, start, end)))
+
+        try:
+            for _ in range(self._max_concurrency):
+                download_next()
+
+            while pending:
+                chunk = await pending.popleft()
+                download_next()
+                yield chunk
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -13,11 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import uuid
 from contextlib import asynccontextmanager
 
 import pytest
 
 from aiq.builder.workflow_builder import WorkflowBuilder
+from aiq.data_models.object_store import KeyAlreadyExistsError
+from aiq.object_store.interfaces import ObjectStore
+from aiq.object_store.models import ObjectStoreStreamItem
 from aiq.plugins.s3.object_store import S3ObjectStoreClientConfig
 from aiq.test.object_store_tests import ObjectStoreTests
 
@@ -38,6 +42,29 @@ class TestS3ObjectStore(ObjectStoreTests):
                 S3ObjectStoreClientConfig(bucket_name="test",
                                           endpoint_url="http://localhost:9000",
                                           access_key="minioadmin",
-                                          secret_key="minioadmin"))
+                                          secret_key="minioadmin",
+                                          part_size=5 * 1024 * 1024))
 
             yield await builder.get_object_store_client("object_store_name")
+
+    async def test_multipart_stream(self, store: ObjectStore):
+
+        key = f"test_key_{uuid.uuid4()}"
+        size = 12 * 1024 * 1024 + 1
+
+        async def chunks():
+            for start in range(0, size, 1000000):
+                yield bytes([start % 251]) * min(1000000, size - start)
+
+        data = b"".join([chunk async for chunk in chunks()])
+
+        # Larger than two parts, uploaded with a multipart upload
+        await store.put_object_stream(key, ObjectStoreStreamItem(chunks=chunks(), content_type="text/plain"))
+
+        with pytest.raises(KeyAlreadyExistsError):
+            await store.put_object_stream(key, ObjectStoreStreamItem(chunks=chunks()))
+
+        stream = await store.get_object_stream(key, chunk_size=3 * 1024 * 1024)
+        assert stream.size == size
+        assert stream.content_type == "text/plain"
+        assert b"".join([chunk async for chunk in stream.chunks]) == data
@@ -19,6 +19,7 @@ from aiq.cli.register_workflow import register_llm_client
 from aiq.data_models.retry_mixin import RetryMixin
 from aiq.llm.openai_llm import OpenAIModelConfig
 from aiq.utils.exception_handlers.automatic_retries import patch_with_retry
+from aiq.utils.exception_handlers.rate_limiter import get_rate_limiter
 
 
 @register_llm_client(config_type=OpenAIModelConfig, wrapper_type=LLMFrameworkEnum.SEMANTIC_KERNEL)
@@ -36,6 +37,7 @@ async def openai_semantic_kernel(llm_config: OpenAIModelConfig, builder: Builder
         llm = patch_with_retry(llm,
                                retries=llm_config.num_retries,
                                retry_codes=llm_config.retry_on_status_codes,
-                               retry_on_messages=llm_config.retry_on_errors)
+                               retry_on_messages=llm_config.retry_on_errors,
+                               rate_limiter=get_rate_limiter(llm_config))
 
     yield llm
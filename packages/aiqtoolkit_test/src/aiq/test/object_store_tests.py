@@ -115,3 +115,57 @@ class ObjectStoreTests:
         # Try to delete the object again
         with pytest.raises(NoSuchKeyError):
             await store.delete_object(key)
+
+    async def test_put_and_get_objects(self, store: ObjectStore):
+
+        items = {}
+        for i in range(5):
+            items[f"test_key_{uuid.uuid4()}"] = ObjectStoreItem(data=bytes(range(256)) * i,
+                                                                content_type="application/octet-stream",
+                                                                metadata={"index": str(i)})
+        await store.put_objects(items)
+
+        retrieved_items = await store.get_objects(list(items))
+        assert retrieved_items == items
+
+        # Try to put a batch with an existing key
+        new_key = f"test_key_{uuid.uuid4()}"
+        with pytest.raises(KeyAlreadyExistsError):
+            await store.put_objects({new_key: ObjectStoreItem(data=b"new_value"), **items})
+
+        # Try to get objects when one of them doesn't exist
+        with pytest.raises(NoSuchKeyError):
+            await store.get_objects([*items, f"test_key_{uuid.uuid4()}"])
+
+    async def test_delete_objects(self, store: ObjectStore):
+
+        items = {f"test_key_{uuid.uuid4()}": ObjectStoreItem(data=b"test_value") for _ in range(3)}
+        await store.put_objects(items)
+
+        await store.delete_objects(list(items))
+
+        for key in items:
+            with pytest.raises(NoSuchKeyError):
+                await store.get_object(key)
+
+        # Try to delete the objects again
+        with pytest.raises(NoSuchKeyError):
+            await store.delete_objects(list(items))
+
+    async def test_get_object_stream(self, store: ObjectStore):
+
+        key = f"test_key_{uuid.uuid4()}"
+
+        initial_item = ObjectStoreItem(data=bytes(range(256)) * 1000, content_type="text/plain", metadata={"k": "v"})
+        await store.put_object(key, initial_item)
+
+        stream = await store.get_object_stream(key, chunk_size=10000)
+        chunks = [chunk async for chunk in stream.chunks]
+
+        assert all(len(chunk) <= 10000 for chunk in chunks)
+        assert b"".join(chunks) == initial_item.data
+        assert stream.content_type == initial_item.content_type
+        assert stream.metadata == initial_item.metadata
+
+        with pytest.raises(NoSuchKeyError):
+            await store.get_object_stream(f"test_key_{uuid.uuid4()}")
@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Scaling benchmark for the nested stack and concurrency spike analyses of the profiler.
+
+Each synthetic example is a workflow function running a mix of sequential and concurrent LLM and tool calls, so that
+the call trees are nested and calls from different examples overlap in time.
+"""
+
+import random
+import time
+import uuid
+
+import click
+
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import UsageInfo
+from aiq.data_models.invocation_node import InvocationNode
+from aiq.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+from aiq.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import multi_example_call_profiling
+from aiq.profiler.inference_optimization.experimental.concurrency_spike_analysis import concurrency_spike_analysis
+from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
+
+_START_END = {
+    "FUNCTION": (IntermediateStepType.FUNCTION_START, IntermediateStepType.FUNCTION_END),
+    "LLM": (IntermediateStepType.LLM_START, IntermediateStepType.LLM_END),
+    "TOOL": (IntermediateStepType.TOOL_START, IntermediateStepType.TOOL_END),
+}
+
+
+def _step(event_type: IntermediateStepType, name: str, step_uuid: str, timestamp: float,
+          usage: UsageInfo | None) -> IntermediatePropertyAdaptor:
+    # Steps are built without validation, building them would otherwise dominate the benchmark
+    payload = IntermediateStepPayload.model_construct(event_type=event_type,
+                                                      event_timestamp=round(timestamp, 3),
+                                                      name=name,
+                                                      UUID=step_uuid,
+                                                      data=None,
+                                                      usage_info=usage)
+    return IntermediatePropertyAdaptor.model_construct(parent_id="root",
+                                                       function_ancestry=InvocationNode(function_id="workflow",
+                                                                                        function_name="workflow"),
+                                                       payload=payload)
+
+
+def _make_example(rng: random.Random, start: float, num_calls: int) -> list[IntermediatePropertyAdaptor]:
+    events: list[tuple[float, int, IntermediatePropertyAdaptor]] = []
+
+    def add_call(op_type: str, name: str, begin: float, end: float):
+        step_uuid = str(uuid.uuid4())
+        usage = UsageInfo(token_usage=TokenUsageBaseModel(
+            prompt_tokens=rng.randint(100, 2000), completion_tokens=100, total_tokens=rng.randint(200, 2100)))
+        start_type, end_type = _START_END[op_type]
+        events.append((begin, len(events), _step(start_type, name, step_uuid, begin, None)))
+        events.append((end, len(events), _step(end_type, name, step_uuid, end, usage)))
+
+    clock = start
+    for _ in range(num_calls):
+        if rng.random() < 0.3:
+            # Concurrent tool calls
+            width = rng.randint(2, 4)
+            longest = 0.0
+            for i in range(width):
+                duration = rng.uniform(0.1, 2.0)
+                add_call("TOOL", f"tool_{i}", clock, clock + duration)
+                longest = max(longest, duration)
+            clock += longest
+        else:
+            duration = rng.uniform(0.5, 3.0)
+            add_call("LLM", "meta/llama-3.1-70b-instruct", clock, clock + duration)
+            clock += duration
+
+    add_call("FUNCTION", "workflow", start - 0.01, clock + 0.01)
+    events.sort(key=lambda e: (e[0], e[1]))
+    return [event for _, _, event in events]
+
+
+def _make_steps(num_steps: int, calls_per_example: int = 10) -> list[list[IntermediatePropertyAdaptor]]:
+    rng = random.Random(0)
+    all_steps = []
+    total = 0
+    while total < num_steps:
+        example = _make_example(rng, start=rng.uniform(0, 60), num_calls=calls_per_example)
+        all_steps.append(example)
+        total += len(example)
+    return all_steps
+
+
+@click.command()
+@click.option("--steps",
+              "step_counts",
+              multiple=True,
+              type=int,
+              default=[10_000, 100_000, 1_000_000],
+              show_default=True,
+              help="Number of intermediate steps, may be repeated.")
+def main(step_counts: list[int]):
+    """
+    Report the run time of the nested stack and concurrency spike analyses for increasing numbers of steps.
+    """
+    for num_steps in step_counts:
+        all_steps = _make_steps(num_steps)
+
+        start = time.perf_counter()
+        multi_example_call_profiling(all_steps)
+        nested_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        concurrency_spike_analysis(all_steps)
+        spike_elapsed = time.perf_counter() - start
+
+        print(f"{num_steps:>10,} steps: nested stack {nested_elapsed:8.2f}s, concurrency spikes {spike_elapsed:8.2f}s")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Snippets per second and latency percentiles of the local code execution sandbox, with concurrent agents executing
+snippets through the async sandbox client. The sandbox server is started for each mode: the warm worker pool and a new
+process per snippet (`SANDBOX_WORKER_POOL_SIZE=0`).
+
+Requires the sandbox server dependencies (flask).
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import click
+import httpx
+import numpy as np
+
+from aiq.tool.code_execution.code_sandbox import get_sandbox
+
+_SERVER_DIR = Path(__file__).parents[2] / "src" / "aiq" / "tool" / "code_execution" / "local_sandbox"
+
+_SNIPPET = """
+total = sum(i * i for i in range(2000))
+print(total)
+"""
+
+
+def _start_server(port: int, pool_size: int) -> subprocess.Popen:
+    env = dict(os.environ, SANDBOX_WORKER_POOL_SIZE=str(pool_size))
+    server = subprocess.Popen(
+        [sys.executable, "-c", f"from local_sandbox_server import app; app.run(port={port}, threaded=True)"],
+        cwd=_SERVER_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/execute", timeout=1)
+            return server
+        except httpx.TransportError:
+            time.sleep(0.2)
+
+    server.kill()
+    raise RuntimeError("Sandbox server did not start")
+
+
+async def _run_agents(port: int, agents: int, snippets: int) -> tuple[float, list[float], int]:
+    sandbox = get_sandbox("local", uri=f"http://127.0.0.1:{port}", max_concurrency=agents)
+    latencies: list[float] = []
+    failures = 0
+
+    async def _agent():
+        nonlocal failures
+        for _ in range(snippets):
+            start = time.perf_counter()
+            result = await sandbox.execute_code(_SNIPPET, timeout_seconds=30)
+            latencies.append(time.perf_counter() - start)
+            if result["process_status"] != "completed":
+                failures += 1
+
+    # Warm up the connections and the workers
+    await asyncio.gather(*(sandbox.execute_code("print(1)") for _ in range(agents)))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_agent() for _ in range(agents)))
+    elapsed = time.perf_counter() - start
+
+    await sandbox.aclose()
+    return elapsed, latencies, failures
+
+
+@click.command()
+@click.option("--agents", default=64, show_default=True, help="Number of concurrent agents.")
+@click.option("--snippets", default=10, show_default=True, help="Number of snippets executed by each agent.")
+@click.option("--pool_size", default=os.cpu_count() or 1, show_default=True, help="Number of warm workers.")
+@click.option("--port", default=6123, show_default=True, help="Port the sandbox server is started on.")
+def main(agents: int, snippets: int, pool_size: int, port: int):
+    """
+    Report the snippets per second and the p50 and p99 latencies of each sandbox server mode.
+    """
+    for label, size in (("warm worker pool", pool_size), ("process per snippet", 0)):
+        server = _start_server(port, size)
+        try:
+            elapsed, latencies, failures = asyncio.run(_run_agents(port, agents, snippets))
+        finally:
+            server.terminate()
+            server.wait()
+
+        p50, p99 = np.percentile(latencies, [50, 99])
+        print(f"{label:>20}: {len(latencies) / elapsed:8.1f} snippets/s  p50 {p50 * 1000:7.1f} ms  "
+              f"p99 {p99 * 1000:7.1f} ms  failures {failures}")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
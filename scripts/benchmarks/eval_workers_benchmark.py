@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Throughput of `aiq eval` in the existing single-process mode and with worker processes running shards of the dataset.
+
+The benchmark workflow mixes simulated I/O (an LLM call latency) with CPU-bound work: it emits tool intermediate steps
+with large payloads, which are validated and adapted for each item. Worker processes re-import this script, which
+registers the workflow in each of them.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import click
+
+from aiq.builder.builder import Builder
+from aiq.builder.context import AIQContext
+from aiq.builder.function_info import FunctionInfo
+from aiq.cli.register_workflow import register_function
+from aiq.data_models.function import FunctionBaseConfig
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.eval.config import EvaluationRunConfig
+from aiq.eval.evaluate import EvaluationRun
+
+
+class _BenchmarkWorkflowConfig(FunctionBaseConfig, name="eval_workers_benchmark_workflow"):
+    latency: float = 0.05
+    steps: int = 50
+    payload_size: int = 2000
+
+
+@register_function(config_type=_BenchmarkWorkflowConfig)
+async def _benchmark_workflow(config: _BenchmarkWorkflowConfig, builder: Builder):  # pylint: disable=W0613
+
+    async def _run(question: str) -> str:
+        step_manager = AIQContext.get().intermediate_step_manager
+        payload = "x" * config.payload_size
+
+        for i in range(config.steps):
+            start = IntermediateStepPayload(event_type=IntermediateStepType.TOOL_START,
+                                            name=f"tool_{i}",
+                                            data=StreamEventData(input=question))
+            step_manager.push_intermediate_step(start)
+            step_manager.push_intermediate_step(
+                IntermediateStepPayload(event_type=IntermediateStepType.TOOL_END,
+                                        name=f"tool_{i}",
+                                        UUID=start.UUID,
+                                        span_event_timestamp=start.event_timestamp,
+                                        data=StreamEventData(input=question, output=payload)))
+
+        await asyncio.sleep(config.latency)
+
+        return question.upper()
+
+    yield FunctionInfo.from_fn(_run)
+
+
+def _write_inputs(directory: Path, items: int, concurrency: int, latency: float, steps: int) -> Path:
+    dataset_file = directory / "dataset.json"
+    dataset_file.write_text(json.dumps([{
+        "id": i, "question": f"question {i}", "answer": f"QUESTION {i}"
+    } for i in range(items)]),
+                            encoding="utf-8")
+
+    config_file = directory / "config.yml"
+    config_file.write_text(f"""
+workflow:
+  _type: eval_workers_benchmark_workflow
+  latency: {latency}
+  steps: {steps}
+eval:
+  general:
+    max_concurrency: {concurrency}
+    output:
+      dir: {directory / "output"}
+    dataset:
+      _type: json
+      file_path: {dataset_file}
+""",
+                           encoding="utf-8")
+    return config_file
+
+
+async def _evaluate(config_file: Path, workers: int) -> tuple[float, int]:
+    config = EvaluationRunConfig(config_file=config_file, write_output=False, workers=workers)
+
+    start = time.perf_counter()
+    output = await EvaluationRun(config).run_and_evaluate()
+    elapsed = time.perf_counter() - start
+
+    completed = sum(1 for item in output.eval_input.eval_input_items if item.output_obj)
+    return elapsed, completed
+
+
+@click.command()
+@click.option("--items", default=400, show_default=True, help="Number of dataset items.")
+@click.option("--concurrency", default=32, show_default=True, help="Maximum number of concurrent workflow runs.")
+@click.option("--latency", default=0.05, show_default=True, help="Simulated I/O latency of each workflow run.")
+@click.option("--steps", default=50, show_default=True, help="Number of tool calls of each workflow run.")
+@click.option("--workers",
+              "worker_counts",
+              multiple=True,
+              type=int,
+              help="Numbers of worker processes to compare with the single-process mode. Defaults to 2 and the number "
+              "of CPUs.")
+def main(items: int, concurrency: int, latency: float, steps: int, worker_counts: tuple[int, ...]):
+    """
+    Report the items per second of the evaluation in the single-process mode and with worker processes.
+    """
+    logging.basicConfig(level=logging.WARNING)
+
+    if not worker_counts:
+        worker_counts = tuple(sorted({2, os.cpu_count() or 1} - {1}))
+
+    with tempfile.TemporaryDirectory() as directory:
+        config_file = _write_inputs(Path(directory), items, concurrency, latency, steps)
+
+        print(f"{items} items, concurrency {concurrency}, {os.cpu_count()} CPUs")
+        for workers in (1, *worker_counts):
+            elapsed, completed = asyncio.run(_evaluate(config_file, workers))
+            label = "single process" if workers == 1 else f"{workers} workers"
+            print(f"{label:>16}: {completed / elapsed:8.1f} items/s  ({completed} items in {elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
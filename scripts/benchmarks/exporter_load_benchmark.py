@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Load test of workflow runs with 0, 1 and 3 span exporters enabled, comparing the requests per second of isolated
+exporters (copied for each run) with exporters shared by every run through a long-lived pipeline.
+"""
+
+import asyncio
+import logging
+import time
+
+import click
+
+from aiq.builder.builder import Builder
+from aiq.builder.context import AIQContext
+from aiq.builder.function_info import FunctionInfo
+from aiq.builder.workflow_builder import WorkflowBuilder
+from aiq.cli.register_workflow import register_function
+from aiq.cli.register_workflow import register_telemetry_exporter
+from aiq.data_models.config import GeneralConfig
+from aiq.data_models.config import TelemetryConfig
+from aiq.data_models.function import FunctionBaseConfig
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.span import Span
+from aiq.data_models.telemetry_exporter import ExporterMode
+from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
+from aiq.observability.exporter.span_exporter import SpanExporter
+
+_EXPORTED_SPANS = 0
+
+
+class _CountingSpanExporter(SpanExporter[Span, Span]):
+
+    async def export_processed(self, item: Span) -> None:
+        global _EXPORTED_SPANS  # pylint: disable=global-statement
+        _EXPORTED_SPANS += 1
+
+
+class _CountingExporterConfig(TelemetryExporterBaseConfig, name="exporter_benchmark_counter"):
+    pass
+
+
+class _SpanEmitterConfig(FunctionBaseConfig, name="exporter_benchmark_span_emitter"):
+    spans: int = 10
+
+
+@register_telemetry_exporter(config_type=_CountingExporterConfig)
+async def _counting_exporter(config: _CountingExporterConfig, builder: Builder):  # pylint: disable=W0613
+    yield _CountingSpanExporter()
+
+
+@register_function(config_type=_SpanEmitterConfig)
+async def _span_emitter(config: _SpanEmitterConfig, builder: Builder):  # pylint: disable=W0613
+
+    async def _emit(message: str) -> str:
+        step_manager = AIQContext.get().intermediate_step_manager
+
+        for i in range(config.spans):
+            start = IntermediateStepPayload(event_type=IntermediateStepType.TOOL_START, name=f"tool_{i}")
+            step_manager.push_intermediate_step(start)
+            step_manager.push_intermediate_step(
+                IntermediateStepPayload(event_type=IntermediateStepType.TOOL_END,
+                                        name=f"tool_{i}",
+                                        UUID=start.UUID,
+                                        span_event_timestamp=start.event_timestamp))
+
+        return message
+
+    yield FunctionInfo.from_fn(_emit)
+
+
+async def _load_test(num_exporters: int, mode: ExporterMode, requests: int, concurrency: int, spans: int) -> float:
+    tracing = {f"exporter_{i}": _CountingExporterConfig() for i in range(num_exporters)}
+    general_config = GeneralConfig(telemetry=TelemetryConfig(tracing=tracing, exporter_mode=mode))
+
+    async with WorkflowBuilder(general_config=general_config) as builder:
+        await builder.set_workflow(_SpanEmitterConfig(spans=spans))
+        workflow = builder.build()
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _request(i: int):
+            async with semaphore:
+                async with workflow.run(f"request {i}") as runner:
+                    await runner.result(to_type=str)
+
+        # Warm up
+        await asyncio.gather(*(_request(i) for i in range(concurrency)))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(_request(i) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+
+    return requests / elapsed
+
+
+@click.command()
+@click.option("--requests", default=2000, show_default=True, help="Number of workflow runs per configuration.")
+@click.option("--concurrency", default=64, show_default=True, help="Maximum number of concurrent workflow runs.")
+@click.option("--spans", default=10, show_default=True, help="Number of tool spans emitted by each run.")
+def main(requests: int, concurrency: int, spans: int):
+    """
+    Report the requests per second of each number of exporters and exporter mode.
+    """
+    global _EXPORTED_SPANS  # pylint: disable=global-statement
+
+    # Silence the per-run start and stop logs of isolated exporters
+    logging.basicConfig(level=logging.WARNING)
+
+    for num_exporters in (0, 1, 3):
+        for mode in ExporterMode:
+            if (num_exporters == 0 and mode == ExporterMode.SHARED):
+                continue
+
+            _EXPORTED_SPANS = 0
+            rps = asyncio.run(_load_test(num_exporters, mode, requests, concurrency, spans))
+            label = f"{num_exporters} exporters" + (f" ({mode.value})" if num_exporters > 0 else "")
+            print(f"{label:>24}: {rps:9.1f} requests/s  spans exported {_EXPORTED_SPANS}")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Insert throughput, search latency and recall of the local vector memory, searched by brute force and with an HNSW
+index, and the time to restart it from a snapshot. With `--redis`, the same items are written to and searched in a
+local Redis Stack instance with RedisEditor, for example:
+
+    docker run --rm -p 6379:6379 redis/redis-stack-server:latest
+
+A deterministic in-process embedder is used so that the numbers reflect the memory backends rather than the embedding
+model. Like the embeddings of text, the vectors of the memories lie close to a low dimensional subspace, and each
+query is embedded as the vector of one of the memories plus noise.
+
+Requires `hnswlib` for the HNSW runs, and the `aiqtoolkit-redis` package for the Redis run.
+"""
+
+import asyncio
+import tempfile
+import time
+
+import click
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from aiq.memory.local_vector.editor import LocalVectorEditor
+from aiq.memory.models import MemoryItem
+
+EMBEDDING_DIM = 384
+LATENT_DIM = 32
+USER_ID = "benchmark"
+
+
+class _IndexedEmbeddings(Embeddings):
+
+    def __init__(self, count: int):
+        rng = np.random.default_rng(0)
+        latent = rng.standard_normal((count, LATENT_DIM), dtype=np.float32)
+        projection = rng.standard_normal((LATENT_DIM, EMBEDDING_DIM), dtype=np.float32)
+        self._vectors = latent @ projection + rng.standard_normal((count, EMBEDDING_DIM), dtype=np.float32)
+
+    def embed_query(self, text: str) -> list[float]:
+        index = int(text.rsplit(" ", 1)[1])
+        noise = np.random.default_rng(index).standard_normal(EMBEDDING_DIM, dtype=np.float32)
+        return (self._vectors[index] + 2 * noise).tolist()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self._vectors[[int(text.rsplit(" ", 1)[1]) for text in texts]].tolist()
+
+
+def _make_items(count: int) -> list[MemoryItem]:
+    return [
+        MemoryItem(user_id=USER_ID, memory=f"remembered fact {i}", tags=[f"tag{i % 10}"], metadata={"index": i})
+        for i in range(count)
+    ]
+
+
+async def _search(editor, queries: list[str], top_k: int) -> tuple[list[float], list[list[int]]]:
+    latencies = []
+    results = []
+    for query in queries:
+        start = time.perf_counter()
+        memories = await editor.search(query, top_k=top_k, user_id=USER_ID)
+        latencies.append(time.perf_counter() - start)
+        results.append([memory.metadata["index"] for memory in memories])
+
+    return latencies, results
+
+
+def _report(label: str, count: int, insert_elapsed: float, latencies: list[float], recall: float | None):
+    p50, p99 = np.percentile(latencies, [50, 99])
+    recall_str = f"  recall@k {recall:5.3f}" if recall is not None else ""
+    print(f"{count:>9,} items {label:>12}: {count / insert_elapsed:10,.0f} items/s  search p50 {p50 * 1000:8.2f} ms  "
+          f"p99 {p99 * 1000:8.2f} ms{recall_str}")
+
+
+def _recall(results: list[list[int]], expected: list[list[int]]) -> float:
+    return float(np.mean([len(set(found) & set(exact)) / max(len(exact), 1)
+                          for found, exact in zip(results, expected)]))
+
+
+async def _run_redis(host: str,
+                     port: int,
+                     items: list[MemoryItem],
+                     embedder: Embeddings,
+                     queries: list[str],
+                     top_k: int,
+                     expected: list[list[int]]):
+    import redis.asyncio as redis
+
+    from aiq.plugins.redis.redis_editor import RedisEditor
+    from aiq.plugins.redis.schema import ensure_index_exists
+
+    client = redis.Redis(host=host, port=port, decode_responses=True)
+    key_prefix = "aiq_benchmark"
+    await ensure_index_exists(client=client, key_prefix=key_prefix, embedding_dim=EMBEDDING_DIM)
+    editor = RedisEditor(client, key_prefix, embedder, batch_size=256, max_concurrency=8)
+
+    try:
+        start = time.perf_counter()
+        await editor.add_items(items)
+        insert_elapsed = time.perf_counter() - start
+
+        latencies, results = await _search(editor, queries, top_k)
+        _report("redis", len(items), insert_elapsed, latencies, _recall(results, expected))
+    finally:
+        await editor.remove_items()
+        await client.close()
+
+
+async def _run(counts: list[int], queries: int, top_k: int, redis_host: str | None, redis_port: int):
+    for count in counts:
+        items = _make_items(count)
+        embedder = _IndexedEmbeddings(count)
+        query_texts = [f"query {i}" for i in np.random.default_rng(2).integers(0, count, queries)]
+
+        expected = None
+        for label, hnsw_threshold in (("brute force", count), ("hnsw", 0)):
+            with tempfile.TemporaryDirectory() as persist_dir:
+                editor = LocalVectorEditor(embedder,
+                                           persist_dir=persist_dir,
+                                           batch_size=256,
+                                           hnsw_threshold=hnsw_threshold)
+
+                start = time.perf_counter()
+                await editor.add_items(items)
+                insert_elapsed = time.perf_counter() - start
+
+                latencies, results = await _search(editor, query_texts, top_k)
+                if expected is None:
+                    expected = results
+                _report(label, count, insert_elapsed, latencies, _recall(results, expected))
+
+                await editor.save()
+                start = time.perf_counter()
+                editor = LocalVectorEditor(embedder, persist_dir=persist_dir, hnsw_threshold=hnsw_threshold)
+                await editor.search(query_texts[0], top_k=top_k, user_id=USER_ID)
+                print(f"{'':>27}restart from snapshot and first search: {time.perf_counter() - start:8.2f} s")
+
+        if redis_host is not None:
+            await _run_redis(redis_host, redis_port, items, embedder, query_texts, top_k, expected)
+
+
+@click.command()
+@click.option("--count",
+              "counts",
+              multiple=True,
+              type=int,
+              default=[10_000, 1_000_000],
+              show_default=True,
+              help="Number of memory items, may be repeated.")
+@click.option("--queries", default=200, show_default=True, help="Number of searches.")
+@click.option("--top-k", default=10, show_default=True, help="Number of memories returned by each search.")
+@click.option("--redis", "redis_host", default=None, help="Host of a Redis Stack instance to compare with.")
+@click.option("--redis-port", default=6379, show_default=True, help="Redis port.")
+def main(counts: list[int], queries: int, top_k: int, redis_host: str | None, redis_port: int):
+    """
+    Report inserted memory items per second, search latencies and recall of each memory backend.
+    """
+    asyncio.run(_run(list(counts), queries, top_k, redis_host, redis_port))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
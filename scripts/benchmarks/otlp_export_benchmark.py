@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Event loop latency while exporting spans to a slow OTLP collector, with the export on the event loop (as the OTLP
+exporters used to do) and with the export worker. A stub collector is started in a thread, it stalls each request for
+the given delay and optionally fails a fraction of the requests.
+
+Requires the `aiqtoolkit-opentelemetry` package.
+"""
+
+import asyncio
+import random
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import click
+import numpy as np
+from opentelemetry.exporter.otlp.proto.http import Compression
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+from aiq.plugins.opentelemetry.mixin.otlp_export_config_mixin import OTLPExportConfig
+from aiq.plugins.opentelemetry.otel_span import OtelSpan
+from aiq.plugins.opentelemetry.otlp_export_worker import OTLPExportWorker
+
+
+def _start_collector(delay: float, failure_rate: float) -> ThreadingHTTPServer:
+
+    class _Handler(BaseHTTPRequestHandler):
+
+        def do_POST(self):  # pylint: disable=invalid-name
+            self.rfile.read(int(self.headers["Content-Length"]))
+            time.sleep(delay)
+            self.send_response(503 if random.random() < failure_rate else 200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _create_batch(size: int) -> list[OtelSpan]:
+    now = time.time_ns()
+    return [
+        OtelSpan(name=f"span_{i}",
+                 context=None,
+                 attributes={"input.value": "x" * 500},
+                 start_time=now,
+                 end_time=now + 1000) for i in range(size)
+    ]
+
+
+async def _measure(export, batches: int, batch_size: int, interval: float) -> list[float]:
+    """Latencies of event loop ticks scheduled every millisecond while batches are exported every `interval`."""
+    lags: list[float] = []
+    done = False
+
+    async def _ticker():
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+
+    ticker = asyncio.create_task(_ticker())
+    for _ in range(batches):
+        await export(_create_batch(batch_size))
+        await asyncio.sleep(interval)
+
+    done = True
+    await ticker
+    return lags
+
+
+@click.command()
+@click.option("--batches", default=50, show_default=True, help="Number of exported batches.")
+@click.option("--batch_size", default=100, show_default=True, help="Number of spans of each batch.")
+@click.option("--interval", default=0.02, show_default=True, help="Delay in seconds between two batches.")
+@click.option("--delay", default=0.1, show_default=True, help="Time in seconds the collector stalls each request.")
+@click.option("--failure_rate", default=0.0, show_default=True, help="Fraction of requests failed by the collector.")
+def main(batches: int, batch_size: int, interval: float, delay: float, failure_rate: float):
+    """
+    Report the p50 and p99 event loop lag of each export mode and the counters of the export worker.
+    """
+    server = _start_collector(delay, failure_rate)
+    endpoint = f"http://127.0.0.1:{server.server_port}/v1/traces"
+
+    try:
+        inline_exporter = OTLPSpanExporter(endpoint=endpoint, compression=Compression.Gzip)
+
+        async def _export_inline(spans):
+            inline_exporter.export(spans)
+
+        with tempfile.TemporaryDirectory() as spill_dir:
+            worker = OTLPExportWorker(endpoint=endpoint,
+                                      config=OTLPExportConfig(spill_dir=spill_dir, retry_backoff=0.05))
+
+            async def _export_worker(spans):
+                worker.submit(spans)
+
+            for label, export in (("inline", _export_inline), ("export worker", _export_worker)):
+                start = time.perf_counter()
+                lags = asyncio.run(_measure(export, batches, batch_size, interval))
+                elapsed = time.perf_counter() - start
+
+                p50, p99 = np.percentile(lags, [50, 99])
+                print(f"{label:>14}: loop lag p50 {p50 * 1000:7.2f} ms  p99 {p99 * 1000:7.2f} ms  "
+                      f"({batches} batches in {elapsed:.2f}s)")
+
+            worker.wait_idle(timeout=60)
+            print(f"export worker: {worker.stats()}")
+            worker.shutdown()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmark of the cold start of `load_config` in fresh interpreters, loading every plugin ("eager"), building the plugin
+manifest ("manifest build") and loading only the plugins used by the configuration from the manifest ("lazy").
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import click
+
+_MINIMAL_CONFIG = """
+llms:
+  nim_llm:
+    _type: nim
+    model_name: meta/llama-3.1-8b-instruct
+workflow:
+  _type: current_datetime
+"""
+
+_PROBE = """
+import sys
+import time
+
+start = time.perf_counter()
+from aiq.runtime.loader import load_config
+imported = time.perf_counter()
+load_config(sys.argv[1])
+loaded = time.perf_counter()
+
+plugins = sum(1 for name in sys.modules if name.startswith("aiq") and name.endswith(".register"))
+print(f"{imported - start} {loaded - imported} {plugins}")
+"""
+
+
+def _run(config_file: Path, env: dict[str, str]) -> tuple[float, float, int]:
+    result = subprocess.run([sys.executable, "-c", _PROBE, str(config_file)],
+                            env=env,
+                            capture_output=True,
+                            text=True,
+                            check=True)
+    import_time, load_time, plugins = result.stdout.split()[-3:]
+    return float(import_time), float(load_time), int(plugins)
+
+
+@click.command()
+@click.option("--config_file",
+              type=click.Path(exists=True, dir_okay=False, path_type=Path),
+              default=None,
+              help="Configuration file to load, a minimal configuration by default.")
+@click.option("--runs", default=5, show_default=True, help="Number of cold starts per mode.")
+def main(config_file: Path | None, runs: int):
+    """
+    Report the median time spent importing the loader and loading the configuration in a fresh interpreter.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if config_file is None:
+            config_file = Path(tmp_dir) / "config.yml"
+            config_file.write_text(_MINIMAL_CONFIG, encoding="utf-8")
+
+        env = dict(os.environ, AIQ_CACHE_DIR=str(Path(tmp_dir) / "cache"))
+
+        eager = [_run(config_file, dict(env, AIQ_LAZY_PLUGIN_LOADING="0")) for _ in range(runs)]
+        manifest_build = [_run(config_file, dict(env, AIQ_LAZY_PLUGIN_LOADING="1"))]
+        lazy = [_run(config_file, dict(env, AIQ_LAZY_PLUGIN_LOADING="1")) for _ in range(runs)]
+
+        for label, samples in (("eager", eager), ("manifest build", manifest_build), ("lazy", lazy)):
+            import_time = statistics.median(s[0] for s in samples)
+            load_time = statistics.median(s[1] for s in samples)
+            print(f"{label:>14}: import {import_time:6.2f}s  load_config {load_time:6.2f}s  "
+                  f"plugin modules {samples[-1][2]:4d}")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmark for RedisEditor.add_items against a local Redis Stack instance, for example:
+
+    docker run --rm -p 6379:6379 redis/redis-stack-server:latest
+
+A deterministic in-process embedder is used so that the numbers reflect the Redis round trips rather than the
+embedding model. The "sequential" run writes and verifies one item at a time, matching the previous behavior.
+"""
+
+import asyncio
+import time
+
+import click
+import numpy as np
+import redis.asyncio as redis
+from langchain_core.embeddings import Embeddings
+
+from aiq.memory.models import MemoryItem
+from aiq.plugins.redis.redis_editor import RedisEditor
+from aiq.plugins.redis.schema import ensure_index_exists
+
+EMBEDDING_DIM = 384
+
+
+class _RandomEmbeddings(Embeddings):
+
+    def __init__(self):
+        self._rng = np.random.default_rng(0)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._rng.random(EMBEDDING_DIM, dtype=np.float32).tolist()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self._rng.random((len(texts), EMBEDDING_DIM), dtype=np.float32).tolist()
+
+
+def _make_items(count: int) -> list[MemoryItem]:
+    items = []
+    for i in range(count):
+        items.append(
+            MemoryItem(conversation=[{
+                "role": "user", "content": f"Message {i}"
+            }],
+                       user_id=f"user{i % 10}",
+                       memory=f"User {i % 10} remembered fact number {i}",
+                       metadata={"index": i},
+                       tags=["benchmark"]))
+    return items
+
+
+async def _delete_keys(client: redis.Redis, key_prefix: str):
+    keys = [key async for key in client.scan_iter(match=f"{key_prefix}:memory:*", count=1000)]
+    for i in range(0, len(keys), 1000):
+        await client.delete(*keys[i:i + 1000])
+
+
+async def _run(host: str, port: int, counts: list[int], batch_size: int, max_concurrency: int):
+    client = redis.Redis(host=host, port=port, decode_responses=True)
+    key_prefix = "aiq_benchmark"
+    embedder = _RandomEmbeddings()
+
+    await ensure_index_exists(client=client, key_prefix=key_prefix, embedding_dim=EMBEDDING_DIM)
+
+    editors = {
+        "sequential": RedisEditor(client, key_prefix, embedder, batch_size=1, max_concurrency=1, verify_writes=True),
+        "batched": RedisEditor(client, key_prefix, embedder, batch_size=batch_size, max_concurrency=max_concurrency),
+    }
+
+    try:
+        for count in counts:
+            items = _make_items(count)
+            for label, editor in editors.items():
+                start = time.perf_counter()
+                await editor.add_items(items)
+                elapsed = time.perf_counter() - start
+                print(f"{count:>8,} items {label:>10}: {count / elapsed:12,.0f} items/s")
+                await _delete_keys(client, key_prefix)
+    finally:
+        await _delete_keys(client, key_prefix)
+        await client.close()
+
+
+@click.command()
+@click.option("--host", default="localhost", show_default=True, help="Redis host.")
+@click.option("--port", default=6379, show_default=True, help="Redis port.")
+@click.option("--count",
+              "counts",
+              multiple=True,
+              type=int,
+              default=[1000, 100000],
+              show_default=True,
+              help="Number of items to insert, may be repeated.")
+@click.option("--batch-size", default=256, show_default=True, help="Items per pipeline for the batched run.")
+@click.option("--max-concurrency", default=8, show_default=True, help="Concurrent pipelines for the batched run.")
+def main(host: str, port: int, counts: list[int], batch_size: int, max_concurrency: int):
+    """
+    Report inserted memory items per second for sequential and batched writes.
+    """
+    asyncio.run(_run(host, port, list(counts), batch_size, max_concurrency))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
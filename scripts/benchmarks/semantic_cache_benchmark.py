@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Searches per second and hit rates of the semantic cache in front of a simulated memory backend, with concurrent
+agents repeating searches the way ReAct loops do: each agent draws its queries from a small pool shared by all agents,
+and some queries are rephrased (different case and spacing, or a trailing question mark, which the embedder maps to a
+nearby vector). Each search of the backend embeds the query and waits for the given latency.
+"""
+
+import asyncio
+import hashlib
+import random
+import time
+
+import click
+import numpy as np
+
+from aiq.memory.interfaces import MemoryEditor
+from aiq.memory.models import MemoryItem
+from aiq.memory.semantic_cache.editor import SemanticCacheMemoryEditor
+from aiq.utils.semantic_cache import SemanticCache
+
+EMBEDDING_DIM = 384
+
+
+class _Embeddings:
+
+    def __init__(self, latency: float):
+        self._latency = latency
+
+    async def aembed_query(self, text: str) -> list[float]:
+        await asyncio.sleep(self._latency)
+        base = text.rstrip("?").strip().casefold()
+        seed = int(hashlib.md5(base.encode()).hexdigest()[:8], 16)
+        vector = np.random.default_rng(seed).standard_normal(EMBEDDING_DIM)
+        if text.endswith("?"):
+            vector += 0.1 * np.random.default_rng(0).standard_normal(EMBEDDING_DIM)
+        return vector.tolist()
+
+
+class _SimulatedMemory(MemoryEditor):
+
+    def __init__(self, embedder: _Embeddings, latency: float):
+        self._embedder = embedder
+        self._latency = latency
+        self.searches = 0
+
+    async def add_items(self, items: list[MemoryItem]) -> None:
+        await asyncio.sleep(self._latency)
+
+    async def search(self, query: str, top_k: int = 5, **kwargs) -> list[MemoryItem]:
+        self.searches += 1
+        await self._embedder.aembed_query(query)
+        await asyncio.sleep(self._latency)
+        return [MemoryItem(memory=f"memory {i} for {query}", user_id=kwargs.get("user_id", "")) for i in range(top_k)]
+
+    async def remove_items(self, **kwargs) -> None:
+        await asyncio.sleep(self._latency)
+
+
+def _rephrase(query: str, rng: random.Random) -> str:
+    return rng.choice([query, query.upper(), f"  {query} ", f"{query}?"])
+
+
+async def _run(editor: MemoryEditor, agents: int, searches: int, pool: int, users: int) -> float:
+
+    async def _agent(agent_id: int):
+        rng = random.Random(agent_id)
+        for _ in range(searches):
+            query = _rephrase(f"what does the user prefer for topic {rng.randrange(pool)}", rng)
+            await editor.search(query, top_k=5, user_id=f"user{agent_id % users}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_agent(i) for i in range(agents)))
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option("--agents", default=32, show_default=True, help="Number of concurrent agents.")
+@click.option("--searches", default=50, show_default=True, help="Number of searches of each agent.")
+@click.option("--pool", default=20, show_default=True, help="Number of distinct queries.")
+@click.option("--users", default=4, show_default=True, help="Number of users the agents search the memories of.")
+@click.option("--latency", default=0.02, show_default=True, help="Latency of the backend and of the embedder.")
+def main(agents: int, searches: int, pool: int, users: int, latency: float):
+    """
+    Report the searches per second, backend searches and hit rates without the cache, with the exact-match cache and
+    with the similarity cache.
+    """
+    embedder = _Embeddings(latency)
+    caches = {
+        "no cache": None,
+        "exact match": {},
+        "similarity": {
+            "similarity_threshold": 0.95, "embedder": embedder
+        },
+    }
+
+    for label, cache_args in caches.items():
+        backend = _SimulatedMemory(embedder, latency)
+        editor = backend
+        if cache_args is not None:
+            editor = SemanticCacheMemoryEditor(backend, SemanticCache("benchmark", **cache_args))
+
+        elapsed = asyncio.run(_run(editor, agents, searches, pool, users))
+        total = agents * searches
+        stats = f"  {editor.cache.stats()}" if cache_args is not None else ""
+        print(f"{label:>12}: {total / elapsed:8.1f} searches/s  {backend.searches:5d} backend searches{stats}")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
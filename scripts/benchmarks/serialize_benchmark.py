@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmark for SerializeMixin on a mix of LLM_START/LLM_END events. The "uncached" run clears the TypeAdapter cache
+before every event, reproducing the cost of building a new TypeAdapter per payload.
+"""
+
+import asyncio
+import time
+import uuid
+
+import click
+from pydantic import BaseModel
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.data_models.intermediate_step import TraceMetadata
+from aiq.data_models.invocation_node import InvocationNode
+from aiq.observability.mixin import serialize_mixin
+from aiq.observability.processor.intermediate_step_serializer import IntermediateStepSerializer
+
+
+class ChatMessage(BaseModel):
+    role: str
+    content: str
+
+
+def _make_events(count: int) -> list[IntermediateStep]:
+    events = []
+    ancestry = InvocationNode(function_id="bench", function_name="bench")
+    messages = [
+        ChatMessage(role="system", content="You are a helpful assistant. " * 20),
+        ChatMessage(role="user", content="What is the weather in Santa Clara?"),
+    ]
+    for _ in range(count // 2):
+        step_uuid = str(uuid.uuid4())
+        events.append(
+            IntermediateStep(parent_id="root",
+                             function_ancestry=ancestry,
+                             payload=IntermediateStepPayload(event_type=IntermediateStepType.LLM_START,
+                                                             name="meta/llama-3.1-70b-instruct",
+                                                             UUID=step_uuid,
+                                                             metadata=TraceMetadata(chat_inputs=messages),
+                                                             data=StreamEventData(input=messages))))
+        events.append(
+            IntermediateStep(parent_id="root",
+                             function_ancestry=ancestry,
+                             payload=IntermediateStepPayload(event_type=IntermediateStepType.LLM_END,
+                                                             name="meta/llama-3.1-70b-instruct",
+                                                             UUID=step_uuid,
+                                                             data=StreamEventData(
+                                                                 input=messages,
+                                                                 output="It is sunny and 72 degrees.",
+                                                             ))))
+    return events
+
+
+async def _run(serializer: IntermediateStepSerializer, events: list[IntermediateStep], cached: bool) -> float:
+    start = time.perf_counter()
+    for event in events:
+        if not cached:
+            serialize_mixin._get_type_adapter.cache_clear()  # pylint: disable=protected-access
+        await serializer.process(event)
+        serializer._serialize_payload(event.payload.data.input)  # pylint: disable=protected-access
+        serializer._serialize_payload(event.payload.data.output)  # pylint: disable=protected-access
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option("--events", "num_events", default=20000, show_default=True, help="Number of events to serialize.")
+def main(num_events: int):
+    """
+    Report serialized events per second with and without the TypeAdapter cache.
+    """
+    events = _make_events(num_events)
+    serializer = IntermediateStepSerializer()
+
+    for label, cached in (("uncached", False), ("cached", True)):
+        elapsed = asyncio.run(_run(serializer, events, cached))
+        print(f"{label:>9}: {len(events) / elapsed:12,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Microbenchmark for the FastAPI StepAdaptor. Adapts runs of increasing length and reports the average time spent per
+step, which should stay flat as the number of steps in the run grows.
+"""
+
+import time
+import uuid
+
+import click
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import StreamEventData
+from aiq.data_models.invocation_node import InvocationNode
+from aiq.data_models.step_adaptor import StepAdaptorConfig
+from aiq.front_ends.fastapi.step_adaptor import StepAdaptor
+
+
+def _make_step(event_type: IntermediateStepType, step_uuid: str, data: StreamEventData) -> IntermediateStep:
+    return IntermediateStep(parent_id="root",
+                            function_ancestry=InvocationNode(function_id="bench", function_name="bench"),
+                            payload=IntermediateStepPayload(event_type=event_type,
+                                                            name="bench_llm",
+                                                            UUID=step_uuid,
+                                                            data=data))
+
+
+def _make_run(num_llm_calls: int, tokens_per_call: int) -> list[IntermediateStep]:
+    steps = []
+    for _ in range(num_llm_calls):
+        step_uuid = str(uuid.uuid4())
+        steps.append(_make_step(IntermediateStepType.LLM_START, step_uuid, StreamEventData(input="prompt")))
+        for _ in range(tokens_per_call):
+            steps.append(_make_step(IntermediateStepType.LLM_NEW_TOKEN, step_uuid, StreamEventData(chunk="tok ")))
+        steps.append(_make_step(IntermediateStepType.LLM_END, step_uuid, StreamEventData(output="done")))
+    return steps
+
+
+@click.command()
+@click.option("--tokens-per-call", default=50, show_default=True, help="Number of streamed tokens per LLM call.")
+@click.option("--calls",
+              "calls",
+              multiple=True,
+              type=int,
+              default=[10, 100, 1000],
+              show_default=True,
+              help="Number of LLM calls per run. Can be repeated.")
+def main(tokens_per_call: int, calls: tuple[int, ...]):
+    """
+    Report the per-step adaptation cost for runs of increasing length.
+    """
+    for num_calls in calls:
+        steps = _make_run(num_calls, tokens_per_call)
+        adaptor = StepAdaptor(StepAdaptorConfig())
+
+        start = time.perf_counter()
+        for step in steps:
+            adaptor.process(step)
+        elapsed = time.perf_counter() - start
+
+        print(f"steps={len(steps):>9,d}  total={elapsed:8.3f}s  per_step={elapsed / len(steps) * 1e6:8.2f}us")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Invocations per second of `Function.ainvoke` and `Function.astream` on the hot path of a chat workflow: a string input
+converted to a chat request, and a chat response output converted to a string. Each function is invoked with the
+memoized conversion paths of the type converters, and with the paths cleared before every conversion, which is the cost
+of resolving them on each call.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+
+import click
+
+from aiq.builder.function import LambdaFunction
+from aiq.builder.function_info import FunctionInfo
+from aiq.data_models.api_server import AIQChatRequest
+from aiq.data_models.api_server import AIQChatResponse
+from aiq.data_models.api_server import AIQChatResponseChunk
+from aiq.data_models.function import FunctionBaseConfig
+from aiq.utils import type_converter
+from aiq.utils.type_converter import GlobalTypeConverter
+
+
+class _BenchmarkFunctionConfig(FunctionBaseConfig, name="type_converter_benchmark_function"):
+    pass
+
+
+async def _respond(request: AIQChatRequest) -> AIQChatResponse:
+    return AIQChatResponse.from_string(request.messages[-1].content.upper())
+
+
+async def _stream(request: AIQChatRequest) -> AsyncGenerator[AIQChatResponseChunk]:
+    for word in request.messages[-1].content.split():
+        yield AIQChatResponseChunk.from_string(word)
+
+
+def _clear_paths(function: LambdaFunction) -> None:
+    function._converter._clear_paths()  # pylint: disable=protected-access
+    GlobalTypeConverter.get()._clear_paths()  # pylint: disable=protected-access
+    type_converter._root_types.clear()  # pylint: disable=protected-access
+
+
+async def _invoke(function: LambdaFunction, calls: int, memoized: bool) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        if not memoized:
+            _clear_paths(function)
+        await function.ainvoke(f"question {i}", to_type=str)
+    return calls / (time.perf_counter() - start)
+
+
+async def _stream_chunks(function: LambdaFunction, calls: int, memoized: bool) -> float:
+    start = time.perf_counter()
+    chunks = 0
+    for i in range(calls):
+        if not memoized:
+            _clear_paths(function)
+        async for _ in function.astream(f"question {i} with a few more words to stream", to_type=str):
+            chunks += 1
+    return chunks / (time.perf_counter() - start)
+
+
+@click.command()
+@click.option("--calls", default=5000, show_default=True, help="Number of invocations of each function.")
+def main(calls: int):
+    """
+    Report the invocations per second of `ainvoke` and the chunks per second of `astream`, with and without the
+    memoized conversion paths.
+    """
+    config = _BenchmarkFunctionConfig()
+    invoke_function = LambdaFunction.from_info(config=config, info=FunctionInfo.from_fn(_respond))
+    stream_function = LambdaFunction.from_info(config=config, info=FunctionInfo.from_fn(_stream))
+
+    for label, memoized in (("paths resolved per call", False), ("memoized paths", True)):
+        invocations = asyncio.run(_invoke(invoke_function, calls, memoized))
+        chunks = asyncio.run(_stream_chunks(stream_function, calls // 10, memoized))
+        print(f"{label:>24}: ainvoke {invocations:9.1f} calls/s  astream {chunks:9.1f} chunks/s")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
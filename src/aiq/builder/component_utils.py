@@ -314,3 +314,42 @@ def build_dependency_sequence(config: "AIQConfig") -> list[ComponentInstanceData
     assert len(dependency_sequence) == total_node_count, "Dependency sequence generation failed. Report as bug."
 
     return dependency_sequence
+
+
+def build_dependency_levels(config: "AIQConfig") -> list[list[ComponentInstanceData]]:
+    """Groups the dependency sequence of an AIQ Toolkit configuration object into levels, where every component only
+    depends on components of previous levels. The components of a level can therefore be instantiated concurrently.
+
+    Args:
+        config (AIQConfig): An AIQ Toolkit configuration object.
+
+    Returns:
+        list[list[ComponentInstanceData]]: The levels of the instantiation sequence, in the order of
+            `build_dependency_sequence` within each level. The root workflow is alone in the last level.
+    """
+
+    dependency_graph: nx.DiGraph
+    _, dependency_graph = config_to_dependency_objects(config=config)
+
+    component_levels: dict[str, int] = {}
+    levels: list[list[ComponentInstanceData]] = []
+
+    for component_instance in build_dependency_sequence(config):
+
+        instance_id = component_instance.instance_id
+
+        if (component_instance.is_root):
+            level = len(levels)
+        else:
+            # The sequence is topologically sorted, every dependency already has a level
+            dependencies = nx.descendants(dependency_graph, instance_id) if instance_id in dependency_graph else set()
+            level = max((component_levels[dep] + 1 for dep in dependencies if dep in component_levels), default=0)
+
+        component_levels[instance_id] = level
+
+        if (level == len(levels)):
+            levels.append([])
+
+        levels[level].append(component_instance)
+
+    return levels
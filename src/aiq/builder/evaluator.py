@@ -13,17 +13,47 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Awaitable
 from collections.abc import Callable
 
 from aiq.data_models.evaluator import EvaluatorBaseConfig
+from aiq.eval.evaluator.base_evaluator import BaseEvaluator
 from aiq.eval.evaluator.evaluator_model import EvalInput
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
 from aiq.eval.evaluator.evaluator_model import EvalOutput
+from aiq.eval.evaluator.evaluator_model import EvalOutputItem
 
 
 class EvaluatorInfo:
 
-    def __init__(self, *, config: EvaluatorBaseConfig, evaluate_fn: Callable[[EvalInput], EvalOutput],
-                 description: str):
+    def __init__(self,
+                 *,
+                 config: EvaluatorBaseConfig,
+                 evaluate_fn: Callable[[EvalInput], EvalOutput],
+                 description: str,
+                 evaluate_item_fn: Callable[[EvalInputItem], Awaitable[EvalOutputItem]] | None = None,
+                 max_concurrency: int | None = None):
+        """
+        Args:
+            config (EvaluatorBaseConfig): The configuration of the evaluator.
+            evaluate_fn (Callable[[EvalInput], EvalOutput]): Evaluates a whole dataset.
+            description (str): A description of the evaluator.
+            evaluate_item_fn (Callable[[EvalInputItem], Awaitable[EvalOutputItem]] | None): Evaluates a single item,
+                allowing items to be scored as soon as their workflow run completes. Defaults to the `evaluate_item`
+                method when `evaluate_fn` is the `evaluate` method of a `BaseEvaluator`.
+            max_concurrency (int | None): Maximum number of items evaluated concurrently with `evaluate_item_fn`.
+                Defaults to the concurrency of the `BaseEvaluator`, if any.
+        """
         self.config = config
         self.evaluate_fn = evaluate_fn
         self.description = description
+
+        evaluator = getattr(evaluate_fn, "__self__", None)
+        if (isinstance(evaluator, BaseEvaluator)):
+            if (evaluate_item_fn is None):
+                evaluate_item_fn = evaluator.evaluate_item
+            if (max_concurrency is None):
+                max_concurrency = evaluator.max_concurrency
+
+        self.evaluate_item_fn = evaluate_item_fn
+        self.max_concurrency = max_concurrency
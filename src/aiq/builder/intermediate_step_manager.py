@@ -20,6 +20,8 @@ import typing
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.data_models.intermediate_step import IntermediateStepPayload
 from aiq.data_models.intermediate_step import IntermediateStepState
+from aiq.utils.reactive.buffered_subject import BufferedSubject
+from aiq.utils.reactive.buffered_subject import ObserverMetrics
 from aiq.utils.reactive.observable import OnComplete
 from aiq.utils.reactive.observable import OnError
 from aiq.utils.reactive.observable import OnNext
@@ -172,3 +174,16 @@ class IntermediateStepManager:
         """
 
         return self._context_state.event_stream.get().subscribe(on_next, on_error, on_complete)
+
+    def get_delivery_metrics(self) -> list[ObserverMetrics]:
+        """
+        Returns the per-subscriber queue depth, lag and drop counts when the event stream delivers asynchronously. With
+        synchronous delivery there is nothing queued and an empty list is returned.
+        """
+
+        event_stream = self._context_state.event_stream.get()
+
+        if isinstance(event_stream, BufferedSubject):
+            return event_stream.get_observer_metrics()
+
+        return []
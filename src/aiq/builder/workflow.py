@@ -32,6 +32,7 @@ from aiq.memory.interfaces import MemoryEditor
 from aiq.object_store.interfaces import ObjectStore
 from aiq.observability.exporter.base_exporter import BaseExporter
 from aiq.observability.exporter_manager import ExporterManager
+from aiq.observability.exporter_pipeline import SharedExporterPipeline
 from aiq.runtime.runner import AIQRunner
 
 callback_handler_var: ContextVar[Any | None] = ContextVar("callback_handler_var", default=None)
@@ -51,6 +52,7 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
                  telemetry_exporters: dict[str, BaseExporter] | None = None,
                  retrievers: dict[str | None, RetrieverProviderInfo] | None = None,
                  its_strategies: dict[str, StrategyBase] | None = None,
+                 exporter_pipeline: SharedExporterPipeline | None = None,
                  context_state: AIQContextState):
 
         super().__init__(input_schema=entry_fn.input_schema,
@@ -66,7 +68,7 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
         self.object_stores = object_stores or {}
         self.retrievers = retrievers or {}
 
-        self._exporter_manager = ExporterManager.from_exporters(self.telemetry_exporters)
+        self._exporter_manager = ExporterManager.from_exporters(self.telemetry_exporters, pipeline=exporter_pipeline)
         self.its_strategies = its_strategies or {}
 
         self._entry_fn = entry_fn
@@ -93,7 +95,8 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
         async with AIQRunner(input_message=message,
                              entry_fn=self._entry_fn,
                              context_state=self._context_state,
-                             exporter_manager=self._exporter_manager.get()) as runner:
+                             exporter_manager=self._exporter_manager.get(),
+                             event_stream_config=self.config.general.telemetry.event_stream) as runner:
 
             # The caller can `yield runner` so they can do `runner.result()` or `runner.result_stream()`
             yield runner
@@ -126,6 +129,7 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
                       telemetry_exporters: dict[str, BaseExporter] | None = None,
                       retrievers: dict[str | None, RetrieverProviderInfo] | None = None,
                       its_strategies: dict[str, StrategyBase] | None = None,
+                      exporter_pipeline: SharedExporterPipeline | None = None,
                       context_state: AIQContextState) -> 'Workflow[InputT, StreamingOutputT, SingleOutputT]':
 
         input_type: type = entry_fn.input_type
@@ -145,4 +149,5 @@ class Workflow(FunctionBase[InputT, StreamingOutputT, SingleOutputT]):
                             telemetry_exporters=telemetry_exporters,
                             retrievers=retrievers,
                             its_strategies=its_strategies,
+                            exporter_pipeline=exporter_pipeline,
                             context_state=context_state)
@@ -13,9 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import contextvars
 import dataclasses
 import inspect
 import logging
+import time
 import warnings
 from contextlib import AbstractAsyncContextManager
 from contextlib import AsyncExitStack
@@ -25,6 +28,7 @@ from aiq.authentication.interfaces import AuthProviderBase
 from aiq.builder.builder import Builder
 from aiq.builder.builder import UserManagerHolder
 from aiq.builder.component_utils import ComponentInstanceData
+from aiq.builder.component_utils import build_dependency_levels
 from aiq.builder.component_utils import build_dependency_sequence
 from aiq.builder.context import AIQContext
 from aiq.builder.context import AIQContextState
@@ -58,6 +62,7 @@ from aiq.data_models.llm import LLMBaseConfig
 from aiq.data_models.memory import MemoryBaseConfig
 from aiq.data_models.object_store import ObjectStoreBaseConfig
 from aiq.data_models.retriever import RetrieverBaseConfig
+from aiq.data_models.telemetry_exporter import ExporterMode
 from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
 from aiq.experimental.decorators.experimental_warning_decorator import aiq_experimental
 from aiq.experimental.inference_time_scaling.models.stage_enums import PipelineTypeEnum
@@ -66,12 +71,19 @@ from aiq.experimental.inference_time_scaling.models.strategy_base import Strateg
 from aiq.memory.interfaces import MemoryEditor
 from aiq.object_store.interfaces import ObjectStore
 from aiq.observability.exporter.base_exporter import BaseExporter
+from aiq.observability.exporter_pipeline import SharedExporterPipeline
 from aiq.profiler.decorators.framework_wrapper import chain_wrapped_build_fn
 from aiq.profiler.utils import detect_llm_frameworks_in_build_fn
 from aiq.utils.type_utils import override
 
 logger = logging.getLogger(__name__)
 
+# Exit stack receiving the contexts entered while building a component in its own task (see `populate_builder`)
+_component_exit_stack: contextvars.ContextVar[AsyncExitStack | None] = contextvars.ContextVar("component_exit_stack",
+                                                                                              default=None)
+
+_MISSING = object()
+
 
 @dataclasses.dataclass
 class ConfiguredTelemetryExporter:
@@ -127,6 +139,14 @@ class ConfiguredITSStrategy:
     instance: StrategyBase
 
 
+@dataclasses.dataclass
+class ComponentBuildTime:
+    name: str
+    component_group: str
+    level: int
+    seconds: float
+
+
 # pylint: disable=too-many-public-methods
 class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
@@ -144,6 +164,7 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
         self._logging_handlers: dict[str, logging.Handler] = {}
         self._telemetry_exporters: dict[str, ConfiguredTelemetryExporter] = {}
+        self._exporter_pipeline: SharedExporterPipeline | None = None
 
         self._functions: dict[str, ConfiguredFunction] = {}
         self._workflow: ConfiguredFunction | None = None
@@ -164,6 +185,8 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         self.function_dependencies: dict[str, FunctionDependencies] = {}
         self.current_function_building: str | None = None
 
+        self._build_times: list[ComponentBuildTime] = []
+
     async def __aenter__(self):
 
         self._exit_stack = AsyncExitStack()
@@ -296,16 +319,47 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
                                               k: v.instance
                                               for k, v in self._its_strategies.items()
                                           },
+                                          exporter_pipeline=self._get_exporter_pipeline(),
                                           context_state=self._context_state)
 
         return workflow
 
+    def _get_exporter_pipeline(self) -> SharedExporterPipeline | None:
+        """
+        The pipeline shared by every run of the built workflows when the exporters are shared, created on first use
+        and closed with the builder.
+        """
+        telemetry_config = self.general_config.telemetry
+
+        if (telemetry_config.exporter_mode != ExporterMode.SHARED or not self._telemetry_exporters):
+            return None
+
+        if (self._exporter_pipeline is None):
+            exporters = {k: v.instance for k, v in self._telemetry_exporters.items()}
+            self._exporter_pipeline = SharedExporterPipeline(exporters, queue_size=telemetry_config.exporter_queue_size)
+
+            self._get_exit_stack().push_async_callback(self._exporter_pipeline.aclose)
+
+        return self._exporter_pipeline
+
+    @property
+    def build_times(self) -> list[ComponentBuildTime]:
+        """
+        Time spent building each component added by `populate_builder`, in the order the components were built.
+        """
+        return list(self._build_times)
+
     def _get_exit_stack(self) -> AsyncExitStack:
 
         if self._exit_stack is None:
             raise ValueError(
                 "Exit stack not initialized. Did you forget to call `async with WorkflowBuilder() as builder`?")
 
+        # Components built concurrently hold their contexts in the exit stack of their own task
+        component_exit_stack = _component_exit_stack.get()
+        if component_exit_stack is not None:
+            return component_exit_stack
+
         return self._exit_stack
 
     async def _build_function(self, name: str, config: FunctionBaseConfig) -> ConfiguredFunction:
@@ -860,81 +914,250 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         """
         self._log_build_failure("<workflow>", "workflow", completed_components, remaining_components, original_error)
 
+    async def _build_component(self, component_instance: ComponentInstanceData) -> float:
+        """
+        Add a component of the build sequence to the builder, returning the time spent building it in seconds.
+        """
+        start_time = time.perf_counter()
+
+        # Instantiate a the llm
+        if component_instance.component_group == ComponentGroup.LLMS:
+            await self.add_llm(component_instance.name, component_instance.config)
+        # Instantiate a the embedder
+        elif component_instance.component_group == ComponentGroup.EMBEDDERS:
+            await self.add_embedder(component_instance.name, component_instance.config)
+        # Instantiate a memory client
+        elif component_instance.component_group == ComponentGroup.MEMORY:
+            await self.add_memory_client(component_instance.name, component_instance.config)
+        # Instantiate a object store client
+        elif component_instance.component_group == ComponentGroup.OBJECT_STORES:
+            await self.add_object_store(component_instance.name, component_instance.config)
+        # Instantiate a retriever client
+        elif component_instance.component_group == ComponentGroup.RETRIEVERS:
+            await self.add_retriever(component_instance.name, component_instance.config)
+        # Instantiate a function
+        elif component_instance.component_group == ComponentGroup.FUNCTIONS:
+            # If the function is the root, set it as the workflow later
+            if (not component_instance.is_root):
+                await self.add_function(component_instance.name, component_instance.config)
+        elif component_instance.component_group == ComponentGroup.ITS_STRATEGIES:
+            await self.add_its_strategy(component_instance.name, component_instance.config)
+
+        elif component_instance.component_group == ComponentGroup.AUTHENTICATION:
+            await self.add_auth_provider(component_instance.name, component_instance.config)
+        else:
+            raise ValueError(f"Unknown component group {component_instance.component_group}")
+
+        return time.perf_counter() - start_time
+
+    async def _own_component(self,
+                             component_instance: ComponentInstanceData,
+                             built: asyncio.Future,
+                             shutdown: asyncio.Event) -> None:
+        """
+        Build a component and keep the contexts entered while building it open until `shutdown` is set. The contexts
+        are entered and exited from this task, as some context managers (e.g. cancel scopes) must be exited from the
+        task they were entered in.
+        """
+        async with AsyncExitStack() as exit_stack:
+            token = _component_exit_stack.set(exit_stack)
+            try:
+                seconds = await self._build_component(component_instance)
+            except Exception as e:
+                built.set_exception(e)
+                return
+            finally:
+                _component_exit_stack.reset(token)
+
+            built.set_result(seconds)
+
+            await shutdown.wait()
+
+    @staticmethod
+    async def _shutdown_components(shutdown: asyncio.Event, tasks: list[asyncio.Task]) -> None:
+
+        shutdown.set()
+
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                raise result
+
+    @staticmethod
+    def _propagate_context(base_context: contextvars.Context, context: contextvars.Context) -> None:
+        """
+        Set the context variables changed by a component built in its own task in the current context, as if the
+        component was built from the current task.
+        """
+        for var, value in context.items():
+            if base_context.get(var, _MISSING) is not value:
+                var.set(value)
+
+    async def _build_level(self,
+                           level: int,
+                           components: list[ComponentInstanceData],
+                           completed_components: list[tuple[str, str]],
+                           remaining_components: list[tuple[str, str]]) -> None:
+        """
+        Concurrently build components which do not depend on each other. Each component is built in its own task,
+        which keeps its contexts open until the builder exits. Components of a level are torn down together, after the
+        components of the following levels.
+        """
+        base_context = contextvars.copy_context()
+        shutdown = asyncio.Event()
+
+        builds: dict[asyncio.Future, tuple[ComponentInstanceData, contextvars.Context, asyncio.Task]] = {}
+        for component_instance in components:
+            # Each component gets a copy of the current context, like a component built from the current task would
+            context = contextvars.copy_context()
+            built = asyncio.get_running_loop().create_future()
+            task = asyncio.create_task(self._own_component(component_instance, built, shutdown),
+                                       name=f"build-{component_instance.name}",
+                                       context=context)
+            # The build is not waited for forever if the task is cancelled from elsewhere
+            task.add_done_callback(lambda _, built=built: built.cancel())
+            builds[built] = (component_instance, context, task)
+
+            remaining_components.remove((str(component_instance.name), component_instance.component_group.value))
+
+        try:
+            pending = set(builds)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                failed: tuple[ComponentInstanceData, Exception] | None = None
+                for built in done:
+                    component_instance = builds[built][0]
+                    if built.cancelled():
+                        failed = failed or (component_instance,
+                                            RuntimeError(f"Build of `{component_instance.name}` was cancelled"))
+                        continue
+                    if built.exception() is not None:
+                        failed = failed or (component_instance, built.exception())
+                        continue
+
+                    completed_components.append(
+                        (str(component_instance.name), component_instance.component_group.value))
+                    self._build_times.append(
+                        ComponentBuildTime(name=str(component_instance.name),
+                                           component_group=component_instance.component_group.value,
+                                           level=level,
+                                           seconds=built.result()))
+
+                if failed is not None:
+                    # Components still being built are cancelled, they have not been built either
+                    for built in pending:
+                        component_instance = builds[built][0]
+                        remaining_components.insert(
+                            0, (str(component_instance.name), component_instance.component_group.value))
+
+                    self._log_build_failure_component(failed[0], completed_components, remaining_components, failed[1])
+                    raise failed[1]
+        finally:
+            for built, (_, _, task) in builds.items():
+                if not built.done():
+                    task.cancel()
+
+            # Registered even if the build failed, so that the components already built are torn down
+            self._get_exit_stack().push_async_callback(self._shutdown_components,
+                                                       shutdown, [task for _, _, task in builds.values()])
+
+        # Applied in build sequence order, the last component setting a variable wins
+        for _, context, _ in builds.values():
+            self._propagate_context(base_context, context)
+
     async def populate_builder(self, config: AIQConfig, skip_workflow: bool = False):
         """
         Populate the builder with components and optionally set up the workflow.
 
+        When `general.parallel_build` is enabled, the components are built level by level from the dependency graph, the
+        components of a level being built concurrently. The time spent building each component is available from
+        `build_times`.
+
         Args:
             config (AIQConfig): The configuration object containing component definitions.
             skip_workflow (bool): If True, skips the workflow instantiation step. Defaults to False.
 
         """
         # Generate the build sequence
-        build_sequence = build_dependency_sequence(config)
+        if self.general_config.parallel_build:
+            build_levels = [[comp for comp in level if not comp.is_root] for level in build_dependency_levels(config)]
+            build_levels = [level for level in build_levels if level]
+        else:
+            build_levels = [[comp] for comp in build_dependency_sequence(config) if not comp.is_root]
 
         # Initialize progress tracking
         completed_components = []
-        remaining_components = [(str(comp.name), comp.component_group.value) for comp in build_sequence
-                                if not comp.is_root]
+        remaining_components = [(str(comp.name), comp.component_group.value) for level in build_levels
+                                for comp in level]
         if not skip_workflow:
             remaining_components.append(("<workflow>", "workflow"))
 
+        start_time = time.perf_counter()
+
         # Loop over all objects and add to the workflow builder
-        for component_instance in build_sequence:
-            try:
-                # Remove from remaining as we start building (if not root)
-                if not component_instance.is_root:
+        for level, components in enumerate(build_levels):
+            if len(components) > 1:
+                await self._build_level(level, components, completed_components, remaining_components)
+                continue
+
+            for component_instance in components:
+                try:
+                    # Remove from remaining as we start building
                     remaining_components.remove(
                         (str(component_instance.name), component_instance.component_group.value))
 
-                # Instantiate a the llm
-                if component_instance.component_group == ComponentGroup.LLMS:
-                    await self.add_llm(component_instance.name, component_instance.config)
-                # Instantiate a the embedder
-                elif component_instance.component_group == ComponentGroup.EMBEDDERS:
-                    await self.add_embedder(component_instance.name, component_instance.config)
-                # Instantiate a memory client
-                elif component_instance.component_group == ComponentGroup.MEMORY:
-                    await self.add_memory_client(component_instance.name, component_instance.config)
-            # Instantiate a object store client
-                elif component_instance.component_group == ComponentGroup.OBJECT_STORES:
-                    await self.add_object_store(component_instance.name, component_instance.config)
-                # Instantiate a retriever client
-                elif component_instance.component_group == ComponentGroup.RETRIEVERS:
-                    await self.add_retriever(component_instance.name, component_instance.config)
-                # Instantiate a function
-                elif component_instance.component_group == ComponentGroup.FUNCTIONS:
-                    # If the function is the root, set it as the workflow later
-                    if (not component_instance.is_root):
-                        await self.add_function(component_instance.name, component_instance.config)
-                elif component_instance.component_group == ComponentGroup.ITS_STRATEGIES:
-                    await self.add_its_strategy(component_instance.name, component_instance.config)
-
-                elif component_instance.component_group == ComponentGroup.AUTHENTICATION:
-                    await self.add_auth_provider(component_instance.name, component_instance.config)
-                else:
-                    raise ValueError(f"Unknown component group {component_instance.component_group}")
-
-                # Add to completed after successful build (if not root)
-                if not component_instance.is_root:
+                    seconds = await self._build_component(component_instance)
+
+                    # Add to completed after successful build
                     completed_components.append(
                         (str(component_instance.name), component_instance.component_group.value))
+                    self._build_times.append(
+                        ComponentBuildTime(name=str(component_instance.name),
+                                           component_group=component_instance.component_group.value,
+                                           level=level,
+                                           seconds=seconds))
 
-            except Exception as e:
-                self._log_build_failure_component(component_instance, completed_components, remaining_components, e)
-                raise
+                except Exception as e:
+                    self._log_build_failure_component(component_instance, completed_components, remaining_components, e)
+                    raise
 
         # Instantiate the workflow
         if not skip_workflow:
             try:
                 # Remove workflow from remaining as we start building
                 remaining_components.remove(("<workflow>", "workflow"))
+                workflow_start_time = time.perf_counter()
                 await self.set_workflow(config.workflow)
                 completed_components.append(("<workflow>", "workflow"))
+                self._build_times.append(
+                    ComponentBuildTime(name="<workflow>",
+                                       component_group="workflow",
+                                       level=len(build_levels),
+                                       seconds=time.perf_counter() - workflow_start_time))
             except Exception as e:
                 self._log_build_failure_workflow(completed_components, remaining_components, e)
                 raise
 
+        self._log_build_times(time.perf_counter() - start_time)
+
+    def _log_build_times(self, elapsed: float) -> None:
+
+        if not self._build_times:
+            return
+
+        logger.info("Built %d components in %.2fs (%.2fs spent building components)",
+                    len(self._build_times),
+                    elapsed,
+                    sum(build_time.seconds for build_time in self._build_times))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for build_time in sorted(self._build_times, key=lambda b: b.seconds, reverse=True):
+                logger.debug("- %s (%s, level %d): %.3fs",
+                             build_time.name,
+                             build_time.component_group,
+                             build_time.level,
+                             build_time.seconds)
+
     @classmethod
     @asynccontextmanager
     async def from_config(cls, config: AIQConfig):
@@ -77,6 +77,13 @@ logger = logging.getLogger(__name__)
     default=1,
     help="Number of repetitions for the evaluation.",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes running the workflow on shards of the dataset, spreading the CPU-bound work "
+    "across CPU cores. Evaluation and profiling run in the main process on the merged results.",
+)
 @click.option(
     "--override",
     type=(str, str),
@@ -107,6 +114,7 @@ def process_aiq_eval(
     endpoint: str,
     endpoint_timeout: int,
     reps: int,
+    workers: int,
     override: tuple[tuple[str, str], ...],
 ):
     """
@@ -124,6 +132,10 @@ def process_aiq_eval(
                                "exclusive. You cannot run multiple repetitions if you are skipping the workflow or "
                                "have a partially completed dataset.")
 
+    # Workers run the workflow locally
+    if workers > 1 and (skip_workflow or endpoint):
+        raise click.UsageError("The option '--workers' can not be used with '--skip_workflow' or '--endpoint'.")
+
     # Create the configuration object
     config = EvaluationRunConfig(
         config_file=config_file,
@@ -135,5 +147,6 @@ def process_aiq_eval(
         endpoint_timeout=endpoint_timeout,
         reps=reps,
         override=override,
+        workers=workers,
     )
     asyncio.run(run_and_evaluate(config))
@@ -107,12 +107,9 @@ def list_components(fields: list[SearchFields],
                     component_types: list[AIQComponentEnum],
                     output_path: str | None = None) -> None:
 
-    from aiq.runtime.loader import PluginTypes
-    from aiq.runtime.loader import discover_and_register_plugins
     from aiq.settings.global_settings import GlobalSettings
 
-    discover_and_register_plugins(PluginTypes.ALL)
-
+    # The local registry handler loads the plugins, unless the components can be listed from the plugin manifest
     config_dict = {"channels": {"list_components": {"_type": "local"}}}
     registry_config = GlobalSettings.get().model_validate(config_dict)
     local_registry_config = registry_config.channels.get("list_components", None)
@@ -22,6 +22,7 @@ import click
 
 from aiq.tool.mcp.exceptions import MCPError
 from aiq.tool.mcp.mcp_client import MCPBuilder
+from aiq.tool.mcp.mcp_session_pool import close_pools
 from aiq.utils.exception_handlers.mcp import format_mcp_error
 
 # Suppress verbose logs from mcp.client.sse and httpx
@@ -109,6 +110,9 @@ async def list_tools_and_schemas(url: str, tool_name: str | None = None) -> list
     except MCPError as e:
         format_mcp_error(e, include_traceback=False)
         return []
+    finally:
+        # The CLI exits right after, close the pooled session instead of leaving it to the event loop shutdown
+        await close_pools()
 
 
 async def list_tools_direct(url: str, tool_name: str | None = None) -> list[dict[str, str | None]]:
@@ -26,8 +26,6 @@ from pydantic_core import SchemaValidator
 from aiq.cli.cli_utils.config_override import load_and_override_config
 from aiq.cli.type_registry import GlobalTypeRegistry
 from aiq.cli.type_registry import RegisteredFrontEndInfo
-from aiq.data_models.config import AIQConfig
-from aiq.utils.data_models.schema_validator import validate_schema
 from aiq.utils.type_utils import DecomposedType
 
 logger = logging.getLogger(__name__)
@@ -171,21 +169,22 @@ class StartCommandGroup(click.Group):
 
         from aiq.runtime.loader import PluginTypes
         from aiq.runtime.loader import discover_and_register_plugins
+        from aiq.runtime.loader import validate_config
 
         if (config_file is None):
             raise click.ClickException("No config file provided.")
 
-        # Here we need to ensure all objects are loaded before we try to create the config object
-        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
-
         logger.info("Starting AIQ Toolkit from config file: '%s'", config_file)
 
         config_dict = load_and_override_config(config_file, override)
 
+        # Here we need to ensure all objects used by the config are loaded before we try to create the config object
+        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT, config=config_dict)
+
         # Get the front end for the command
         front_end: RegisteredFrontEndInfo = self._registered_front_ends[cmd_name]
 
-        config = validate_schema(config_dict, AIQConfig)
+        config = validate_config(config_dict)
 
         # Override default front end config with values from the config file for serverless execution modes.
         # Check that we have the right kind of front end
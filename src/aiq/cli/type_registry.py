@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
 import typing
 from collections.abc import AsyncIterator
@@ -298,6 +299,29 @@ class RegisteredPackage(BaseModel):
     discovery_metadata: DiscoveryMetadata
 
 
+def _load_plugins_on_miss(fn: Callable) -> Callable:
+    """
+    Retry a failed registry lookup after loading the plugins which were deferred by lazy plugin loading (see
+    `TypeRegistry.set_missing_registration_hook`).
+    """
+
+    @functools.wraps(fn)
+    def wrapper(self: "TypeRegistry", *args, **kwargs):
+        try:
+            return fn(self, *args, **kwargs)
+        except KeyError:
+            if (self._missing_registration_hook is None):
+                raise
+
+        # Called outside of the exception handler so that errors logged while loading plugins are not chained to the
+        # lookup error
+        self._missing_registration_hook()
+
+        return fn(self, *args, **kwargs)
+
+    return wrapper
+
+
 class TypeRegistry:  # pylint: disable=too-many-public-methods
 
     def __init__(self) -> None:
@@ -362,6 +386,8 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
         self._registration_changed_hooks: list[Callable[[], None]] = []
         self._registration_changed_hooks_active: bool = True
 
+        self._missing_registration_hook: Callable[[], typing.Any] | None = None
+
         self._registered_channel_map = {}
 
     def _registration_changed(self):
@@ -378,6 +404,13 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed_hooks.append(cb)
 
+    def set_missing_registration_hook(self, cb: Callable[[], typing.Any] | None) -> None:
+        """
+        Set the callback invoked when a lookup does not find a registration, after which the lookup is retried once.
+        The callback is expected to register the components which were not loaded yet.
+        """
+        self._missing_registration_hook = cb
+
     @contextmanager
     def pause_registration_changed_hooks(self):
 
@@ -401,6 +434,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_telemetry_exporter(self, config_type: type[TelemetryExporterBaseConfig]) -> RegisteredTelemetryExporter:
 
         try:
@@ -423,6 +457,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_logging_method(self, config_type: type[LoggingBaseConfig]) -> RegisteredLoggingMethod:
         try:
             return self._registered_logging_methods[config_type]
@@ -444,6 +479,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_front_end(self, config_type: type[FrontEndBaseConfig]) -> RegisteredFrontEndInfo:
 
         try:
@@ -466,6 +502,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_function(self, config_type: type[FunctionBaseConfig]) -> RegisteredFunctionInfo:
 
         try:
@@ -488,6 +525,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_llm_provider(self, config_type: type[LLMBaseConfig]) -> RegisteredLLMProviderInfo:
 
         try:
@@ -510,6 +548,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_auth_provider(self, config_type: type[AuthProviderBaseConfig]) -> RegisteredAuthProviderInfo:
         try:
             return self._registered_auth_provider_infos[config_type]
@@ -532,6 +571,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_llm_client(self, config_type: type[LLMBaseConfig], wrapper_type: str) -> RegisteredLLMClientInfo:
 
         try:
@@ -556,6 +596,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_embedder_provider(self, config_type: type[EmbedderBaseConfig]) -> RegisteredEmbedderProviderInfo:
 
         try:
@@ -580,6 +621,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_embedder_client(self, config_type: type[EmbedderBaseConfig],
                             wrapper_type: str) -> RegisteredEmbedderClientInfo:
 
@@ -605,6 +647,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_evaluator(self, config_type: type[EvaluatorBaseConfig]) -> RegisteredEvaluatorInfo:
 
         try:
@@ -627,6 +670,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_memory(self, config_type: type[MemoryBaseConfig]) -> RegisteredMemoryInfo:
 
         try:
@@ -649,6 +693,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_object_store(self, config_type: type[ObjectStoreBaseConfig]) -> RegisteredObjectStoreInfo:
 
         try:
@@ -671,6 +716,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_retriever_provider(self, config_type: type[RetrieverBaseConfig]) -> RegisteredRetrieverProviderInfo:
 
         try:
@@ -695,6 +741,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_retriever_client(self, config_type: type[RetrieverBaseConfig],
                              wrapper_type: str | None) -> RegisteredRetrieverClientInfo:
 
@@ -720,6 +767,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_tool_wrapper(self, llm_framework: str) -> RegisteredToolWrapper:
 
         try:
@@ -737,6 +785,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_its_strategy(self, config_type: type[ITSStrategyBaseConfig]) -> RegisteredITSStrategyInfo:
         try:
             strategy = self._registered_its_strategies[config_type]
@@ -758,6 +807,7 @@ class TypeRegistry:  # pylint: disable=too-many-public-methods
 
         self._registration_changed()
 
+    @_load_plugins_on_miss
     def get_registry_handler(self, config_type: type[RegistryHandlerBaseConfig]) -> RegisteredRegistryHandlerInfo:
 
         try:
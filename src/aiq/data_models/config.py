@@ -20,17 +20,20 @@ import typing
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Discriminator
+from pydantic import Field
 from pydantic import ValidationError
 from pydantic import ValidationInfo
 from pydantic import ValidatorFunctionWrapHandler
 from pydantic import field_validator
 
 from aiq.data_models.evaluate import EvalConfig
+from aiq.data_models.event_stream import EventStreamConfig
 from aiq.data_models.front_end import FrontEndBaseConfig
 from aiq.data_models.function import EmptyFunctionConfig
 from aiq.data_models.function import FunctionBaseConfig
 from aiq.data_models.its_strategy import ITSStrategyBaseConfig
 from aiq.data_models.logging import LoggingBaseConfig
+from aiq.data_models.telemetry_exporter import ExporterMode
 from aiq.data_models.telemetry_exporter import TelemetryExporterBaseConfig
 from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
 
@@ -137,6 +140,11 @@ class TelemetryConfig(BaseModel):
 
     logging: dict[str, LoggingBaseConfig] = {}
     tracing: dict[str, TelemetryExporterBaseConfig] = {}
+    event_stream: EventStreamConfig = EventStreamConfig()
+    # Whether the tracing exporters are copied for each workflow run or shared by every run
+    exporter_mode: ExporterMode = ExporterMode.ISOLATED
+    # Maximum number of events pending dispatch to the shared exporters before they are dispatched by the producer
+    exporter_queue_size: int = Field(default=8192, gt=0)
 
     @field_validator("logging", "tracing", mode="wrap")
     @classmethod
@@ -191,6 +199,13 @@ class GeneralConfig(BaseModel):
     better error messages when debugging.
     """
 
+    parallel_build: bool = True
+    """
+    Whether to instantiate the components that do not depend on each other concurrently when building the workflow.
+    Dependencies are only known through component references (e.g. `LLMRef`, `FunctionRef`) in the configuration,
+    disable for components looking up other components by plain name while they are built.
+    """
+
     telemetry: TelemetryConfig = TelemetryConfig()
 
     # FrontEnd Configuration
@@ -19,6 +19,7 @@ from pathlib import Path
 
 from pydantic import BaseModel
 from pydantic import Discriminator
+from pydantic import Field
 from pydantic import model_validator
 
 from aiq.data_models.common import TypedBaseModel
@@ -69,6 +70,16 @@ class EvalOutputConfig(BaseModel):
     workflow_output_step_filter: list[IntermediateStepType] | None = None
 
 
+class EvalCacheConfig(BaseModel):
+    # Path to the SQLite database of the cache, defaults to eval_cache.sqlite in the output directory. The cache is kept
+    # when the output directory is cleaned up
+    path: Path | None = None
+    # Whether to cache the workflow output of each item
+    workflow_outputs: bool = True
+    # Whether to cache the scores of the evaluators
+    scores: bool = True
+
+
 class EvalGeneralConfig(BaseModel):
     max_concurrency: int = 8
 
@@ -88,6 +99,17 @@ class EvalGeneralConfig(BaseModel):
     # Inference profiler
     profiler: ProfilerConfig | None = None
 
+    # Evaluate each item as soon as its workflow run completes, rather than after the whole dataset. The workflow output
+    # and the scores are also appended to JSON Lines files as they are produced
+    pipelined: bool = False
+
+    # Maximum number of completed items waiting to be scored by each evaluator when pipelined
+    pipeline_queue_size: int = Field(default=64, gt=0)
+
+    # Cache of the workflow outputs and scores, reused by later runs as long as the configuration and the items they
+    # depend on are unchanged
+    cache: EvalCacheConfig | None = None
+
     # overwrite the output_dir with the output config if present
     @model_validator(mode="before")
     @classmethod
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from enum import Enum
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from aiq.utils.reactive.buffered_subject import OverflowPolicy
+
+
+class EventDeliveryMode(str, Enum):
+    SYNC = "sync"
+    ASYNC = "async"
+
+
+class EventStreamConfig(BaseModel):
+    """
+    Configures how intermediate steps are delivered to their subscribers (exporters, step subscribers, eval collectors).
+
+    Args:
+        delivery (EventDeliveryMode): One of:
+            - 'sync' => every step is delivered to every subscriber on the producer's stack
+            - 'async' => steps are enqueued into a bounded buffer per subscriber and delivered in batches by a
+              background task
+        buffer_size (int): Maximum number of pending steps per subscriber in 'async' mode.
+        batch_size (int): Maximum number of steps delivered per batch in 'async' mode.
+        overflow_policy (OverflowPolicy): What to do when a subscriber's buffer is full in 'async' mode.
+        sample_rate (int): With the 'sample' overflow policy, one out of every `sample_rate` overflowing steps is kept.
+    """
+    delivery: EventDeliveryMode = EventDeliveryMode.SYNC
+    buffer_size: int = Field(default=1024, gt=0)
+    batch_size: int = Field(default=64, gt=0)
+    overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK
+    sample_rate: int = Field(default=10, gt=0)
@@ -13,12 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import typing
+
 from pydantic import BaseModel
 
 
 class PromptCachingConfig(BaseModel):
     enable: bool = False
     min_frequency: float = 0.5
+    max_memory_mb: float = 1024.0
 
 
 class BottleneckConfig(BaseModel):
@@ -40,6 +43,14 @@ class PrefixSpanConfig(BaseModel):
     chain_with_common_prefixes: bool = False
 
 
+class TraceStoreConfig(BaseModel):
+    # Format of the all_requests_profiler_traces file written to the output directory
+    traces_format: typing.Literal["json", "parquet"] = "json"
+    # Stream steps to an Arrow file in the output directory as examples complete, instead of keeping them in memory
+    spill_to_disk: bool = False
+    batch_size: int = 4096
+
+
 class ProfilerConfig(BaseModel):
 
     base_metrics: bool = False
@@ -52,3 +63,4 @@ class ProfilerConfig(BaseModel):
     bottleneck_analysis: BottleneckConfig = BottleneckConfig()
     concurrency_spike_analysis: ConcurrencySpikeConfig = ConcurrencySpikeConfig()
     prefix_span_analysis: PrefixSpanConfig = PrefixSpanConfig()
+    trace_store: TraceStoreConfig = TraceStoreConfig()
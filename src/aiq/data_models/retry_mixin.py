@@ -33,3 +33,32 @@ class RetryMixin(BaseModel):
     retry_on_errors: list[str] | None = Field(default_factory=lambda: ["Too Many Requests"],
                                               description="List of error substrings that should trigger a retry.",
                                               exclude=True)
+    rate_limit_requests_per_minute: float | None = Field(default=None,
+                                                         gt=0,
+                                                         description="Maximum number of requests per minute, shared by "
+                                                         "every client built from this configuration.",
+                                                         exclude=True)
+    rate_limit_tokens_per_minute: float | None = Field(default=None,
+                                                       gt=0,
+                                                       description="Maximum number of estimated input tokens per "
+                                                       "minute, shared by every client built from this configuration.",
+                                                       exclude=True)
+    max_concurrent_requests: int | None = Field(default=None,
+                                                gt=0,
+                                                description="Maximum number of concurrent requests, shared by every "
+                                                "client built from this configuration.",
+                                                exclude=True)
+    adaptive_concurrency: bool = Field(default=False,
+                                       description="Whether to halve the number of concurrent requests when the "
+                                       "service responds 429 or 503, and raise it again as requests succeed.",
+                                       exclude=True)
+    circuit_breaker_threshold: int | None = Field(default=None,
+                                                  gt=0,
+                                                  description="Number of consecutive failed requests after which calls "
+                                                  "fail fast until the service recovers. Disabled when not set.",
+                                                  exclude=True)
+    circuit_breaker_reset_timeout: float = Field(default=30.0,
+                                                 gt=0,
+                                                 description="Time in seconds an open circuit breaker fails calls "
+                                                 "before letting a probe request through.",
+                                                 exclude=True)
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import model_validator
+
+from aiq.data_models.component_ref import EmbedderRef
+
+
+class SemanticCacheMixin(BaseModel):
+    """Mixin class for the configuration of a read-through cache of search results."""
+    ttl_seconds: float | None = Field(default=300.0,
+                                      gt=0,
+                                      description="Number of seconds a search result is cached for. Results do not "
+                                      "expire when not set.")
+    max_entries: int = Field(default=1024, gt=0, description="Maximum number of cached search results.")
+    normalize_queries: bool = Field(default=True,
+                                    description="Whether queries differing only in case and whitespace share "
+                                    "their cached results.")
+    similarity_threshold: float | None = Field(default=None,
+                                               gt=0,
+                                               le=1,
+                                               description="Minimum cosine similarity between the embeddings of a "
+                                               "query and of a cached query for the cached results to be returned. "
+                                               "Only exact matches are returned when not set.")
+    embedder: EmbedderRef | None = Field(default=None,
+                                         description="Instance name of the embedder client used to embed queries for "
+                                         "the similarity cache.")
+    max_embeddings: int = Field(default=4096, gt=0, description="Maximum number of cached query embeddings.")
+
+    @model_validator(mode="after")
+    def _check_embedder(self):
+        if self.similarity_threshold is not None and self.embedder is None:
+            raise ValueError("An embedder is required when similarity_threshold is set")
+        return self
@@ -14,11 +14,24 @@
 # limitations under the License.
 
 import typing
+from enum import Enum
 
 from aiq.data_models.common import BaseModelRegistryTag
 from aiq.data_models.common import TypedBaseModel
 
 
+class ExporterMode(str, Enum):
+    """
+    How telemetry exporters are shared by concurrent workflow runs.
+
+    - 'isolated' => every run starts isolated copies of the exporters, stopped when the run completes
+    - 'shared' => the exporters are started once and fed the events of every run by a long-lived pipeline, which tags
+      the events with the id of their run
+    """
+    ISOLATED = "isolated"
+    SHARED = "shared"
+
+
 class TelemetryExporterBaseConfig(TypedBaseModel, BaseModelRegistryTag):
     pass
 
@@ -20,6 +20,7 @@ from pydantic import BaseModel
 from aiq.eval.evaluator.evaluator_model import EvalInput
 from aiq.eval.evaluator.evaluator_model import EvalOutput
 from aiq.eval.usage_stats import UsageStats
+from aiq.eval.utils.result_cache import EvalCacheStats
 from aiq.profiler.data_models import ProfilerResults
 
 
@@ -44,6 +45,8 @@ class EvaluationRunConfig(BaseModel):
     # number of passes at each concurrency, if 0 the dataset is adjusted to a multiple of the
     # concurrency. The is only used if adjust_dataset_size is true
     num_passes: int = 0
+    # number of worker processes running the workflow on shards of the dataset, 1 runs it in the current process
+    workers: int = 1
 
 
 class EvaluationRunOutput(BaseModel):
@@ -58,3 +61,4 @@ class EvaluationRunOutput(BaseModel):
     evaluation_results: list[tuple[str, EvalOutput]]
     usage_stats: UsageStats | None = None
     profiler_results: ProfilerResults
+    cache_stats: EvalCacheStats | None = None
@@ -220,10 +220,9 @@ class DatasetHandler:
         filtered_steps = self.intermediate_step_adapter.filter_intermediate_steps(intermediate_steps, event_filter)
         return self.intermediate_step_adapter.serialize_intermediate_steps(filtered_steps)
 
-    def publish_eval_input(self, eval_input, workflow_output_step_filter: list[IntermediateStepType] = None) -> str:
+    def _publish_item(self, item: EvalInputItem, workflow_output_step_filter: list[IntermediateStepType] = None):
         """
-        Convert the EvalInput object to a JSON output for storing in a file. Use the orginal keys to
-        allow re-running evaluation using the orignal config file and '--skip_workflow' option.
+        Convert an EvalInputItem to the JSON-serializable entry stored in the workflow output.
         """
 
         def parse_if_json_string(value):
@@ -236,19 +235,35 @@ class DatasetHandler:
                 return value.model_dump()
             return value
 
-        indent = 2
         if self.is_structured_input():
-            # Extract structured data from EvalInputItems
-            data = [{
+            # Extract structured data from the EvalInputItem
+            return {
                 self.id_key: item.id,
                 self.question_key: item.input_obj,
                 self.answer_key: item.expected_output_obj,
                 self.generated_answer_key: item.output_obj,
                 self.trajectory_key: self.filter_intermediate_steps(item.trajectory, workflow_output_step_filter),
                 self.expected_trajectory_key: self.filter_intermediate_steps(item.expected_trajectory),
-            } for item in eval_input.eval_input_items]
-        else:
-            # Unstructured case: return only raw output objects as a JSON array
-            data = [parse_if_json_string(item.output_obj) for item in eval_input.eval_input_items]
+            }
+
+        # Unstructured case: return only the raw output object
+        return parse_if_json_string(item.output_obj)
+
+    def publish_eval_input(self, eval_input, workflow_output_step_filter: list[IntermediateStepType] = None) -> str:
+        """
+        Convert the EvalInput object to a JSON output for storing in a file. Use the orginal keys to
+        allow re-running evaluation using the orignal config file and '--skip_workflow' option.
+        """
+        indent = 2
+        data = [self._publish_item(item, workflow_output_step_filter) for item in eval_input.eval_input_items]
 
         return json.dumps(data, indent=indent, ensure_ascii=False, default=str)
+
+    def publish_eval_input_item(self,
+                                item: EvalInputItem,
+                                workflow_output_step_filter: list[IntermediateStepType] = None) -> str:
+        """
+        Convert a single EvalInputItem to a single line of JSON, the entry of the item in the workflow output, for
+        appending to a JSON Lines file.
+        """
+        return json.dumps(self._publish_item(item, workflow_output_step_filter), ensure_ascii=False, default=str)
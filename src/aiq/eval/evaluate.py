@@ -16,6 +16,9 @@
 import asyncio
 import logging
 import shutil
+import typing
+from collections.abc import Awaitable
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
@@ -31,14 +34,20 @@ from aiq.eval.dataset_handler.dataset_handler import DatasetHandler
 from aiq.eval.evaluator.evaluator_model import EvalInput
 from aiq.eval.evaluator.evaluator_model import EvalInputItem
 from aiq.eval.evaluator.evaluator_model import EvalOutput
+from aiq.eval.evaluator.evaluator_model import EvalOutputItem
 from aiq.eval.usage_stats import UsageStats
 from aiq.eval.usage_stats import UsageStatsItem
 from aiq.eval.usage_stats import UsageStatsLLM
 from aiq.eval.utils.output_uploader import OutputUploader
+from aiq.eval.utils.result_cache import EvalCacheStats
+from aiq.eval.utils.result_cache import EvalResultCache
 from aiq.eval.utils.weave_eval import WeaveEvaluationIntegration
 from aiq.profiler.data_models import ProfilerResults
 from aiq.runtime.session import AIQSessionManager
 
+if typing.TYPE_CHECKING:
+    from aiq.profiler.trace_store import TraceStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,9 +56,13 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
     Instantiated for each evaluation run and used to store data for that single run.
     """
 
-    def __init__(self, config: EvaluationRunConfig):
+    def __init__(self,
+                 config: EvaluationRunConfig,
+                 result_cache_provider: Callable[[Path], EvalResultCache] | None = None):
         """
-        Initialize an EvaluationRun with configuration.
+        Initialize an EvaluationRun with configuration. If the evaluation config enables the result cache,
+        `result_cache_provider` is called with the path of the cache to get a cache shared with other runs, otherwise
+        the run opens its own cache.
         """
         from aiq.eval.intermediate_step_adapter import IntermediateStepAdapter
 
@@ -76,6 +89,18 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         # evaluation output files
         self.evaluator_output_files: list[Path] = []
 
+        # intermediate steps of each item, appended as items complete when profiling is enabled
+        self.trace_store: "TraceStore | None" = None
+        self._traced_items: set[int] = set()
+
+        # cache of the workflow outputs and scores, and the fingerprints of the configs the cached results depend on
+        self.result_cache_provider = result_cache_provider
+        self.result_cache: EvalResultCache | None = None
+        self.cache_stats: EvalCacheStats = EvalCacheStats()
+        self._owns_result_cache: bool = False
+        self._workflow_fingerprint: str | None = None
+        self._evaluator_fingerprints: dict[str, str] = {}
+
     def _compute_usage_stats(self, item: EvalInputItem):
         """Compute usage stats for a single item using the intermediate steps"""
         # get the prompt and completion tokens from the intermediate steps
@@ -129,9 +154,167 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                                                                      llm_latency=llm_latency)
         return self.usage_stats.usage_stats_items[item.id]
 
-    async def run_workflow_local(self, session_manager: AIQSessionManager):
+    def _record_trace(self, item_index: int, item: EvalInputItem):
+        """Append the intermediate steps of an item to the profiler trace store, if profiling is enabled"""
+        if not self.eval_config.general.profiler or item_index in self._traced_items:
+            return
+
+        if self.trace_store is None:
+            from aiq.profiler.profile_runner import ProfilerRunner
+            self.trace_store = ProfilerRunner.create_trace_store(self.eval_config.general.profiler,
+                                                                 self.eval_config.general.output_dir)
+
+        self.trace_store.append_example(item_index, item.trajectory)
+        self._traced_items.add(item_index)
+
+    def _open_result_cache(self, config: typing.Any) -> None:
+        """Open the result cache if enabled, and compute the fingerprints of the workflow and evaluator configs"""
+        cache_config = self.eval_config.general.cache
+        if not cache_config:
+            return
+
+        # Resolved before the job id is appended to the output directory, so that the cache is shared by the jobs
+        cache_path = cache_config.path or self.eval_config.general.output_dir / "eval_cache.sqlite"
+
+        if self.result_cache_provider is not None:
+            self.result_cache = self.result_cache_provider(cache_path)
+        else:
+            self.result_cache = EvalResultCache(cache_path)
+            self._owns_result_cache = True
+        logger.info("Using evaluation result cache %s", self.result_cache.db_path)
+
+        if cache_config.workflow_outputs and not self.config.endpoint:
+            self._workflow_fingerprint = EvalResultCache.workflow_fingerprint(config, self.config.result_json_path)
+
+        if cache_config.scores:
+            self._evaluator_fingerprints = {
+                name: EvalResultCache.evaluator_fingerprint(config, name)
+                for name in self.eval_config.evaluators
+            }
+
+    def _close_result_cache(self) -> None:
+        if self.result_cache is None:
+            return
+
+        logger.info("Evaluation result cache: %s", self.cache_stats)
+        if self._owns_result_cache:
+            self.result_cache.close()
+        self.result_cache = None
+
+    async def _restore_workflow_output(self, cache_key: str, item: EvalInputItem) -> bool:
+        """Restore the workflow output and trajectory of an item from the cache, returning whether they were cached"""
+        cached = await self.result_cache.get_workflow_output(cache_key)
+        if cached is None:
+            self.cache_stats.workflow_misses += 1
+            return False
+
+        self.cache_stats.workflow_hits += 1
+        item.output_obj, item.trajectory = cached
+        return True
+
+    @staticmethod
+    def _is_error_item(output_item: EvalOutputItem) -> bool:
+        """Whether an output item records an evaluator error, which is not cached so that the item is scored again"""
+        return isinstance(output_item.reasoning, dict) and "error" in output_item.reasoning
+
+    def _with_cached_scores(self, evaluator_name: str, evaluator: Any) -> Any:
+        """Wrap the item evaluation function of an evaluator to reuse and store the scores in the cache"""
+        from aiq.builder.evaluator import EvaluatorInfo
+
+        fingerprint = self._evaluator_fingerprints[evaluator_name]
+        evaluate_item_fn = evaluator.evaluate_item_fn
+
+        async def evaluate_item(item: EvalInputItem) -> EvalOutputItem:
+            cache_key = EvalResultCache.score_key(fingerprint, EvalResultCache.item_digest(item))
+            cached = await self.result_cache.get_scores([cache_key])
+            if cache_key in cached:
+                self.cache_stats.score_hits += 1
+                return cached[cache_key]
+
+            self.cache_stats.score_misses += 1
+            output_item = await evaluate_item_fn(item)
+            if not self._is_error_item(output_item):
+                await self.result_cache.put_scores(evaluator_name, {cache_key: output_item})
+            return output_item
+
+        return EvaluatorInfo(config=evaluator.config,
+                             evaluate_fn=evaluator.evaluate_fn,
+                             description=evaluator.description,
+                             evaluate_item_fn=evaluate_item,
+                             max_concurrency=evaluator.max_concurrency)
+
+    async def _evaluate_cached(self, evaluator_name: str, evaluator: Any) -> EvalOutput:
+        """
+        Evaluate the dataset, reusing the cached scores. Evaluators scoring items one at a time only score the items
+        missing from the cache, the output of other evaluators is cached for the dataset as a whole.
+        """
+        from aiq.eval.streaming_evaluation import ScoreReduction
+
+        fingerprint = self._evaluator_fingerprints[evaluator_name]
+        items = self.eval_input.eval_input_items
+        item_digests = [EvalResultCache.item_digest(item) for item in items]
+
+        if evaluator.evaluate_item_fn is None:
+            cache_key = EvalResultCache.output_key(fingerprint, item_digests)
+            eval_output = await self.result_cache.get_output(cache_key)
+            if eval_output is not None:
+                self.cache_stats.score_hits += len(items)
+                return eval_output
+
+            self.cache_stats.score_misses += len(items)
+            eval_output = await evaluator.evaluate_fn(self.eval_input)
+            if not any(self._is_error_item(output_item) for output_item in eval_output.eval_output_items):
+                await self.result_cache.put_output(evaluator_name, cache_key, eval_output)
+            return eval_output
+
+        cache_keys = [EvalResultCache.score_key(fingerprint, item_digest) for item_digest in item_digests]
+        scores = await self.result_cache.get_scores(cache_keys)
+        missing = [(cache_key, item) for cache_key, item in zip(cache_keys, items) if cache_key not in scores]
+        self.cache_stats.score_hits += len(items) - len(missing)
+        self.cache_stats.score_misses += len(missing)
+
+        if missing:
+            missing_output = await evaluator.evaluate_fn(EvalInput(eval_input_items=[item for _, item in missing]))
+            if len(missing_output.eval_output_items) != len(missing):
+                logger.warning("Evaluator %s did not return one output item per input item, evaluating all the items",
+                               evaluator_name)
+                return await evaluator.evaluate_fn(self.eval_input)
+
+            missing_keys = [cache_key for cache_key, _ in missing]
+            new_scores = dict(zip(missing_keys, missing_output.eval_output_items))
+            valid_scores = {key: item for key, item in new_scores.items() if not self._is_error_item(item)}
+            await self.result_cache.put_scores(evaluator_name, valid_scores)
+            scores.update(new_scores)
+
+        # Items in dataset order, with the average computed as BaseEvaluator does
+        output_items = [scores[cache_key] for cache_key in cache_keys]
+        reduction = ScoreReduction()
+        for output_item in output_items:
+            reduction.add(output_item.score)
+
+        return EvalOutput(average_score=reduction.average_score, eval_output_items=output_items)
+
+    async def _record_item(self, item_index: int, item: EvalInputItem, usage_stats_item: UsageStatsItem | None = None):
+        """
+        Record the usage stats and trace of an item whose workflow output is available. The usage stats are computed
+        from the trajectory unless they are given.
+        """
+        if usage_stats_item is None:
+            usage_stats_item = self._compute_usage_stats(item)
+        else:
+            self.usage_stats.usage_stats_items[item.id] = usage_stats_item
+        self._record_trace(item_index, item)
+
+        self.weave_eval.log_prediction(item, item.output_obj)
+        await self.weave_eval.log_usage_stats(item, usage_stats_item)
+
+    async def run_workflow_local(self,
+                                 session_manager: AIQSessionManager,
+                                 on_item_complete: Callable[[EvalInputItem], Awaitable[None]] | None = None,
+                                 show_progress: bool = True):
         '''
-        Launch the workflow with the specified questions and extract the output using the jsonpath
+        Launch the workflow with the specified questions and extract the output using the jsonpath. If provided,
+        `on_item_complete` is awaited with each item whose workflow run completed.
         '''
         # import function level dependencies
         from jsonpath_ng import parse
@@ -142,9 +325,18 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         jsonpath_expr = parse(self.config.result_json_path)
         stop_event = asyncio.Event()
 
+        item_indices = {id(item): i for i, item in enumerate(self.eval_input.eval_input_items)}
+
         async def run_one(item: EvalInputItem):
             if stop_event.is_set():
-                return "", []
+                return False
+
+            cache_key = None
+            if self._workflow_fingerprint is not None:
+                cache_key = EvalResultCache.workflow_key(self._workflow_fingerprint, item)
+                if await self._restore_workflow_output(cache_key, item):
+                    await self._record_item(item_indices[id(item)], item)
+                    return True
 
             async with session_manager.run(item.input_obj) as runner:
                 if not session_manager.workflow.has_single_output:
@@ -198,14 +390,18 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
 
                 item.output_obj = output
                 item.trajectory = self.intermediate_step_adapter.validate_intermediate_steps(intermediate_steps)
-                usage_stats_item = self._compute_usage_stats(item)
+                await self._record_item(item_indices[id(item)], item)
+
+            if cache_key is not None:
+                await self.result_cache.put_workflow_output(cache_key, item.output_obj, item.trajectory)
 
-                self.weave_eval.log_prediction(item, output)
-                await self.weave_eval.log_usage_stats(item, usage_stats_item)
+            return True
 
         async def wrapped_run(item: EvalInputItem) -> None:
-            await run_one(item)
+            completed = await run_one(item)
             pbar.update(1)
+            if completed and on_item_complete is not None:
+                await on_item_complete(item)
 
         # if self.config.skip_complete is set skip eval_input_items with a non-empty output_obj
         if self.config.skip_completed_entries:
@@ -215,10 +411,69 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                 return
         else:
             eval_input_items = self.eval_input.eval_input_items
-        pbar = tqdm(total=len(eval_input_items), desc="Running workflow")
+        pbar = tqdm(total=len(eval_input_items), desc="Running workflow", disable=not show_progress)
         await asyncio.gather(*[wrapped_run(item) for item in eval_input_items])
         pbar.close()
 
+    async def run_workflow_sharded(self, on_item_complete: Callable[[EvalInputItem], Awaitable[None]] | None = None):
+        '''
+        Run the workflow with `workers` processes, each running a shard of the dataset. Items are recorded as their
+        output streams back from the workers, and `on_item_complete` is awaited with each of them if provided.
+        '''
+        from aiq.eval.sharded_workflow import EvaluationShardedWorkflowHandler
+
+        items = list(enumerate(self.eval_input.eval_input_items))
+        if self.config.skip_completed_entries:
+            items = [(index, item) for index, item in items if not item.output_obj]
+            if not items:
+                logger.warning("All items have a non-empty output. Skipping workflow pass altogether.")
+                return
+
+        pbar = tqdm(total=len(items), desc="Running workflow")
+        try:
+            # Items restored from the result cache are not sent to the workers
+            cache_keys: dict[int, str] = {}
+            pending = []
+            for index, item in items:
+                if self._workflow_fingerprint is not None:
+                    cache_keys[index] = EvalResultCache.workflow_key(self._workflow_fingerprint, item)
+                    if await self._restore_workflow_output(cache_keys[index], item):
+                        await self._record_item(index, item)
+                        pbar.update(1)
+                        if on_item_complete is not None:
+                            await on_item_complete(item)
+                        continue
+                pending.append((index, item))
+
+            handler = EvaluationShardedWorkflowHandler(self.config,
+                                                       max_concurrency=self.eval_config.general.max_concurrency,
+                                                       workers=self.config.workers)
+            async for index, output, trajectory, usage_stats_item in handler.run_workflow_sharded(pending):
+                item = self.eval_input.eval_input_items[index]
+                item.output_obj = output
+                item.trajectory = trajectory
+                await self._record_item(index, item, usage_stats_item)
+
+                if index in cache_keys:
+                    await self.result_cache.put_workflow_output(cache_keys[index], item.output_obj, item.trajectory)
+
+                pbar.update(1)
+                if on_item_complete is not None:
+                    await on_item_complete(item)
+
+            self.workflow_interrupted = self.workflow_interrupted or handler.workflow_interrupted
+        finally:
+            pbar.close()
+
+    async def run_workflow(self,
+                           session_manager: AIQSessionManager | None,
+                           on_item_complete: Callable[[EvalInputItem], Awaitable[None]] | None = None):
+        """Run the workflow locally, in this process or with several worker processes"""
+        if self.config.workers > 1:
+            await self.run_workflow_sharded(on_item_complete)
+        else:
+            await self.run_workflow_local(session_manager, on_item_complete)
+
     async def run_workflow_remote(self):
         from aiq.eval.remote_workflow import EvaluationRemoteWorkflowHandler
         handler = EvaluationRemoteWorkflowHandler(self.config, self.eval_config.general.max_concurrency)
@@ -239,15 +494,18 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
 
         from aiq.profiler.profile_runner import ProfilerRunner
 
-        all_stats = []
-        for input_item in self.eval_input.eval_input_items:
-            all_stats.append(input_item.trajectory)
+        # Items whose steps were not recorded while the workflow ran (remote or skipped items) are added now
+        for i, input_item in enumerate(self.eval_input.eval_input_items):
+            self._record_trace(i, input_item)
 
         profiler_runner = ProfilerRunner(self.eval_config.general.profiler,
                                          self.eval_config.general.output_dir,
                                          write_output=self.config.write_output)
 
-        return await profiler_runner.run(all_stats)
+        if self.trace_store is None:
+            return await profiler_runner.run([])
+
+        return await profiler_runner.run(self.trace_store)
 
     def cleanup_output_directory(self):
         '''Remove contents of the output directory if it exists'''
@@ -260,7 +518,19 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         # If cleanup is true, remove the entire directory and we are done
         if output_config.cleanup:
             logger.info("Cleaning up entire output directory: %s", output_config.dir)
-            shutil.rmtree(output_config.dir)
+            kept_files = {path.resolve() for path in self.result_cache.files} if self.result_cache else set()
+            if not any(path.parent == output_dir.resolve() for path in kept_files):
+                shutil.rmtree(output_config.dir)
+                return
+
+            # Keep the result cache, it is reused by the next runs
+            for path in output_dir.iterdir():
+                if path.resolve() in kept_files:
+                    continue
+                if path.is_dir() and not path.is_symlink():
+                    shutil.rmtree(path)
+                else:
+                    path.unlink()
             return
 
         if output_config.job_management.max_jobs == 0:
@@ -349,13 +619,67 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
     async def run_single_evaluator(self, evaluator_name: str, evaluator: Any):
         """Run a single evaluator and store its results."""
         try:
-            eval_output = await evaluator.evaluate_fn(self.eval_input)
+            if self.result_cache is not None and evaluator_name in self._evaluator_fingerprints:
+                eval_output = await self._evaluate_cached(evaluator_name, evaluator)
+            else:
+                eval_output = await evaluator.evaluate_fn(self.eval_input)
             self.evaluation_results.append((evaluator_name, eval_output))
 
             await self.weave_eval.alog_score(eval_output, evaluator_name)
         except Exception as e:
             logger.exception("An error occurred while running evaluator %s: %s", evaluator_name, e, exc_info=True)
 
+    async def run_pipelined(self,
+                            session_manager: AIQSessionManager | None,
+                            evaluators: dict[str, Any],
+                            dataset_handler: DatasetHandler):
+        """
+        Run the workflow and the evaluators concurrently, each item being scored as soon as its workflow run completes.
+        Evaluators which can only score the whole dataset are run once the workflow completes.
+        """
+        from aiq.eval.streaming_evaluation import StreamingEvaluation
+
+        general_config = self.eval_config.general
+
+        streamed = {
+            name: evaluator
+            for name, evaluator in evaluators.items() if StreamingEvaluation.can_stream(evaluator)
+        }
+        batched = {name: evaluator for name, evaluator in evaluators.items() if evaluator and name not in streamed}
+
+        if self.result_cache is not None:
+            streamed = {
+                name: self._with_cached_scores(name, evaluator) if name in self._evaluator_fingerprints else evaluator
+                for name, evaluator in streamed.items()
+            }
+
+        step_filter = general_config.output.workflow_output_step_filter if general_config.output else None
+
+        def publish_item(item: EvalInputItem) -> str:
+            return dataset_handler.publish_eval_input_item(item, step_filter)
+
+        streaming = StreamingEvaluation(streamed,
+                                        self.eval_input.eval_input_items,
+                                        queue_size=general_config.pipeline_queue_size,
+                                        default_concurrency=general_config.max_concurrency,
+                                        output_dir=general_config.output_dir if self.config.write_output else None,
+                                        publish_item=publish_item)
+
+        try:
+            async with streaming:
+                await self.run_workflow(session_manager, on_item_complete=streaming.submit)
+                await streaming.submit_remaining()
+
+                batch_tasks = [self.run_single_evaluator(name, evaluator) for name, evaluator in batched.items()]
+                streamed_results, *_ = await asyncio.gather(streaming.finish(), *batch_tasks)
+
+            for evaluator_name, eval_output in streamed_results:
+                self.evaluation_results.append((evaluator_name, eval_output))
+                await self.weave_eval.alog_score(eval_output, evaluator_name)
+        finally:
+            # Finish prediction loggers in Weave
+            await self.weave_eval.afinish_loggers()
+
     async def run_evaluators(self, evaluators: dict[str, Any]):
         """Run all configured evaluators asynchronously."""
         tasks = [self.run_single_evaluator(name, evaluator) for name, evaluator in evaluators.items() if evaluator]
@@ -375,16 +699,16 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
 
     def apply_overrides(self):
         from aiq.cli.cli_utils.config_override import load_and_override_config
-        from aiq.data_models.config import AIQConfig
         from aiq.runtime.loader import PluginTypes
         from aiq.runtime.loader import discover_and_register_plugins
-        from aiq.utils.data_models.schema_validator import validate_schema
-
-        # Register plugins before validation
-        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
+        from aiq.runtime.loader import validate_config
 
         config_dict = load_and_override_config(self.config.config_file, self.config.override)
-        config = validate_schema(config_dict, AIQConfig)
+
+        # Register the plugins used by the config before validation
+        discover_and_register_plugins(PluginTypes.CONFIG_OBJECT, config=config_dict)
+
+        config = validate_config(config_dict)
         return config
 
     def _get_workflow_alias(self, workflow_type: str | None = None):
@@ -405,7 +729,6 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         """
         logger.info("Starting evaluation run with config file: %s", self.config.config_file)
 
-        from aiq.builder.eval_builder import WorkflowEvalBuilder
         from aiq.runtime.loader import load_config
 
         # Load and override the config
@@ -417,6 +740,20 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         workflow_alias = self._get_workflow_alias(config.workflow.type)
         logger.debug("Loaded %s evaluation configuration: %s", workflow_alias, self.eval_config)
 
+        # Open the result cache
+        self._open_result_cache(config)
+        try:
+            return await self._run_and_evaluate(config, workflow_alias, session_manager, job_id)
+        finally:
+            self._close_result_cache()
+
+    async def _run_and_evaluate(self,
+                                config: typing.Any,
+                                workflow_alias: str,
+                                session_manager: AIQSessionManager | None,
+                                job_id: str | None) -> EvaluationRunOutput:
+        from aiq.builder.eval_builder import WorkflowEvalBuilder
+
         # Cleanup the output directory
         if self.eval_config.general.output:
             self.cleanup_output_directory()
@@ -463,19 +800,30 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
             # Initialize Weave integration
             self.weave_eval.initialize_logger(workflow_alias, self.eval_input, config)
 
-            # Run workflow
-            if self.config.endpoint:
-                await self.run_workflow_remote()
+            evaluators = {name: eval_workflow.get_evaluator(name) for name in self.eval_config.evaluators}
+
+            # With worker processes, each worker builds its own workflow
+            build_session_manager = session_manager is None and self.config.workers <= 1
+
+            if self.eval_config.general.pipelined and not self.config.endpoint and not self.config.skip_workflow:
+                # Run the workflow and evaluate items as they complete
+                if build_session_manager:
+                    session_manager = AIQSessionManager(eval_workflow.build(),
+                                                        max_concurrency=self.eval_config.general.max_concurrency)
+                await self.run_pipelined(session_manager, evaluators, dataset_handler)
             else:
-                if not self.config.skip_workflow:
-                    if session_manager is None:
-                        session_manager = AIQSessionManager(eval_workflow.build(),
-                                                            max_concurrency=self.eval_config.general.max_concurrency)
-                    await self.run_workflow_local(session_manager)
+                # Run workflow
+                if self.config.endpoint:
+                    await self.run_workflow_remote()
+                else:
+                    if not self.config.skip_workflow:
+                        if build_session_manager:
+                            session_manager = AIQSessionManager(
+                                eval_workflow.build(), max_concurrency=self.eval_config.general.max_concurrency)
+                        await self.run_workflow(session_manager)
 
-            # Evaluate
-            evaluators = {name: eval_workflow.get_evaluator(name) for name in self.eval_config.evaluators}
-            await self.run_evaluators(evaluators)
+                # Evaluate
+                await self.run_evaluators(evaluators)
 
         # Profile the workflow
         profiler_results = await self.profile_workflow()
@@ -503,4 +851,5 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                                    eval_input=self.eval_input,
                                    evaluation_results=self.evaluation_results,
                                    usage_stats=self.usage_stats,
-                                   profiler_results=profiler_results)
+                                   profiler_results=profiler_results,
+                                   cache_stats=self.cache_stats if self.result_cache is not None else None)
@@ -14,17 +14,26 @@
 # limitations under the License.
 
 import copy
+import logging
 import typing
+from pathlib import Path
 
 from aiq.eval.config import EvaluationRunConfig
 from aiq.eval.config import EvaluationRunOutput
 from aiq.eval.evaluate import EvaluationRun
 from aiq.eval.runners.config import MultiEvaluationRunConfig
+from aiq.eval.utils.result_cache import EvalCacheStats
+from aiq.eval.utils.result_cache import EvalResultCache
+
+logger = logging.getLogger(__name__)
 
 
 class MultiEvaluationRunner:
     """
     Run a multi-evaluation run.
+
+    Runs enabling the result cache share one cache per cache path, so that each run only pays for the workflow outputs
+    and scores affected by its overrides.
     """
 
     def __init__(self, config: MultiEvaluationRunConfig):
@@ -33,14 +42,36 @@ class MultiEvaluationRunner:
         """
         self.config = config
         self.evaluation_run_outputs: dict[typing.Any, EvaluationRunOutput] = {}
+        self.result_caches: dict[Path, EvalResultCache] = {}
+
+    def get_result_cache(self, path: Path) -> EvalResultCache:
+        """
+        Get the result cache at a path, shared by every run using it.
+        """
+        path = path.resolve()
+        if path not in self.result_caches:
+            self.result_caches[path] = EvalResultCache(path)
+        return self.result_caches[path]
 
     async def run_all(self):
         """
         Run all evaluations defined by the overrides.
         """
-        for id, config in self.config.configs.items():
-            output = await self.run_single_evaluation(id, config)
-            self.evaluation_run_outputs[id] = output
+        try:
+            for id, config in self.config.configs.items():
+                output = await self.run_single_evaluation(id, config)
+                self.evaluation_run_outputs[id] = output
+        finally:
+            for result_cache in self.result_caches.values():
+                result_cache.close()
+            self.result_caches.clear()
+
+        cache_stats = [output.cache_stats for output in self.evaluation_run_outputs.values() if output.cache_stats]
+        if cache_stats:
+            total_cache_stats = EvalCacheStats()
+            for stats in cache_stats:
+                total_cache_stats.add(stats)
+            logger.info("Evaluation result cache over %d runs: %s", len(cache_stats), total_cache_stats)
 
         return self.evaluation_run_outputs
 
@@ -50,5 +81,5 @@ class MultiEvaluationRunner:
         """
         # copy the config in case the caller is using the same config for multiple evaluations
         config_copy = copy.deepcopy(config)
-        evaluation_run = EvaluationRun(config_copy)
+        evaluation_run = EvaluationRun(config_copy, result_cache_provider=self.get_result_cache)
         return await evaluation_run.run_and_evaluate()
@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import pickle
+import queue
+import typing
+from collections.abc import AsyncIterator
+
+from pydantic_core import to_jsonable_python
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.eval.config import EvaluationRunConfig
+from aiq.eval.evaluator.evaluator_model import EvalInput
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
+from aiq.eval.usage_stats import UsageStatsItem
+
+logger = logging.getLogger(__name__)
+
+# Messages sent by the workers to the parent process
+_ITEM = "item"
+_DONE = "done"
+
+# Index in the dataset, output, trajectory and usage stats of a completed item
+ShardResult = tuple[int, typing.Any, list[IntermediateStep], UsageStatsItem]
+
+
+def _dump_result(result: ShardResult) -> bytes:
+    """
+    Pickle the result of an item in the worker, so that the parent only unpickles already validated models. Outputs
+    and intermediate steps holding objects which can not be pickled are sent as JSON like in the workflow output file,
+    validated again in the worker.
+    """
+    try:
+        return pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        index, output, trajectory, usage_stats_item = result
+        trajectory = [IntermediateStep.model_validate(to_jsonable_python(step, fallback=str)) for step in trajectory]
+        return pickle.dumps((index, to_jsonable_python(output, fallback=str), trajectory, usage_stats_item),
+                            protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _shard_item(item: EvalInputItem) -> EvalInputItem:
+    """The part of an item needed to run the workflow, leaving out dataset entries which may not be picklable"""
+    return EvalInputItem(id=item.id,
+                         input_obj=item.input_obj,
+                         expected_output_obj=None,
+                         output_obj=None,
+                         expected_trajectory=[],
+                         trajectory=[],
+                         full_dataset_entry=None)
+
+
+async def _run_shard(worker_id: int,
+                     config_json: str,
+                     max_concurrency: int,
+                     shard: list[tuple[int, EvalInputItem]],
+                     result_queue: multiprocessing.Queue) -> bool:
+    from aiq.builder.workflow_builder import WorkflowBuilder
+    from aiq.eval.evaluate import EvaluationRun
+    from aiq.runtime.loader import load_config
+    from aiq.runtime.session import AIQSessionManager
+
+    config = EvaluationRunConfig.model_validate_json(config_json)
+    evaluation_run = EvaluationRun(config)
+
+    if config.override:
+        aiq_config = evaluation_run.apply_overrides()
+    else:
+        aiq_config = load_config(config.config_file)
+
+    # The parent profiles and caches the merged results, the worker only runs the workflow
+    evaluation_run.eval_config = aiq_config.eval.model_copy(deep=True)
+    evaluation_run.eval_config.general.profiler = None
+    evaluation_run.eval_config.general.cache = None
+
+    indices = {id(item): index for index, item in shard}
+    evaluation_run.eval_input = EvalInput(eval_input_items=[item for _, item in shard])
+
+    async def send_item(item: EvalInputItem) -> None:
+        # The usage stats were computed when the worker recorded the item, the parent only merges them
+        usage_stats_item = evaluation_run.usage_stats.usage_stats_items[item.id]
+        result_queue.put((_ITEM, _dump_result((indices[id(item)], item.output_obj, item.trajectory, usage_stats_item))))
+
+    async with WorkflowBuilder.from_config(config=aiq_config) as workflow_builder:
+        session_manager = AIQSessionManager(workflow_builder.build(), max_concurrency=max_concurrency)
+        await evaluation_run.run_workflow_local(session_manager, on_item_complete=send_item, show_progress=False)
+
+    logger.debug("Evaluation worker %d completed %d items", worker_id, len(shard))
+    return evaluation_run.workflow_interrupted
+
+
+def _worker_main(worker_id: int,
+                 config_json: str,
+                 max_concurrency: int,
+                 shard: list[tuple[int, EvalInputItem]],
+                 result_queue: multiprocessing.Queue) -> None:
+    """Entry point of a worker process, running the workflow on a shard of the dataset"""
+    interrupted = True
+    try:
+        interrupted = asyncio.run(_run_shard(worker_id, config_json, max_concurrency, shard, result_queue))
+    except Exception as e:
+        logger.exception("Evaluation worker %d failed: %s", worker_id, e, exc_info=True)
+    finally:
+        result_queue.put((_DONE, worker_id, interrupted))
+
+
+class EvaluationShardedWorkflowHandler:
+    """
+    Runs the workflow on a dataset with several worker processes, each building its own workflow and session manager,
+    so that the CPU-bound parts of the workflow runs (output extraction, validation of the intermediate steps, ...) are
+    spread across CPU cores.
+
+    Items are sharded round-robin across the workers, and the output and intermediate steps of each item are streamed
+    back to the parent process as soon as the item completes, for evaluation and profiling. A workflow error stops the
+    shard it occurred in, other shards run to completion.
+    """
+
+    def __init__(self, config: EvaluationRunConfig, max_concurrency: int, workers: int):
+        """
+        Args:
+            config (EvaluationRunConfig): The configuration of the evaluation run, loaded again by each worker.
+            max_concurrency (int): Maximum number of concurrent workflow runs, split across the workers.
+            workers (int): Number of worker processes.
+        """
+        self.config = config
+        self.max_concurrency = max_concurrency
+        self.workers = max(workers, 1)
+        self.workflow_interrupted = False
+
+    async def run_workflow_sharded(self, items: list[tuple[int, EvalInputItem]]) -> AsyncIterator[ShardResult]:
+        """
+        Run the workflow on the items, given with their index in the dataset.
+
+        Yields:
+            tuple[int, typing.Any, list[IntermediateStep], UsageStatsItem]: The index, output, trajectory and usage
+            stats of each completed item, in completion order.
+        """
+        num_workers = min(self.workers, len(items))
+        if num_workers == 0:
+            return
+
+        shards = [[(index, _shard_item(item)) for index, item in items[i::num_workers]] for i in range(num_workers)]
+        worker_concurrency = max(math.ceil(self.max_concurrency / num_workers), 1)
+        config_json = self.config.model_dump_json()
+
+        # Workers are spawned, forking a process with a running event loop and threads is unsafe. They are not daemonic,
+        # so that workflows can start processes of their own, and are terminated below instead
+        context = multiprocessing.get_context("spawn")
+        result_queue = context.Queue()
+        processes = [
+            context.Process(target=_worker_main,
+                            args=(worker_id, config_json, worker_concurrency, shard, result_queue),
+                            name=f"aiq-eval-worker-{worker_id}",
+                            daemon=False) for worker_id, shard in enumerate(shards)
+        ]
+
+        logger.info("Running the workflow on %d items with %d worker processes", len(items), num_workers)
+        running = set(range(num_workers))
+        try:
+            for process in processes:
+                process.start()
+
+            while running:
+                try:
+                    message = await asyncio.to_thread(result_queue.get, True, 0.5)
+                except queue.Empty:
+                    # A worker which exited without reporting it is done has crashed
+                    for worker_id in list(running):
+                        if processes[worker_id].exitcode is not None:
+                            logger.error("Evaluation worker %d exited with code %s",
+                                         worker_id,
+                                         processes[worker_id].exitcode)
+                            running.discard(worker_id)
+                            self.workflow_interrupted = True
+                    continue
+
+                if message[0] == _DONE:
+                    _, worker_id, interrupted = message
+                    running.discard(worker_id)
+                    self.workflow_interrupted |= interrupted
+                    continue
+
+                yield pickle.loads(message[1])
+        finally:
+            for process in processes:
+                if process.pid is None:
+                    # Not started
+                    continue
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+            result_queue.close()
@@ -0,0 +1,250 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import logging
+import typing
+from collections.abc import Awaitable
+from collections.abc import Callable
+from pathlib import Path
+
+from pydantic_core import PydanticSerializationError
+from tqdm import tqdm
+
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
+from aiq.eval.evaluator.evaluator_model import EvalOutput
+from aiq.eval.evaluator.evaluator_model import EvalOutputItem
+from aiq.eval.utils.tqdm_position_registry import TqdmPositionRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class ScoreReduction:
+    """
+    Streaming average of the numeric scores of an evaluator, equal to the average computed by `BaseEvaluator`.
+    """
+
+    def __init__(self):
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, score: typing.Any) -> None:
+        if isinstance(score, (int, float)):
+            self.total += score
+            self.count += 1
+
+    @property
+    def average_score(self) -> float | None:
+        return round(self.total / self.count, 2) if self.count else None
+
+
+class _ItemEvaluator:
+    """
+    Scores the items of a single evaluator as they are enqueued, with up to `concurrency` items in flight.
+    """
+
+    def __init__(self,
+                 name: str,
+                 evaluate_item_fn: Callable[[EvalInputItem], Awaitable[EvalOutputItem]],
+                 concurrency: int,
+                 queue_size: int,
+                 total_items: int,
+                 output_file: Path | None):
+        self.name = name
+        self._evaluate_item_fn = evaluate_item_fn
+        self._concurrency = max(concurrency, 1)
+        self._queue: asyncio.Queue[tuple[int, EvalInputItem] | None] = asyncio.Queue(maxsize=queue_size)
+        self._results: dict[int, EvalOutputItem] = {}
+        self._reduction = ScoreReduction()
+        self._workers: list[asyncio.Task] = []
+
+        self._output_file = output_file
+        # Line buffered, every score is persisted as soon as it is computed
+        self._output = open(output_file, "w", encoding="utf-8", buffering=1) if output_file is not None else None
+
+        self._pbar_position = TqdmPositionRegistry.claim()
+        self._pbar = tqdm(total=total_items, desc=f"Evaluating {name}", position=self._pbar_position)
+
+    def start(self) -> None:
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"eval-{self.name}-{i}") for i in range(self._concurrency)
+        ]
+
+    async def put(self, index: int, item: EvalInputItem) -> None:
+        await self._queue.put((index, item))
+
+    async def _work(self) -> None:
+        while True:
+            entry = await self._queue.get()
+            if entry is None:
+                return
+
+            index, item = entry
+
+            try:
+                output_item = await self._evaluate_item_fn(item)
+            except Exception as e:
+                # If the evaluator fails, record an error item with a score of 0.0, as BaseEvaluator does
+                output_item = EvalOutputItem(id=item.id, score=0.0, reasoning={"error": f"Evaluator error: {str(e)}"})
+
+            self._results[index] = output_item
+            self._reduction.add(output_item.score)
+
+            if self._output is not None:
+                try:
+                    line = output_item.model_dump_json()
+                except PydanticSerializationError:
+                    # Scores and reasonings can hold arbitrary objects, fall back to their string representation
+                    line = json.dumps(output_item.model_dump(), default=str)
+                self._output.write(line + "\n")
+
+            self._pbar.update(1)
+
+    async def finish(self) -> EvalOutput:
+        """
+        Wait for every enqueued item to be scored and return the output, with items in dataset order.
+        """
+        for _ in self._workers:
+            await self._queue.put(None)
+
+        await asyncio.gather(*self._workers)
+        self.close()
+
+        output_items = [self._results[index] for index in sorted(self._results)]
+        return EvalOutput(average_score=self._reduction.average_score, eval_output_items=output_items)
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+
+        if self._output is not None:
+            self._output.close()
+            self._output = None
+            logger.info("Evaluation results of %s appended to %s", self.name, self._output_file)
+
+        if self._pbar is not None:
+            self._pbar.close()
+            TqdmPositionRegistry.release(self._pbar_position)
+            self._pbar = None
+
+
+class StreamingEvaluation:
+    """
+    Scores dataset items as soon as their workflow run completes, overlapping the workflow and the evaluators.
+
+    Completed items are pushed through a bounded queue per evaluator to the evaluator's `evaluate_item`, so that the
+    workflow is slowed down rather than memory growing when the evaluators fall behind. When `output_dir` is set, the
+    workflow output of each item is appended to `workflow_output.jsonl`, and the scores of each evaluator to
+    `<evaluator>_output.jsonl`, as they are produced. Average scores are reduced as scores come in.
+
+    Only evaluators providing `evaluate_item_fn` can be streamed, see `StreamingEvaluation.can_stream`.
+    """
+
+    def __init__(self,
+                 evaluators: dict[str, typing.Any],
+                 items: list[EvalInputItem],
+                 queue_size: int = 64,
+                 default_concurrency: int = 4,
+                 output_dir: Path | None = None,
+                 publish_item: Callable[[EvalInputItem], str] | None = None):
+        """
+        Args:
+            evaluators (dict[str, EvaluatorInfo]): The evaluators to stream, by name.
+            items (list[EvalInputItem]): The items of the dataset, in order.
+            queue_size (int): Maximum number of completed items waiting to be scored by each evaluator.
+            default_concurrency (int): Number of items scored concurrently by evaluators not specifying it.
+            output_dir (Path | None): Directory the JSON Lines files are written to, None to not write them.
+            publish_item (Callable[[EvalInputItem], str] | None): Converts an item to its line of the workflow output.
+        """
+        self._item_indices = {id(item): i for i, item in enumerate(items)}
+        self._items = items
+        self._submitted: set[int] = set()
+
+        self._workflow_output = None
+        self._publish_item = publish_item
+        if output_dir is not None:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            if publish_item is not None:
+                self._workflow_output = open(output_dir / "workflow_output.jsonl", "w", encoding="utf-8", buffering=1)
+
+        self._evaluators: list[_ItemEvaluator] = []
+        try:
+            for name, evaluator in evaluators.items():
+                output_file = output_dir / f"{name}_output.jsonl" if output_dir is not None else None
+                self._evaluators.append(
+                    _ItemEvaluator(name,
+                                   evaluator.evaluate_item_fn,
+                                   concurrency=evaluator.max_concurrency or default_concurrency,
+                                   queue_size=queue_size,
+                                   total_items=len(items),
+                                   output_file=output_file))
+        except Exception:
+            self.close()
+            raise
+
+    @staticmethod
+    def can_stream(evaluator: typing.Any) -> bool:
+        """Whether an evaluator can score items one at a time."""
+        return getattr(evaluator, "evaluate_item_fn", None) is not None
+
+    async def __aenter__(self) -> "StreamingEvaluation":
+        for evaluator in self._evaluators:
+            evaluator.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    async def submit(self, item: EvalInputItem) -> None:
+        """
+        Record the workflow output of a completed item and enqueue it for every evaluator, waiting for room in the
+        queues. Items already submitted are ignored.
+        """
+        index = self._item_indices[id(item)]
+        if index in self._submitted:
+            return
+        self._submitted.add(index)
+
+        if self._workflow_output is not None:
+            self._workflow_output.write(self._publish_item(item) + "\n")
+
+        for evaluator in self._evaluators:
+            await evaluator.put(index, item)
+
+    async def submit_remaining(self) -> None:
+        """
+        Enqueue the items which were not submitted, such as items skipped or not run after the workflow was
+        interrupted. They are scored with their current output, as when evaluating the whole dataset.
+        """
+        for item in self._items:
+            await self.submit(item)
+
+    async def finish(self) -> list[tuple[str, EvalOutput]]:
+        """
+        Wait for every submitted item to be scored, returning the output of each evaluator.
+        """
+        outputs = await asyncio.gather(*(evaluator.finish() for evaluator in self._evaluators))
+        self.close()
+
+        return [(evaluator.name, output) for evaluator, output in zip(self._evaluators, outputs)]
+
+    def close(self) -> None:
+        if self._workflow_output is not None:
+            self._workflow_output.close()
+            self._workflow_output = None
+
+        for evaluator in self._evaluators:
+            evaluator.close()
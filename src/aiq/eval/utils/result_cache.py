@@ -0,0 +1,286 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import typing
+from pathlib import Path
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.eval.evaluator.evaluator_model import EvalInputItem
+from aiq.eval.evaluator.evaluator_model import EvalOutput
+from aiq.eval.evaluator.evaluator_model import EvalOutputItem
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflow_outputs (
+    key TEXT PRIMARY KEY,
+    output_json TEXT NOT NULL,
+    trajectory_json TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scores (
+    key TEXT PRIMARY KEY,
+    evaluator TEXT NOT NULL,
+    output_json TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+# Sections of the workflow config which do not change the output of the workflow
+_NON_WORKFLOW_SECTIONS = {"general", "eval"}
+
+
+def _digest(value: typing.Any) -> str:
+    """
+    Hash of the canonical JSON representation of a value. Objects which are not JSON serializable are represented by
+    their string representation, as in the workflow output file.
+    """
+    canonical = json.dumps(to_jsonable_python(value, fallback=str),
+                           sort_keys=True,
+                           separators=(",", ":"),
+                           ensure_ascii=False,
+                           default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _same_value(restored: typing.Any, value: typing.Any) -> bool:
+    """
+    Whether a value restored from JSON is equal to the original value, with the same types (a tuple is restored as a
+    list, an arbitrary object as its string representation).
+    """
+    if type(restored) is not type(value):
+        return False
+
+    if isinstance(value, dict):
+        return restored.keys() == value.keys() and all(_same_value(restored[k], v) for k, v in value.items())
+
+    if isinstance(value, list):
+        return len(restored) == len(value) and all(_same_value(r, v) for r, v in zip(restored, value))
+
+    return restored == value
+
+
+class EvalCacheStats(BaseModel):
+    """
+    Hits and misses of the evaluation result cache.
+    """
+    workflow_hits: int = 0
+    workflow_misses: int = 0
+    score_hits: int = 0
+    score_misses: int = 0
+
+    def add(self, other: "EvalCacheStats") -> None:
+        self.workflow_hits += other.workflow_hits
+        self.workflow_misses += other.workflow_misses
+        self.score_hits += other.score_hits
+        self.score_misses += other.score_misses
+
+    def __str__(self) -> str:
+        return (f"workflow outputs {self.workflow_hits} hits / {self.workflow_misses} misses, "
+                f"scores {self.score_hits} hits / {self.score_misses} misses")
+
+
+class EvalResultCache:
+    """
+    Content-addressed cache of workflow outputs and evaluator scores, persisted in a SQLite database in WAL mode so that
+    it survives interrupted runs and can be shared by several evaluation runs, and processes, on the same host.
+
+    Keys are hashes of the content the result depends on, so a change of configuration invalidates exactly the results
+    it affects, without any bookkeeping:
+
+    * the workflow output of an item is keyed by the item id and input, the workflow config (every section but
+      `general` and `eval`) and the JSON path used to extract the output;
+    * the score of an item is keyed by the evaluator config, the LLM and embedder configs it may reference, and the
+      item, including its workflow output and trajectory. Scores are then reused as long as the workflow output they
+      were computed from is unchanged, whether it came from the cache, a dataset or a remote workflow.
+    """
+
+    def __init__(self, db_path: str | Path):
+        """
+        Args:
+            db_path (str | Path): Path to the SQLite database file, created if it does not exist.
+        """
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False, isolation_level=None, timeout=30.0)
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    @property
+    def files(self) -> list[Path]:
+        """The database file and its write-ahead log files."""
+        return [
+            self._db_path,
+            self._db_path.with_name(self._db_path.name + "-wal"),
+            self._db_path.with_name(self._db_path.name + "-shm")
+        ]
+
+    def _execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    async def _run(self, sql: str, params: tuple = ()) -> list[tuple]:
+        return await asyncio.to_thread(self._execute, sql, params)
+
+    @staticmethod
+    def workflow_fingerprint(config: BaseModel, result_json_path: str) -> str:
+        """
+        Hash of the parts of a config which determine the output of the workflow.
+
+        Args:
+            config (Config): The full configuration of the evaluation run.
+            result_json_path (str): The JSON path used to extract the output of the workflow.
+        """
+        workflow_config = config.model_dump(mode="json", exclude=_NON_WORKFLOW_SECTIONS)
+        return _digest({"config": workflow_config, "result_json_path": result_json_path})
+
+    @staticmethod
+    def evaluator_fingerprint(config: BaseModel, evaluator_name: str) -> str:
+        """
+        Hash of the parts of a config which determine the scores of an evaluator. Evaluators reference their LLMs and
+        embedders by name, so the LLM and embedder sections are included.
+
+        Args:
+            config (Config): The full configuration of the evaluation run.
+            evaluator_name (str): The name of the evaluator.
+        """
+        evaluator_config = config.eval.evaluators[evaluator_name]
+        llm_configs = {name: llm.model_dump(mode="json") for name, llm in config.llms.items()}
+        embedder_configs = {name: embedder.model_dump(mode="json") for name, embedder in config.embedders.items()}
+        return _digest({
+            "evaluator": evaluator_config.model_dump(mode="json"), "llms": llm_configs, "embedders": embedder_configs
+        })
+
+    @staticmethod
+    def workflow_key(workflow_fingerprint: str, item: EvalInputItem) -> str:
+        return _digest([workflow_fingerprint, item.id, item.input_obj])
+
+    @staticmethod
+    def item_digest(item: EvalInputItem) -> str:
+        """Hash of everything an evaluator can see of an item."""
+        return _digest([
+            item.id,
+            item.input_obj,
+            item.expected_output_obj,
+            item.output_obj,
+            item.trajectory,
+            item.expected_trajectory,
+        ])
+
+    @staticmethod
+    def score_key(evaluator_fingerprint: str, item_digest: str) -> str:
+        return _digest(["item", evaluator_fingerprint, item_digest])
+
+    @staticmethod
+    def output_key(evaluator_fingerprint: str, item_digests: list[str]) -> str:
+        """Key of the output of an evaluator scoring a whole dataset at once."""
+        return _digest(["dataset", evaluator_fingerprint, item_digests])
+
+    async def get_workflow_output(self, key: str) -> tuple[typing.Any, list[IntermediateStep]] | None:
+        """
+        Returns:
+            tuple[typing.Any, list[IntermediateStep]] | None: The output and the trajectory of the workflow, None if
+            they are not cached.
+        """
+        rows = await self._run("SELECT output_json, trajectory_json FROM workflow_outputs WHERE key = ?", (key, ))
+        if not rows:
+            return None
+
+        output_json, trajectory_json = rows[0]
+        trajectory = [IntermediateStep.model_validate(step) for step in json.loads(trajectory_json)]
+        return json.loads(output_json), trajectory
+
+    async def put_workflow_output(self, key: str, output: typing.Any, trajectory: list[IntermediateStep]) -> None:
+        """
+        Cache the output and the trajectory of the workflow. Outputs which do not round-trip through JSON unchanged,
+        with the same types, are not cached, so that a cached output is always identical to the output of a run.
+        """
+        output_json = json.dumps(to_jsonable_python(output, fallback=str), ensure_ascii=False)
+        if not _same_value(json.loads(output_json), output):
+            logger.debug("Not caching workflow output of type %s, it is not preserved by JSON", type(output).__name__)
+            return
+
+        trajectory_json = json.dumps(to_jsonable_python(trajectory, fallback=str), ensure_ascii=False)
+
+        await self._run(
+            "INSERT OR REPLACE INTO workflow_outputs (key, output_json, trajectory_json, created_at) "
+            "VALUES (?, ?, ?, ?)", (key, output_json, trajectory_json, time.time()))
+
+    async def get_scores(self, keys: list[str]) -> dict[str, EvalOutputItem]:
+        """
+        Returns:
+            dict[str, EvalOutputItem]: The cached scores among `keys`, by key.
+        """
+        scores = {}
+
+        # Bounded by the maximum number of SQLite host parameters
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = await self._run(f"SELECT key, output_json FROM scores WHERE key IN ({placeholders})", tuple(chunk))
+            for key, output_json in rows:
+                scores[key] = EvalOutputItem.model_validate_json(output_json)
+
+        return scores
+
+    async def put_scores(self, evaluator_name: str, scores: dict[str, EvalOutputItem]) -> None:
+        if not scores:
+            return
+
+        now = time.time()
+        rows = [(key, evaluator_name, json.dumps(to_jsonable_python(score, fallback=str), ensure_ascii=False), now)
+                for key, score in scores.items()]
+
+        def _insert():
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO scores (key, evaluator, output_json, created_at) VALUES (?, ?, ?, ?)", rows)
+
+        await asyncio.to_thread(_insert)
+
+    async def get_output(self, key: str) -> EvalOutput | None:
+        rows = await self._run("SELECT output_json FROM scores WHERE key = ?", (key, ))
+        if not rows:
+            return None
+
+        return EvalOutput.model_validate_json(rows[0][0])
+
+    async def put_output(self, evaluator_name: str, key: str, output: EvalOutput) -> None:
+        output_json = json.dumps(to_jsonable_python(output, fallback=str), ensure_ascii=False)
+        await self._run("INSERT OR REPLACE INTO scores (key, evaluator, output_json, created_at) VALUES (?, ?, ?, ?)",
+                        (key, evaluator_name, output_json, time.time()))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -176,6 +176,25 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
             description="Sets a maximum time in seconds for browsers to cache CORS responses.",
         )
 
+    class JobStoreConfig(BaseModel):
+        backend: typing.Literal["memory", "sqlite", "redis"] = Field(
+            default="memory",
+            description=("Backend used to track async generation and evaluation jobs. 'memory' keeps jobs in the "
+                         "worker process, 'sqlite' and 'redis' allow multiple worker processes to share job state."))
+        sqlite_path: str = Field(default=".tmp/aiq/job_store.db",
+                                 description="Path to the SQLite database when using the 'sqlite' backend.")
+        redis_url: str = Field(default="redis://localhost:6379/0",
+                               description="Redis connection URL when using the 'redis' backend.")
+        key_prefix: str = Field(default="aiq:jobs", description="Prefix of the keys written to Redis.")
+        object_store: ObjectStoreRef | None = Field(
+            default=None,
+            description=("Object store used to hold job outputs larger than `output_size_threshold`. Only used by the "
+                         "'sqlite' and 'redis' backends. If None, all outputs are stored inline."))
+        output_size_threshold: int = Field(
+            default=64 * 1024,
+            ge=0,
+            description="Size in bytes of a serialized job output above which it is stored in the object store.")
+
     root_path: str = Field(default="", description="The root path for the API")
     host: str = Field(default="localhost", description="Host to bind the server to")
     port: int = Field(default=8000, description="Port to bind the server to", ge=0, le=65535)
@@ -185,6 +204,8 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
                                         description="Maximum number of async jobs to run concurrently",
                                         ge=1)
     step_adaptor: StepAdaptorConfig = StepAdaptorConfig()
+    job_store: JobStoreConfig = Field(default_factory=JobStoreConfig,
+                                      description="Configuration of the store tracking async jobs.")
 
     workflow: typing.Annotated[EndpointBase, Field(description="Endpoint for the default workflow.")] = EndpointBase(
         method="POST",
@@ -60,12 +60,15 @@ from aiq.front_ends.fastapi.fastapi_front_end_config import AIQEvaluateStatusRes
 from aiq.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
 from aiq.front_ends.fastapi.job_store import JobInfo
 from aiq.front_ends.fastapi.job_store import JobStore
+from aiq.front_ends.fastapi.job_store import JobStoreBase
 from aiq.front_ends.fastapi.message_handler import WebSocketMessageHandler
 from aiq.front_ends.fastapi.response_helpers import generate_single_response
 from aiq.front_ends.fastapi.response_helpers import generate_streaming_response_as_str
 from aiq.front_ends.fastapi.response_helpers import generate_streaming_response_full_as_str
 from aiq.front_ends.fastapi.step_adaptor import StepAdaptor
-from aiq.object_store.models import ObjectStoreItem
+from aiq.object_store.interfaces import DEFAULT_CHUNK_SIZE
+from aiq.object_store.interfaces import ObjectStore
+from aiq.object_store.models import ObjectStoreStreamItem
 from aiq.runtime.session import AIQSessionManager
 
 logger = logging.getLogger(__name__)
@@ -85,6 +88,9 @@ class FastApiFrontEndPluginWorkerBase(ABC):
         self._cleanup_tasks_lock = asyncio.Lock()
         self._http_flow_handler: HTTPAuthenticationFlowHandler | None = HTTPAuthenticationFlowHandler()
 
+        self._job_stores: list[JobStoreBase] = []
+        self._job_store_object_store: ObjectStore | None = None
+
     @property
     def config(self) -> AIQConfig:
         return self._config
@@ -121,6 +127,11 @@ class FastApiFrontEndPluginWorkerBase(ABC):
 
                     self._cleanup_tasks.clear()
 
+                for job_store in self._job_stores:
+                    await job_store.close()
+
+                self._job_stores.clear()
+
             logger.debug("Closing AIQ Toolkit server from process %s", os.getpid())
 
         aiq_app = FastAPI(lifespan=lifespan)
@@ -209,16 +220,16 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         self._outstanding_flows_lock = asyncio.Lock()
 
     @staticmethod
-    async def _periodic_cleanup(name: str, job_store: JobStore, sleep_time_sec: int = 300):
+    async def _periodic_cleanup(name: str, job_store: JobStoreBase, sleep_time_sec: int = 300):
         while True:
             try:
-                job_store.cleanup_expired_jobs()
+                await job_store.cleanup_expired_jobs()
                 logger.debug("Expired %s jobs cleaned up", name)
             except Exception as e:
                 logger.error("Error during %s job cleanup: %s", name, e)
             await asyncio.sleep(sleep_time_sec)
 
-    async def create_cleanup_task(self, app: FastAPI, name: str, job_store: JobStore, sleep_time_sec: int = 300):
+    async def create_cleanup_task(self, app: FastAPI, name: str, job_store: JobStoreBase, sleep_time_sec: int = 300):
         # Schedule periodic cleanup of expired jobs on first job creation
         attr_name = f"{name}_cleanup_task"
 
@@ -238,11 +249,47 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
         return StepAdaptor(self.front_end_config.step_adaptor)
 
+    def create_job_store(self, namespace: str) -> JobStoreBase:
+        """
+        Create the store tracking the async jobs of a route, using the configured backend.
+
+        Args:
+            namespace (str): Namespace of the jobs, so that routes sharing a persistent backend do not see each
+                other's jobs.
+        """
+        job_store_config = self.front_end_config.job_store
+
+        if job_store_config.backend == "sqlite":
+            from aiq.front_ends.fastapi.sqlite_job_store import SQLiteJobStore
+
+            job_store = SQLiteJobStore(db_path=job_store_config.sqlite_path,
+                                       namespace=namespace,
+                                       object_store=self._job_store_object_store,
+                                       output_size_threshold=job_store_config.output_size_threshold)
+        elif job_store_config.backend == "redis":
+            from aiq.front_ends.fastapi.redis_job_store import RedisJobStore
+
+            job_store = RedisJobStore(url=job_store_config.redis_url,
+                                      namespace=namespace,
+                                      key_prefix=job_store_config.key_prefix,
+                                      object_store=self._job_store_object_store,
+                                      output_size_threshold=job_store_config.output_size_threshold)
+        else:
+            job_store = JobStore()
+
+        self._job_stores.append(job_store)
+
+        return job_store
+
     async def configure(self, app: FastAPI, builder: WorkflowBuilder):
 
         # Do things like setting the base URL and global configuration options
         app.root_path = self.front_end_config.root_path
 
+        if self.front_end_config.job_store.object_store:
+            self._job_store_object_store = await builder.get_object_store_client(
+                self.front_end_config.job_store.object_store)
+
         await self.add_routes(app, builder)
 
     async def add_routes(self, app: FastAPI, builder: WorkflowBuilder):
@@ -277,7 +324,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         }
 
         # Create job store for tracking evaluation jobs
-        job_store = JobStore()
+        job_store = self.create_job_store(namespace="evaluate")
         # Don't run multiple evaluations at the same time
         evaluation_lock = asyncio.Lock()
 
@@ -289,20 +336,20 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     eval_config = EvaluationRunConfig(config_file=Path(config_file), dataset=None, reps=reps)
 
                     # Create a new EvaluationRun with the evaluation-specific config
-                    job_store.update_status(job_id, "running")
+                    await job_store.update_status(job_id, "running")
                     eval_runner = EvaluationRun(eval_config)
                     output: EvaluationRunOutput = await eval_runner.run_and_evaluate(session_manager=session_manager,
                                                                                      job_id=job_id)
                     if output.workflow_interrupted:
-                        job_store.update_status(job_id, "interrupted")
+                        await job_store.update_status(job_id, "interrupted")
                     else:
                         parent_dir = os.path.dirname(
                             output.workflow_output_file) if output.workflow_output_file else None
 
-                        job_store.update_status(job_id, "success", output_path=str(parent_dir))
+                        await job_store.update_status(job_id, "success", output_path=str(parent_dir))
                 except Exception as e:
                     logger.error("Error in evaluation job %s: %s", job_id, str(e))
-                    job_store.update_status(job_id, "failure", error=str(e))
+                    await job_store.update_status(job_id, "failure", error=str(e))
 
         async def start_evaluation(request: AIQEvaluateRequest,
                                    background_tasks: BackgroundTasks,
@@ -313,11 +360,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 # if job_id is present and already exists return the job info
                 if request.job_id:
-                    job = job_store.get_job(request.job_id)
+                    job = await job_store.get_job(request.job_id)
                     if job:
                         return AIQEvaluateResponse(job_id=job.job_id, status=job.status)
 
-                job_id = job_store.create_job(request.config_file, request.job_id, request.expiry_seconds)
+                job_id = await job_store.create_job(request.config_file, request.job_id, request.expiry_seconds)
                 await self.create_cleanup_task(app=app, name="async_evaluation", job_store=job_store)
                 background_tasks.add_task(run_evaluation, job_id, request.config_file, request.reps, session_manager)
 
@@ -340,7 +387,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_job(job_id)
+                job = await job_store.get_job(job_id)
                 if not job:
                     logger.warning("Job %s not found", job_id)
                     raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
@@ -353,7 +400,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_last_job()
+                job = await job_store.get_last_job()
                 if not job:
                     logger.warning("No jobs found when requesting last job status")
                     raise HTTPException(status_code=404, detail="No jobs found")
@@ -367,10 +414,10 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 if status is None:
                     logger.info("Getting all jobs")
-                    jobs = job_store.get_all_jobs()
+                    jobs = await job_store.get_all_jobs()
                 else:
                     logger.info("Getting jobs with status %s", status)
-                    jobs = job_store.get_jobs_by_status(status)
+                    jobs = await job_store.get_jobs_by_status(status)
                 logger.info("Found %d jobs", len(jobs))
                 return [translate_job_to_response(job) for job in jobs]
 
@@ -440,14 +487,21 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 raise HTTPException(status_code=400, detail="Filename cannot be empty.")
             return sanitized_path
 
+        # Uploaded files are spooled to disk by the server and streamed to the object store in chunks
+        def read_chunks(file: UploadFile):
+
+            async def chunks():
+                while chunk := await file.read(DEFAULT_CHUNK_SIZE):
+                    yield chunk
+
+            return ObjectStoreStreamItem(chunks=chunks(), content_type=file.content_type, size=file.size)
+
         # Upload static files to the object store; if key is present, it will fail with 409 Conflict
         async def add_static_file(file_path: str, file: UploadFile):
             sanitized_file_path = sanitize_path(file_path)
-            file_data = await file.read()
 
             try:
-                await object_store_client.put_object(sanitized_file_path,
-                                                     ObjectStoreItem(data=file_data, content_type=file.content_type))
+                await object_store_client.put_object_stream(sanitized_file_path, read_chunks(file))
             except KeyAlreadyExistsError as e:
                 raise HTTPException(status_code=409, detail=str(e)) from e
 
@@ -456,29 +510,25 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         # Upsert static files to the object store; if key is present, it will overwrite the file
         async def upsert_static_file(file_path: str, file: UploadFile):
             sanitized_file_path = sanitize_path(file_path)
-            file_data = await file.read()
 
-            await object_store_client.upsert_object(sanitized_file_path,
-                                                    ObjectStoreItem(data=file_data, content_type=file.content_type))
+            await object_store_client.upsert_object_stream(sanitized_file_path, read_chunks(file))
 
             return {"filename": sanitized_file_path}
 
-        # Get static files from the object store
+        # Get static files from the object store, streaming them in chunks
         async def get_static_file(file_path: str):
 
             try:
-                file_data = await object_store_client.get_object(file_path)
+                file_stream = await object_store_client.get_object_stream(file_path)
             except NoSuchKeyError as e:
                 raise HTTPException(status_code=404, detail=str(e)) from e
 
             filename = file_path.split("/")[-1]
+            headers = {"Content-Disposition": f"attachment; filename={filename}"}
+            if file_stream.size is not None:
+                headers["Content-Length"] = str(file_stream.size)
 
-            async def reader():
-                yield file_data.data
-
-            return StreamingResponse(reader(),
-                                     media_type=file_data.content_type,
-                                     headers={"Content-Disposition": f"attachment; filename={filename}"})
+            return StreamingResponse(file_stream.chunks, media_type=file_stream.content_type, headers=headers)
 
         async def delete_static_file(file_path: str):
             try:
@@ -563,7 +613,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         }
 
         # Create job store for tracking async generation jobs
-        job_store = JobStore()
+        job_store = self.create_job_store(namespace=f"generate:{endpoint.path}")
 
         # Run up to max_running_async_jobs jobs at the same time
         async_job_concurrency = asyncio.Semaphore(self._front_end_config.max_running_async_jobs)
@@ -739,10 +789,10 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     result = await generate_single_response(payload=payload,
                                                             session_manager=session_manager,
                                                             result_type=result_type)
-                    job_store.update_status(job_id, "success", output=result)
+                    await job_store.update_status(job_id, "success", output=result)
                 except Exception as e:
                     logger.error("Error in evaluation job %s: %s", job_id, e)
-                    job_store.update_status(job_id, "failure", error=str(e))
+                    await job_store.update_status(job_id, "failure", error=str(e))
 
         def _job_status_to_response(job: JobInfo) -> AIQAsyncGenerationStatusResponse:
             job_output = job.output
@@ -767,11 +817,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                     # if job_id is present and already exists return the job info
                     if request.job_id:
-                        job = job_store.get_job(request.job_id)
+                        job = await job_store.get_job(request.job_id)
                         if job:
                             return AIQAsyncGenerateResponse(job_id=job.job_id, status=job.status)
 
-                    job_id = job_store.create_job(job_id=request.job_id, expiry_seconds=request.expiry_seconds)
+                    job_id = await job_store.create_job(job_id=request.job_id, expiry_seconds=request.expiry_seconds)
                     await self.create_cleanup_task(app=app, name="async_generation", job_store=job_store)
 
                     # The fastapi/starlette background tasks won't begin executing until after the response is sent
@@ -791,7 +841,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     now = time.time()
                     sync_timeout = now + request.sync_timeout
                     while time.time() < sync_timeout:
-                        job = job_store.get_job(job_id)
+                        job = await job_store.get_job(job_id)
                         if job is not None and job.status not in job_store.ACTIVE_STATUS:
                             # If the job is done, return the result
                             response.status_code = 200
@@ -811,7 +861,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_job(job_id)
+                job = await job_store.get_job(job_id)
                 if not job:
                     logger.warning("Job %s not found", job_id)
                     raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
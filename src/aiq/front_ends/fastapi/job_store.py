@@ -13,10 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import heapq
 import logging
 import os
 import shutil
 import threading
+import typing
+from abc import ABC
+from abc import abstractmethod
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
@@ -24,6 +28,11 @@ from enum import Enum
 from uuid import uuid4
 
 from pydantic import BaseModel
+from pydantic import RootModel
+
+from aiq.data_models.object_store import NoSuchKeyError
+from aiq.object_store.interfaces import ObjectStore
+from aiq.object_store.models import ObjectStoreItem
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +59,21 @@ class JobInfo(BaseModel):
     output: BaseModel | None = None
 
 
-class JobStore:
+class JobOutput(RootModel[typing.Any]):
+    """
+    Job output restored from a persistent job store. The original output model type is not known when reading the job
+    back, so the dumped output is kept as-is and returned unchanged by `model_dump()`.
+    """
+    pass
+
+
+class JobStoreBase(ABC):
+    """
+    Abstract interface for the stores tracking async generation and evaluation jobs.
+
+    Implementations may keep jobs in process memory or in a shared backend, allowing several worker processes to serve
+    status requests for the same jobs.
+    """
 
     MIN_EXPIRY = 600  # 10 minutes
     MAX_EXPIRY = 86400  # 24 hours
@@ -59,125 +82,292 @@ class JobStore:
     # active jobs are exempt from expiry
     ACTIVE_STATUS = {"running", "submitted"}
 
-    def __init__(self):
-        self._jobs = {}
-        self._lock = threading.Lock()  # Ensure thread safety for job operations
-
-    def create_job(self,
-                   config_file: str | None = None,
-                   job_id: str | None = None,
-                   expiry_seconds: int = DEFAULT_EXPIRY) -> str:
-        if job_id is None:
-            job_id = str(uuid4())
+    def __init__(self, object_store: ObjectStore | None = None, output_size_threshold: int = 64 * 1024):
+        """
+        Args:
+            object_store (ObjectStore | None): Object store used to hold job outputs larger than
+                `output_size_threshold`. Only used by persistent job stores.
+            output_size_threshold (int): Size in bytes of a serialized job output above which it is stored by reference
+                in the object store rather than inline.
+        """
+        self._object_store = object_store
+        self._output_size_threshold = output_size_threshold
 
+    def _clamp_expiry(self, job_id: str, expiry_seconds: int) -> int:
         clamped_expiry = max(self.MIN_EXPIRY, min(expiry_seconds, self.MAX_EXPIRY))
         if expiry_seconds != clamped_expiry:
             logger.info("Clamped expiry_seconds from %d to %d for job %s", expiry_seconds, clamped_expiry, job_id)
+        return clamped_expiry
+
+    def _new_job(self, config_file: str | None, job_id: str | None, expiry_seconds: int) -> JobInfo:
+        if job_id is None:
+            job_id = str(uuid4())
+
+        now = datetime.now(UTC)
 
-        job = JobInfo(job_id=job_id,
-                      status=JobStatus.SUBMITTED,
-                      config_file=config_file,
-                      created_at=datetime.now(UTC),
-                      updated_at=datetime.now(UTC),
-                      error=None,
-                      output_path=None,
-                      expiry_seconds=clamped_expiry)
+        return JobInfo(job_id=job_id,
+                       status=JobStatus.SUBMITTED,
+                       config_file=config_file,
+                       created_at=now,
+                       updated_at=now,
+                       error=None,
+                       output_path=None,
+                       expiry_seconds=self._clamp_expiry(job_id, expiry_seconds))
 
-        with self._lock:
-            self._jobs[job_id] = job
+    def get_expires_at(self, job: JobInfo) -> datetime | None:
+        """Get the time for a job to expire."""
+        if job.status in self.ACTIVE_STATUS:
+            return None
+        return job.updated_at + timedelta(seconds=job.expiry_seconds)
+
+    @staticmethod
+    def _remove_output_path(job_id: str, output_path: str | None) -> None:
+        """Remove the output file or directory of an expired job."""
+        if not output_path:
+            return
+
+        logger.info("Cleaning up output directory for job %s at %s", job_id, output_path)
+        # If it is a file remove it
+        if os.path.isfile(output_path):
+            os.remove(output_path)
+        # If it is a directory remove it
+        elif os.path.isdir(output_path):
+            shutil.rmtree(output_path)
+
+    @staticmethod
+    def _output_key(job_id: str) -> str:
+        return f"aiq_jobs/{job_id}/output.json"
+
+    async def _dump_output(self, job_id: str, output: BaseModel | None) -> tuple[str | None, str | None]:
+        """
+        Serialize a job output for a persistent store.
+
+        Returns:
+            tuple[str | None, str | None]: The inline serialized output and the object store key of the output. At most
+                one of them is set.
+        """
+        if output is None:
+            return None, None
+
+        output_json = output.model_dump_json()
+
+        if self._object_store is None or len(output_json) <= self._output_size_threshold:
+            return output_json, None
+
+        key = self._output_key(job_id)
+        await self._object_store.upsert_object(
+            key, ObjectStoreItem(data=output_json.encode("utf-8"), content_type="application/json"))
+
+        return None, key
+
+    async def _load_output(self, output_json: str | None, output_ref: str | None) -> BaseModel | None:
+        """Restore a job output serialized by `_dump_output`."""
+        if output_ref is not None:
+            if self._object_store is None:
+                logger.warning("Job output %s is stored by reference but no object store is configured", output_ref)
+                return None
+            try:
+                item = await self._object_store.get_object(output_ref)
+            except NoSuchKeyError:
+                logger.warning("Job output %s not found in the object store", output_ref)
+                return None
+            output_json = item.data.decode("utf-8")
+
+        if output_json is None:
+            return None
+
+        return JobOutput.model_validate_json(output_json)
+
+    async def _delete_output(self, output_ref: str | None) -> None:
+        if output_ref is None or self._object_store is None:
+            return
+        try:
+            await self._object_store.delete_object(output_ref)
+        except NoSuchKeyError:
+            pass
+
+    @abstractmethod
+    async def create_job(self,
+                         config_file: str | None = None,
+                         job_id: str | None = None,
+                         expiry_seconds: int = DEFAULT_EXPIRY) -> str:
+        """
+        Create a new job in the submitted state.
 
-        logger.info("Created new job %s with config %s", job_id, config_file)
-        return job_id
+        Returns:
+            str: The ID of the new job.
+        """
+        pass
+
+    @abstractmethod
+    async def update_status(self,
+                            job_id: str,
+                            status: str,
+                            error: str | None = None,
+                            output_path: str | None = None,
+                            output: BaseModel | None = None):
+        """
+        Update the status of a job.
 
-    def update_status(self,
-                      job_id: str,
-                      status: str,
-                      error: str | None = None,
-                      output_path: str | None = None,
-                      output: BaseModel | None = None):
-        if job_id not in self._jobs:
-            raise ValueError(f"Job {job_id} not found")
+        Raises:
+            ValueError: If the job does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> JobInfo | None:
+        """Get a job by its ID."""
+        pass
+
+    async def get_status(self, job_id: str) -> JobInfo | None:
+        return await self.get_job(job_id)
+
+    @abstractmethod
+    async def get_last_job(self) -> JobInfo | None:
+        """Get the last created job."""
+        pass
 
+    @abstractmethod
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
+        """Get all jobs with the specified status."""
+        pass
+
+    @abstractmethod
+    async def get_all_jobs(self) -> list[JobInfo]:
+        """Get all jobs in the store."""
+        pass
+
+    async def list_jobs(self) -> dict[str, JobInfo]:
+        return {job.job_id: job for job in await self.get_all_jobs()}
+
+    @abstractmethod
+    async def cleanup_expired_jobs(self):
+        """
+        Cleanup expired jobs, keeping the most recent one.
+        Updated_at is used instead of created_at to determine the most recent job.
+        This is because jobs may not be processed in the order they are created.
+        """
+        pass
+
+    async def close(self):
+        """Release any resources held by the job store."""
+        pass
+
+
+class JobStore(JobStoreBase):
+    """
+    Process-local job store. Jobs are indexed by status and finished jobs are kept in a heap ordered by their
+    expiration time so that lookups and expiry do not need to scan every job.
+    """
+
+    def __init__(self, object_store: ObjectStore | None = None, output_size_threshold: int = 64 * 1024):
+        super().__init__(object_store=object_store, output_size_threshold=output_size_threshold)
+        self._jobs: dict[str, JobInfo] = {}
+        self._jobs_by_status: dict[str, dict[str, JobInfo]] = {}
+        self._last_job_id: str | None = None
+        self._last_finished_job_id: str | None = None
+        # Heap of (expires_at, updated_at, job_id), entries are invalidated lazily when the job is updated
+        self._expiry_heap: list[tuple[datetime, datetime, str]] = []
+        self._lock = threading.Lock()  # Ensure thread safety for job operations
+
+    def _index_job(self, job: JobInfo) -> None:
+        self._jobs_by_status.setdefault(job.status, {})[job.job_id] = job
+
+        expires_at = self.get_expires_at(job)
+        if expires_at is not None:
+            heapq.heappush(self._expiry_heap, (expires_at, job.updated_at, job.job_id))
+            self._last_finished_job_id = job.job_id
+
+    def _unindex_job(self, job: JobInfo) -> None:
+        jobs = self._jobs_by_status.get(job.status)
+        if jobs is not None:
+            jobs.pop(job.job_id, None)
+
+    async def create_job(self,
+                         config_file: str | None = None,
+                         job_id: str | None = None,
+                         expiry_seconds: int = JobStoreBase.DEFAULT_EXPIRY) -> str:
+        job = self._new_job(config_file, job_id, expiry_seconds)
+
+        with self._lock:
+            existing_job = self._jobs.get(job.job_id)
+            if existing_job is not None:
+                self._unindex_job(existing_job)
+            self._jobs[job.job_id] = job
+            self._index_job(job)
+            self._last_job_id = job.job_id
+
+        logger.info("Created new job %s with config %s", job.job_id, config_file)
+        return job.job_id
+
+    async def update_status(self,
+                            job_id: str,
+                            status: str,
+                            error: str | None = None,
+                            output_path: str | None = None,
+                            output: BaseModel | None = None):
         with self._lock:
-            job = self._jobs[job_id]
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise ValueError(f"Job {job_id} not found")
+
+            self._unindex_job(job)
             job.status = status
             job.error = error
             job.output_path = output_path
             job.updated_at = datetime.now(UTC)
             job.output = output
+            self._index_job(job)
 
-    def get_status(self, job_id: str) -> JobInfo | None:
+    async def get_job(self, job_id: str) -> JobInfo | None:
         with self._lock:
             return self._jobs.get(job_id)
 
-    def list_jobs(self):
+    async def get_last_job(self) -> JobInfo | None:
         with self._lock:
-            return self._jobs
+            last_job = self._jobs.get(self._last_job_id) if self._last_job_id is not None else None
 
-    def get_job(self, job_id: str) -> JobInfo | None:
-        """Get a job by its ID."""
-        with self._lock:
-            return self._jobs.get(job_id)
+        if last_job is None:
+            logger.info("No jobs found in job store")
+            return None
 
-    def get_last_job(self) -> JobInfo | None:
-        """Get the last created job."""
-        with self._lock:
-            if not self._jobs:
-                logger.info("No jobs found in job store")
-                return None
-            last_job = max(self._jobs.values(), key=lambda job: job.created_at)
-            logger.info("Retrieved last job %s created at %s", last_job.job_id, last_job.created_at)
-            return last_job
+        logger.info("Retrieved last job %s created at %s", last_job.job_id, last_job.created_at)
+        return last_job
 
-    def get_jobs_by_status(self, status: str) -> list[JobInfo]:
-        """Get all jobs with the specified status."""
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
         with self._lock:
-            return [job for job in self._jobs.values() if job.status == status]
+            return list(self._jobs_by_status.get(status, {}).values())
 
-    def get_all_jobs(self) -> list[JobInfo]:
-        """Get all jobs in the store."""
+    async def get_all_jobs(self) -> list[JobInfo]:
         with self._lock:
             return list(self._jobs.values())
 
-    def get_expires_at(self, job: JobInfo) -> datetime | None:
-        """Get the time for a job to expire."""
-        if job.status in self.ACTIVE_STATUS:
-            return None
-        return job.updated_at + timedelta(seconds=job.expiry_seconds)
-
-    def cleanup_expired_jobs(self):
-        """
-        Cleanup expired jobs, keeping the most recent one.
-        Updated_at is used instead of created_at to determine the most recent job.
-        This is because jobs may not be processed in the order they are created.
-        """
+    async def cleanup_expired_jobs(self):
         now = datetime.now(UTC)
+        expired_jobs: list[JobInfo] = []
+        kept_entries = []
 
-        # Filter out active jobs
         with self._lock:
-            finished_jobs = {job_id: job for job_id, job in self._jobs.items() if job.status not in self.ACTIVE_STATUS}
-
-        # Sort finished jobs by updated_at descending
-        sorted_finished = sorted(finished_jobs.items(), key=lambda item: item[1].updated_at, reverse=True)
-
-        # Always keep the most recent finished job
-        jobs_to_check = sorted_finished[1:]
-
-        expired_ids = []
-        for job_id, job in jobs_to_check:
-            expires_at = self.get_expires_at(job)
-            if expires_at and now > expires_at:
-                expired_ids.append(job_id)
-                # cleanup output dir if present
-                if job.output_path:
-                    logger.info("Cleaning up output directory for job %s at %s", job_id, job.output_path)
-                    # If it is a file remove it
-                    if os.path.isfile(job.output_path):
-                        os.remove(job.output_path)
-                    # If it is a directory remove it
-                    elif os.path.isdir(job.output_path):
-                        shutil.rmtree(job.output_path)
+            while self._expiry_heap and self._expiry_heap[0][0] < now:
+                entry = heapq.heappop(self._expiry_heap)
+                _, updated_at, job_id = entry
+                job = self._jobs.get(job_id)
 
-        with self._lock:
-            for job_id in expired_ids:
+                # Skip entries invalidated by a later update of the job
+                if job is None or job.updated_at != updated_at or job.status in self.ACTIVE_STATUS:
+                    continue
+
+                # Always keep the most recent finished job
+                if job_id == self._last_finished_job_id:
+                    kept_entries.append(entry)
+                    continue
+
+                self._unindex_job(job)
                 del self._jobs[job_id]
+                expired_jobs.append(job)
+
+            for entry in kept_entries:
+                heapq.heappush(self._expiry_heap, entry)
+
+        for job in expired_jobs:
+            self._remove_output_path(job.job_id, job.output_path)
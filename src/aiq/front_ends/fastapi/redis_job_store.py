@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+from datetime import UTC
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from aiq.front_ends.fastapi.job_store import JobInfo
+from aiq.front_ends.fastapi.job_store import JobStoreBase
+from aiq.object_store.interfaces import ObjectStore
+
+logger = logging.getLogger(__name__)
+
+
+class RedisJobStore(JobStoreBase):
+    """
+    Job store persisted in Redis, allowing worker processes on any host to share job state.
+
+    Each job is stored as a JSON document. Secondary indexes are kept as a set per status and as sorted sets ordered by
+    creation time, by update time of finished jobs and by expiration time, so that lookups and expiry are O(log n).
+    Outputs larger than the configured threshold are stored by reference in the object store.
+    """
+
+    def __init__(self,
+                 url: str,
+                 namespace: str = "default",
+                 key_prefix: str = "aiq:jobs",
+                 object_store: ObjectStore | None = None,
+                 output_size_threshold: int = 64 * 1024):
+        """
+        Args:
+            url (str): Redis connection URL, for example `redis://localhost:6379/0`.
+            namespace (str): Namespace of the jobs, allowing several job stores to share a database.
+            key_prefix (str): Prefix of all the keys written by the job store.
+            object_store (ObjectStore | None): Object store used to hold large job outputs.
+            output_size_threshold (int): Size in bytes of a serialized output above which it is stored by reference.
+        """
+        super().__init__(object_store=object_store, output_size_threshold=output_size_threshold)
+
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise ImportError("redis is required for RedisJobStore. Install aiqtoolkit-redis or similar.")
+
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self._namespace = namespace
+        self._prefix = f"{key_prefix}:{namespace}"
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self._prefix}:job:{job_id}"
+
+    def _status_key(self, status: str) -> str:
+        return f"{self._prefix}:status:{status}"
+
+    @property
+    def _created_key(self) -> str:
+        return f"{self._prefix}:created"
+
+    @property
+    def _finished_key(self) -> str:
+        return f"{self._prefix}:finished"
+
+    @property
+    def _expiry_key(self) -> str:
+        return f"{self._prefix}:expiry"
+
+    async def _record_to_job(self, record: str) -> JobInfo:
+        data = json.loads(record)
+
+        return JobInfo(job_id=data["job_id"],
+                       status=data["status"],
+                       config_file=data["config_file"],
+                       error=data["error"],
+                       output_path=data["output_path"],
+                       created_at=datetime.fromtimestamp(data["created_at"], UTC),
+                       updated_at=datetime.fromtimestamp(data["updated_at"], UTC),
+                       expiry_seconds=data["expiry_seconds"],
+                       output=await self._load_output(data["output_json"], data["output_ref"]))
+
+    async def _get_jobs(self, job_ids: list[str]) -> list[JobInfo]:
+        if not job_ids:
+            return []
+
+        records = await self._client.mget([self._job_key(job_id) for job_id in job_ids])
+        return [await self._record_to_job(record) for record in records if record is not None]
+
+    async def create_job(self,
+                         config_file: str | None = None,
+                         job_id: str | None = None,
+                         expiry_seconds: int = JobStoreBase.DEFAULT_EXPIRY) -> str:
+        job = self._new_job(config_file, job_id, expiry_seconds)
+
+        record = {
+            "job_id": job.job_id,
+            "status": job.status.value,
+            "config_file": config_file,
+            "error": None,
+            "output_path": None,
+            "created_at": job.created_at.timestamp(),
+            "updated_at": job.updated_at.timestamp(),
+            "expiry_seconds": job.expiry_seconds,
+            "output_json": None,
+            "output_ref": None,
+        }
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(self._job_key(job.job_id), json.dumps(record))
+            pipe.sadd(self._status_key(job.status.value), job.job_id)
+            pipe.zadd(self._created_key, {job.job_id: record["created_at"]})
+            await pipe.execute()
+
+        logger.info("Created new job %s with config %s", job.job_id, config_file)
+        return job.job_id
+
+    async def update_status(self,
+                            job_id: str,
+                            status: str,
+                            error: str | None = None,
+                            output_path: str | None = None,
+                            output: BaseModel | None = None):
+        from redis.exceptions import WatchError
+
+        job_key = self._job_key(job_id)
+        status = str(getattr(status, "value", status))
+        dumped_output = None
+
+        # The job is watched so that concurrent updates, which may read the same previous status, are retried instead of
+        # leaving the job in two status sets
+        async with self._client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(job_key)
+
+                    existing_record = await pipe.get(job_key)
+                    if existing_record is None:
+                        raise ValueError(f"Job {job_id} not found")
+
+                    record = json.loads(existing_record)
+                    previous_status = record["status"]
+                    updated_at = datetime.now(UTC).timestamp()
+
+                    if dumped_output is None:
+                        dumped_output = await self._dump_output(f"{self._namespace}/{job_id}", output)
+                    output_json, output_ref = dumped_output
+
+                    record.update(status=status,
+                                  error=error,
+                                  output_path=output_path,
+                                  updated_at=updated_at,
+                                  output_json=output_json,
+                                  output_ref=output_ref)
+
+                    pipe.multi()
+                    pipe.set(job_key, json.dumps(record))
+                    pipe.srem(self._status_key(previous_status), job_id)
+                    pipe.sadd(self._status_key(status), job_id)
+                    if status in self.ACTIVE_STATUS:
+                        pipe.zrem(self._finished_key, job_id)
+                        pipe.zrem(self._expiry_key, job_id)
+                    else:
+                        pipe.zadd(self._finished_key, {job_id: updated_at})
+                        pipe.zadd(self._expiry_key, {job_id: updated_at + record["expiry_seconds"]})
+                    await pipe.execute()
+                    return
+
+                except WatchError:
+                    logger.debug("Job %s was modified concurrently, retrying the status update", job_id)
+
+    async def get_job(self, job_id: str) -> JobInfo | None:
+        record = await self._client.get(self._job_key(job_id))
+        return await self._record_to_job(record) if record is not None else None
+
+    async def get_last_job(self) -> JobInfo | None:
+        job_ids = await self._client.zrevrange(self._created_key, 0, 0)
+        jobs = await self._get_jobs(job_ids)
+
+        if not jobs:
+            logger.info("No jobs found in job store")
+            return None
+
+        last_job = jobs[0]
+        logger.info("Retrieved last job %s created at %s", last_job.job_id, last_job.created_at)
+        return last_job
+
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
+        job_ids = await self._client.smembers(self._status_key(str(getattr(status, "value", status))))
+        return await self._get_jobs(list(job_ids))
+
+    async def get_all_jobs(self) -> list[JobInfo]:
+        job_ids = await self._client.zrange(self._created_key, 0, -1)
+        return await self._get_jobs(job_ids)
+
+    async def cleanup_expired_jobs(self):
+        now = datetime.now(UTC).timestamp()
+
+        expired_ids = await self._client.zrangebyscore(self._expiry_key, "-inf", now)
+        if not expired_ids:
+            return
+
+        # Always keep the most recent finished job
+        most_recent = await self._client.zrevrange(self._finished_key, 0, 0)
+        expired_ids = [job_id for job_id in expired_ids if job_id not in most_recent]
+        if not expired_ids:
+            return
+
+        records = await self._client.mget([self._job_key(job_id) for job_id in expired_ids])
+
+        for job_id, record in zip(expired_ids, records):
+            data = json.loads(record) if record is not None else {}
+
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.delete(self._job_key(job_id))
+                if "status" in data:
+                    pipe.srem(self._status_key(data["status"]), job_id)
+                pipe.zrem(self._created_key, job_id)
+                pipe.zrem(self._finished_key, job_id)
+                pipe.zrem(self._expiry_key, job_id)
+                await pipe.execute()
+
+            self._remove_output_path(job_id, data.get("output_path"))
+            await self._delete_output(data.get("output_ref"))
+
+    async def close(self):
+        await self._client.close()
@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import sqlite3
+import threading
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from aiq.front_ends.fastapi.job_store import JobInfo
+from aiq.front_ends.fastapi.job_store import JobStoreBase
+from aiq.object_store.interfaces import ObjectStore
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    namespace TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    config_file TEXT,
+    error TEXT,
+    output_path TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    expiry_seconds INTEGER NOT NULL,
+    expires_at REAL,
+    output_json TEXT,
+    output_ref TEXT,
+    PRIMARY KEY (namespace, job_id)
+);
+CREATE INDEX IF NOT EXISTS jobs_status_idx ON jobs (namespace, status);
+CREATE INDEX IF NOT EXISTS jobs_created_at_idx ON jobs (namespace, created_at);
+CREATE INDEX IF NOT EXISTS jobs_updated_at_idx ON jobs (namespace, updated_at);
+CREATE INDEX IF NOT EXISTS jobs_expires_at_idx ON jobs (namespace, expires_at);
+"""
+
+_COLUMNS = ("job_id, status, config_file, error, output_path, created_at, updated_at, expiry_seconds, output_json, "
+            "output_ref")
+
+
+class SQLiteJobStore(JobStoreBase):
+    """
+    Job store persisted in a SQLite database in WAL mode, allowing multiple worker processes on the same host to share
+    job state.
+
+    Jobs are indexed on status, creation time, update time and expiration time, so that status lookups, the last job
+    and expired jobs are resolved through index range scans. Outputs larger than the configured threshold are stored by
+    reference in the object store.
+    """
+
+    def __init__(self,
+                 db_path: str | Path,
+                 namespace: str = "default",
+                 object_store: ObjectStore | None = None,
+                 output_size_threshold: int = 64 * 1024):
+        """
+        Args:
+            db_path (str | Path): Path to the SQLite database file, created if it does not exist.
+            namespace (str): Namespace of the jobs, allowing several job stores to share a database.
+            object_store (ObjectStore | None): Object store used to hold large job outputs.
+            output_size_threshold (int): Size in bytes of a serialized output above which it is stored by reference.
+        """
+        super().__init__(object_store=object_store, output_size_threshold=output_size_threshold)
+
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._namespace = namespace
+
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False, isolation_level=None, timeout=30.0)
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def _execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    async def _run(self, sql: str, params: tuple = ()) -> list[tuple]:
+        return await asyncio.to_thread(self._execute, sql, params)
+
+    async def _row_to_job(self, row: tuple) -> JobInfo:
+        (job_id,
+         status,
+         config_file,
+         error,
+         output_path,
+         created_at,
+         updated_at,
+         expiry_seconds,
+         output_json,
+         output_ref) = row
+
+        return JobInfo(job_id=job_id,
+                       status=status,
+                       config_file=config_file,
+                       error=error,
+                       output_path=output_path,
+                       created_at=datetime.fromtimestamp(created_at, UTC),
+                       updated_at=datetime.fromtimestamp(updated_at, UTC),
+                       expiry_seconds=expiry_seconds,
+                       output=await self._load_output(output_json, output_ref))
+
+    async def create_job(self,
+                         config_file: str | None = None,
+                         job_id: str | None = None,
+                         expiry_seconds: int = JobStoreBase.DEFAULT_EXPIRY) -> str:
+        job = self._new_job(config_file, job_id, expiry_seconds)
+
+        await self._run(
+            "INSERT OR REPLACE INTO jobs (namespace, job_id, status, config_file, error, output_path, created_at, "
+            "updated_at, expiry_seconds, expires_at, output_json, output_ref) "
+            "VALUES (?, ?, ?, ?, NULL, NULL, ?, ?, ?, NULL, NULL, NULL)",
+            (self._namespace,
+             job.job_id,
+             job.status.value,
+             config_file,
+             job.created_at.timestamp(),
+             job.updated_at.timestamp(),
+             job.expiry_seconds))
+
+        logger.info("Created new job %s with config %s", job.job_id, config_file)
+        return job.job_id
+
+    async def update_status(self,
+                            job_id: str,
+                            status: str,
+                            error: str | None = None,
+                            output_path: str | None = None,
+                            output: BaseModel | None = None):
+        rows = await self._run("SELECT expiry_seconds FROM jobs WHERE namespace = ? AND job_id = ?",
+                               (self._namespace, job_id))
+        if not rows:
+            raise ValueError(f"Job {job_id} not found")
+
+        updated_at = datetime.now(UTC)
+        expiry_seconds = rows[0][0]
+        expires_at = None if status in self.ACTIVE_STATUS else updated_at.timestamp() + expiry_seconds
+
+        output_json, output_ref = await self._dump_output(f"{self._namespace}/{job_id}", output)
+
+        await self._run(
+            "UPDATE jobs SET status = ?, error = ?, output_path = ?, updated_at = ?, expires_at = ?, output_json = ?, "
+            "output_ref = ? WHERE namespace = ? AND job_id = ?",
+            (str(getattr(status, "value", status)),
+             error,
+             output_path,
+             updated_at.timestamp(),
+             expires_at,
+             output_json,
+             output_ref,
+             self._namespace,
+             job_id))
+
+    async def get_job(self, job_id: str) -> JobInfo | None:
+        rows = await self._run(f"SELECT {_COLUMNS} FROM jobs WHERE namespace = ? AND job_id = ?",
+                               (self._namespace, job_id))
+        return await self._row_to_job(rows[0]) if rows else None
+
+    async def get_last_job(self) -> JobInfo | None:
+        rows = await self._run(f"SELECT {_COLUMNS} FROM jobs WHERE namespace = ? ORDER BY created_at DESC LIMIT 1",
+                               (self._namespace, ))
+        if not rows:
+            logger.info("No jobs found in job store")
+            return None
+
+        last_job = await self._row_to_job(rows[0])
+        logger.info("Retrieved last job %s created at %s", last_job.job_id, last_job.created_at)
+        return last_job
+
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
+        rows = await self._run(f"SELECT {_COLUMNS} FROM jobs WHERE namespace = ? AND status = ?",
+                               (self._namespace, str(getattr(status, "value", status))))
+        return [await self._row_to_job(row) for row in rows]
+
+    async def get_all_jobs(self) -> list[JobInfo]:
+        rows = await self._run(f"SELECT {_COLUMNS} FROM jobs WHERE namespace = ?", (self._namespace, ))
+        return [await self._row_to_job(row) for row in rows]
+
+    async def cleanup_expired_jobs(self):
+        now = datetime.now(UTC).timestamp()
+
+        # Both queries are index range scans, the most recent finished job is always kept
+        expired_rows = await self._run(
+            "SELECT job_id, output_path, output_ref FROM jobs "
+            "WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at < ? AND job_id IS NOT ("
+            "SELECT job_id FROM jobs WHERE namespace = ? AND expires_at IS NOT NULL "
+            "ORDER BY updated_at DESC LIMIT 1)", (self._namespace, now, self._namespace))
+
+        for job_id, output_path, output_ref in expired_rows:
+            await self._run("DELETE FROM jobs WHERE namespace = ? AND job_id = ?", (self._namespace, job_id))
+            self._remove_output_path(job_id, output_path)
+            await self._delete_output(output_ref)
+
+    async def close(self):
+        with self._lock:
+            self._conn.close()
@@ -15,7 +15,7 @@
 
 import html
 import logging
-from functools import reduce
+from collections import OrderedDict
 from textwrap import dedent
 
 from aiq.data_models.api_server import AIQResponseIntermediateStep
@@ -31,14 +31,62 @@ from aiq.utils.type_utils import is_valid_json
 
 logger = logging.getLogger(__name__)
 
+# Maps each START event type that the adaptor needs to look up later to the END event type which closes the span
+_TRACKED_SPANS: dict[IntermediateStepType, IntermediateStepType] = {
+    IntermediateStepType.LLM_START: IntermediateStepType.LLM_END,
+    IntermediateStepType.TOOL_START: IntermediateStepType.TOOL_END,
+    IntermediateStepType.FUNCTION_START: IntermediateStepType.FUNCTION_END,
+}
+_END_TO_START: dict[IntermediateStepType, IntermediateStepType] = {v: k for k, v in _TRACKED_SPANS.items()}
+
 
 class StepAdaptor:
 
-    def __init__(self, config: StepAdaptorConfig):
+    def __init__(self, config: StepAdaptorConfig, max_open_spans: int = 10000):
+        """
+        Args:
+            config (StepAdaptorConfig): The configuration used to filter the intermediate steps.
+            max_open_spans (int): The maximum number of START steps (and their streamed chunks) kept while waiting for
+                the matching END step. Once exceeded, the oldest open span is evicted.
+        """
 
-        self._history: list[IntermediateStep] = []
+        # Open START steps and the accumulated LLM output, keyed by (START event type, UUID). Entries are evicted as
+        # soon as the matching END step has been adapted so lookups stay constant time regardless of the run length.
+        self._open_starts: OrderedDict[tuple[IntermediateStepType, str], IntermediateStep] = OrderedDict()
+        self._llm_chunks: dict[str, str] = {}
+        self._max_open_spans = max_open_spans
         self.config = config
 
+    def _get_start_step(self, start_type: IntermediateStepType, uuid: str) -> IntermediateStep | None:
+        return self._open_starts.get((start_type, uuid))
+
+    def _track_step(self, step: IntermediateStep) -> None:
+        """
+        Records START steps so that the matching CHUNK/END steps can be resolved without scanning the history.
+        """
+        if step.event_type not in _TRACKED_SPANS:
+            return
+
+        self._open_starts[(step.event_type, step.UUID)] = step
+
+        while len(self._open_starts) > self._max_open_spans:
+            (_, evicted_uuid), _ = self._open_starts.popitem(last=False)
+            self._llm_chunks.pop(evicted_uuid, None)
+
+    def _release_step(self, step: IntermediateStep) -> None:
+        """
+        Drops the state kept for a span once its END step has been processed.
+        """
+        start_type = _END_TO_START.get(step.event_type)
+
+        if start_type is None:
+            return
+
+        self._open_starts.pop((start_type, step.UUID), None)
+
+        if start_type == IntermediateStepType.LLM_START:
+            self._llm_chunks.pop(step.UUID, None)
+
     def _step_matches_filter(self, step: IntermediateStep, config: StepAdaptorConfig) -> bool:
         """
         Returns True if this intermediate step should be included (based on the config.mode).
@@ -67,9 +115,8 @@ class StepAdaptor:
         input_str: str | None = None
         output_str: str | None = None
 
-        # Find the start in the history with matching run_id
-        start_step = next(
-            (x for x in self._history if x.event_type == IntermediateStepType.LLM_START and x.UUID == step.UUID), None)
+        # Find the open start with matching run_id
+        start_step = self._get_start_step(IntermediateStepType.LLM_START, step.UUID)
 
         if not start_step:
             # If we don't have a start step, we can't do anything
@@ -79,12 +126,9 @@ class StepAdaptor:
 
         if step.event_type == IntermediateStepType.LLM_NEW_TOKEN:
 
-            # Find all of the previous LLM chunks and concatenate them
-            output_str = reduce(
-                lambda x, y: x + y,
-                (str(x.data.chunk)
-                 for x in self._history if x.event_type == IntermediateStepType.LLM_NEW_TOKEN and x.UUID == step.UUID),
-                "")
+            # Append the chunk to the previously accumulated LLM output for this run_id
+            output_str = self._llm_chunks.get(step.UUID, "") + str(step.data.chunk)
+            self._llm_chunks[step.UUID] = output_str
 
         elif step.event_type == IntermediateStepType.LLM_END:
             output_str = str(step.data.output)
@@ -127,9 +171,8 @@ class StepAdaptor:
         input_str: str | None = None
         output_str: str | None = None
 
-        # Find the start in the history with matching run_id
-        start_step = next(
-            (x for x in self._history if x.event_type == IntermediateStepType.TOOL_START and x.UUID == step.UUID), None)
+        # Find the open start with matching run_id
+        start_step = self._get_start_step(IntermediateStepType.TOOL_START, step.UUID)
 
         if not start_step:
             # If we don't have a start step, we can't do anything
@@ -212,10 +255,7 @@ class StepAdaptor:
 
         if step.event_type == IntermediateStepType.FUNCTION_END:
             # Find the start event with matching UUID
-            start_step = next(
-                (x
-                 for x in self._history if x.event_type == IntermediateStepType.FUNCTION_START and x.UUID == step.UUID),
-                None)
+            start_step = self._get_start_step(IntermediateStepType.FUNCTION_START, step.UUID)
 
             # For function end events, display output data
             if step.data and hasattr(step.data, 'output'):
@@ -293,12 +333,13 @@ class StepAdaptor:
 
     def process(self, step: IntermediateStep) -> AIQResponseSerializable | None:  # pylint: disable=R1710
 
-        # Track the chunk
-        self._history.append(step)
+        # Track the step
+        self._track_step(step)
         payload = step.payload
         ancestry = step.function_ancestry
 
         if not self._step_matches_filter(step, self.config):
+            self._release_step(step)
             return None
 
         try:
@@ -318,4 +359,7 @@ class StepAdaptor:
         except Exception as e:
             logger.error("Error processing intermediate step: %s", e, exc_info=True)
 
+        finally:
+            self._release_step(step)
+
         return None
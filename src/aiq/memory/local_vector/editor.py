@@ -0,0 +1,498 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import types
+import typing
+import uuid
+from pathlib import Path
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from aiq.memory.interfaces import MemoryEditor
+from aiq.memory.models import MemoryItem
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_ID = "default"
+
+_MANIFEST_FILE = "manifest.json"
+_SNAPSHOT_VERSION = 1
+
+# Partitions with more rows than this are searched by brute force in a worker thread instead of on the event loop
+_THREAD_SEARCH_ROWS = 50_000
+
+
+def _import_hnswlib() -> types.ModuleType | None:
+    try:
+        import hnswlib
+        return hnswlib
+    except ImportError:
+        return None
+
+
+def _item_text(item: MemoryItem) -> str:
+    """The text embedded for an item: its memory, or the content of its conversation when there is none"""
+    if item.memory:
+        return item.memory
+
+    return "\n".join(message.get("content", "") for message in item.conversation or []).strip()
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def _matches_metadata(record: dict, metadata: dict[str, typing.Any]) -> bool:
+    item_metadata = record.get("metadata") or {}
+    return all(item_metadata.get(key) == value for key, value in metadata.items())
+
+
+class _Partition:
+    """
+    The memories of a single user: an array of normalized embeddings, the JSON records of the items and, once the
+    partition is large enough, an HNSW index over the embeddings. Removed rows are tombstoned until the next snapshot.
+    """
+
+    def __init__(self, user_id: str, dim: int, vectors: np.ndarray | None = None, records: list[dict] | None = None):
+        self.user_id = user_id
+        self.dim = dim
+
+        # Snapshots are loaded as read-only memory maps, they are copied on the first write
+        self.vectors: np.ndarray = vectors if vectors is not None else np.empty((0, dim), dtype=np.float32)
+        self.records: list[dict] = records or []
+        self.count = 0
+        self.alive = np.ones(0, dtype=bool)
+        self.live = 0
+        self.tag_rows: dict[str, list[int]] = {}
+        self.index = None
+        self.dirty = False
+
+        self._reset(self.vectors, self.records)
+
+    def _reset(self, vectors: np.ndarray, records: list[dict]) -> None:
+        self.vectors = vectors
+        self.records = records
+        self.count = len(records)
+        self.alive = np.ones(self.count, dtype=bool)
+        self.live = self.count
+
+        self.tag_rows = {}
+        for row, record in enumerate(records):
+            for tag in record.get("tags") or []:
+                self.tag_rows.setdefault(tag, []).append(row)
+
+        self.index = None
+        self.dirty = False
+
+    def _reserve(self, rows: int) -> None:
+        needed = self.count + rows
+        if needed <= len(self.alive) and self.vectors.flags.writeable and not isinstance(self.vectors, np.memmap):
+            return
+
+        capacity = max(needed, 2 * len(self.alive), 1024)
+        vectors = np.empty((capacity, self.dim), dtype=np.float32)
+        vectors[:self.count] = self.vectors[:self.count]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self.count] = self.alive[:self.count]
+
+        self.vectors = vectors
+        self.alive = alive
+
+        if self.index is not None and self.index.get_max_elements() < capacity:
+            self.index.resize_index(capacity)
+
+    def append(self, vectors: np.ndarray, records: list[dict]) -> None:
+        self._reserve(len(records))
+
+        start = self.count
+        stop = start + len(records)
+        self.vectors[start:stop] = vectors
+        self.alive[start:stop] = True
+        self.records.extend(records)
+
+        for row, record in enumerate(records, start=start):
+            for tag in record.get("tags") or []:
+                self.tag_rows.setdefault(tag, []).append(row)
+
+        if self.index is not None:
+            self.index.add_items(vectors, np.arange(start, stop))
+
+        self.count = stop
+        self.live += len(records)
+        self.dirty = True
+
+    def remove(self, rows: np.ndarray) -> int:
+        rows = rows[self.alive[rows]]
+        self.alive[rows] = False
+        self.live -= len(rows)
+
+        if self.index is not None:
+            for row in rows:
+                self.index.mark_deleted(int(row))
+
+        self.dirty = self.dirty or len(rows) > 0
+        return len(rows)
+
+    def candidates(self, tags: list[str] | None, metadata: dict[str, typing.Any] | None) -> np.ndarray | None:
+        """
+        Mask of the live rows matching the filters, None when there are no filters.
+        """
+        if not tags and not metadata:
+            return None
+
+        mask = self.alive[:self.count].copy()
+        for tag in tags or []:
+            tag_mask = np.zeros(self.count, dtype=bool)
+            tag_mask[self.tag_rows.get(tag, [])] = True
+            mask &= tag_mask
+
+        if metadata:
+            for row in np.flatnonzero(mask):
+                if not _matches_metadata(self.records[row], metadata):
+                    mask[row] = False
+
+        return mask
+
+    def brute_force(self, query: np.ndarray, top_k: int, mask: np.ndarray | None) -> list[tuple[int, float]]:
+        count = self.count
+        vectors = self.vectors
+
+        if mask is None:
+            rows = None if self.live == count else np.flatnonzero(self.alive[:count])
+        else:
+            rows = np.flatnonzero(mask)
+
+        if rows is None:
+            scores = vectors[:count] @ query
+        else:
+            scores = vectors[rows] @ query
+
+        if len(scores) == 0:
+            return []
+
+        k = min(top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        found = top if rows is None else rows[top]
+        return [(int(row), float(scores[i])) for row, i in zip(found, top)]
+
+    def knn(self, query: np.ndarray, top_k: int, mask: np.ndarray | None) -> list[tuple[int, float]] | None:
+        """
+        Search the HNSW index, None when it cannot return enough results and the search should fall back to brute force.
+        """
+        available = self.live if mask is None else int(mask.sum())
+        k = min(top_k, available)
+        if k == 0:
+            return []
+
+        label_filter = (lambda label: mask[label]) if mask is not None else None
+        try:
+            labels, distances = self.index.knn_query(query, k=k, filter=label_filter)
+        except RuntimeError:
+            return None
+
+        return [(int(label), 1.0 - float(distance)) for label, distance in zip(labels[0], distances[0])]
+
+    def compact(self) -> None:
+        """
+        Drop the tombstoned rows. Row numbers change, so the HNSW index is dropped and rebuilt when next needed.
+        """
+        if self.live == self.count:
+            return
+
+        rows = np.flatnonzero(self.alive[:self.count])
+        self._reset(np.ascontiguousarray(self.vectors[rows]), [self.records[row] for row in rows])
+        self.dirty = True
+
+
+class LocalVectorEditor(MemoryEditor):
+    """
+    MemoryEditor keeping memories in process: embeddings are searched by brute force with NumPy, or with an HNSW index
+    (requires `hnswlib`) once a user has more than `hnsw_threshold` memories. Memories are partitioned by user, and can
+    be persisted to snapshots in `persist_dir`, which are memory-mapped when the editor is created again.
+    """
+
+    def __init__(self,
+                 embedder: Embeddings,
+                 persist_dir: str | Path | None = None,
+                 batch_size: int = 64,
+                 max_concurrency: int = 4,
+                 hnsw_threshold: int = 10_000,
+                 hnsw_m: int = 16,
+                 hnsw_ef_construction: int = 200,
+                 hnsw_ef_search: int = 64):
+        """
+        Args:
+            embedder: (Embeddings) Embedder for semantic search functionality
+            persist_dir: (str | Path | None) Directory of the snapshots, memories are not persisted when None
+            batch_size: (int) Number of memory texts embedded per call to the embedder
+            max_concurrency: (int) Maximum number of embedding calls in flight at once
+            hnsw_threshold: (int) Number of memories of a user above which an HNSW index is built
+            hnsw_m: (int) Number of links of each element of the HNSW index
+            hnsw_ef_construction: (int) Size of the candidate list when building the HNSW index
+            hnsw_ef_search: (int) Size of the candidate list when searching the HNSW index
+        """
+        self._embedder = embedder
+        self._persist_dir = Path(persist_dir) if persist_dir else None
+        self._batch_size = max(batch_size, 1)
+        self._max_concurrency = max(max_concurrency, 1)
+        self._hnsw_threshold = hnsw_threshold
+        self._hnsw_m = hnsw_m
+        self._hnsw_ef_construction = hnsw_ef_construction
+        self._hnsw_ef_search = hnsw_ef_search
+
+        self._hnswlib = _import_hnswlib()
+        if self._hnswlib is None:
+            logger.debug("hnswlib is not installed, memories are searched by brute force")
+
+        self._dim: int | None = None
+        self._partitions: dict[str, _Partition] = {}
+        self._snapshots: dict[str, dict] = {}
+        self._lock = asyncio.Lock()
+
+        if self._persist_dir is not None:
+            self._read_manifest()
+
+    @property
+    def user_ids(self) -> list[str]:
+        return sorted(set(self._partitions) | set(self._snapshots))
+
+    def __len__(self) -> int:
+        loaded = sum(partition.live for partition in self._partitions.values())
+        unloaded = sum(snapshot["count"] for user_id, snapshot in self._snapshots.items()
+                       if user_id not in self._partitions)
+        return loaded + unloaded
+
+    async def add_items(self, items: list[MemoryItem]) -> None:
+        """
+        Insert multiple MemoryItems. The texts of the items are embedded in batches of `batch_size`, at most
+        `max_concurrency` batches at a time. Items with neither a memory nor a conversation are skipped.
+        """
+        texts = [_item_text(item) for item in items]
+        items = [item for item, text in zip(items, texts) if text]
+        texts = [text for text in texts if text]
+
+        if not items:
+            return
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _embed(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await self._embedder.aembed_documents(batch)
+
+        batches = [texts[i:i + self._batch_size] for i in range(0, len(texts), self._batch_size)]
+        embedded = await asyncio.gather(*(_embed(batch) for batch in batches))
+        vectors = _normalize([vector for batch in embedded for vector in batch])
+        self._check_dim(vectors.shape[1])
+
+        by_user: dict[str, list[int]] = {}
+        for i, item in enumerate(items):
+            by_user.setdefault(item.user_id or DEFAULT_USER_ID, []).append(i)
+
+        async with self._lock:
+            for user_id, indices in by_user.items():
+                partition = self._partition(user_id, create=True)
+                partition.append(vectors[indices], [items[i].model_dump(mode="json") for i in indices])
+                await self._maybe_build_index(partition)
+
+        logger.debug("Added %d memory items for %d users", len(items), len(by_user))
+
+    async def search(self, query: str, top_k: int = 5, **kwargs) -> list[MemoryItem]:
+        """
+        Retrieve items relevant to the given query.
+
+        Args:
+            query (str): The query string to match.
+            top_k (int): Maximum number of items to return.
+            kwargs (dict): `user_id` of the memories to search, `tags` which the items must all have and `metadata`
+                key-value pairs which the items must all have.
+
+        Returns:
+            list[MemoryItem]: The most relevant MemoryItems for the given query.
+        """
+        user_id = kwargs.get("user_id") or DEFAULT_USER_ID
+        partition = self._partition(user_id)
+        if partition is None or partition.live == 0 or top_k <= 0:
+            return []
+
+        query_vector = _normalize(await self._embedder.aembed_query(query))
+        self._check_dim(query_vector.shape[0])
+
+        mask = partition.candidates(kwargs.get("tags"), kwargs.get("metadata"))
+
+        results = None
+        # Very selective filters are cheaper to search by brute force than through the index
+        if partition.index is not None and (mask is None or mask.sum() > self._hnsw_threshold):
+            results = partition.knn(query_vector, top_k, mask)
+
+        if results is None:
+            if partition.count > _THREAD_SEARCH_ROWS:
+                results = await asyncio.to_thread(partition.brute_force, query_vector, top_k, mask)
+            else:
+                results = partition.brute_force(query_vector, top_k, mask)
+
+        return [MemoryItem.model_validate(partition.records[row]) for row, _ in results]
+
+    async def remove_items(self, **kwargs) -> None:
+        """
+        Remove the memories of the user given by `user_id`. When `tags` or `metadata` are given, only the memories
+        matching them are removed.
+        """
+        if "user_id" not in kwargs:
+            raise ValueError("user_id not provided as part of the tool call.")
+
+        user_id = kwargs["user_id"] or DEFAULT_USER_ID
+
+        async with self._lock:
+            partition = self._partition(user_id)
+            if partition is None:
+                return
+
+            mask = partition.candidates(kwargs.get("tags"), kwargs.get("metadata"))
+            if mask is None:
+                mask = partition.alive[:partition.count]
+
+            removed = partition.remove(np.flatnonzero(mask))
+
+        logger.debug("Removed %d memory items of user %s", removed, user_id)
+
+    async def save(self) -> None:
+        """
+        Write a snapshot of the partitions modified since the last one to `persist_dir`.
+        """
+        if self._persist_dir is None:
+            return
+
+        async with self._lock:
+            await asyncio.to_thread(self._write_snapshot)
+
+    def _check_dim(self, dim: int) -> None:
+        if self._dim is None:
+            self._dim = dim
+        elif dim != self._dim:
+            raise ValueError(f"Embedding dimension {dim} does not match the dimension {self._dim} of the memories")
+
+    def _partition(self, user_id: str, create: bool = False) -> _Partition | None:
+        partition = self._partitions.get(user_id)
+        if partition is not None:
+            return partition
+
+        if user_id in self._snapshots:
+            partition = self._load_partition(user_id, self._snapshots[user_id])
+        elif create:
+            partition = _Partition(user_id, self._dim)
+        else:
+            return None
+
+        self._partitions[user_id] = partition
+        return partition
+
+    def _new_index(self, max_elements: int):
+        index = self._hnswlib.Index(space="ip", dim=self._dim)
+        index.init_index(max_elements=max_elements, ef_construction=self._hnsw_ef_construction, M=self._hnsw_m)
+        index.set_ef(self._hnsw_ef_search)
+        return index
+
+    def _needs_index(self, partition: _Partition) -> bool:
+        return self._hnswlib is not None and partition.index is None and partition.live > self._hnsw_threshold
+
+    def _build_index(self, partition: _Partition) -> None:
+        logger.debug("Building the HNSW index of %d memories of user %s", partition.count, partition.user_id)
+
+        index = self._new_index(max(len(partition.alive), partition.count))
+        index.add_items(partition.vectors[:partition.count], np.arange(partition.count))
+        for row in np.flatnonzero(~partition.alive[:partition.count]):
+            index.mark_deleted(int(row))
+
+        partition.index = index
+
+    async def _maybe_build_index(self, partition: _Partition) -> None:
+        if self._needs_index(partition):
+            await asyncio.to_thread(self._build_index, partition)
+
+    def _read_manifest(self) -> None:
+        manifest_file = self._persist_dir / _MANIFEST_FILE
+        if not manifest_file.exists():
+            return
+
+        manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+        if manifest.get("version") != _SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported memory snapshot version {manifest.get('version')} in {manifest_file}")
+
+        self._dim = manifest["dim"]
+        self._snapshots = manifest["partitions"]
+
+    def _load_partition(self, user_id: str, snapshot: dict) -> _Partition:
+        stem = self._persist_dir / snapshot["file"]
+
+        vectors = np.load(stem.with_suffix(".npy"), mmap_mode="r")
+        records = json.loads(stem.with_suffix(".items.json").read_text(encoding="utf-8"))
+        partition = _Partition(user_id, self._dim, vectors, records)
+
+        index_file = stem.with_suffix(".hnsw")
+        if self._hnswlib is not None and index_file.exists():
+            partition.index = self._hnswlib.Index(space="ip", dim=self._dim)
+            partition.index.load_index(str(index_file), max_elements=partition.count)
+            partition.index.set_ef(self._hnsw_ef_search)
+
+        logger.debug("Loaded %d memories of user %s from %s", partition.count, user_id, stem)
+        return partition
+
+    def _write_snapshot(self) -> None:
+        self._persist_dir.mkdir(parents=True, exist_ok=True)
+
+        snapshots = dict(self._snapshots)
+        for user_id, partition in self._partitions.items():
+            if not partition.dirty:
+                continue
+
+            partition.compact()
+            if self._needs_index(partition):
+                self._build_index(partition)
+
+            # A new file name for each snapshot, the manifest is replaced atomically to point to the new files
+            stem = f"{hashlib.sha1(user_id.encode(), usedforsecurity=False).hexdigest()[:16]}-{uuid.uuid4().hex[:8]}"
+            path = self._persist_dir / stem
+            np.save(path.with_suffix(".npy"), partition.vectors[:partition.count])
+            path.with_suffix(".items.json").write_text(json.dumps(partition.records), encoding="utf-8")
+            if partition.index is not None:
+                partition.index.save_index(str(path.with_suffix(".hnsw")))
+
+            snapshots[user_id] = {"file": stem, "count": partition.count}
+            partition.dirty = False
+
+        manifest = {"version": _SNAPSHOT_VERSION, "dim": self._dim, "partitions": snapshots}
+        manifest_tmp = self._persist_dir / f"{_MANIFEST_FILE}.tmp"
+        manifest_tmp.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(manifest_tmp, self._persist_dir / _MANIFEST_FILE)
+        self._snapshots = snapshots
+
+        # Files of previous snapshots are removed once the manifest no longer refers to them
+        current = {snapshot["file"] for snapshot in snapshots.values()}
+        for file in self._persist_dir.iterdir():
+            if file.name != _MANIFEST_FILE and file.name.split(".", 1)[0] not in current:
+                file.unlink(missing_ok=True)
+
+        logger.debug("Wrote a snapshot of %d users to %s", len(snapshots), self._persist_dir)
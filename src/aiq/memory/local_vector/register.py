@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pydantic import Field
+
+from aiq.builder.builder import Builder
+from aiq.builder.framework_enum import LLMFrameworkEnum
+from aiq.cli.register_workflow import register_memory
+from aiq.data_models.component_ref import EmbedderRef
+from aiq.data_models.memory import MemoryBaseConfig
+
+
+class LocalVectorMemoryConfig(MemoryBaseConfig, name="local_vector_memory"):
+    """
+    Configuration for a memory kept in process and searched with a local vector index, optionally persisted to disk.
+    """
+    embedder: EmbedderRef = Field(description=("Instance name of the embedder client instance from the workflow "
+                                               "configuration object."))
+    persist_dir: str | None = Field(
+        default=None,
+        description=("Directory the memories are snapshotted to when the workflow shuts down and loaded from when it "
+                     "starts. Memories are not persisted when not set."))
+    batch_size: int = Field(default=64, gt=0, description="Number of memory texts embedded per call to the embedder")
+    max_concurrency: int = Field(default=4, gt=0, description="Maximum number of embedding calls in flight at once")
+    hnsw_threshold: int = Field(
+        default=10_000,
+        ge=0,
+        description=("Number of memories of a user above which they are searched with an HNSW index instead of by "
+                     "brute force. Requires the 'hnswlib' package, memories are always searched by brute force "
+                     "without it."))
+    hnsw_m: int = Field(default=16, gt=0, description="Number of links of each element of the HNSW index")
+    hnsw_ef_construction: int = Field(default=200,
+                                      gt=0,
+                                      description="Size of the candidate list when building the HNSW index")
+    hnsw_ef_search: int = Field(default=64,
+                                gt=0,
+                                description="Size of the candidate list when searching the HNSW index")
+
+
+@register_memory(config_type=LocalVectorMemoryConfig)
+async def local_vector_memory_client(config: LocalVectorMemoryConfig, builder: Builder):
+
+    from aiq.memory.local_vector.editor import LocalVectorEditor
+
+    embedder = await builder.get_embedder(config.embedder, wrapper_type=LLMFrameworkEnum.LANGCHAIN)
+
+    memory_editor = LocalVectorEditor(embedder=embedder,
+                                      persist_dir=config.persist_dir,
+                                      batch_size=config.batch_size,
+                                      max_concurrency=config.max_concurrency,
+                                      hnsw_threshold=config.hnsw_threshold,
+                                      hnsw_m=config.hnsw_m,
+                                      hnsw_ef_construction=config.hnsw_ef_construction,
+                                      hnsw_ef_search=config.hnsw_ef_search)
+
+    try:
+        yield memory_editor
+    finally:
+        await memory_editor.save()
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+
+from aiq.memory.interfaces import MemoryEditor
+from aiq.memory.models import MemoryItem
+from aiq.utils.semantic_cache import SemanticCache
+from aiq.utils.semantic_cache import scope_key
+
+
+class SemanticCacheMemoryEditor(MemoryEditor):
+    """
+    MemoryEditor caching the search results of another MemoryEditor. Adding or removing the memories of a user
+    invalidates the cached results of that user.
+    """
+
+    def __init__(self, memory_editor: MemoryEditor, cache: SemanticCache):
+        """
+        Args:
+            memory_editor: (MemoryEditor) The memory editor whose search results are cached
+            cache: (SemanticCache) The cache of the search results
+        """
+        self._memory_editor = memory_editor
+        self._cache = cache
+
+    @property
+    def cache(self) -> SemanticCache:
+        return self._cache
+
+    async def add_items(self, items: list[MemoryItem]) -> None:
+        await self._memory_editor.add_items(items)
+        self._cache.invalidate({item.user_id for item in items})
+
+    async def search(self, query: str, top_k: int = 5, **kwargs) -> list[MemoryItem]:
+        search = functools.partial(self._memory_editor.search, query, top_k, **kwargs)
+        return await self._cache.get_or_search(query,
+                                               search,
+                                               scope=scope_key(top_k=top_k, **kwargs),
+                                               partition=kwargs.get("user_id"))
+
+    async def remove_items(self, **kwargs) -> None:
+        await self._memory_editor.remove_items(**kwargs)
+        self._cache.invalidate([kwargs["user_id"]] if "user_id" in kwargs else None)
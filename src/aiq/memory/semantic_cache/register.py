@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+from pydantic import Field
+
+from aiq.builder.builder import Builder
+from aiq.builder.framework_enum import LLMFrameworkEnum
+from aiq.cli.register_workflow import register_memory
+from aiq.data_models.component_ref import MemoryRef
+from aiq.data_models.memory import MemoryBaseConfig
+from aiq.data_models.semantic_cache_mixin import SemanticCacheMixin
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCacheMemoryConfig(MemoryBaseConfig, SemanticCacheMixin, name="semantic_cache_memory"):
+    """
+    Configuration for a read-through cache of the search results of another memory.
+    """
+    memory: MemoryRef = Field(description="Instance name of the memory whose search results are cached.")
+
+
+@register_memory(config_type=SemanticCacheMemoryConfig)
+async def semantic_cache_memory_client(config: SemanticCacheMemoryConfig, builder: Builder):
+
+    from aiq.memory.semantic_cache.editor import SemanticCacheMemoryEditor
+    from aiq.utils.semantic_cache import SemanticCache
+
+    embedder = None
+    if config.embedder is not None:
+        embedder = await builder.get_embedder(config.embedder, wrapper_type=LLMFrameworkEnum.LANGCHAIN)
+
+    cache = SemanticCache(f"memory {config.memory}",
+                          ttl=config.ttl_seconds,
+                          max_entries=config.max_entries,
+                          normalize_queries=config.normalize_queries,
+                          similarity_threshold=config.similarity_threshold,
+                          embedder=embedder,
+                          max_embeddings=config.max_embeddings)
+
+    try:
+        yield SemanticCacheMemoryEditor(builder.get_memory_client(config.memory), cache)
+    finally:
+        logger.info("%s", cache.stats())
@@ -17,6 +17,10 @@ from abc import ABC
 from abc import abstractmethod
 
 from .models import ObjectStoreItem
+from .models import ObjectStoreStreamItem
+
+# Default size of the chunks of streamed objects
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
 
 
 class ObjectStore(ABC):
@@ -82,3 +86,115 @@ class ObjectStore(ABC):
             NoSuchKeyError: If the item does not exist.
         """
         pass
+
+    async def put_objects(self, items: dict[str, ObjectStoreItem]) -> None:
+        """
+        Save several ObjectStoreItems in the object store, by key.
+        If any of the keys already exists, raise an error.
+
+        The default implementation saves the items one at a time. Implementations which support it save them in bulk,
+        and atomically: either all the items are saved or none of them is.
+
+        Args:
+            items (dict[str, ObjectStoreItem]): The items to save, by key.
+
+        Raises:
+            KeyAlreadyExistsError: If one of the keys already exists.
+        """
+        for key, item in items.items():
+            await self.put_object(key, item)
+
+    async def get_objects(self, keys: list[str]) -> dict[str, ObjectStoreItem]:
+        """
+        Get several ObjectStoreItems from the object store by key.
+
+        The default implementation gets the items one at a time. Implementations which support it get them in bulk.
+
+        Args:
+            keys (list[str]): The keys to get the items from.
+
+        Returns:
+            dict[str, ObjectStoreItem]: The items retrieved from the object store, by key.
+
+        Raises:
+            NoSuchKeyError: If one of the items does not exist.
+        """
+        return {key: await self.get_object(key) for key in dict.fromkeys(keys)}
+
+    async def delete_objects(self, keys: list[str]) -> None:
+        """
+        Delete several ObjectStoreItems from the object store by key.
+
+        The default implementation deletes the items one at a time. Implementations which support it delete them in
+        bulk, and atomically: either all the items are deleted or none of them is.
+
+        Args:
+            keys (list[str]): The keys to delete the items from.
+
+        Raises:
+            NoSuchKeyError: If one of the items does not exist.
+        """
+        for key in dict.fromkeys(keys):
+            await self.delete_object(key)
+
+    async def get_object_stream(self, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ObjectStoreStreamItem:
+        """
+        Get an ObjectStoreItem from the object store by key, with its data read in chunks.
+
+        The default implementation gets the whole item and returns its data as a single chunk. Implementations which
+        support it read the data as the chunks are iterated, bounding the memory used for large objects.
+
+        Args:
+            key (str): The key to get the item from.
+            chunk_size (int): The maximum size of the chunks, in bytes.
+
+        Returns:
+            ObjectStoreStreamItem: The item, with an iterator over the chunks of its data.
+
+        Raises:
+            NoSuchKeyError: If the item does not exist.
+        """
+        item = await self.get_object(key)
+
+        async def chunks():
+            for start in range(0, len(item.data), chunk_size):
+                yield item.data[start:start + chunk_size]
+
+        return ObjectStoreStreamItem(chunks=chunks(),
+                                     content_type=item.content_type,
+                                     metadata=item.metadata,
+                                     size=len(item.data))
+
+    async def put_object_stream(self, key: str, item: ObjectStoreStreamItem) -> None:
+        """
+        Save an ObjectStoreItem whose data is given in chunks in the object store with the given key.
+        If the key already exists, raise an error.
+
+        The default implementation joins the chunks and saves the whole item. Implementations which support it upload
+        the chunks as they are iterated, bounding the memory used for large objects.
+
+        Args:
+            key (str): The key to save the item under.
+            item (ObjectStoreStreamItem): The item to save, with an iterator over the chunks of its data.
+
+        Raises:
+            KeyAlreadyExistsError: If the key already exists.
+        """
+        data = b"".join([chunk async for chunk in item.chunks])
+        await self.put_object(key, ObjectStoreItem(data=data, content_type=item.content_type, metadata=item.metadata))
+
+    async def upsert_object_stream(self, key: str, item: ObjectStoreStreamItem) -> None:
+        """
+        Save an ObjectStoreItem whose data is given in chunks in the object store with the given key.
+        If the key already exists, update the item.
+
+        The default implementation joins the chunks and saves the whole item. Implementations which support it upload
+        the chunks as they are iterated, bounding the memory used for large objects.
+
+        Args:
+            key (str): The key to save the item under.
+            item (ObjectStoreStreamItem): The item to save, with an iterator over the chunks of its data.
+        """
+        data = b"".join([chunk async for chunk in item.chunks])
+        await self.upsert_object(key,
+                                 ObjectStoreItem(data=data, content_type=item.content_type, metadata=item.metadata))
@@ -13,7 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import AsyncIterator
+
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
 
 
@@ -34,3 +37,28 @@ class ObjectStoreItem(BaseModel):
     data: bytes = Field(description="The data to store in the object store.")
     content_type: str | None = Field(description="The content type of the data.", default=None)
     metadata: dict[str, str] | None = Field(description="The metadata of the data.", default=None)
+
+
+class ObjectStoreStreamItem(BaseModel):
+    """
+    Represents an object store item whose data is read in chunks, so that large objects are not loaded in memory at
+    once. The chunks are read as they are iterated and should be iterated only once.
+
+    Attributes
+    ----------
+    chunks : AsyncIterator[bytes]
+        The chunks of the data, in order.
+    content_type : str | None
+        The content type of the data.
+    metadata : dict[str, str] | None
+        Metadata providing context and utility for management operations.
+    size : int | None
+        The size of the data in bytes, if it is known.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    chunks: AsyncIterator[bytes] = Field(description="The chunks of the data, in order.", exclude=True)
+    content_type: str | None = Field(description="The content type of the data.", default=None)
+    metadata: dict[str, str] | None = Field(description="The metadata of the data.", default=None)
+    size: int | None = Field(description="The size of the data in bytes, if it is known.", default=None)
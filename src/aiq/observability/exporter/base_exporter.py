@@ -336,6 +336,46 @@ class BaseExporter(Exporter):
         finally:
             await self.stop()
 
+    @asynccontextmanager
+    async def start_detached(self) -> AsyncGenerator[None]:
+        """Start the exporter without subscribing to an event stream.
+
+        Events are fed to a detached exporter with `export_run_event`, by a shared pipeline serving every workflow run
+        (see `SharedExporterPipeline`). The exporter is stopped when exiting the context.
+        """
+        try:
+            await self._pre_start()
+
+            self._running = True
+            self._ready_event.set()
+
+            yield
+
+        finally:
+            await self.stop()
+
+    def export_run_event(self, run_id: str, event: IntermediateStep) -> None:
+        """Export an event of a workflow run, when the exporter is shared by concurrent runs.
+
+        Exporters keeping state across the events of a run should partition it by `run_id`. By default, the event is
+        exported with `export`.
+
+        Args:
+            run_id (str): The id of the workflow run the event belongs to.
+            event (IntermediateStep): The event to be exported.
+        """
+        self.export(event)
+
+    def end_run(self, run_id: str) -> None:
+        """Called once every event of a workflow run has been exported with `export_run_event`.
+
+        Exporters should release the state they kept for the run. By default, this does nothing.
+
+        Args:
+            run_id (str): The id of the completed workflow run.
+        """
+        pass
+
     async def _cleanup(self):
         """Clean up any resources."""
         pass
@@ -75,6 +75,8 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
     _outstanding_spans: IsolatedAttribute[dict] = IsolatedAttribute(dict)
     _span_stack: IsolatedAttribute[dict] = IsolatedAttribute(dict)
     _metadata_stack: IsolatedAttribute[dict] = IsolatedAttribute(dict)
+    # Outstanding span ids by workflow run, when the exporter is shared by concurrent runs
+    _run_spans: IsolatedAttribute[dict] = IsolatedAttribute(dict)
 
     @abstractmethod
     async def export_processed(self, item: OutputSpanT) -> None:
@@ -100,6 +102,50 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
         elif (event.event_state == IntermediateStepState.END):
             self._process_end_event(event)
 
+    @override
+    def export_run_event(self, run_id: str, event: IntermediateStep) -> None:
+        """Process an event of a workflow run, tracking the spans left open by the run.
+
+        Spans are keyed by step id, which is unique across runs, so the spans of concurrent runs share the tracking
+        dictionaries. Only the ids of the outstanding spans are partitioned by run.
+
+        Args:
+            run_id (str): The id of the workflow run the event belongs to.
+            event (IntermediateStep): The event to process.
+        """
+        self.export(event)
+
+        if not isinstance(event, IntermediateStep):
+            return
+
+        if (event.event_state == IntermediateStepState.START):
+            if event.UUID in self._outstanding_spans:  # type: ignore
+                self._run_spans.setdefault(run_id, set()).add(event.UUID)  # type: ignore
+        elif (event.event_state == IntermediateStepState.END):
+            run_spans = self._run_spans.get(run_id)  # type: ignore
+            if run_spans is not None:
+                run_spans.discard(event.UUID)
+
+    @override
+    def end_run(self, run_id: str) -> None:
+        """End the spans a completed workflow run left open, without exporting them.
+
+        Args:
+            run_id (str): The id of the completed workflow run.
+        """
+        run_spans = self._run_spans.pop(run_id, None)  # type: ignore
+        if not run_spans:
+            return
+
+        logger.warning("Not all spans of run %s were closed. Remaining: %d", run_id, len(run_spans))
+
+        for span_id in run_spans:
+            span = self._outstanding_spans.pop(span_id, None)  # type: ignore
+            if span is not None:
+                span.end()
+            self._span_stack.pop(span_id, None)  # type: ignore
+            self._metadata_stack.pop(span_id, None)  # type: ignore
+
     def _process_start_event(self, event: IntermediateStep):
         """Process the start event of an intermediate step.
 
@@ -262,3 +308,4 @@ class SpanExporter(ProcessingExporter[InputSpanT, OutputSpanT], SerializeMixin):
         self._outstanding_spans.clear()  # type: ignore
         self._span_stack.clear()  # type: ignore
         self._metadata_stack.clear()  # type: ignore
+        self._run_spans.clear()  # type: ignore
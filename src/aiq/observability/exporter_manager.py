@@ -19,6 +19,7 @@ from contextlib import asynccontextmanager
 
 from aiq.builder.context import AIQContextState
 from aiq.observability.exporter.base_exporter import BaseExporter
+from aiq.observability.exporter_pipeline import SharedExporterPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -38,12 +39,18 @@ class ExporterManager:
     Exporters added after `start()` is called will not be started automatically. They will only be
     started on the next lifecycle (i.e., after a stop and subsequent start).
 
+    When a shared pipeline is provided, the exporters it serves are not copied for each workflow execution. Instead the
+    events of the execution are fed to the long-lived exporters of the pipeline, tagged with the id of the execution.
+    Exporters of the registry which are not served by the pipeline are still isolated.
+
     Args:
         shutdown_timeout (int, optional): Maximum time in seconds to wait for exporters to shut down gracefully.
         Defaults to 120 seconds.
+        pipeline (SharedExporterPipeline | None, optional): The shared pipeline of long-lived exporters. Defaults to
+        None.
     """
 
-    def __init__(self, shutdown_timeout: int = 120):
+    def __init__(self, shutdown_timeout: int = 120, pipeline: SharedExporterPipeline | None = None):
         """Initialize the ExporterManager."""
         self._tasks: dict[str, asyncio.Task] = {}
         self._running: bool = False
@@ -54,10 +61,13 @@ class ExporterManager:
         self._shutdown_timeout: int = shutdown_timeout
         # Track isolated exporters for proper cleanup
         self._active_isolated_exporters: dict[str, BaseExporter] = {}
+        self._pipeline: SharedExporterPipeline | None = pipeline
 
     @classmethod
-    def _create_with_shared_registry(cls, shutdown_timeout: int,
-                                     shared_registry: dict[str, BaseExporter]) -> "ExporterManager":
+    def _create_with_shared_registry(cls,
+                                     shutdown_timeout: int,
+                                     shared_registry: dict[str, BaseExporter],
+                                     pipeline: SharedExporterPipeline | None = None) -> "ExporterManager":
         """Internal factory method for creating instances with shared registry."""
         instance = cls.__new__(cls)
         instance._tasks = {}
@@ -68,6 +78,7 @@ class ExporterManager:
         instance._shutdown_event = asyncio.Event()
         instance._shutdown_timeout = shutdown_timeout
         instance._active_isolated_exporters = {}
+        instance._pipeline = pipeline
         return instance
 
     def _ensure_registry_owned(self):
@@ -133,6 +144,19 @@ class ExporterManager:
         """
         return self._exporter_registry
 
+    def _get_unshared_exporters(self) -> dict[str, BaseExporter]:
+        """
+        The registered exporters which are not served by the shared pipeline.
+        """
+        if self._pipeline is None:
+            return self._exporter_registry
+
+        shared = self._pipeline.exporters
+        return {
+            name: exporter
+            for name, exporter in self._exporter_registry.items() if shared.get(name) is not exporter
+        }
+
     def create_isolated_exporters(self, context_state: AIQContextState | None = None) -> dict[str, BaseExporter]:
         """
         Create isolated copies of all exporters for concurrent execution.
@@ -152,7 +176,7 @@ class ExporterManager:
             context_state = AIQContextState.get()
 
         isolated_exporters = {}
-        for name, exporter in self._exporter_registry.items():
+        for name, exporter in self._get_unshared_exporters().items():
             if hasattr(exporter, 'create_isolated_instance'):
                 isolated_exporters[name] = exporter.create_isolated_instance(context_state)
             else:
@@ -228,7 +252,7 @@ class ExporterManager:
                 self._active_isolated_exporters = exporters_to_start
                 logger.debug("Created %d isolated exporters", len(exporters_to_start))
             else:
-                exporters_to_start = self._exporter_registry
+                exporters_to_start = self._get_unshared_exporters()
                 # Clear isolated exporters since we're using originals
                 self._active_isolated_exporters = {}
 
@@ -245,7 +269,12 @@ class ExporterManager:
             await asyncio.gather(*[exporter.wait_ready() for exporter in exporters])
 
         try:
-            yield self
+            if self._pipeline is not None:
+                event_stream = (context_state or AIQContextState.get()).event_stream.get()
+                async with self._pipeline.run(event_stream):
+                    yield self
+            else:
+                yield self
         finally:
             # Clean up isolated exporters BEFORE stopping tasks
             try:
@@ -313,11 +342,13 @@ class ExporterManager:
             logger.warning("Exporters did not shut down in time: %s", ", ".join(stuck_tasks))
 
     @staticmethod
-    def from_exporters(exporters: dict[str, BaseExporter], shutdown_timeout: int = 120) -> "ExporterManager":
+    def from_exporters(exporters: dict[str, BaseExporter],
+                       shutdown_timeout: int = 120,
+                       pipeline: SharedExporterPipeline | None = None) -> "ExporterManager":
         """
-        Create an ExporterManager from a dictionary of exporters.
+        Create an ExporterManager from a dictionary of exporters, optionally serving them from a shared pipeline.
         """
-        exporter_manager = ExporterManager(shutdown_timeout=shutdown_timeout)
+        exporter_manager = ExporterManager(shutdown_timeout=shutdown_timeout, pipeline=pipeline)
         for name, exporter in exporters.items():
             exporter_manager.add_exporter(name, exporter)
 
@@ -332,4 +363,4 @@ class ExporterManager:
         Returns:
             ExporterManager: A new ExporterManager instance with shared exporters (copy-on-write).
         """
-        return self._create_with_shared_registry(self._shutdown_timeout, self._exporter_registry)
+        return self._create_with_shared_registry(self._shutdown_timeout, self._exporter_registry, self._pipeline)
@@ -0,0 +1,254 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextvars
+import dataclasses
+import logging
+import threading
+import uuid
+from collections import deque
+from contextlib import AsyncExitStack
+from contextlib import asynccontextmanager
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.observability.exporter.base_exporter import BaseExporter
+from aiq.utils.reactive.subject import Subject
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class ExporterPipelineMetrics:
+    """
+    Statistics of a shared exporter pipeline.
+    """
+    exporters: int
+    active_runs: int
+    completed_runs: int
+    pending_events: int
+    dispatched_events: int
+    inline_dispatched_events: int
+
+
+class SharedExporterPipeline:
+    """
+    A long-lived pipeline delivering the intermediate steps of every workflow run to a shared set of exporters.
+
+    Exporters are started once, without subscribing to an event stream, and a single background task dispatches the
+    events of all the runs to them. Each run subscribes a single observer to its event stream, which tags the events
+    with the id of the run and enqueues them. The cost of a run is one enqueue per event, instead of an isolated copy,
+    a task and a subscription per exporter.
+
+    Exporters partition their state by run (see `BaseExporter.export_run_event`), and are notified with
+    `BaseExporter.end_run` once every event of a run has been dispatched to them. Exporters are stopped, flushing their
+    processors, when the pipeline is closed.
+
+    The pipeline is started on first use, on the running event loop, and restarted if used from another event loop.
+    """
+
+    def __init__(self, exporters: dict[str, BaseExporter], queue_size: int = 8192, shutdown_timeout: float = 120):
+        """
+        Args:
+            exporters (dict[str, BaseExporter]): The exporters fed by the pipeline, by name.
+            queue_size (int): Maximum number of events pending dispatch. When the queue is full, half of it is
+                dispatched on the producer's stack to make room.
+            shutdown_timeout (float): Maximum time in seconds to wait for the exporters to stop when the pipeline is
+                closed.
+        """
+        self._exporters = dict(exporters)
+        self._queue_size = max(queue_size, 1)
+        self._shutdown_timeout = shutdown_timeout
+
+        self._pending: deque[tuple[str, IntermediateStep | None]] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._started: list[tuple[str, BaseExporter]] | None = None
+        self._closed = False
+
+        self._active_runs = 0
+        self._completed_runs = 0
+        self._dispatched_events = 0
+        self._inline_dispatched_events = 0
+
+    @property
+    def exporters(self) -> dict[str, BaseExporter]:
+        return self._exporters
+
+    def _ensure_started(self) -> None:
+        if (self._closed):
+            raise RuntimeError("Shared exporter pipeline is closed")
+
+        loop = asyncio.get_running_loop()
+
+        if (self._task is not None and self._loop is loop and not self._task.done()):
+            return
+
+        if (self._task is not None and self._loop is not loop):
+            logger.debug("Restarting the shared exporter pipeline on a new event loop")
+
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._wakeup = asyncio.Event()
+        self._started = None
+        self._pending.clear()
+
+        # Started in an empty context, the pipeline must not hold on to the context variables of the first run
+        self._task = loop.create_task(self._run(self._wakeup),
+                                      name="aiq-exporter-pipeline",
+                                      context=contextvars.Context())
+
+    def _enqueue(self, run_id: str, event: IntermediateStep | None) -> None:
+        on_loop_thread = threading.get_ident() == self._loop_thread_id
+
+        if (on_loop_thread and self._started is not None and len(self._pending) >= self._queue_size):
+            # Backpressure: make room by dispatching on the producer's stack, exporters can only be called from the
+            # event loop thread
+            count = self._drain(self._started, self._queue_size // 2 or 1)
+            self._inline_dispatched_events += count
+
+        self._pending.append((run_id, event))
+
+        wakeup = self._wakeup
+        if (wakeup is None or wakeup.is_set()):
+            return
+
+        if (on_loop_thread):
+            wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(wakeup.set)
+
+    def _drain(self, exporters: list[tuple[str, BaseExporter]], max_items: int | None = None) -> int:
+        """
+        Dispatch up to `max_items` pending events (all of them if None), in the order they were enqueued.
+        """
+        pending = self._pending
+        count = 0
+
+        while pending and (max_items is None or count < max_items):
+            run_id, event = pending.popleft()
+            self._dispatch(exporters, run_id, event)
+            count += 1
+
+        return count
+
+    def _dispatch(self, exporters: list[tuple[str, BaseExporter]], run_id: str, event: IntermediateStep | None):
+        for name, exporter in exporters:
+            try:
+                if (event is None):
+                    exporter.end_run(run_id)
+                else:
+                    exporter.export_run_event(run_id, event)
+            except Exception as e:
+                logger.error("Exporter '%s' failed to handle an event of run %s: %s", name, run_id, e, exc_info=True)
+
+        if (event is None):
+            self._completed_runs += 1
+        else:
+            self._dispatched_events += 1
+
+    async def _run(self, wakeup: asyncio.Event) -> None:
+        async with AsyncExitStack() as stack:
+            started: list[tuple[str, BaseExporter]] = []
+
+            for name, exporter in self._exporters.items():
+                try:
+                    await stack.enter_async_context(exporter.start_detached())
+                    started.append((name, exporter))
+                    logger.info("Started exporter '%s'", name)
+                except Exception as e:
+                    logger.error("Failed to start exporter '%s': %s", name, e, exc_info=True)
+
+            self._started = started
+
+            try:
+                while True:
+                    self._drain(started)
+
+                    # Stop once closed and every pending event has been dispatched
+                    if (self._closed):
+                        return
+
+                    await wakeup.wait()
+                    wakeup.clear()
+            finally:
+                self._started = None
+                logger.info("Stopping %d exporters of the shared exporter pipeline", len(started))
+
+    @asynccontextmanager
+    async def run(self, event_stream: Subject | None):
+        """
+        Feed the events of a workflow run to the exporters of the pipeline, for the duration of the context.
+
+        Args:
+            event_stream (Subject | None): The event stream of the run.
+
+        Yields:
+            str: The id the events of the run are tagged with.
+        """
+        self._ensure_started()
+
+        run_id = uuid.uuid4().hex
+        enqueue = self._enqueue
+
+        def on_next(event: IntermediateStep) -> None:
+            enqueue(run_id, event)
+
+        subscription = None
+        if (event_stream is not None):
+            subscription = event_stream.subscribe(on_next=on_next)
+
+        self._active_runs += 1
+        try:
+            yield run_id
+        finally:
+            self._active_runs -= 1
+            if (subscription is not None):
+                subscription.unsubscribe()
+            enqueue(run_id, None)
+
+    def metrics(self) -> ExporterPipelineMetrics:
+        return ExporterPipelineMetrics(exporters=len(self._exporters),
+                                       active_runs=self._active_runs,
+                                       completed_runs=self._completed_runs,
+                                       pending_events=len(self._pending),
+                                       dispatched_events=self._dispatched_events,
+                                       inline_dispatched_events=self._inline_dispatched_events)
+
+    async def aclose(self) -> None:
+        """
+        Dispatch the pending events and stop the exporters. The pipeline can not be used afterwards.
+        """
+        self._closed = True
+
+        task = self._task
+        if (task is None or task.done()):
+            return
+
+        if (self._loop is not asyncio.get_running_loop()):
+            logger.warning("Shared exporter pipeline was started on another event loop and can not be stopped")
+            return
+
+        self._wakeup.set()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout=self._shutdown_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Shared exporter pipeline did not shut down in %s seconds", self._shutdown_timeout)
+            task.cancel()
+        except Exception as e:
+            logger.error("Error stopping the shared exporter pipeline: %s", e, exc_info=True)
@@ -15,6 +15,7 @@
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -25,6 +26,24 @@ from aiq.observability.mixin.resource_conflict_mixin import ResourceConflictMixi
 logger = logging.getLogger(__name__)
 
 
+class _BufferedWriterState:
+    """Mutable state of the persistent file writer.
+
+    Kept in a separate object so that isolated (shallow) copies of an exporter share the same open file handle and
+    pending write buffer with the original instance.
+    """
+
+    def __init__(self):
+        self.handle: Any = None
+        self.first_write: bool = True
+        self.lines: list[str] = []
+        self.pending_bytes: int = 0
+        self.last_flush: float = time.monotonic()
+        self.flush_timer: asyncio.TimerHandle | None = None
+        # Flushes started by the timer, referenced until they complete so that they are not garbage collected
+        self.flush_tasks: set[asyncio.Task] = set()
+
+
 class FileExportMixin(ResourceConflictMixin):
     """Mixin for file-based exporters.
 
@@ -45,6 +64,9 @@ class FileExportMixin(ResourceConflictMixin):
             max_file_size: int = 10 * 1024 * 1024,  # 10MB default
             max_files: int = 5,
             cleanup_on_init: bool = False,
+            persistent_writer: bool = False,
+            write_buffer_size: int = 64 * 1024,  # 64KB default
+            flush_interval: float = 1.0,
             **kwargs):
         """Initialize the file exporter with the specified output_path and project.
 
@@ -56,6 +78,12 @@ class FileExportMixin(ResourceConflictMixin):
             max_file_size (int): Maximum file size in bytes before rolling. Defaults to 10MB.
             max_files (int): Maximum number of rolled files to keep. Defaults to 5.
             cleanup_on_init (bool): Clean up old files during initialization. Defaults to False.
+            persistent_writer (bool): Keep the file handle open across exports and coalesce lines into a write buffer
+                instead of reopening the file for every item. Defaults to False.
+            write_buffer_size (int): Size in bytes of pending lines which triggers a flush when the persistent writer
+                is enabled. Defaults to 64KB.
+            flush_interval (float): Maximum time in seconds a line is kept in the write buffer when the persistent
+                writer is enabled. Defaults to 1.0.
 
         Raises:
             ResourceConflictError: If another FileExportMixin instance is already using
@@ -68,8 +96,12 @@ class FileExportMixin(ResourceConflictMixin):
         self._max_file_size = max_file_size
         self._max_files = max_files
         self._cleanup_on_init = cleanup_on_init
+        self._persistent_writer = persistent_writer
+        self._write_buffer_size = write_buffer_size
+        self._flush_interval = flush_interval
         self._lock = asyncio.Lock()
         self._first_write = True
+        self._writer_state = _BufferedWriterState()
 
         # Initialize file paths first, then check for conflicts via ResourceConflictMixin
         self._setup_file_paths()
@@ -220,6 +252,10 @@ class FileExportMixin(ResourceConflictMixin):
         Args:
             item (str | list[str]): The string or list of strings to export.
         """
+        if self._persistent_writer:
+            await self._buffer_lines(item if isinstance(item, list) else [item])
+            return
+
         try:
             # Lazy import to avoid slow startup times
             import aiofiles
@@ -250,6 +286,124 @@ class FileExportMixin(ResourceConflictMixin):
         except Exception as e:
             logger.error("Error exporting event: %s", e, exc_info=True)
 
+    async def _buffer_lines(self, lines: list[str]) -> None:
+        """Append lines to the write buffer, flushing it once the size or time bound is reached.
+
+        Args:
+            lines (list[str]): The lines to write, without trailing newlines.
+        """
+        state = self._writer_state
+
+        for line in lines:
+            state.lines.append(line)
+            state.lines.append("\n")
+            state.pending_bytes += len(line) + 1
+
+        if (state.pending_bytes >= self._write_buffer_size
+                or time.monotonic() - state.last_flush >= self._flush_interval):
+            await self.flush()
+        elif state.flush_timer is None:
+            # Make sure the buffered lines are written even if no further items arrive
+            loop = asyncio.get_running_loop()
+            state.flush_timer = loop.call_later(self._flush_interval, self._schedule_flush)
+
+    def _schedule_flush(self) -> None:
+        """Timer callback which flushes the write buffer from the event loop."""
+        state = self._writer_state
+        state.flush_timer = None
+
+        task = asyncio.ensure_future(self.flush())
+        state.flush_tasks.add(task)
+        task.add_done_callback(self._on_flush_done)
+
+    def _on_flush_done(self, task: asyncio.Task) -> None:
+        """Release a completed timer flush and log its error, if any."""
+        self._writer_state.flush_tasks.discard(task)
+
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Error flushing buffered events: %s", task.exception(), exc_info=task.exception())
+
+    async def flush(self) -> None:
+        """Write all buffered lines to the current file.
+
+        This is a no-op unless the persistent writer is enabled.
+        """
+        if not self._persistent_writer:
+            return
+
+        try:
+            # Lazy import to avoid slow startup times
+            import aiofiles
+
+            async with self._lock:
+                state = self._writer_state
+
+                if state.flush_timer is not None:
+                    state.flush_timer.cancel()
+                    state.flush_timer = None
+
+                state.last_flush = time.monotonic()
+
+                if not state.lines:
+                    return
+
+                data = "".join(state.lines)
+                state.lines.clear()
+                state.pending_bytes = 0
+
+                # Check if we need to roll the file. The handle must be closed first so that subsequent writes go to
+                # the new file rather than the renamed one.
+                if await self._should_roll_file():
+                    await self._close_handle()
+                    await self._roll_file()
+
+                if state.handle is None:
+                    # Determine file mode
+                    if state.first_write and self._mode == FileMode.OVERWRITE:
+                        file_mode = "w"
+                    else:
+                        file_mode = "a"
+                    state.first_write = False
+
+                    state.handle = await aiofiles.open(self._current_file_path, mode=file_mode)
+
+                await state.handle.write(data)
+                await state.handle.flush()
+
+        except Exception as e:
+            logger.error("Error flushing buffered events: %s", e, exc_info=True)
+
+    async def _close_handle(self) -> None:
+        """Close the persistent file handle if it is open."""
+        state = self._writer_state
+
+        if state.handle is not None:
+            try:
+                await state.handle.close()
+            except OSError as e:
+                logger.error("Error closing file %s: %s", self._current_file_path, e)
+            finally:
+                state.handle = None
+
+    async def _cleanup(self):
+        """Flush the write buffer after any final batches were exported and release the file handle.
+
+        Isolated instances share the file handle with the original exporter, so only the original closes it.
+        """
+        await super()._cleanup()  # type: ignore
+
+        if not self._persistent_writer:
+            return
+
+        if self._writer_state.flush_tasks:
+            await asyncio.gather(*self._writer_state.flush_tasks, return_exceptions=True)
+
+        await self.flush()
+
+        if not getattr(self, "_is_isolated_instance", False):
+            async with self._lock:
+                await self._close_handle()
+
     def get_current_file_path(self) -> Path:
         """Get the current file path being written to.
 
@@ -272,8 +426,16 @@ class FileExportMixin(ResourceConflictMixin):
             "cleanup_on_init": self._cleanup_on_init,
             "project": self._project,
             "effective_project": self._project,
+            "persistent_writer": self._persistent_writer,
         }
 
+        if self._persistent_writer:
+            info.update({
+                "write_buffer_size": self._write_buffer_size,
+                "flush_interval": self._flush_interval,
+                "buffered_bytes": self._writer_state.pending_bytes,
+            })
+
         if self._enable_rolling:
             info.update({
                 "max_file_size": self._max_file_size,
@@ -14,12 +14,22 @@
 # limitations under the License.
 
 import json
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel
 from pydantic import TypeAdapter
 
 
+@lru_cache(maxsize=256)
+def _get_type_adapter(value_type: type) -> TypeAdapter:
+    """
+    Returns a cached TypeAdapter for the given type. Building a TypeAdapter compiles a schema which is far more
+    expensive than the serialization itself, so adapters are reused across payloads of the same type.
+    """
+    return TypeAdapter(value_type)
+
+
 class SerializeMixin:
 
     def _process_streaming_output(self, input_value: Any) -> Any:
@@ -27,7 +37,7 @@ class SerializeMixin:
         Serialize a list of values to a JSON string.
         """
         if isinstance(input_value, BaseModel):
-            return json.loads(TypeAdapter(type(input_value)).dump_json(input_value).decode('utf-8'))
+            return _get_type_adapter(type(input_value)).dump_python(input_value, mode="json")
         if isinstance(input_value, dict):
             return input_value
         return input_value
@@ -45,11 +55,18 @@ class SerializeMixin:
                 JSON or a string.
         """
         try:
+            if isinstance(input_value, str):
+                return input_value, False
             if isinstance(input_value, BaseModel):
-                return TypeAdapter(type(input_value)).dump_json(input_value).decode('utf-8'), True
+                return _get_type_adapter(type(input_value)).dump_json(input_value).decode('utf-8'), True
             if isinstance(input_value, dict):
                 return json.dumps(input_value), True
             if isinstance(input_value, list):
+                # Fast path for lists of plain JSON values, only fall back to pydantic if the list contains models
+                try:
+                    return json.dumps(input_value), True
+                except TypeError:
+                    pass
                 serialized_list = []
                 for value in input_value:
                     serialized_value = self._process_streaming_output(value)
@@ -42,6 +42,17 @@ class FileTelemetryExporterConfig(TelemetryExporterBaseConfig, name="file"):
         description="Maximum file size in bytes before rolling to a new file.")
     max_files: int = Field(default=5, description="Maximum number of rolled files to keep.")
     cleanup_on_init: bool = Field(default=False, description="Clean up old files during initialization.")
+    persistent_writer: bool = Field(
+        default=False,
+        description="Keep the file open across exports and coalesce lines into a buffer instead of reopening the "
+        "file for every item.")
+    write_buffer_size: int = Field(
+        default=64 * 1024,  # 64KB
+        description="Size in bytes of buffered lines which triggers a write when the persistent writer is enabled.")
+    flush_interval: float = Field(
+        default=1.0,
+        description="Maximum time in seconds lines are buffered before being written when the persistent writer "
+        "is enabled.")
 
 
 @register_telemetry_exporter(config_type=FileTelemetryExporterConfig)
@@ -58,7 +69,10 @@ async def file_telemetry_exporter(config: FileTelemetryExporterConfig, builder:
                        enable_rolling=config.enable_rolling,
                        max_file_size=config.max_file_size,
                        max_files=config.max_files,
-                       cleanup_on_init=config.cleanup_on_init)
+                       cleanup_on_init=config.cleanup_on_init,
+                       persistent_writer=config.persistent_writer,
+                       write_buffer_size=config.write_buffer_size,
+                       flush_interval=config.flush_interval)
 
 
 class ConsoleLoggingMethodConfig(LoggingBaseConfig, name="console"):
@@ -29,17 +29,21 @@ An enhanced script that:
 6. Returns a Pydantic object with concurrency stats, node metrics, top bottlenecks, and a textual report.
 """
 
+import heapq
 import logging
 import os
 
+import numpy as np
 import pandas as pd
 
 from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.profiler.inference_optimization.call_spans import CallSpans
+from aiq.profiler.inference_optimization.call_spans import ConcurrencyTimeline
 from aiq.profiler.inference_optimization.data_models import CallNode
 from aiq.profiler.inference_optimization.data_models import ConcurrencyDistribution
 from aiq.profiler.inference_optimization.data_models import NestedCallProfilingResult
 from aiq.profiler.inference_optimization.data_models import NodeMetrics
-from aiq.profiler.utils import create_standardized_dataframe
+from aiq.profiler.trace_store import TraceStore
 
 logger = logging.getLogger(__name__)
 
@@ -59,115 +63,18 @@ def build_call_tree_for_example(example_df: pd.DataFrame) -> list[CallNode]:
     Returns:
       A list of top-level calls for this example.
     """
-    stack: list[CallNode] = []
-    top_level_dict: dict[str, CallNode] = {}
-    partial_map: dict[str, CallNode] = {}
-
-    def parse_op_type(evt: str) -> str | None:
-        evt = evt.upper()
-        if evt.startswith("LLM_"):
-            return "LLM"
-        if evt.startswith("TOOL_"):
-            return "TOOL"
-        if evt.startswith("FUNCTION_"):
-            return "FUNCTION"
-        if evt.startswith("SPAN_"):
-            return "FUNCTION"
-        return None
-
-    def get_op_name(row: pd.Series, op_type: str) -> str:
-        if op_type == "LLM":
-            return row.get("llm_name") or "unknown_llm"
-        if op_type == "FUNCTION":
-            return row.get("function_name") or "unknown_function"
-        if op_type == "TOOL":
-            return row.get("tool_name") or "unknown_tool"
-
-        return "unknown_op"
-
-    for _, row in example_df.iterrows():
-        et = row["event_type"].value.upper()
-        uuid = str(row["UUID"])
-        ts = float(row["event_timestamp"])
-
-        op_type = parse_op_type(et)
-        if not op_type:
-            # not an LLM_/TOOL_ event => skip
-            continue
-
-        if et.endswith("_START"):
-            name = get_op_name(row, op_type)
-            node = CallNode(uuid=uuid,
-                            operation_type=op_type,
-                            operation_name=name,
-                            start_time=ts,
-                            end_time=ts,
-                            duration=0.0,
-                            children=[],
-                            parent=None)
-            if stack:
-                parent = stack[-1]
-                node.parent = parent
-                parent.children.append(node)
-            else:
-                # top-level
-                top_level_dict[uuid] = node
-
-            stack.append(node)
-            partial_map[uuid] = node
-
-        elif et.endswith("_END"):
-            if uuid not in partial_map:
-                # no known start => skip
-                continue
-            node = partial_map[uuid]
-            if stack and stack[-1].uuid == uuid:
-                stack.pop()
-
-            node.end_time = ts
-            node.duration = max(0.0, ts - node.start_time)
-            del partial_map[uuid]
-
-    # partial calls remain in stack => they have no final end_time
-    # we won't forcibly remove them
-
-    # collect top-level nodes
-    roots = []
-    for _, node in top_level_dict.items():
-        if node.parent is None:
-            roots.append(node)
-
-    return roots
+    return CallSpans.from_dataframe(example_df).to_call_nodes()
 
 
 def build_call_tree_per_example(all_steps: list[list[IntermediateStep]]) -> list[CallNode]:
     """
-    1) Group the DataFrame by example_number.
+    1) Group the steps by example_number.
     2) For each example, build a separate stack-based call tree.
     3) Return a combined list of all top-level calls from all examples.
 
     This ensures no cross-example nesting.
     """
-    df = create_standardized_dataframe(all_steps)
-    required = {"example_number", "event_type", "UUID", "event_timestamp"}
-    missing = required - set(df.columns)
-    if missing:
-        raise ValueError(f"DataFrame missing required columns: {missing}")
-
-    # Sort globally first (so each example is also in ascending time)
-    dfc = df.copy()
-    dfc.sort_values(["example_number", "event_timestamp"], inplace=True)
-
-    # We'll collect top-level calls for each example
-    all_roots: list[CallNode] = []
-
-    for _, group_df in dfc.groupby("example_number"):
-        # Build the call tree for this single example
-        # group_df is already sorted within this example
-        roots_for_example = build_call_tree_for_example(group_df)
-        all_roots.extend(roots_for_example)
-
-    return all_roots
+    return CallSpans.from_steps(all_steps).to_call_nodes()
 
 
 # --------------------------------------------------------------------------------
@@ -175,6 +82,14 @@ def build_call_tree_per_example(all_steps: list[list[IntermediateStep]]) -> list
 # --------------------------------------------------------------------------------
 
 
+def _concurrency_distribution(timeline: ConcurrencyTimeline) -> ConcurrencyDistribution:
+    return ConcurrencyDistribution(timeline_segments=timeline.segments(),
+                                   p50=timeline.percentile(50),
+                                   p90=timeline.percentile(90),
+                                   p95=timeline.percentile(95),
+                                   p99=timeline.percentile(99))
+
+
 def compute_time_based_concurrency(roots: list[CallNode]) -> ConcurrencyDistribution:
     """
     Build a timeline of (start, +1), (end, -1) from all calls, then:
@@ -188,80 +103,7 @@ def compute_time_based_concurrency(roots: list[CallNode]) -> ConcurrencyDistribu
     ConcurrencyDistribution
         with the piecewise segments + concurrency percentiles.
     """
-    # Flatten
-    all_nodes = []
-
-    def dfs(n: CallNode):
-        all_nodes.append(n)
-        for c in n.children:
-            dfs(c)
-
-    for r in roots:
-        dfs(r)
-
-    if not all_nodes:
-        return ConcurrencyDistribution(timeline_segments=[], p50=0, p90=0, p95=0, p99=0)
-
-    events = []
-    for n in all_nodes:
-        st = n.start_time
-        et = n.end_time
-        if st > et:
-            # partial or invalid => skip
-            continue
-        events.append((st, +1))
-        events.append((et, -1))
-
-    events.sort(key=lambda x: x[0])
-    timeline_segments: list[tuple[float, float, int]] = []
-    curr_concurrency = 0
-    prev_time = events[0][0]
-
-    for _, (t, delta) in enumerate(events):
-        if t > prev_time:
-            # segment is [prev_time, t) at concurrency=curr_concurrency
-            timeline_segments.append((prev_time, t, curr_concurrency))
-        curr_concurrency += delta
-        prev_time = t
-
-    # Summaries
-    total_time = 0.0
-    concurrency_durations: dict[int, float] = {}
-
-    for (seg_start, seg_end, c_val) in timeline_segments:
-        length = seg_end - seg_start
-        if length <= 0:
-            continue
-        total_time += length
-        concurrency_durations[c_val] = concurrency_durations.get(c_val, 0) + length
-
-    if total_time <= 0:
-        return ConcurrencyDistribution(timeline_segments=timeline_segments, p50=0, p90=0, p95=0, p99=0)
-
-    # Build concurrency-level distribution
-    sorted_levels = sorted(concurrency_durations.items(), key=lambda x: x[0])  # ascending concurrency
-
-    def concurrency_at_percentile(p: float) -> float:
-        threshold = total_time * (p / 100.0)
-        accum = 0.0
-        last_c = 0
-        for c_val, c_dur in sorted_levels:
-            accum += c_dur
-            if accum >= threshold:
-                return float(c_val)
-            last_c = c_val
-        return float(last_c)
-
-    p50_val = concurrency_at_percentile(50)
-    p90_val = concurrency_at_percentile(90)
-    p95_val = concurrency_at_percentile(95)
-    p99_val = concurrency_at_percentile(99)
-
-    return ConcurrencyDistribution(timeline_segments=timeline_segments,
-                                   p50=p50_val,
-                                   p90=p90_val,
-                                   p95=p95_val,
-                                   p99=p99_val)
+    return _concurrency_distribution(CallSpans.from_call_nodes(roots).concurrency_timeline())
 
 
 def find_midpoint_concurrency(node: CallNode, segments: list[tuple[float, float, int]]) -> float:
@@ -299,7 +141,10 @@ def save_gantt_chart(all_nodes: list[CallNode], output_path: str) -> None:
     Each node is displayed as a horizontal bar from start_time to end_time.
     The y-axis is the node index (sorted by start_time).
     """
+    _save_gantt_chart(CallSpans.from_call_nodes(all_nodes), output_path)
+
 
+def _save_gantt_chart(spans: CallSpans, output_path: str) -> None:
     try:
         import matplotlib.pyplot as plt
     except ImportError:
@@ -309,9 +154,12 @@ def save_gantt_chart(all_nodes: list[CallNode], output_path: str) -> None:
         raise
 
     # Sort calls by start_time
-    sorted_nodes = sorted(all_nodes, key=lambda x: x.start_time)
-    min_start = sorted_nodes[0].start_time
-    max_end = max(node.end_time for node in sorted_nodes)
+    order = np.argsort(spans.start_time, kind="stable")
+    start_time = spans.start_time[order]
+    end_time = spans.end_time[order]
+    operation_type = spans.operation_type[order]
+    min_start = start_time[0]
+    max_end = end_time.max()
 
     color_map = {
         "LLM": "tab:blue",
@@ -322,17 +170,19 @@ def save_gantt_chart(all_nodes: list[CallNode], output_path: str) -> None:
 
     fig, ax = plt.subplots(figsize=(20, 15))
 
-    y_positions = range(len(sorted_nodes))
-    labels = []
-    for i, node in enumerate(sorted_nodes):
-        start = node.start_time
-        width = node.end_time - node.start_time
-        c = color_map.get(node.operation_type, default_color)
-        ax.barh(y=i, width=width, left=start - min_start, height=0.6, color=c, edgecolor="black")
-        labels.append(f"{node.operation_type}:{node.operation_name}")
-
-    ax.set_yticks(list(y_positions))
-    ax.set_yticklabels(labels)
+    y_positions = np.arange(len(order))
+    ax.barh(y=y_positions,
+            width=end_time - start_time,
+            left=start_time - min_start,
+            height=0.6,
+            color=[color_map.get(op_type, default_color) for op_type in operation_type.tolist()],
+            edgecolor="black")
+
+    ax.set_yticks(y_positions)
+    ax.set_yticklabels([
+        f"{op_type}:{op_name}"
+        for op_type, op_name in zip(operation_type.tolist(), spans.operation_name[order].tolist())
+    ])
     ax.invert_yaxis()
     ax.set_xlim(0, max_end - min_start)
     ax.set_xlabel("Time")
@@ -357,72 +207,73 @@ def analyze_calls_and_build_result(roots: list[CallNode], output_dir: str | None
 
     Returns NestedCallProfilingResult.
     """
-    if not roots:
+    return analyze_call_spans(CallSpans.from_call_nodes(roots), output_dir=output_dir)
+
+
+def analyze_call_spans(spans: CallSpans, output_dir: str | None = None, top_k: int = 5) -> NestedCallProfilingResult:
+    """
+    Same as `analyze_calls_and_build_result`, computed column-wise on the calls of all examples.
+    """
+    if not len(spans):
         empty_concurrency = ConcurrencyDistribution(timeline_segments=[], p50=0, p90=0, p95=0, p99=0)
         return NestedCallProfilingResult(concurrency=empty_concurrency,
                                          node_metrics={},
                                          top_bottlenecks=[],
                                          textual_report="No calls found.")
 
-    # Flatten all calls
-    all_nodes: list[CallNode] = []
-
-    def dfs(n: CallNode):
-        all_nodes.append(n)
-        for c in n.children:
-            dfs(c)
-
-    for r in roots:
-        dfs(r)
-
     # 1) concurrency across all calls
-    concurrency_info = compute_time_based_concurrency(roots)
+    timeline = spans.concurrency_timeline()
+    concurrency_info = _concurrency_distribution(timeline)
 
     # 2) build NodeMetrics
+    self_time = spans.self_time()
+    subtree_time = spans.subtree_time(self_time)
+    midpoint_concurrency = timeline.level_at(spans.midpoint(zero_length_at_start=True)).astype(np.float64)
+
     node_metrics_map: dict[str, NodeMetrics] = {}
-    for node in all_nodes:
-        self_t = node.compute_self_time()
-        subtree_t = node.compute_subtree_time()
-        bscore = subtree_t
-        mid_conc = find_midpoint_concurrency(node, concurrency_info.timeline_segments)
-
-        m = NodeMetrics(uuid=node.uuid,
-                        operation_type=node.operation_type,
-                        operation_name=node.operation_name,
-                        start_time=node.start_time,
-                        end_time=node.end_time,
-                        duration=node.duration,
-                        self_time=self_t,
-                        subtree_time=subtree_t,
-                        concurrency_midpoint=mid_conc,
-                        bottleneck_score=bscore)
-        node_metrics_map[node.uuid] = m
-
-    # 3) top 5
-    all_metrics = list(node_metrics_map.values())
-    sorted_metrics = sorted(all_metrics, key=lambda x: x.bottleneck_score, reverse=True)
-    top_5 = sorted_metrics[:5]
+    for (uuid, op_type, op_name, start, end, duration, self_t, subtree_t,
+         mid_conc) in zip(spans.uuid.tolist(),
+                          spans.operation_type.tolist(),
+                          spans.operation_name.tolist(),
+                          spans.start_time.tolist(),
+                          spans.end_time.tolist(),
+                          spans.duration.tolist(),
+                          self_time.tolist(),
+                          subtree_time.tolist(),
+                          midpoint_concurrency.tolist()):
+        # The values are computed from validated columns, skip re-validating one model per call
+        node_metrics_map[uuid] = NodeMetrics.model_construct(uuid=uuid,
+                                                             operation_type=op_type,
+                                                             operation_name=op_name,
+                                                             start_time=start,
+                                                             end_time=end,
+                                                             duration=duration,
+                                                             self_time=self_t,
+                                                             subtree_time=subtree_t,
+                                                             concurrency_midpoint=mid_conc,
+                                                             bottleneck_score=subtree_t)
+
+    # 3) top k, equivalent to a stable sort by descending score
+    top_calls = heapq.nlargest(top_k, node_metrics_map.values(), key=lambda x: x.bottleneck_score)
 
     # 4) textual report
     lines = []
     lines.append("=== Multi-Example Nested Call Profiling Report ===")
-    lines.append(f"Total calls (across all examples): {len(all_nodes)}")
+    lines.append(f"Total calls (across all examples): {len(spans)}")
 
     lines.append("\n-- Concurrency Distribution (all examples) --")
     lines.append(f"p50={concurrency_info.p50:.1f}, p90={concurrency_info.p90:.1f}, "
                  f"p95={concurrency_info.p95:.1f}, p99={concurrency_info.p99:.1f}")
 
-    lines.append("\n-- Top 5 Calls by Bottleneck Score (subtree_time) --")
-    for i, tm in enumerate(top_5, start=1):
+    lines.append(f"\n-- Top {top_k} Calls by Bottleneck Score (subtree_time) --")
+    for i, tm in enumerate(top_calls, start=1):
         lines.append(f"{i}) UUID={tm.uuid}, {tm.operation_type} '{tm.operation_name}', "
                      f"dur={tm.duration:.2f}, self_time={tm.self_time:.2f}, "
                      f"subtree_time={tm.subtree_time:.2f}, concurrency={tm.concurrency_midpoint:.1f}, "
                      f"score={tm.bottleneck_score:.2f}")
 
     lines.append("\n-- Full Tree(s) (All Examples) --")
-
-    for root in roots:
-        lines.append(str(root))
+    lines.extend(spans.render_trees())
 
     report_text = "\n".join(lines)
 
@@ -430,16 +281,16 @@ def analyze_calls_and_build_result(roots: list[CallNode], output_dir: str | None
     if output_dir:
         os.makedirs(output_dir, exist_ok=True)
         chart_path = os.path.join(output_dir, "gantt_chart.png")
-        save_gantt_chart(all_nodes, chart_path)
+        _save_gantt_chart(spans, chart_path)
 
     # Return the final Pydantic result
     return NestedCallProfilingResult(concurrency=concurrency_info,
                                      node_metrics=node_metrics_map,
-                                     top_bottlenecks=top_5,
+                                     top_bottlenecks=top_calls,
                                      textual_report=report_text)
 
 
-def multi_example_call_profiling(all_steps: list[list[IntermediateStep]],
+def multi_example_call_profiling(all_steps: list[list[IntermediateStep]] | TraceStore,
                                  output_dir: str | None = None) -> NestedCallProfilingResult:
     """
     The high-level function:
@@ -449,12 +300,15 @@ def multi_example_call_profiling(all_steps: list[list[IntermediateStep]],
     3. Return a NestedCallProfilingResult with concurrency distribution, node metrics, top bottlenecks, and textual
        report. Optionally saves a Gantt chart.
 
-    :param all_steps: Intermediate steps for each example.
+    :param all_steps: Intermediate steps for each example, or a TraceStore holding them.
     :param output_dir: Directory path to save gantt_chart.png (if provided)
     :return: NestedCallProfilingResult (pydantic)
     """
-    # Build the forest (all examples combined)
-    roots = build_call_tree_per_example(all_steps)
+    # Build the calls of all examples as columns, call trees are never materialized
+    if isinstance(all_steps, TraceStore):
+        spans = CallSpans.from_trace_store(all_steps)
+    else:
+        spans = CallSpans.from_steps(all_steps)
     # Analyze calls
-    result = analyze_calls_and_build_result(roots, output_dir=output_dir)
+    result = analyze_call_spans(spans, output_dir=output_dir)
     return result
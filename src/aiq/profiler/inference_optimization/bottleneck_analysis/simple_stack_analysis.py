@@ -31,13 +31,14 @@ import pandas as pd
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import SimpleBottleneckReport
 from aiq.profiler.inference_optimization.data_models import SimpleOperationStats
+from aiq.profiler.trace_store import TraceStore
 from aiq.profiler.utils import create_standardized_dataframe
 
 
 # ----------------------------------------------------------------------
 # Main Function
 # ----------------------------------------------------------------------
-def profile_workflow_bottlenecks(all_steps: list[list[IntermediateStep]]) -> SimpleBottleneckReport:
+def profile_workflow_bottlenecks(all_steps: list[list[IntermediateStep]] | TraceStore) -> SimpleBottleneckReport:
     """
     Perform advanced bottleneck profiling on a workflow dataframe.
 
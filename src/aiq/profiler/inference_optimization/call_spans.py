@@ -0,0 +1,526 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Columnar engine for the call tree and concurrency analyses.
+
+START/END events are paired into spans stored as NumPy arrays (one entry per call), with the parent of every call
+stored as an index. Self time, subtree time and concurrency timelines are computed with vectorized sorts and cumulative
+sums; `CallNode` objects are only materialized on demand.
+"""
+
+import dataclasses
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.profiler.inference_optimization.data_models import CallNode
+from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
+from aiq.profiler.trace_store import TraceStore
+
+ALL_OPERATION_TYPES = ("LLM", "TOOL", "FUNCTION")
+
+# Event type prefix => operation type of the call
+_OPERATION_PREFIXES = {"LLM": "LLM", "TOOL": "TOOL", "FUNCTION": "FUNCTION", "SPAN": "FUNCTION"}
+
+_DEFAULT_NAMES = {"LLM": "unknown_llm", "TOOL": "unknown_tool", "FUNCTION": "unknown_function"}
+
+
+def _as_object_array(values: Sequence[Any]) -> np.ndarray:
+    """
+    One dimensional object array, even when the values are themselves sequences.
+    """
+    if isinstance(values, np.ndarray) and values.ndim == 1:
+        return values.astype(object, copy=False)
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _parse_event_type(event_type: Any) -> tuple[str | None, int]:
+    """
+    Returns the operation type of an event and whether it starts (1) or ends (-1) a call, (None, 0) otherwise.
+    """
+    event_type = str(getattr(event_type, "value", event_type)).upper()
+    prefix, _, suffix = event_type.partition("_")
+    op_type = _OPERATION_PREFIXES.get(prefix)
+
+    if op_type is None or suffix not in ("START", "END"):
+        return None, 0
+
+    return op_type, 1 if suffix == "START" else -1
+
+
+@dataclasses.dataclass
+class ConcurrencyTimeline:
+    """
+    Piecewise constant number of calls in flight: `levels[i]` calls are running between `starts[i]` and `ends[i]`.
+    Segments are contiguous and of positive length.
+    """
+    starts: np.ndarray
+    ends: np.ndarray
+    levels: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def segments(self) -> list[tuple[float, float, int]]:
+        return list(zip(self.starts.tolist(), self.ends.tolist(), self.levels.tolist()))
+
+    def distribution(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the concurrency levels observed, in ascending order, and the total time spent at each of them.
+        """
+        if not len(self.levels):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        durations = np.bincount(self.levels, weights=self.ends - self.starts)
+        observed = np.flatnonzero(np.bincount(self.levels))
+        return observed, durations[observed]
+
+    def distribution_dict(self) -> dict[int, float]:
+        levels, durations = self.distribution()
+        return dict(zip(levels.tolist(), durations.tolist()))
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Concurrency level at the given percentile of the total time observed.
+        """
+        levels, durations = self.distribution()
+        total_time = durations.sum()
+        if total_time <= 0:
+            return 0.0
+
+        accumulated = np.cumsum(durations)
+        index = int(np.searchsorted(accumulated, total_time * (percentile / 100.0), side="left"))
+        return float(levels[min(index, len(levels) - 1)])
+
+    def level_at(self, times: np.ndarray) -> np.ndarray:
+        """
+        Concurrency level at each of the given times, 0 outside of the timeline.
+        """
+        times = np.asarray(times, dtype=np.float64)
+        if not len(self.levels):
+            return np.zeros(len(times), dtype=np.int64)
+
+        index = np.searchsorted(self.starts, times, side="right") - 1
+        clipped = np.clip(index, 0, len(self.levels) - 1)
+        inside = (index >= 0) & (times < self.ends[clipped])
+        return np.where(inside, self.levels[clipped], 0)
+
+    def covered_segments(self, start_time: np.ndarray, end_time: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        For each interval, the range `[first, last)` of segments it overlaps. Interval bounds are expected to be
+        segment boundaries, which holds for the calls the timeline was built from.
+        """
+        first = np.searchsorted(self.starts, start_time, side="left")
+        last = np.searchsorted(self.ends, end_time, side="right")
+        return first, np.maximum(last, first)
+
+
+@dataclasses.dataclass
+class CallSpans:
+    """
+    Calls stored column-wise, in the order in which they started (which is also the depth first order of the call
+    trees). `parent` holds the index of the parent call, or -1 for top-level calls.
+
+    Calls without an END event have an end time equal to their start time and a duration of 0.
+    """
+    uuid: np.ndarray
+    example_number: np.ndarray
+    operation_type: np.ndarray
+    operation_name: np.ndarray
+    start_time: np.ndarray
+    end_time: np.ndarray
+    duration: np.ndarray
+    parent: np.ndarray
+    extra: dict[str, np.ndarray] = dataclasses.field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.uuid)
+
+    # ----------------------------------------------------------------
+    # Construction
+    # ----------------------------------------------------------------
+
+    @classmethod
+    def from_events(cls,
+                    *,
+                    example_number: Sequence[int],
+                    event_type: Sequence[Any],
+                    uuid: Sequence[str],
+                    timestamp: Sequence[float],
+                    llm_name: Sequence[str | None],
+                    tool_name: Sequence[str | None],
+                    function_name: Sequence[str | None],
+                    operation_types: Iterable[str] = ALL_OPERATION_TYPES,
+                    end_columns: dict[str, Sequence[Any]] | None = None) -> "CallSpans":
+        """
+        Pair the START/END events of every example into calls.
+
+        Events are sorted by example and timestamp. Within an example, a START event opens a call nested under the
+        most recent call still open, and an END event closes the open call with the same UUID. Values of
+        `end_columns` are taken from the END event of each call.
+        """
+        operation_types = set(operation_types)
+
+        event_type = _as_object_array(event_type)
+        uuid = np.array([str(u) for u in uuid], dtype=object)
+        examples = np.asarray(example_number, dtype=np.int64)
+        timestamps = np.asarray(timestamp, dtype=np.float64)
+
+        # Parse each distinct event type once
+        distinct_types, type_codes = np.unique(np.array([str(getattr(e, "value", e)) for e in event_type], dtype=str),
+                                               return_inverse=True)
+        parsed = [_parse_event_type(e) for e in distinct_types.tolist()]
+        kinds = np.array([kind if op_type in operation_types else 0 for op_type, kind in parsed] or [0],
+                         dtype=np.int8)[type_codes]
+        op_types = np.array([op_type or "" for op_type, _ in parsed] or [""], dtype=object)[type_codes]
+
+        # Stable sort of the START/END events by (example, timestamp)
+        relevant = np.flatnonzero(kinds != 0)
+        order = relevant[np.lexsort((timestamps[relevant], examples[relevant]))]
+
+        _, uuid_codes = np.unique(uuid.astype(str), return_inverse=True)
+
+        start_events: list[int] = []
+        end_events: list[int] = []
+        parents: list[int] = []
+
+        # Stack pass over integer codes, this is the only per event Python loop
+        examples_list = examples.tolist()
+        kinds_list = kinds.tolist()
+        uuid_list = uuid_codes.tolist()
+        stack: list[int] = []
+        open_calls: dict[int, int] = {}
+        current_example = None
+
+        for i in order.tolist():
+            if examples_list[i] != current_example:
+                current_example = examples_list[i]
+                stack.clear()
+                open_calls.clear()
+
+            if kinds_list[i] > 0:
+                call = len(start_events)
+                start_events.append(i)
+                end_events.append(-1)
+                parents.append(stack[-1] if stack else -1)
+                stack.append(call)
+                open_calls[uuid_list[i]] = call
+            else:
+                call = open_calls.pop(uuid_list[i], None)
+                if call is None:
+                    # no known start => skip
+                    continue
+                end_events[call] = i
+                if stack and stack[-1] == call:
+                    stack.pop()
+
+        start_events = np.asarray(start_events, dtype=np.int64)
+        end_events = np.asarray(end_events, dtype=np.int64)
+        has_end = end_events >= 0
+        safe_end_events = np.where(has_end, end_events, start_events)
+
+        start_time = timestamps[start_events]
+        end_time = timestamps[safe_end_events]
+        duration = np.where(has_end, np.maximum(end_time - start_time, 0.0), 0.0)
+
+        # Name the calls after the LLM, tool or function they run
+        span_types = op_types[start_events]
+        names = np.full(len(start_events), None, dtype=object)
+        for op_type, column in (("LLM", llm_name), ("TOOL", tool_name), ("FUNCTION", function_name)):
+            is_type = span_types == op_type
+            if is_type.any():
+                names[is_type] = _as_object_array(column)[start_events[is_type]]
+        for op_type, default in _DEFAULT_NAMES.items():
+            names[(span_types == op_type) & ~names.astype(bool)] = default
+
+        extra = {}
+        for name, column in (end_columns or {}).items():
+            values = _as_object_array(column)[safe_end_events]
+            values[~has_end] = None
+            extra[name] = values
+
+        return cls(uuid=uuid[start_events],
+                   example_number=examples[start_events],
+                   operation_type=span_types,
+                   operation_name=names,
+                   start_time=start_time,
+                   end_time=end_time,
+                   duration=duration,
+                   parent=np.asarray(parents, dtype=np.int64),
+                   extra=extra)
+
+    @classmethod
+    def from_steps(cls,
+                   all_steps: Iterable[Iterable[IntermediateStep]],
+                   operation_types: Iterable[str] = ALL_OPERATION_TYPES,
+                   end_columns: dict[str, Callable[[IntermediatePropertyAdaptor], Any]] | None = None) -> "CallSpans":
+        """
+        Build the calls of every example directly from the intermediate steps, without going through a DataFrame.
+
+        `end_columns` maps column names to accessors, evaluated on the END event of every call.
+        """
+        end_columns = end_columns or {}
+        columns: dict[str, list] = {
+            "example_number": [],
+            "event_type": [],
+            "uuid": [],
+            "timestamp": [],
+            "llm_name": [],
+            "tool_name": [],
+            "function_name": [],
+        }
+        extra_columns: dict[str, list] = {name: [] for name in end_columns}
+
+        for example_number, steps in enumerate(all_steps):
+            for step in steps:
+                if _parse_event_type(step.event_type)[0] is None:
+                    continue
+
+                if not isinstance(step, IntermediatePropertyAdaptor):
+                    step = IntermediatePropertyAdaptor.from_intermediate_step(step)
+
+                columns["example_number"].append(example_number)
+                columns["event_type"].append(step.event_type)
+                columns["uuid"].append(str(step.payload.UUID))
+                columns["timestamp"].append(step.event_timestamp)
+                columns["llm_name"].append(step.llm_name)
+                columns["tool_name"].append(step.tool_name)
+                columns["function_name"].append(step.function_name)
+
+                for name, accessor in end_columns.items():
+                    extra_columns[name].append(accessor(step))
+
+        return cls.from_events(**columns, operation_types=operation_types, end_columns=extra_columns)
+
+    @classmethod
+    def from_dataframe(cls,
+                       df: pd.DataFrame,
+                       operation_types: Iterable[str] = ALL_OPERATION_TYPES,
+                       end_columns: Iterable[str] = ()) -> "CallSpans":
+        """
+        Build the calls from a standardized DataFrame (see `create_standardized_dataframe`).
+        """
+
+        def column(name: str):
+            return df[name].to_numpy() if name in df.columns else np.full(len(df), None, dtype=object)
+
+        return cls.from_events(example_number=column("example_number"),
+                               event_type=column("event_type"),
+                               uuid=column("UUID"),
+                               timestamp=column("event_timestamp"),
+                               llm_name=column("llm_name"),
+                               tool_name=column("tool_name"),
+                               function_name=column("function_name"),
+                               operation_types=operation_types,
+                               end_columns={name: column(name)
+                                            for name in end_columns})
+
+    @classmethod
+    def from_trace_store(cls,
+                         store: TraceStore,
+                         operation_types: Iterable[str] = ALL_OPERATION_TYPES,
+                         end_columns: Iterable[str] = ()) -> "CallSpans":
+        """
+        Build the calls from the columns of a `TraceStore`, numeric columns are read without copying.
+        """
+        return cls.from_events(example_number=store.column("example_number"),
+                               event_type=store.column("event_type"),
+                               uuid=store.column("UUID"),
+                               timestamp=store.column("event_timestamp"),
+                               llm_name=store.column("llm_name"),
+                               tool_name=store.column("tool_name"),
+                               function_name=store.column("function_name"),
+                               operation_types=operation_types,
+                               end_columns={name: store.column(name)
+                                            for name in end_columns})
+
+    @classmethod
+    def from_call_nodes(cls, roots: list[CallNode], extra_fields: Iterable[str] = ()) -> "CallSpans":
+        """
+        Convert call trees into columns, in depth first order.
+        """
+        extra_fields = list(extra_fields)
+        nodes: list[CallNode] = []
+        parents: list[int] = []
+
+        stack = [(root, -1) for root in reversed(roots)]
+        while stack:
+            node, parent = stack.pop()
+            index = len(nodes)
+            nodes.append(node)
+            parents.append(parent)
+            stack.extend((child, index) for child in reversed(node.children))
+
+        return cls(
+            uuid=np.array([n.uuid for n in nodes], dtype=object),
+            example_number=np.array([getattr(n, "example_number", 0) for n in nodes], dtype=np.int64),
+            operation_type=np.array([n.operation_type for n in nodes], dtype=object),
+            operation_name=np.array([n.operation_name for n in nodes], dtype=object),
+            start_time=np.array([n.start_time for n in nodes], dtype=np.float64),
+            end_time=np.array([n.end_time for n in nodes], dtype=np.float64),
+            duration=np.array([n.duration for n in nodes], dtype=np.float64),
+            parent=np.array(parents, dtype=np.int64),
+            extra={name: np.array([getattr(n, name, None) for n in nodes], dtype=object)
+                   for name in extra_fields})
+
+    # ----------------------------------------------------------------
+    # Tree metrics
+    # ----------------------------------------------------------------
+
+    def depth(self) -> np.ndarray:
+        depth = np.zeros(len(self), dtype=np.int64)
+        ancestor = self.parent.copy()
+        while (has_ancestor := ancestor >= 0).any():
+            depth[has_ancestor] += 1
+            ancestor = np.where(has_ancestor, self.parent[np.maximum(ancestor, 0)], -1)
+        return depth
+
+    def self_time(self) -> np.ndarray:
+        """
+        Duration of every call minus the union of its children's intervals, clamped to the call's interval.
+        """
+        self_time = self.duration.copy()
+
+        children = np.flatnonzero(self.parent >= 0)
+        if not len(children):
+            return self_time
+
+        order = children[np.lexsort((self.start_time[children], self.parent[children]))]
+        parent = self.parent[order]
+
+        # Clamp each child interval to its parent, the union of the clamped intervals is the clamped union
+        lower = self.start_time[parent]
+        upper = self.end_time[parent]
+        start = np.clip(self.start_time[order], lower, upper)
+        end = np.clip(self.end_time[order], lower, upper)
+
+        # Furthest end among the previous children of the same parent
+        furthest = pd.Series(end).groupby(parent).cummax()
+        previous = furthest.groupby(parent).shift(1).to_numpy(dtype=np.float64, na_value=-np.inf)
+
+        covered = np.maximum(end - np.maximum(start, previous), 0.0)
+        self_time -= np.bincount(parent, weights=covered, minlength=len(self))
+        return np.maximum(self_time, 0.0)
+
+    def subtree_time(self, self_time: np.ndarray | None = None) -> np.ndarray:
+        """
+        Self time of every call plus the subtree time of its children.
+        """
+        subtree_time = (self.self_time() if self_time is None else self_time).copy()
+        depth = self.depth()
+
+        for level in range(int(depth.max(initial=0)), 0, -1):
+            at_level = np.flatnonzero(depth == level)
+            np.add.at(subtree_time, self.parent[at_level], subtree_time[at_level])
+
+        return subtree_time
+
+    def midpoint(self, zero_length_at_start: bool = True) -> np.ndarray:
+        """
+        Midpoint of every call. Zero-length calls are placed at their start time, or at NaN (outside any timeline)
+        when `zero_length_at_start` is False.
+        """
+        midpoint = 0.5 * (self.start_time + self.end_time)
+        zero_length = self.start_time >= self.end_time
+        return np.where(zero_length, self.start_time if zero_length_at_start else np.nan, midpoint)
+
+    # ----------------------------------------------------------------
+    # Concurrency
+    # ----------------------------------------------------------------
+
+    def concurrency_timeline(self) -> ConcurrencyTimeline:
+        """
+        Number of calls in flight over time, across all examples.
+        """
+        valid = self.start_time <= self.end_time
+        times = np.concatenate((self.start_time[valid], self.end_time[valid]))
+        deltas = np.concatenate((np.ones(valid.sum(), dtype=np.int64), -np.ones(valid.sum(), dtype=np.int64)))
+
+        order = np.argsort(times, kind="stable")
+        times = times[order]
+        levels = np.cumsum(deltas[order])
+
+        # Concurrency after all the events sharing a timestamp have been applied
+        is_last = np.append(times[1:] != times[:-1], True) if len(times) else np.empty(0, dtype=bool)
+        boundaries = times[is_last]
+        levels = levels[is_last]
+
+        return ConcurrencyTimeline(starts=boundaries[:-1], ends=boundaries[1:], levels=levels[:-1])
+
+    # ----------------------------------------------------------------
+    # Materialization
+    # ----------------------------------------------------------------
+
+    def to_call_nodes(self, node_cls: type[CallNode] = CallNode) -> list[CallNode]:
+        """
+        Materialize the call trees, returning the top-level calls.
+        """
+        extra_columns = {name: values.tolist() for name, values in self.extra.items()}
+        nodes: list[CallNode] = []
+        roots: list[CallNode] = []
+
+        for i, (uuid, op_type, op_name, start, end, duration, parent, example) in enumerate(
+                zip(self.uuid.tolist(),
+                    self.operation_type.tolist(),
+                    self.operation_name.tolist(),
+                    self.start_time.tolist(),
+                    self.end_time.tolist(),
+                    self.duration.tolist(),
+                    self.parent.tolist(),
+                    self.example_number.tolist())):
+            fields = {name: values[i] for name, values in extra_columns.items()}
+            if "example_number" in node_cls.model_fields:
+                fields["example_number"] = example
+
+            node = node_cls.model_construct(uuid=uuid,
+                                            operation_type=op_type,
+                                            operation_name=op_name,
+                                            start_time=start,
+                                            end_time=end,
+                                            duration=duration,
+                                            children=[],
+                                            parent=None,
+                                            **fields)
+            nodes.append(node)
+
+            if parent >= 0:
+                node.parent = nodes[parent]
+                nodes[parent].children.append(node)
+            else:
+                roots.append(node)
+
+        return roots
+
+    def render_trees(self) -> list[str]:
+        """
+        Text rendering of every call tree, in the format of `CallNode.__str__`.
+        """
+        lines = []
+        depth = self.depth().tolist()
+        for (level, op_type, op_name, uuid, start, end, duration) in zip(depth,
+                                                                         self.operation_type.tolist(),
+                                                                         self.operation_name.tolist(),
+                                                                         self.uuid.tolist(),
+                                                                         self.start_time.tolist(),
+                                                                         self.end_time.tolist(),
+                                                                         self.duration.tolist()):
+            lines.append(f"{'  ' * level}- {op_type} '{op_name}' "
+                         f"(uuid={uuid}, start={start:.2f}, end={end:.2f}, dur={duration:.2f})")
+        return lines
@@ -31,15 +31,24 @@ Changes from previous version:
 
 """
 
+import typing
+
 import numpy as np
 import pandas as pd
 
 from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.profiler.inference_optimization.call_spans import CallSpans
+from aiq.profiler.inference_optimization.call_spans import ConcurrencyTimeline
 from aiq.profiler.inference_optimization.data_models import ConcurrencyAnalysisResult
 from aiq.profiler.inference_optimization.data_models import ConcurrencyCallNode
 from aiq.profiler.inference_optimization.data_models import ConcurrencyCorrelationStats
 from aiq.profiler.inference_optimization.data_models import ConcurrencySpikeInfo
-from aiq.profiler.utils import create_standardized_dataframe
+from aiq.profiler.trace_store import TraceStore
+
+_OPERATION_TYPES = ("LLM", "TOOL")
+
+# Columns of the DataFrame, taken from the END event of each call
+_END_COLUMNS = ("prompt_tokens", "completion_tokens", "total_tokens", "tool_outputs", "llm_text_output")
 
 # --------------------------------------------------------------------------------
 # 1) Building the Per-Example Call Trees
@@ -50,78 +59,7 @@ def build_call_tree_for_example(example_df: pd.DataFrame) -> list[ConcurrencyCal
     """
     Sort events by time, push on `*_START`, pop on `*_END`, build stack-based calls for a single example.
     """
-    stack: list[ConcurrencyCallNode] = []
-    top_level: dict[str, ConcurrencyCallNode] = {}
-    partial_map: dict[str, ConcurrencyCallNode] = {}
-
-    def parse_op_type(et: str) -> str | None:
-        et = et.upper()
-        if et.startswith("LLM_"):
-            return "LLM"
-        if et.startswith("TOOL_"):
-            return "TOOL"
-        return None
-
-    def get_op_name(row: pd.Series, op_type: str) -> str:
-        if op_type == "LLM":
-            return row.get("llm_name") or "unknown_llm"
-        if op_type == "TOOL":
-            return row.get("tool_name") or "unknown_tool"
-        return "unknown_op"
-
-    example_num = int(example_df["example_number"].iloc[0])
-
-    for _, row in example_df.iterrows():
-        et = row["event_type"].value.upper()
-        uuid = str(row["UUID"])
-        ts = float(row["event_timestamp"])
-        op_type = parse_op_type(et)
-        if not op_type:
-            continue
-
-        if et.endswith("_START"):
-            op_name = get_op_name(row, op_type)
-            node = ConcurrencyCallNode(
-                uuid=uuid,
-                example_number=example_num,
-                operation_type=op_type,
-                operation_name=op_name,
-                start_time=ts,
-                end_time=ts,  # updated on END
-                duration=0.0)
-            if stack:
-                parent = stack[-1]
-                node.parent = parent
-                parent.children.append(node)
-            else:
-                top_level[uuid] = node
-
-            stack.append(node)
-            partial_map[uuid] = node
-
-        elif et.endswith("_END"):
-            if uuid not in partial_map:
-                continue
-            node = partial_map[uuid]
-            node.end_time = ts
-            node.duration = max(0.0, node.end_time - node.start_time)
-            node.prompt_tokens = row.get("prompt_tokens")
-            node.completion_tokens = row.get("completion_tokens")
-            node.total_tokens = row.get("total_tokens")
-            node.tool_outputs = row.get("metadata").get("tool_outputs") if (
-                row.get("metadata") and row.get("metadata").get("tool_outputs")) else None
-            node.llm_text_output = row.get("llm_text_output")
-
-            if stack and stack[-1].uuid == uuid:
-                stack.pop()
-            del partial_map[uuid]
-
-    # gather top-level
-    roots = []
-    for _, nd in top_level.items():
-        if nd.parent is None:
-            roots.append(nd)
-    return roots
+    return build_call_tree_per_example(example_df)
 
 
 def build_call_tree_per_example(df: pd.DataFrame) -> list[ConcurrencyCallNode]:
@@ -133,14 +71,24 @@ def build_call_tree_per_example(df: pd.DataFrame) -> list[ConcurrencyCallNode]:
     if missing:
         raise ValueError(f"DataFrame missing required columns: {missing}")
 
-    dfc = df.copy()
-    dfc.sort_values(["example_number", "event_timestamp"], inplace=True)
+    if "tool_outputs" not in df.columns and "metadata" in df.columns:
+        df = df.assign(tool_outputs=[_tool_outputs(metadata) for metadata in df["metadata"].tolist()])
+
+    spans = CallSpans.from_dataframe(df, operation_types=_OPERATION_TYPES, end_columns=_END_COLUMNS)
+    return spans.to_call_nodes(node_cls=ConcurrencyCallNode)
+
+
+def _tool_outputs(metadata) -> typing.Any:
+    """
+    The tool outputs recorded in the metadata of an event, as a dictionary or a `TraceMetadata`.
+    """
+    if not metadata:
+        return None
+
+    if isinstance(metadata, dict):
+        return metadata.get("tool_outputs") or None
 
-    all_roots: list[ConcurrencyCallNode] = []
-    for _, grp in dfc.groupby("example_number"):
-        r = build_call_tree_for_example(grp)
-        all_roots.extend(r)
-    return all_roots
+    return getattr(metadata, "tool_outputs", None) or None
 
 
 def flatten_calls(roots: list[ConcurrencyCallNode]) -> list[ConcurrencyCallNode]:
@@ -168,57 +116,14 @@ def compute_concurrency_distribution(roots: list[ConcurrencyCallNode]) -> dict[i
     """
     Flatten calls, produce (start, +1)/(end, -1), accumulate total time at each concurrency level.
     """
-    all_nodes = flatten_calls(roots)
-    if not all_nodes:
-        return {}
-
-    events = []
-    for n in all_nodes:
-        if n.start_time <= n.end_time:
-            events.append((n.start_time, +1))
-            events.append((n.end_time, -1))
-
-    events.sort(key=lambda x: x[0])
-    dist_map: dict[int, float] = {}
-    curr_conc = 0
-    prev_time = events[0][0]
-
-    for (time_val, delta) in events:
-        if time_val > prev_time:
-            length = time_val - prev_time
-            dist_map[curr_conc] = dist_map.get(curr_conc, 0.0) + length
-        curr_conc += delta
-        prev_time = time_val
-
-    return dist_map
+    return CallSpans.from_call_nodes(roots).concurrency_timeline().distribution_dict()
 
 
 def build_concurrency_segments(roots: list[ConcurrencyCallNode]) -> list[tuple[float, float, int]]:
     """
     Return piecewise segments of (start, end, concurrency) across all calls.
     """
-    all_nodes = flatten_calls(roots)
-    if not all_nodes:
-        return []
-
-    events = []
-    for n in all_nodes:
-        if n.start_time <= n.end_time:
-            events.append((n.start_time, +1))
-            events.append((n.end_time, -1))
-
-    events.sort(key=lambda x: x[0])
-    segments: list[tuple[float, float, int]] = []
-    curr_conc = 0
-    prev_time = events[0][0]
-
-    for (t, delta) in events:
-        if t > prev_time:
-            segments.append((prev_time, t, curr_conc))
-        curr_conc += delta
-        prev_time = t
-
-    return segments
+    return CallSpans.from_call_nodes(roots).concurrency_timeline().segments()
 
 
 def find_percentile_concurrency(dist_map: dict[int, float], percentile: float) -> float:
@@ -353,13 +258,40 @@ def average_latency_by_midpoint_concurrency(roots: list[ConcurrencyCallNode]) ->
     return result
 
 
+def _spike_calls(spans: CallSpans, timeline: ConcurrencyTimeline,
+                 spike_segments: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pair every spike with the calls active during it.
+
+    Returns two aligned arrays of call indices and spike ordinals (indices into `spike_segments`).
+    """
+    # Calls span a contiguous range of segments, count the spike segments within each range
+    first, last = timeline.covered_segments(spans.start_time, spans.end_time)
+    lo = np.searchsorted(spike_segments, first, side="left")
+    hi = np.searchsorted(spike_segments, last, side="left")
+    counts = np.maximum(hi - lo, 0)
+
+    calls = np.repeat(np.arange(len(spans)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    spikes = np.repeat(lo, counts) + offsets
+    return calls, spikes
+
+
+def _weighted_positive_mean(values: np.ndarray, weights: np.ndarray) -> float:
+    values = np.array(values, dtype=np.float64)
+    positive = (values > 0) & (weights > 0)
+    if not positive.any():
+        return 0.0
+    return float(np.average(values[positive], weights=weights[positive]))
+
+
 # --------------------------------------------------------------------------------
 # 5) Main Analysis Function
 # --------------------------------------------------------------------------------
 
 
 def concurrency_spike_analysis(
-    all_steps: list[list[IntermediateStep]],
+    all_steps: list[list[IntermediateStep]] | TraceStore,
     concurrency_spike_threshold: int | None = None,
 ) -> ConcurrencyAnalysisResult:
     """
@@ -371,51 +303,63 @@ def concurrency_spike_analysis(
     6) Also compute average latency by concurrency and add to report.
     7) Return a Pydantic object with everything, plus a textual report.
     """
-    df = create_standardized_dataframe(all_steps)
-    required_cols = {
-        "framework",
-        "llm_name",
-        "llm_text_input",
-        "llm_text_output",
-        "event_timestamp",
-        "event_type",
-        "UUID",
-        "example_number",
-        "prompt_tokens",
-        "completion_tokens",
-        "total_tokens"
-    }
-    missing = required_cols - set(df.columns)
-    if missing:
-        raise ValueError(f"DataFrame missing required columns: {missing}")
-
-    # Build global forest
-    roots = build_call_tree_per_example(df)
-    all_calls = flatten_calls(roots)
-    num_calls = len(all_calls)
+    # Build the calls of all examples as columns, call trees are never materialized
+    if isinstance(all_steps, TraceStore):
+        spans = CallSpans.from_trace_store(all_steps,
+                                           operation_types=_OPERATION_TYPES,
+                                           end_columns=("prompt_tokens", "total_tokens"))
+    else:
+        spans = CallSpans.from_steps(all_steps,
+                                     operation_types=_OPERATION_TYPES,
+                                     end_columns={
+                                         "prompt_tokens": lambda step: step.token_usage.prompt_tokens,
+                                         "total_tokens": lambda step: step.token_usage.total_tokens,
+                                     })
+    num_calls = len(spans)
 
     # Concurrency distribution
-    dist_map = compute_concurrency_distribution(roots)
+    timeline = spans.concurrency_timeline()
+    dist_map = timeline.distribution_dict()
     total_time = sum(dist_map.values())
 
-    p50_c = find_percentile_concurrency(dist_map, 50)
-    p90_c = find_percentile_concurrency(dist_map, 90)
-    p95_c = find_percentile_concurrency(dist_map, 95)
-    p99_c = find_percentile_concurrency(dist_map, 99)
+    p50_c = timeline.percentile(50)
+    p90_c = timeline.percentile(90)
+    p95_c = timeline.percentile(95)
+    p99_c = timeline.percentile(99)
 
     # Threshold
     if concurrency_spike_threshold is None:
         concurrency_spike_threshold = max(1, int(np.ceil(p90_c)))
 
-    # Build concurrency segments, detect spikes
-    segments = build_concurrency_segments(roots)
-    spike_intervals = detect_concurrency_spikes(segments, concurrency_spike_threshold)
-
-    # Correlate
-    corr_stats = correlate_spike_calls(spike_intervals, roots)
+    # Detect spikes, every segment at or above the threshold
+    spike_segments = np.flatnonzero(timeline.levels >= concurrency_spike_threshold)
+    spike_calls, spike_ordinals = _spike_calls(spans, timeline, spike_segments)
+
+    # Record the active call uuids for each spike
+    order = np.argsort(spike_ordinals, kind="stable")
+    active_uuids = np.split(spans.uuid[spike_calls[order]],
+                            np.cumsum(np.bincount(spike_ordinals, minlength=len(spike_segments)))[:-1])
+
+    spike_starts = timeline.starts[spike_segments].tolist()
+    spike_ends = timeline.ends[spike_segments].tolist()
+    spike_levels = timeline.levels[spike_segments].tolist()
+    spike_intervals = [
+        ConcurrencySpikeInfo(start_time=start, end_time=end, concurrency=level, active_uuids=list(set(uuids.tolist())))
+        for start, end, level, uuids in zip(spike_starts, spike_ends, spike_levels, active_uuids)
+    ]
+
+    # Correlate, every call counts once for each spike it is active in
+    spikes_per_call = np.bincount(spike_calls, minlength=num_calls)
+    corr_stats = ConcurrencyCorrelationStats(
+        avg_prompt_tokens=_weighted_positive_mean(spans.extra["prompt_tokens"], spikes_per_call),
+        avg_total_tokens=_weighted_positive_mean(spans.extra["total_tokens"], spikes_per_call),
+    )
 
-    # Average latency by concurrency
-    avg_lat_by_conc = average_latency_by_midpoint_concurrency(roots)
+    # Average latency by concurrency at the midpoint of each call, zero-length calls are at concurrency 0
+    midpoint_levels = timeline.level_at(spans.midpoint(zero_length_at_start=False))
+    levels, level_codes = np.unique(midpoint_levels, return_inverse=True)
+    mean_latency = np.bincount(level_codes, weights=spans.duration) / np.bincount(level_codes)
+    avg_lat_by_conc = dict(zip(levels.tolist(), mean_latency.tolist()))
 
     # Build textual report
     lines = []
@@ -36,6 +36,7 @@ from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import FrequentPattern
 from aiq.profiler.inference_optimization.data_models import PrefixCallNode
 from aiq.profiler.inference_optimization.data_models import PrefixSpanSubworkflowResult
+from aiq.profiler.trace_store import TraceStore
 from aiq.profiler.utils import create_standardized_dataframe
 
 logger = logging.getLogger(__name__)
@@ -322,7 +323,7 @@ def compute_coverage_and_duration(sequences_map: dict[int, list[PrefixCallNode]]
 
 
 def prefixspan_subworkflow_with_text(  # pylint: disable=too-many-positional-arguments
-        all_steps: list[list[IntermediateStep]],
+        all_steps: list[list[IntermediateStep]] | TraceStore,
         min_support: int | float = 2,
         top_k: int = 10,
         min_coverage: float = 0.0,
@@ -17,6 +17,7 @@ import numpy as np
 import pandas as pd
 
 from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.profiler.trace_store import TraceStore
 from aiq.profiler.utils import create_standardized_dataframe
 
 
@@ -26,7 +27,7 @@ class LLMMetrics:
     """
 
     @staticmethod
-    def compute_profiling_metrics(all_steps: list[list[IntermediateStep]]) -> pd.DataFrame:
+    def compute_profiling_metrics(all_steps: list[list[IntermediateStep]] | TraceStore) -> pd.DataFrame:
         """
         Compute and append the following columns to the provided DataFrame:
 
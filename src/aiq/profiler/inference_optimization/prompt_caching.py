@@ -13,151 +13,358 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+import math
+from array import array
+from collections.abc import Iterable
+
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import CommonPrefixesOutput
 from aiq.profiler.inference_optimization.data_models import FrameworkLLMPrefixData
 from aiq.profiler.inference_optimization.data_models import PrefixInfo
-from aiq.profiler.utils import create_standardized_dataframe
+from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
+from aiq.profiler.trace_store import TraceStore
+
+logger = logging.getLogger(__name__)
+
+# Rough per-node overhead of the radix tree: the node arrays plus its share of the children dictionaries
+_NODE_BYTES = 160
 
 
 # -----------------------------------------------------------
-# 1. Helper: Build a prefix trie
+# 1. Helper: Token radix tree
 # -----------------------------------------------------------
-def build_prefix_trie(strings: list[str]) -> dict:
+class TokenRadixTree:
+    """
+    Radix tree over sequences of token ids.
+
+    Nodes are stored in parallel arrays and edge labels are slices of a single token pool, so shared prefixes are
+    stored once and a node is only created where prompts diverge. Each node counts the number of sequences passing
+    through it.
     """
-    Build a trie from a list of strings.
 
-    Returns a nested dictionary with::
+    def __init__(self):
+        self._pool = array("I")
+        self._edge_start = array("Q", [0])
+        self._edge_len = array("I", [0])
+        self._counts = array("Q", [0])
+        self._children: list[dict[int, int] | None] = [None]
 
-        {
-            'count': int,         # number of strings passing through this node
-            'children': dict[str, TrieNode]
-        }
+    @property
+    def total(self) -> int:
+        """Number of sequences inserted in the tree."""
+        return self._counts[0]
 
-    """
-    root = {'count': 0, 'children': {}}
-    for s in strings:
-        node = root
-        node['count'] += 1  # every string passes through the root
-        for ch in s:
-            if ch not in node['children']:
-                node['children'][ch] = {'count': 0, 'children': {}}
-            node = node['children'][ch]
-            node['count'] += 1
-    return root
+    @property
+    def num_nodes(self) -> int:
+        return len(self._counts)
+
+    def memory_usage(self) -> int:
+        """Approximate size of the tree in bytes."""
+        return self._pool.itemsize * len(self._pool) + _NODE_BYTES * len(self._counts)
+
+    def _new_node(self, edge_start: int, edge_len: int, count: int) -> int:
+        self._edge_start.append(edge_start)
+        self._edge_len.append(edge_len)
+        self._counts.append(count)
+        self._children.append(None)
+        return len(self._counts) - 1
+
+    def _split(self, parent: int, child: int, at: int) -> int:
+        """
+        Split the edge leading to `child` after `at` tokens, returning the new intermediate node.
+        """
+        start = self._edge_start[child]
+        mid = self._new_node(start, at, self._counts[child])
+        self._children[mid] = {self._pool[start + at]: child}
+        self._children[parent][self._pool[start]] = mid
+
+        self._edge_start[child] = start + at
+        self._edge_len[child] -= at
+        return mid
+
+    def insert(self, tokens: array) -> None:
+        """
+        Insert a sequence of token ids, incrementing the count of every node along its path.
+        """
+        pool = self._pool
+        node = 0
+        self._counts[0] += 1
+        i = 0
+        n = len(tokens)
+
+        while i < n:
+            children = self._children[node]
+            child = children.get(tokens[i]) if children else None
+
+            if child is None:
+                # The remainder of the sequence becomes a new leaf
+                leaf = self._new_node(len(pool), n - i, 1)
+                pool.extend(tokens[i:])
+                if children is None:
+                    self._children[node] = {tokens[i]: leaf}
+                else:
+                    children[tokens[i]] = leaf
+                return
+
+            start = self._edge_start[child]
+            length = self._edge_len[child]
+            limit = min(length, n - i)
+
+            # Length of the match along the edge, compared slice-wise and narrowed down by bisection
+            if pool[start:start + limit] == tokens[i:i + limit]:
+                matched = limit
+            else:
+                lo, hi = 1, limit - 1
+                while lo < hi:
+                    mid = (lo + hi + 1) // 2
+                    if pool[start:start + mid] == tokens[i:i + mid]:
+                        lo = mid
+                    else:
+                        hi = mid - 1
+                matched = lo
+
+            if matched < length:
+                child = self._split(node, child, matched)
+
+            self._counts[child] += 1
+            node = child
+            i += matched
+
+    def prune(self, min_count: int) -> None:
+        """
+        Drop every node seen by fewer than `min_count` sequences and compact the token pool.
+        """
+        pool = array("I")
+        edge_start = array("Q", [0])
+        edge_len = array("I", [0])
+        counts = array("Q", [self._counts[0]])
+        children: list[dict[int, int] | None] = [None]
+
+        # Counts decrease along every path, so dropped nodes are whole subtrees
+        stack = [(0, 0)]
+        while stack:
+            old, new = stack.pop()
+            for first, old_child in (self._children[old] or {}).items():
+                if self._counts[old_child] < min_count:
+                    continue
+
+                start = self._edge_start[old_child]
+                length = self._edge_len[old_child]
+
+                edge_start.append(len(pool))
+                edge_len.append(length)
+                counts.append(self._counts[old_child])
+                children.append(None)
+                pool.extend(self._pool[start:start + length])
+
+                new_child = len(counts) - 1
+                if children[new] is None:
+                    children[new] = {}
+                children[new][first] = new_child
+                stack.append((old_child, new_child))
+
+        self._pool = pool
+        self._edge_start = edge_start
+        self._edge_len = edge_len
+        self._counts = counts
+        self._children = children
+
+    def maximal_prefixes(self, min_count: int) -> Iterable[tuple[array, int]]:
+        """
+        Yield the token ids and count of every prefix seen by at least `min_count` sequences which is not itself the
+        prefix of a longer one meeting the threshold.
+        """
+        stack = [(0, array("I"))]
+        while stack:
+            node, prefix = stack.pop()
+
+            frequent_children = [
+                child for child in (self._children[node] or {}).values() if self._counts[child] >= min_count
+            ]
+
+            if not frequent_children:
+                if node != 0:
+                    yield prefix, self._counts[node]
+                continue
+
+            for child in frequent_children:
+                start = self._edge_start[child]
+                stack.append((child, prefix + self._pool[start:start + self._edge_len[child]]))
 
 
 # -----------------------------------------------------------
-# 2. Helper: Iterative traversal of the trie
+# 2. Helper: Streaming prefix analyzer
 # -----------------------------------------------------------
-def collect_prefixes_iterative(root: dict, total_calls: int) -> list[dict]:
+class PromptPrefixAnalyzer:
     """
-    Iteratively traverse the trie to collect prefix statistics,
-    avoiding recursion depth limits.
+    Streaming computation of the common prefixes of LLM prompts, grouped by LLM name.
 
-    :param root: Trie node with 'count' and 'children'
-    :param total_calls: Number of total calls in this group (denominator for percentages)
-    :return: A list of dicts, each dict containing prefix info
+    Prompts are split into space separated words, which are mapped to integer ids shared across LLMs, and inserted into
+    one `TokenRadixTree` per LLM. When the trees grow beyond the memory budget, the least frequent prefixes are pruned,
+    doubling the count threshold until the trees fit in three quarters of the budget. Counts below the threshold are
+    then approximate.
     """
-    results = []
-    # stack holds (node, prefix_so_far)
-    stack = [(root, "")]
 
-    while stack:
-        node, prefix = stack.pop()
+    def __init__(self, max_memory_mb: float = 1024.0):
+        """
+        Args:
+            max_memory_mb (float): Approximate memory budget of the prefix trees, in megabytes.
+        """
+        self._max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self._vocab: dict[str, int] = {}
+        self._words: list[str] = []
+        self._trees: dict[str, TokenRadixTree] = {}
+        self._min_count = 1
 
-        # Skip storing the empty root prefix
-        if prefix:
-            calls_count = node['count']
-            calls_percentage = calls_count / total_calls
-            results.append({
-                'prefix': prefix,
-                'prefix_length': len(prefix),
-                'calls_count': calls_count,
-                'calls_percentage': calls_percentage
-            })
+    def _encode(self, text: str) -> array:
+        if not text:
+            return array("I")
 
-        # Add children to the stack
-        for ch, child_node in node['children'].items():
-            stack.append((child_node, prefix + ch))
+        # Splitting on single spaces is lossless, joining the words with spaces restores the text exactly
+        words = text.split(" ")
+        ids = list(map(self._vocab.get, words))
 
-    return results
+        if None in ids:
+            for i, token_id in enumerate(ids):
+                if token_id is None:
+                    token_id = self._vocab.get(words[i])
+                    if token_id is None:
+                        token_id = self._vocab[words[i]] = len(self._words)
+                        self._words.append(words[i])
+                    ids[i] = token_id
 
+        return array("I", ids)
 
-# -----------------------------------------------------------
-# 3. Main Function
-# -----------------------------------------------------------
-def get_common_prefixes(all_steps: list[list[IntermediateStep]],
-                        min_call_percentage: float = 0.0) -> CommonPrefixesOutput:
-    """
-    Given a pandas DataFrame with columns 'framework', 'llm_name',
-    and 'llm_text_input', return a Pydantic-validated RootModel
-    keyed by "<llm_name>" with a sorted list of
-    common prefix statistics.
+    def _decode(self, ids: array) -> str:
+        words = self._words
+        return " ".join([words[token_id] for token_id in ids])
 
-    1) Only includes prefixes with calls_percentage >= `min_call_percentage`.
-    2) Excludes any prefix that is a substring of another (longer) prefix
-       that already meets the threshold and is retained.
-    3) Optionally writes the resulting dictionary to JSON if `output_path` is provided.
+    def memory_usage(self) -> int:
+        """Approximate size of the prefix trees in bytes."""
+        return sum(tree.memory_usage() for tree in self._trees.values())
 
-    :param all_steps: Intermediate Steps
-    :param min_call_percentage: Exclude prefixes that appear in fewer than this fraction
-                                of total calls. (Default 0.0 = no filtering)
+    def add(self, llm_name: str, text: str) -> None:
+        """
+        Count one call to `llm_name`. Empty texts only count towards the total number of calls.
+        """
+        tree = self._trees.get(llm_name)
+        if tree is None:
+            tree = self._trees[llm_name] = TokenRadixTree()
 
-    Sorting: primarily by prefix length (descending),
-             secondarily by frequency (descending).
-    """
-    # Validate necessary columns
-    df = create_standardized_dataframe(all_steps)
+        tree.insert(self._encode(text))
+
+        if self.memory_usage() > self._max_memory_bytes:
+            self._shrink()
+
+    def add_steps(self, steps: Iterable[IntermediateStep]) -> None:
+        """
+        Count every step against the LLM it belongs to, using the prompt of LLM_START steps.
+        """
+        for step in steps:
+            if not isinstance(step, IntermediatePropertyAdaptor):
+                step = IntermediatePropertyAdaptor.from_intermediate_step(step)
+            self.add(step.llm_name, str(step.llm_text_input))
+
+    def add_trace_store(self, store: TraceStore) -> None:
+        """
+        Count every step of a `TraceStore`, reading the LLM names and prompts from its columns.
+        """
+        for llm_name, text in zip(store.column("llm_name").tolist(), store.column("llm_text_input").tolist()):
+            self.add(llm_name, str(text))
+
+    def _shrink(self) -> None:
+        target_bytes = self._max_memory_bytes * 3 // 4
+        min_count = max(self._min_count, 2)
+
+        while True:
+            nodes_before = sum(tree.num_nodes for tree in self._trees.values())
+            for tree in self._trees.values():
+                tree.prune(min_count)
+
+            if self.memory_usage() <= target_bytes:
+                break
+
+            if sum(tree.num_nodes for tree in self._trees.values()) == nodes_before:
+                # Only the frequent prefixes are left, pruning further would not free any memory
+                break
+
+            min_count *= 2
 
-    required_cols = {'framework', 'llm_name', 'llm_text_input'}
-    if not required_cols.issubset(df.columns):
-        missing = required_cols - set(df.columns)
-        raise ValueError(f"DataFrame missing required columns: {missing}")
+        if min_count > self._min_count:
+            self._min_count = min_count
+            logger.warning(
+                "Prompt prefix trees exceed the memory budget of %d bytes, pruned prefixes seen fewer than "
+                "%d times. Counts below this threshold are approximate.",
+                self._max_memory_bytes,
+                min_count)
 
-    output_data: dict[str, FrameworkLLMPrefixData] = {}
+    def get_common_prefixes(self, min_call_percentage: float = 0.0) -> CommonPrefixesOutput:
+        """
+        Returns the common prefixes of the prompts seen so far for every LLM.
 
-    # Group DataFrame by (framework, llm_name)
-    grouped = df.groupby(['llm_name'])
-    for llm_name, group_df in grouped:
-        # Unpack llm_name Tuple
-        llm_name = llm_name[0]
+        :param min_call_percentage: Exclude prefixes that appear in fewer than this fraction of total calls.
+        """
+        output_data: dict[str, FrameworkLLMPrefixData] = {}
 
-        text_inputs = group_df['llm_text_input'].astype(str).tolist()
-        total_calls = len(text_inputs)
+        for llm_name in sorted(self._trees):
+            tree = self._trees[llm_name]
+            total_calls = tree.total
 
-        # Build trie for all text inputs
-        trie = build_prefix_trie(text_inputs)
+            # Smallest count meeting the threshold, prefixes must be seen at least once
+            min_count = max(math.ceil(min_call_percentage * total_calls), 1)
+            while min_count > 1 and (min_count - 1) / total_calls >= min_call_percentage:
+                min_count -= 1
+            while min_count / total_calls < min_call_percentage:
+                min_count += 1
 
-        # Collect prefix info using iterative traversal
-        results = collect_prefixes_iterative(trie, total_calls=total_calls)
+            results = []
+            for ids, calls_count in tree.maximal_prefixes(min_count):
+                prefix = self._decode(ids)
+                results.append(
+                    PrefixInfo(prefix=prefix,
+                               prefix_length=len(prefix),
+                               calls_count=calls_count,
+                               calls_percentage=calls_count / total_calls))
 
-        # 1) Filter out prefixes below min_call_percentage
-        results_filtered = [r for r in results if r['calls_percentage'] >= min_call_percentage]
+            # Sort results: prefix_length desc, then calls_count desc
+            results.sort(key=lambda r: (r.prefix_length, r.calls_count), reverse=True)
 
-        # 2) Sort results: prefix_length desc, then calls_count desc
-        results_sorted = sorted(results_filtered, key=lambda x: (x['prefix_length'], x['calls_count']), reverse=True)
+            output_data[llm_name] = FrameworkLLMPrefixData(total_calls=total_calls, prefix_info=results)
 
-        # 3) Substring filtering:
-        #    Because results_sorted is in descending length order,
-        #    if we keep a prefix, we exclude any shorter prefix that
-        #    is a substring of that already-kept prefix.
-        final_results = []
-        for r in results_sorted:
-            pfx = r['prefix']
-            # Check if this prefix is contained in any longer prefix we have kept
-            if not any(pfx in kept['prefix'] for kept in final_results):
-                final_results.append(r)
+        return CommonPrefixesOutput(root=output_data)
 
-        # Convert each dict to a PrefixInfo model
-        prefix_info_list = [PrefixInfo(**res) for res in final_results]
 
-        # Construct the dictionary key
-        framework_llm_key = f"{llm_name}"
+# -----------------------------------------------------------
+# 3. Main Function
+# -----------------------------------------------------------
+def get_common_prefixes(all_steps: Iterable[Iterable[IntermediateStep]] | TraceStore,
+                        min_call_percentage: float = 0.0,
+                        max_memory_mb: float = 1024.0) -> CommonPrefixesOutput:
+    """
+    Given the intermediate steps of every request, return a Pydantic-validated RootModel
+    keyed by "<llm_name>" with a sorted list of common prefix statistics.
+
+    1) Only includes prefixes with calls_percentage >= `min_call_percentage`.
+    2) Excludes any prefix of another (longer) prefix that already meets the threshold.
+
+    Prompts are compared word by word, words being separated by spaces, so prefixes end on word boundaries. Steps are
+    streamed into a radix tree, they do not need to be materialized in a DataFrame.
+
+    :param all_steps: Intermediate Steps, or a TraceStore holding them
+    :param min_call_percentage: Exclude prefixes that appear in fewer than this fraction
+                                of total calls. (Default 0.0 = no filtering)
+    :param max_memory_mb: Approximate memory budget of the prefix trees, in megabytes.
+
+    Sorting: primarily by prefix length (descending),
+             secondarily by frequency (descending).
+    """
+    analyzer = PromptPrefixAnalyzer(max_memory_mb=max_memory_mb)
 
-        # Save the data for this group
-        output_data[framework_llm_key] = FrameworkLLMPrefixData(total_calls=total_calls, prefix_info=prefix_info_list)
+    if isinstance(all_steps, TraceStore):
+        analyzer.add_trace_store(all_steps)
+    else:
+        for steps in all_steps:
+            analyzer.add_steps(steps)
 
-    # Package the final result in a validated RootModel
-    result_model = CommonPrefixesOutput(root=output_data)
-    return result_model
+    return analyzer.get_common_prefixes(min_call_percentage)
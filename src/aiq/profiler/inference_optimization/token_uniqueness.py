@@ -20,13 +20,15 @@ import numpy as np
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import LLMUniquenessMetrics
 from aiq.profiler.inference_optimization.data_models import LLMUniquenessMetricsByLLM
+from aiq.profiler.trace_store import TraceStore
 from aiq.profiler.utils import create_standardized_dataframe
 
 
 # ----------------------------------------------------------------
 # 1. Main Function
 # ----------------------------------------------------------------
-def compute_inter_query_token_uniqueness_by_llm(all_steps: list[list[IntermediateStep]]) -> LLMUniquenessMetricsByLLM:
+def compute_inter_query_token_uniqueness_by_llm(
+        all_steps: list[list[IntermediateStep]] | TraceStore) -> LLMUniquenessMetricsByLLM:
     """
     Computes p90, p95, and p99 of 'new words added' between consecutive llm_start events,
     grouped by (llm_name, example_number).
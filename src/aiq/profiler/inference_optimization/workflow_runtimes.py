@@ -17,10 +17,11 @@ import numpy as np
 
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.inference_optimization.data_models import WorkflowRuntimeMetrics
+from aiq.profiler.trace_store import TraceStore
 from aiq.profiler.utils import create_standardized_dataframe
 
 
-def compute_workflow_runtime_metrics(all_steps: list[list[IntermediateStep]]) -> WorkflowRuntimeMetrics:
+def compute_workflow_runtime_metrics(all_steps: list[list[IntermediateStep]] | TraceStore) -> WorkflowRuntimeMetrics:
     """
     Computes the p90, p95, and p99 of workflow runtime for each example_number.
 
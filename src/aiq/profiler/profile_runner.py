@@ -21,6 +21,8 @@ import statistics
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import pandas as pd
 from pydantic import BaseModel
 
 from aiq.data_models.evaluate import ProfilerConfig
@@ -28,6 +30,7 @@ from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.data_models import ProfilerResults
 from aiq.profiler.forecasting.model_trainer import ModelTrainer
 from aiq.profiler.inference_metrics_model import InferenceMetricsModel
+from aiq.profiler.trace_store import TraceStore
 from aiq.profiler.utils import create_standardized_dataframe
 from aiq.utils.type_converter import TypeConverter
 
@@ -58,8 +61,8 @@ class ProfilerRunner:
 
     Updated version with additional metrics:
 
-    - For each request, we collect a list of UsageStatistic objects, store them individually,
-      and also keep a final large JSON of all requests.
+    - The intermediate steps of all requests are held in a single columnar `TraceStore`, which every analysis reads
+      from, and which is written out as a final large JSON (or Parquet) file of all requests.
     - We then compute:
        1. 90, 95, 99% confidence intervals for the mean total workflow run time.
        2. 90, 95, 99% confidence intervals for the mean LLM latency.
@@ -74,19 +77,28 @@ class ProfilerRunner:
         self.write_output = write_output
         self._converter = TypeConverter([])
 
-        # Holds per-request data (prompt, output, usage_stats, etc.)
-        # This will be saved at the end to a big JSON file
-        self.all_requests_data: list[dict] = []
-        self.all_steps = []
+        # Holds the intermediate steps of every request, shared by all the analyses
+        self.trace_store: TraceStore | None = None
 
         # Ensure output directory
         os.makedirs(output_dir, exist_ok=True)
 
-    async def run(self, all_steps: list[list[IntermediateStep]]) -> ProfilerResults:
+    @staticmethod
+    def create_trace_store(profiler_config: ProfilerConfig, output_dir: Path) -> TraceStore:
         """
-        Main entrypoint: Works on Input DataFrame generated from eval to fit forecasting model,
-        writes out combined requests JSON, then computes and saves additional metrics,
-        and optionally fits a forecasting model.
+        Create an empty trace store configured for the profiler, which can be filled while the workflow runs and then
+        passed to `run`.
+        """
+        store_config = profiler_config.trace_store
+        spill_path = Path(output_dir) / "all_requests_profiler_traces.arrow" if store_config.spill_to_disk else None
+
+        return TraceStore(spill_path=spill_path, batch_size=store_config.batch_size)
+
+    async def run(self, all_steps: list[list[IntermediateStep]] | TraceStore) -> ProfilerResults:
+        """
+        Main entrypoint: Works on the intermediate steps collected by eval, either as a list of steps per request or as
+        a TraceStore filled while the workflow ran. Writes out combined requests traces, then computes and saves
+        additional metrics, and optionally fits a forecasting model.
         """
         from aiq.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import \
             multi_example_call_profiling
@@ -100,36 +112,35 @@ class ProfilerRunner:
         from aiq.profiler.inference_optimization.prompt_caching import get_common_prefixes
         from aiq.profiler.inference_optimization.token_uniqueness import compute_inter_query_token_uniqueness_by_llm
         from aiq.profiler.inference_optimization.workflow_runtimes import compute_workflow_runtime_metrics
-        from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
 
-        # Convert the incoming DataFrame to a list of dicts and store
-        all_steps = [[IntermediatePropertyAdaptor.from_intermediate_step(step) for step in steps]
-                     for steps in all_steps]  # Add adapter properties to each step
+        # Every analysis reads from the same columnar store, steps are never copied per analysis
+        if isinstance(all_steps, TraceStore):
+            trace_store = all_steps
+        else:
+            trace_store = self.create_trace_store(self.profile_config, self.output_dir)
+            for i, steps in enumerate(all_steps):
+                trace_store.append_example(i, steps)
 
-        self.all_steps = all_steps
-        self.all_requests_data = []
-        for i, steps in enumerate(all_steps):
-            request_data = []
-            for step in steps:
-                request_data.append(step.model_dump())
-            self.all_requests_data.append({"request_number": i, "intermediate_steps": request_data})
+        trace_store.seal()
+        self.trace_store = trace_store
 
-        # Write the final big JSON (all requests)
+        # Write the final big traces file (all requests)
         if self.write_output:
-            final_path = os.path.join(self.output_dir, "all_requests_profiler_traces.json")
-            with open(final_path, 'w', encoding='utf-8') as f:
-                json.dump(self.all_requests_data, f, indent=2, default=str)
+            if self.profile_config.trace_store.traces_format == "parquet":
+                final_path = os.path.join(self.output_dir, "all_requests_profiler_traces.parquet")
+                trace_store.write_parquet(final_path)
+            else:
+                final_path = os.path.join(self.output_dir, "all_requests_profiler_traces.json")
+                trace_store.write_json(final_path)
             logger.info("Wrote combined data to: %s", final_path)
 
         # ------------------------------------------------------------
         # Generate one standardized dataframe for all usage stats
         # ------------------------------------------------------------
-        merged_df = create_standardized_dataframe(all_steps)
-
-        if self.profile_config.compute_llm_metrics and not merged_df.empty:
-            merged_df = LLMMetrics.compute_profiling_metrics(all_steps)
-
-        output_df = merged_df.copy()
+        if self.profile_config.compute_llm_metrics:
+            output_df = LLMMetrics.compute_profiling_metrics(trace_store)
+        else:
+            output_df = create_standardized_dataframe(trace_store)
 
         if self.profile_config.csv_exclude_io_text and not output_df.empty:
             # Exclude text fields from CSV
@@ -163,7 +174,9 @@ class ProfilerRunner:
             # Compute and save common prefixes
             # ------------------------------------------------------------
 
-            prefixes = get_common_prefixes(all_steps, self.profile_config.prompt_caching_prefixes.min_frequency)
+            prefixes = get_common_prefixes(trace_store,
+                                           self.profile_config.prompt_caching_prefixes.min_frequency,
+                                           max_memory_mb=self.profile_config.prompt_caching_prefixes.max_memory_mb)
             common_prefix_results = prefixes
 
         if self.profile_config.token_uniqueness_forecast:
@@ -171,7 +184,7 @@ class ProfilerRunner:
             # Compute and save inter-query token uniqueness
             # ------------------------------------------------------------
 
-            uniqueness = compute_inter_query_token_uniqueness_by_llm(all_steps)
+            uniqueness = compute_inter_query_token_uniqueness_by_llm(trace_store)
             token_uniqueness_results = uniqueness
 
         if self.profile_config.workflow_runtime_forecast or self.profile_config.base_metrics:
@@ -179,7 +192,7 @@ class ProfilerRunner:
             # Compute and save workflow runtime metrics
             # ------------------------------------------------------------
 
-            workflow_runtimes = compute_workflow_runtime_metrics(all_steps)
+            workflow_runtimes = compute_workflow_runtime_metrics(trace_store)
             workflow_runtimes_results = workflow_runtimes
 
         inference_optimization_results = InferenceOptimizationHolder(confidence_intervals=simple_metrics,
@@ -202,7 +215,7 @@ class ProfilerRunner:
             # Profile workflow bottlenecks
             # ------------------------------------------------------------
 
-            workflow_bottlenecks = profile_workflow_bottlenecks(all_steps)
+            workflow_bottlenecks = profile_workflow_bottlenecks(trace_store)
             workflow_bottlenecks = workflow_bottlenecks.model_dump()
             workflow_profiling_reports += "\n\n\n" + workflow_bottlenecks["summary"]
             workflow_profiling_metrics["simple_stack_analysis"] = workflow_bottlenecks["stats"]
@@ -212,7 +225,7 @@ class ProfilerRunner:
             # ------------------------------------------------------------
             # Profile workflow bottlenecks with nested stack analysis
             # ------------------------------------------------------------
-            nested_bottlenecks = multi_example_call_profiling(all_steps, output_dir=str(self.output_dir))
+            nested_bottlenecks = multi_example_call_profiling(trace_store, output_dir=str(self.output_dir))
             workflow_profiling_reports += "\n\n\n" + nested_bottlenecks.textual_report
             workflow_profiling_metrics["nested_stack_analysis"] = nested_bottlenecks.model_dump(
                 exclude=["textual_report"])
@@ -223,7 +236,7 @@ class ProfilerRunner:
             # Profile concurrency spikes
             # ------------------------------------------------------------
             concurrency_metrics = concurrency_spike_analysis(
-                all_steps, self.profile_config.concurrency_spike_analysis.spike_threshold)
+                trace_store, self.profile_config.concurrency_spike_analysis.spike_threshold)
             workflow_profiling_reports += "\n\n\n" + concurrency_metrics.textual_report
             workflow_profiling_metrics["concurrency_spike_analysis"] = concurrency_metrics.model_dump(
                 exclude=["textual_report"])
@@ -242,7 +255,7 @@ class ProfilerRunner:
                         prefix_list.append(prefix_data["prefix"])
 
             prefix_span_analysis = prefixspan_subworkflow_with_text(
-                all_steps,
+                trace_store,
                 **self.profile_config.prefix_span_analysis.model_dump(exclude=["enable", "chain_with_common_prefixes"]),
                 prefix_list=prefix_list)
 
@@ -274,7 +287,7 @@ class ProfilerRunner:
             model_trainer = ModelTrainer()
 
             try:
-                fitted_model = model_trainer.train(all_steps)
+                fitted_model = model_trainer.train(trace_store.iter_examples())
                 logger.info("Fitted model for forecasting.")
             except Exception as e:
                 logger.exception("Fitting model failed. %s", e, exc_info=True)
@@ -300,16 +313,12 @@ class ProfilerRunner:
         The total workflow run time for each request is the difference between the last and first
         event timestamps in usage_stats.
         """
-        run_times = []
-        for req_data in self.all_steps:
-            # Find the min and max event_timestamp
-            timestamps = [u.event_timestamp for u in req_data]
-            if not timestamps:
-                continue
+        if self.trace_store.num_rows == 0:
+            return self._compute_confidence_intervals([], "Workflow Run Time")
 
-            start_time = min(timestamps)
-            end_time = max(timestamps)
-            run_times.append(end_time - start_time)
+        timestamps = pd.Series(self.trace_store.column("event_timestamp"))
+        span = timestamps.groupby(self.trace_store.column("example_number"), sort=True).agg(["min", "max"])
+        run_times = (span["max"] - span["min"]).tolist()
 
         return self._compute_confidence_intervals(run_times, "Workflow Run Time")
 
@@ -319,20 +328,29 @@ class ProfilerRunner:
         LLM latency is defined as the difference between an LLM_END event_timestamp and
         the immediately preceding LLM_START event_timestamp, across all usage_stats.
         """
-        latencies = []
-        for req_data in self.all_steps:
+        event_types = self.trace_store.column("event_type")
+        is_start = event_types == "LLM_START"
+        llm_events = np.flatnonzero(is_start | (event_types == "LLM_END"))
 
-            usage_stats_sorted = sorted(req_data, key=lambda x: x.event_timestamp)
+        # Stable sort of the LLM events of each request by timestamp, other events do not affect the pairing
+        examples = self.trace_store.column("example_number")[llm_events]
+        timestamps = self.trace_store.column("event_timestamp")[llm_events]
+        order = np.lexsort((timestamps, examples))
 
-            previous_llm_start_time = None
-            for u in usage_stats_sorted:
-                event_type = u.event_type.value
-                ts = u.event_timestamp
-                if event_type == "LLM_START":
-                    previous_llm_start_time = ts
-                elif event_type == "LLM_END" and previous_llm_start_time is not None:
-                    latencies.append(ts - previous_llm_start_time)
-                    previous_llm_start_time = None
+        latencies = []
+        current_example = None
+        previous_llm_start_time = None
+        for example, ts, start in zip(examples[order].tolist(), timestamps[order].tolist(),
+                                      is_start[llm_events][order].tolist()):
+            if example != current_example:
+                current_example = example
+                previous_llm_start_time = None
+
+            if start:
+                previous_llm_start_time = ts
+            elif previous_llm_start_time is not None:
+                latencies.append(ts - previous_llm_start_time)
+                previous_llm_start_time = None
 
         return self._compute_confidence_intervals(latencies, "LLM Latency")
 
@@ -347,22 +365,18 @@ class ProfilerRunner:
         Note: This is a simple approximate measure of overall throughput for the entire run.
         """
         # Gather min timestamp and max timestamp across ALL requests
-        all_timestamps = []
-        for req_data in self.all_steps:
-            for u in req_data:
-                all_timestamps.append(u.event_timestamp)
-
-        if not all_timestamps:
+        if self.trace_store.num_rows == 0:
             return InferenceMetricsModel()
 
-        min_ts = min(all_timestamps)
-        max_ts = max(all_timestamps)
+        all_timestamps = self.trace_store.column("event_timestamp")
+        min_ts = float(all_timestamps.min())
+        max_ts = float(all_timestamps.max())
         total_time = max_ts - min_ts
         if total_time <= 0:
             # Can't compute a meaningful throughput if time <= 0
             return InferenceMetricsModel()
 
-        total_requests = len(self.all_requests_data)
+        total_requests = self.trace_store.num_examples
         # Single estimate of throughput
         throughput_value = total_requests / total_time
 
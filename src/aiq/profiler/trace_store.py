@@ -0,0 +1,362 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import json
+import logging
+import threading
+import typing
+from collections.abc import Iterable
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pydantic_core import PydanticSerializationError
+
+from aiq.data_models.intermediate_step import IntermediateStep
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
+
+# pyarrow is imported once a store is used, so that building the DataFrame from lists of steps does not require it
+if typing.TYPE_CHECKING:
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Columns of the standardized DataFrame, in the order of `DataFrameRow`
+STANDARDIZED_COLUMNS = (
+    "event_type",
+    "event_timestamp",
+    "example_number",
+    "prompt_tokens",
+    "completion_tokens",
+    "total_tokens",
+    "llm_text_input",
+    "llm_text_output",
+    "llm_new_token",
+    "llm_name",
+    "tool_name",
+    "function_name",
+    "function_id",
+    "parent_function_name",
+    "parent_function_id",
+    "UUID",
+    "framework",
+)
+
+
+@functools.cache
+def _schema() -> "pa.Schema":
+    import pyarrow as pa
+
+    return pa.schema([
+        ("event_type", pa.string()),
+        ("event_timestamp", pa.float64()),
+        ("example_number", pa.int64()),
+        ("prompt_tokens", pa.int64()),
+        ("completion_tokens", pa.int64()),
+        ("total_tokens", pa.int64()),
+        ("llm_text_input", pa.large_string()),
+        ("llm_text_output", pa.large_string()),
+        ("llm_new_token", pa.string()),
+        ("llm_name", pa.string()),
+        ("tool_name", pa.string()),
+        ("function_name", pa.string()),
+        ("function_id", pa.string()),
+        ("parent_function_name", pa.string()),
+        ("parent_function_id", pa.string()),
+        ("UUID", pa.string()),
+        ("framework", pa.string()),
+        ("step_json", pa.large_string()),
+    ])
+
+
+def _as_text(value) -> str | None:
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+def _dump_step(step: IntermediateStep) -> str:
+    try:
+        return step.model_dump_json()
+    except PydanticSerializationError:
+        # Payloads can hold arbitrary objects, fall back to their string representation
+        return json.dumps(step.model_dump(), default=str)
+
+
+class TraceStore:
+    """
+    Append-only columnar store of the intermediate steps of every example, backed by Arrow record batches.
+
+    Steps are appended one example at a time while the workflow runs and buffered until `batch_size` rows are pending,
+    at which point they are converted to a record batch. When `spill_path` is set, record batches are written to an
+    Arrow IPC file instead of being kept in memory, and the file is memory-mapped once the store is sealed.
+
+    Reading the store (`table`, `column`, `to_dataframe`, ...) seals it, after which no more steps can be appended.
+    Rows are ordered by example number, and within an example in the order the steps were appended, so analyses see
+    the same rows as with `create_standardized_dataframe`.
+    """
+
+    def __init__(self, spill_path: str | Path | None = None, batch_size: int = 4096):
+        """
+        Args:
+            spill_path (str | Path | None): Arrow IPC file record batches are written to. When None, record batches
+                are kept in memory.
+            batch_size (int): Number of rows buffered before they are converted to a record batch.
+        """
+        self._spill_path = Path(spill_path) if spill_path is not None else None
+        self._batch_size = max(batch_size, 1)
+        self._lock = threading.Lock()
+
+        self._pending: dict[str, list] = {name: [] for name in _schema().names}
+        self._batches: list["pa.RecordBatch"] = []
+        self._writer: "pa.ipc.RecordBatchFileWriter | None" = None
+        self._num_rows = 0
+        self._examples: set[int] = set()
+        self._last_example = -1
+        self._in_order = True
+        self._table: "pa.Table | None" = None
+
+        if self._spill_path is not None:
+            import pyarrow as pa
+
+            self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pa.ipc.new_file(str(self._spill_path), _schema())
+
+    @classmethod
+    def from_steps(cls, all_steps: Iterable[Iterable[IntermediateStep]], **kwargs) -> "TraceStore":
+        """
+        Build a store from the intermediate steps of every example, numbering examples in iteration order.
+        """
+        store = cls(**kwargs)
+        for example_number, steps in enumerate(all_steps):
+            store.append_example(example_number, steps)
+
+        return store
+
+    @classmethod
+    def from_parquet(cls, path: str | Path) -> "TraceStore":
+        """
+        Load a sealed store from a Parquet file written by `write_parquet`.
+        """
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(str(path), schema=_schema(), memory_map=True)
+
+        store = cls()
+        store._num_rows = table.num_rows
+        store._examples = set(pc.unique(table.column("example_number")).to_pylist())
+        store._table = table
+        return store
+
+    @property
+    def num_rows(self) -> int:
+        return self._num_rows
+
+    @property
+    def num_examples(self) -> int:
+        """Number of examples appended to the store, including examples without any step."""
+        return len(self._examples)
+
+    @property
+    def sealed(self) -> bool:
+        return self._table is not None
+
+    def append_example(self, example_number: int, steps: Iterable[IntermediateStep]) -> None:
+        """
+        Append the intermediate steps of an example. Examples can be appended in any order, but the steps of an example
+        must be appended in a single call.
+        """
+        with self._lock:
+            if self._table is not None:
+                raise RuntimeError("Cannot append steps to a sealed TraceStore")
+
+            if example_number in self._examples:
+                raise ValueError(f"Steps of example {example_number} were already appended")
+
+            self._examples.add(example_number)
+            self._in_order = self._in_order and example_number > self._last_example
+            self._last_example = max(self._last_example, example_number)
+
+            pending = self._pending
+            for step in steps:
+                if not isinstance(step, IntermediatePropertyAdaptor):
+                    # Shallow copy, the adaptor only adds properties on top of the step fields
+                    step = IntermediatePropertyAdaptor.model_construct(**dict(step))
+
+                token_usage = step.token_usage
+
+                pending["event_type"].append(str(step.event_type.value))
+                pending["event_timestamp"].append(step.event_timestamp)
+                pending["example_number"].append(example_number)
+                pending["prompt_tokens"].append(token_usage.prompt_tokens)
+                pending["completion_tokens"].append(token_usage.completion_tokens)
+                pending["total_tokens"].append(token_usage.total_tokens)
+                pending["llm_text_input"].append(_as_text(step.llm_text_input))
+                pending["llm_text_output"].append(_as_text(step.llm_text_output))
+                pending["llm_new_token"].append(_as_text(step.llm_text_chunk))
+                pending["llm_name"].append(step.llm_name)
+                pending["tool_name"].append(step.tool_name)
+                pending["function_name"].append(step.function_name)
+                pending["function_id"].append(step.function_id)
+                pending["parent_function_name"].append(step.parent_function_name)
+                pending["parent_function_id"].append(step.parent_function_id)
+                pending["UUID"].append(str(step.payload.UUID))
+                pending["framework"].append(step.framework.value if step.framework is not None else None)
+                pending["step_json"].append(_dump_step(step))
+
+                self._num_rows += 1
+
+            if len(pending["step_json"]) >= self._batch_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending["step_json"]:
+            return
+
+        import pyarrow as pa
+
+        batch = pa.RecordBatch.from_pydict(self._pending, schema=_schema())
+        self._pending = {name: [] for name in _schema().names}
+
+        if self._writer is not None:
+            self._writer.write_batch(batch)
+        else:
+            self._batches.append(batch)
+
+    def seal(self) -> "pa.Table":
+        """
+        Flush the pending steps and freeze the store, returning the table of all steps.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        with self._lock:
+            if self._table is not None:
+                return self._table
+
+            self._flush()
+
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+                # Memory-mapped, the record batches are read without copying them
+                with pa.memory_map(str(self._spill_path)) as source:
+                    table = pa.ipc.open_file(source).read_all()
+            else:
+                # A single copy into contiguous columns, after which the record batches are released
+                table = pa.Table.from_batches(self._batches, schema=_schema()).combine_chunks()
+                self._batches = []
+
+            if not self._in_order:
+                # Stable sort, steps of an example keep the order they were appended in
+                table = table.take(pc.sort_indices(table, sort_keys=[("example_number", "ascending")]))
+
+            self._table = table
+            return table
+
+    def close(self) -> None:
+        """
+        Seal the store, closing the spill file if any.
+        """
+        self.seal()
+
+    def table(self, columns: Iterable[str] | None = None) -> "pa.Table":
+        """
+        The steps as an Arrow table, restricted to `columns` if provided. This does not copy any data.
+        """
+        table = self.seal()
+        return table.select(list(columns)) if columns is not None else table
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        A single column as a NumPy array. Numeric columns are returned without copying, string columns as object
+        arrays with None for missing values.
+        """
+        return self.seal().column(name).to_numpy(zero_copy_only=False)
+
+    def to_dataframe(self, columns: Iterable[str] = STANDARDIZED_COLUMNS) -> pd.DataFrame:
+        """
+        The standardized DataFrame of all steps (see `create_standardized_dataframe`). Event types are converted back
+        to `IntermediateStepType` members.
+        """
+        if self.num_rows == 0:
+            return pd.DataFrame()
+
+        # Built from the column arrays so that pandas infers the dtypes as it does for a DataFrame built from records
+        table = self.table(columns)
+        df = pd.DataFrame({name: table.column(name).to_numpy(zero_copy_only=False) for name in table.column_names})
+
+        if "event_type" in df.columns:
+            event_types = {value: IntermediateStepType(value) for value in df["event_type"].unique()}
+            df["event_type"] = [event_types[value] for value in df["event_type"].tolist()]
+
+        return df
+
+    def _iter_serialized_examples(self) -> Iterator[tuple[int, list[str]]]:
+        table = self.table(["example_number", "step_json"])
+        examples = iter(sorted(self._examples))
+        current_example = None
+        current_steps: list[str] = []
+
+        for batch in table.to_batches():
+            for example_number, step_json in zip(batch.column(0).to_pylist(), batch.column(1).to_pylist()):
+                if example_number != current_example:
+                    if current_example is not None:
+                        yield current_example, current_steps
+                    # Examples without any step have no rows
+                    for empty_example in examples:
+                        if empty_example == example_number:
+                            break
+                        yield empty_example, []
+                    current_example = example_number
+                    current_steps = []
+                current_steps.append(step_json)
+
+        if current_example is not None:
+            yield current_example, current_steps
+
+        for empty_example in examples:
+            yield empty_example, []
+
+    def iter_examples(self) -> Iterator[list[IntermediatePropertyAdaptor]]:
+        """
+        Lazily rebuild the intermediate steps of each example, one example at a time, in example number order.
+        """
+        for _, step_json in self._iter_serialized_examples():
+            yield [IntermediatePropertyAdaptor.model_validate_json(s) for s in step_json]
+
+    def write_parquet(self, path: str | Path) -> None:
+        """
+        Write all steps to a Parquet file, which can be loaded back with `from_parquet`.
+        """
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.seal(), str(path), compression="zstd")
+
+    def write_json(self, path: str | Path) -> None:
+        """
+        Write all steps to a JSON file, as a list of `{"request_number": ..., "intermediate_steps": [...]}` objects.
+        Steps are written from their serialized form one example at a time, the file is never built in memory.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[")
+            for i, (example_number, step_json) in enumerate(self._iter_serialized_examples()):
+                f.write(",\n" if i > 0 else "\n")
+                f.write(f'{{"request_number": {example_number}, "intermediate_steps": [')
+                f.write(",\n".join(step_json))
+                f.write("]}")
+            f.write("\n]\n")
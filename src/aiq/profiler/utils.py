@@ -16,6 +16,7 @@
 import inspect
 import logging
 import re
+import typing
 from collections.abc import Callable
 from typing import Any
 
@@ -26,6 +27,9 @@ from aiq.cli.type_registry import RegisteredFunctionInfo
 from aiq.data_models.intermediate_step import IntermediateStep
 from aiq.profiler.data_frame_row import DataFrameRow
 
+if typing.TYPE_CHECKING:
+    from aiq.profiler.trace_store import TraceStore
+
 # A simple set of regex patterns to scan for direct references to LLMFrameworkEnum
 _FRAMEWORK_REGEX_MAP = {t: fr'\b{t._name_}\b' for t in LLMFrameworkEnum}
 
@@ -145,11 +149,17 @@ def detect_llm_frameworks_in_build_fn(registration: RegisteredFunctionInfo) -> l
 # -------------------------------------------------------------------
 # Create a single standardized DataFrame for all usage stats
 # -------------------------------------------------------------------
-def create_standardized_dataframe(requests_data: list[list[IntermediateStep]]) -> pd.DataFrame:
+def create_standardized_dataframe(requests_data: "list[list[IntermediateStep]] | TraceStore") -> pd.DataFrame:
     """
     Merge usage stats for *all* requests into one DataFrame, each row representing a usage_stats entry.
     - Include a column 'example_number' to mark which request it originated from.
+    - When given a `TraceStore`, the DataFrame is converted from its columns instead of being built row by row.
     """
+    from aiq.profiler.trace_store import TraceStore
+
+    if isinstance(requests_data, TraceStore):
+        return requests_data.to_dataframe()
+
     all_rows = []
     try:
         for i, steps in enumerate(requests_data):
@@ -22,6 +22,7 @@ from functools import lru_cache
 
 from aiq.data_models.component import AIQComponentEnum
 from aiq.data_models.discovery_metadata import DiscoveryMetadata
+from aiq.data_models.discovery_metadata import DiscoveryStatusEnum
 from aiq.registry_handlers.schemas.package import WheelData
 from aiq.registry_handlers.schemas.publish import AIQArtifact
 from aiq.runtime.loader import PluginTypes
@@ -145,8 +146,14 @@ def build_package_metadata(wheel_data: WheelData | None) -> dict[AIQComponentEnu
     from aiq.cli.type_registry import GlobalTypeRegistry
     from aiq.registry_handlers.metadata_factory import ComponentDiscoveryMetadata
     from aiq.runtime.loader import discover_and_register_plugins
+    from aiq.runtime.loader import load_plugin_manifest
 
-    discover_and_register_plugins(PluginTypes.ALL)
+    # The metadata of the installed components is listed from the plugin manifest when it is up to date, without
+    # importing any plugin
+    manifest = load_plugin_manifest() if wheel_data is None else None
+
+    if (manifest is None):
+        discover_and_register_plugins(PluginTypes.ALL)
 
     registry = GlobalTypeRegistry.get()
 
@@ -171,6 +178,12 @@ def build_package_metadata(wheel_data: WheelData | None) -> dict[AIQComponentEnu
 
         if (component_type == AIQComponentEnum.UNDEFINED):
             continue
+        if (manifest is not None and component_type != AIQComponentEnum.PACKAGE):
+            discovery_metadata[component_type] = [
+                metadata.model_dump() for metadata in manifest.get_discovery_metadata(component_type)
+                if metadata.status == DiscoveryStatusEnum.SUCCESS
+            ]
+            continue
         component_metadata = ComponentDiscoveryMetadata.from_package_component_type(wheel_data=wheel_data,
                                                                                     component_type=component_type)
         component_metadata.load_metadata()
@@ -48,6 +48,16 @@ class MilvusRetrieverConfig(RetrieverBaseConfig, name="milvus_retriever"):
     description: str | None = Field(default=None,
                                     description="If present it will be used as the tool description",
                                     alias="collection_description")
+    schema_cache_ttl: float = Field(default=300.0,
+                                    ge=0,
+                                    description="Number of seconds collection schemas are cached for, 0 disables it")
+    batch_window: float = Field(
+        default=0.0,
+        ge=0,
+        description=("Number of seconds to wait for concurrent queries to embed with a single 'embed_documents' call "
+                     "and search with a single multi-vector search, 0 disables batching. Only enable batching with "
+                     "embedding models which embed queries and documents the same way."))
+    max_batch_size: int = Field(default=64, gt=0, description="Maximum number of queries searched in a single batch")
 
 
 @register_retriever_provider(config_type=MilvusRetrieverConfig)
@@ -69,6 +79,9 @@ async def milvus_retriever_client(config: MilvusRetrieverConfig, builder: Builde
         client=milvus_client,
         embedder=embedder,
         content_field=config.content_field,
+        schema_cache_ttl=config.schema_cache_ttl,
+        batch_window=config.batch_window,
+        max_batch_size=config.max_batch_size,
     )
 
     # Using parameters in the config to set default values which can be overridden during the function call.
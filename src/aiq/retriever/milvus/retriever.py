@@ -13,7 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import dataclasses
+import json
 import logging
+import time
 from functools import partial
 
 from langchain_core.embeddings import Embeddings
@@ -32,6 +36,16 @@ class CollectionNotFoundError(RetrieverError):
     pass
 
 
+@dataclasses.dataclass
+class _PendingBatch:
+    """
+    Queries waiting to be embedded and searched together with a single multi-vector search.
+    """
+    search_kwargs: dict
+    requests: list[tuple[str, int, asyncio.Future]] = dataclasses.field(default_factory=list)
+    handle: asyncio.TimerHandle | None = None
+
+
 class MilvusRetriever(AIQRetriever):
     """
     Client for retrieving document chunks from a Milvus vectorstore
@@ -43,12 +57,23 @@ class MilvusRetriever(AIQRetriever):
         embedder: Embeddings,
         content_field: str = "text",
         use_iterator: bool = False,
+        schema_cache_ttl: float = 300.0,
+        batch_window: float = 0.0,
+        max_batch_size: int = 64,
     ) -> None:
         """
         Initialize the Milvus Retriever using a preconfigured MilvusClient
 
         Args:
            client (MilvusClient): Preinstantiate pymilvus.MilvusClient object.
+           embedder (Embeddings): Embedder used to vectorize the queries.
+           content_field (str): Name of the field holding the document content.
+           use_iterator (bool): Whether to search using a search iterator.
+           schema_cache_ttl (float): Number of seconds collection schemas are cached for. Set to 0 to disable caching.
+           batch_window (float): Number of seconds to wait for concurrent queries against the same collection with the
+             same search parameters, which are then embedded with a single `embed_documents` call and searched with a
+             single multi-vector search. Set to 0 to disable batching.
+           max_batch_size (int): Maximum number of queries in a batch, a full batch is searched immediately.
         """
         self._client = client
         self._embedder = embedder
@@ -60,6 +85,15 @@ class MilvusRetriever(AIQRetriever):
         self._default_params = None
         self._bound_params = []
         self.content_field = content_field
+
+        self._schema_cache_ttl = schema_cache_ttl
+        self._schema_cache: dict[str, tuple[float, list[str]]] = {}
+
+        self._batch_window = batch_window
+        self._max_batch_size = max(max_batch_size, 1)
+        self._pending_batches: dict[tuple, _PendingBatch] = {}
+        self._batch_tasks: set[asyncio.Task] = set()
+
         logger.info("Mivlus Retriever using %s for search.", self._search_func.__name__)
 
     def bind(self, **kwargs) -> None:
@@ -81,8 +115,36 @@ class MilvusRetriever(AIQRetriever):
         """
         return [param for param in ["query", "collection_name", "top_k", "filters"] if param not in self._bound_params]
 
-    def _validate_collection(self, collection_name: str) -> bool:
-        return collection_name in self._client.list_collections()
+    def invalidate_schema_cache(self, collection_name: str | None = None) -> None:
+        """
+        Drop the cached schema of a collection, or of all collections if no name is given.
+        """
+        if collection_name is None:
+            self._schema_cache.clear()
+        else:
+            self._schema_cache.pop(collection_name, None)
+
+    async def _validate_collection(self, collection_name: str) -> bool:
+        return collection_name in await asyncio.to_thread(self._client.list_collections)
+
+    async def _get_collection_fields(self, collection_name: str) -> list[str]:
+        """
+        Returns the names of the fields of a collection, using the schema cache when possible.
+        """
+        cached = self._schema_cache.get(collection_name)
+        if cached is not None and time.monotonic() - cached[0] < self._schema_cache_ttl:
+            return cached[1]
+
+        if not await self._validate_collection(collection_name):
+            raise CollectionNotFoundError(f"Collection: {collection_name} does not exist")
+
+        collection_schema = await asyncio.to_thread(self._client.describe_collection, collection_name)
+        fields = [field.get("name") for field in collection_schema.get("fields", [])]
+
+        if self._schema_cache_ttl > 0:
+            self._schema_cache[collection_name] = (time.monotonic(), fields)
+
+        return fields
 
     async def search(self, query: str, **kwargs):
         return await self._search_func(query=query, **kwargs)
@@ -108,31 +170,40 @@ class MilvusRetriever(AIQRetriever):
                      collection_name,
                      top_k)
 
-        if not self._validate_collection(collection_name):
-            raise CollectionNotFoundError(f"Collection: {collection_name} does not exist")
+        available_fields = await self._get_collection_fields(collection_name)
 
         # If no output fields are specified, return all of them
         if not output_fields:
-            collection_schema = self._client.describe_collection(collection_name)
-            output_fields = [
-                field["name"] for field in collection_schema.get("fields") if field["name"] != vector_field_name
-            ]
-
-        search_vector = self._embedder.embed_query(query)
-
-        search_iterator = self._client.search_iterator(
-            collection_name=collection_name,
-            data=[search_vector],
-            batch_size=kwargs.get("batch_size", 1000),
-            filter=filters,
-            limit=top_k,
-            output_fields=output_fields,
-            search_params=search_params if search_params else {"metric_type": "L2"},
-            timeout=timeout,
-            anns_field=vector_field_name,
-            round_decimal=kwargs.get("round_decimal", -1),
-            partition_names=kwargs.get("partition_names", None),
-        )
+            output_fields = [field for field in available_fields if field != vector_field_name]
+
+        search_vector = await self._embedder.aembed_query(query)
+
+        try:
+            # The iterator makes a blocking round trip per page, so it is consumed entirely off the event loop
+            results = await asyncio.to_thread(
+                self._iterate_search,
+                distance_cutoff=distance_cutoff,
+                collection_name=collection_name,
+                data=[search_vector],
+                batch_size=kwargs.get("batch_size", 1000),
+                filter=filters,
+                limit=top_k,
+                output_fields=output_fields,
+                search_params=search_params if search_params else {"metric_type": "L2"},
+                timeout=timeout,
+                anns_field=vector_field_name,
+                round_decimal=kwargs.get("round_decimal", -1),
+                partition_names=kwargs.get("partition_names", None),
+            )
+
+            return _wrap_milvus_results(results, content_field=self.content_field)
+
+        except Exception as e:
+            logger.exception("Exception when retrieving results from milvus for query %s: %s", query, e)
+            raise RetrieverError(f"Error when retrieving documents from {collection_name} for query '{query}'") from e
+
+    def _iterate_search(self, distance_cutoff: float | None, **search_kwargs) -> list[Hit]:
+        search_iterator = self._client.search_iterator(**search_kwargs)
 
         results = []
         try:
@@ -140,7 +211,6 @@ class MilvusRetriever(AIQRetriever):
                 _res = search_iterator.next()
                 res = _res.get_res()
                 if len(_res) == 0:
-                    search_iterator.close()
                     break
 
                 if distance_cutoff and res[0][-1].distance > distance_cutoff:
@@ -150,12 +220,10 @@ class MilvusRetriever(AIQRetriever):
                         results.append(res[0][i])
                     break
                 results.extend(res[0])
+        finally:
+            search_iterator.close()
 
-                return _wrap_milvus_results(results, content_field=self.content_field)
-
-        except Exception as e:
-            logger.exception("Exception when retrieving results from milvus for query %s: %s", query, e)
-            raise RetrieverError(f"Error when retrieving documents from {collection_name} for query '{query}'") from e
+        return results
 
     async def _search(self,
                       query: str,
@@ -176,10 +244,7 @@ class MilvusRetriever(AIQRetriever):
                      collection_name,
                      top_k)
 
-        if not self._validate_collection(collection_name):
-            raise CollectionNotFoundError(f"Collection: {collection_name} does not exist")
-
-        available_fields = [v.get("name") for v in self._client.describe_collection(collection_name).get("fields", {})]
+        available_fields = await self._get_collection_fields(collection_name)
 
         if self.content_field not in available_fields:
             raise ValueError(f"The specified content field: {self.content_field} is not part of the schema.")
@@ -190,23 +255,93 @@ class MilvusRetriever(AIQRetriever):
         # If no output fields are specified, return all of them
         if not output_fields:
             output_fields = [field for field in available_fields if field != vector_field_name]
+        else:
+            output_fields = list(output_fields)
 
         if self.content_field not in output_fields:
             output_fields.append(self.content_field)
 
-        search_vector = self._embedder.embed_query(query)
-        res = self._client.search(
-            collection_name=collection_name,
-            data=[search_vector],
-            filter=filters,
-            output_fields=output_fields,
-            search_params=search_params if search_params else {"metric_type": "L2"},
-            timeout=timeout,
-            anns_field=vector_field_name,
-            limit=top_k,
-        )
-
-        return _wrap_milvus_results(res[0], content_field=self.content_field)
+        if not search_params:
+            search_params = {"metric_type": "L2"}
+
+        search_kwargs = {
+            "collection_name": collection_name,
+            "filter": filters,
+            "output_fields": output_fields,
+            "search_params": search_params,
+            "timeout": timeout,
+            "anns_field": vector_field_name,
+        }
+
+        if self._batch_window > 0:
+            hits = await self._batched_search(query, top_k, search_kwargs)
+        else:
+            search_vector = await self._embedder.aembed_query(query)
+            res = await asyncio.to_thread(self._client.search, data=[search_vector], limit=top_k, **search_kwargs)
+            hits = res[0]
+
+        return _wrap_milvus_results(hits, content_field=self.content_field)
+
+    async def _batched_search(self, query: str, top_k: int, search_kwargs: dict) -> list[Hit | dict]:
+        """
+        Queue a query to be searched together with the other queries sharing the same search parameters.
+        """
+        key = (search_kwargs["collection_name"],
+               search_kwargs["filter"],
+               tuple(search_kwargs["output_fields"]),
+               json.dumps(search_kwargs["search_params"], sort_keys=True, default=str),
+               search_kwargs["timeout"],
+               search_kwargs["anns_field"])
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending_batches.get(key)
+        if batch is None:
+            batch = _PendingBatch(search_kwargs=search_kwargs)
+            batch.handle = loop.call_later(self._batch_window, self._flush_batch, key)
+            self._pending_batches[key] = batch
+
+        batch.requests.append((query, top_k, future))
+
+        if len(batch.requests) >= self._max_batch_size:
+            self._flush_batch(key)
+
+        return await future
+
+    def _flush_batch(self, key: tuple) -> None:
+        batch = self._pending_batches.pop(key, None)
+        if batch is None:
+            return
+
+        if batch.handle is not None:
+            batch.handle.cancel()
+
+        task = asyncio.get_running_loop().create_task(self._execute_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _execute_batch(self, batch: _PendingBatch) -> None:
+        queries = [query for query, _, _ in batch.requests]
+        limit = max(top_k for _, top_k, _ in batch.requests)
+
+        logger.debug("MilvusRetriever searching a batch of %s queries in collection: %s",
+                     len(queries),
+                     batch.search_kwargs["collection_name"])
+
+        try:
+            search_vectors = await self._embedder.aembed_documents(queries)
+            res = await asyncio.to_thread(self._client.search, data=search_vectors, limit=limit, **batch.search_kwargs)
+        except Exception as e:
+            for _, _, future in batch.requests:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        # Results of each query are sorted by distance, so they can be truncated to the requested number
+        for (_, top_k, future), hits in zip(batch.requests, res):
+            if not future.done():
+                future.set_result(list(hits)[:top_k])
 
 
 def _wrap_milvus_results(res: list[Hit], content_field: str):
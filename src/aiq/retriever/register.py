@@ -20,3 +20,4 @@
 # Import any providers which need to be automatically registered here
 import aiq.retriever.milvus.register
 import aiq.retriever.nemo_retriever.register
+import aiq.retriever.semantic_cache.register
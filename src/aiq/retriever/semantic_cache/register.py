@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+from pydantic import Field
+
+from aiq.builder.builder import Builder
+from aiq.builder.builder import LLMFrameworkEnum
+from aiq.builder.retriever import RetrieverProviderInfo
+from aiq.cli.register_workflow import register_retriever_client
+from aiq.cli.register_workflow import register_retriever_provider
+from aiq.data_models.component_ref import RetrieverRef
+from aiq.data_models.retriever import RetrieverBaseConfig
+from aiq.data_models.semantic_cache_mixin import SemanticCacheMixin
+from aiq.utils.semantic_cache import SemanticCache
+
+logger = logging.getLogger(__name__)
+
+# Cache of each configured retriever, shared by all of its clients while the workflow is built
+_caches: dict[int, SemanticCache] = {}
+
+
+class SemanticCacheRetrieverConfig(RetrieverBaseConfig, SemanticCacheMixin, name="semantic_cache_retriever"):
+    """
+    Configuration for a Retriever which caches the search results of another Retriever.
+    """
+    retriever: RetrieverRef = Field(description="Instance name of the retriever whose search results are cached.")
+
+
+@register_retriever_provider(config_type=SemanticCacheRetrieverConfig)
+async def semantic_cache_retriever(retriever_config: SemanticCacheRetrieverConfig, builder: Builder):
+    embedder = None
+    if retriever_config.embedder is not None:
+        embedder = await builder.get_embedder(retriever_config.embedder, wrapper_type=LLMFrameworkEnum.LANGCHAIN)
+
+    cache = SemanticCache(f"retriever {retriever_config.retriever}",
+                          ttl=retriever_config.ttl_seconds,
+                          max_entries=retriever_config.max_entries,
+                          normalize_queries=retriever_config.normalize_queries,
+                          similarity_threshold=retriever_config.similarity_threshold,
+                          embedder=embedder,
+                          max_embeddings=retriever_config.max_embeddings)
+    _caches[id(retriever_config)] = cache
+
+    try:
+        yield RetrieverProviderInfo(config=retriever_config,
+                                    description="A read-through cache of the search results of another Retriever")
+    finally:
+        _caches.pop(id(retriever_config), None)
+        logger.info("%s", cache.stats())
+
+
+@register_retriever_client(config_type=SemanticCacheRetrieverConfig, wrapper_type=None)
+async def semantic_cache_retriever_client(config: SemanticCacheRetrieverConfig, builder: Builder):
+    from aiq.retriever.semantic_cache.retriever import SemanticCacheRetriever
+
+    retriever = await builder.get_retriever(config.retriever)
+
+    yield SemanticCacheRetriever(retriever, _caches[id(config)])
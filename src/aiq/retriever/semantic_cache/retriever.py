@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+
+from aiq.retriever.interface import AIQRetriever
+from aiq.retriever.models import RetrieverOutput
+from aiq.utils.semantic_cache import SemanticCache
+from aiq.utils.semantic_cache import scope_key
+
+
+class SemanticCacheRetriever(AIQRetriever):
+    """
+    Retriever caching the search results of another retriever.
+    """
+
+    def __init__(self, retriever: AIQRetriever, cache: SemanticCache):
+        """
+        Args:
+            retriever (AIQRetriever): The retriever whose search results are cached.
+            cache (SemanticCache): The cache of the search results, shared by the clients of the same configuration.
+        """
+        self._retriever = retriever
+        self._cache = cache
+
+    @property
+    def cache(self) -> SemanticCache:
+        return self._cache
+
+    async def search(self, query: str, **kwargs) -> RetrieverOutput:
+        search = functools.partial(self._retriever.search, query, **kwargs)
+        return await self._cache.get_or_search(query, search, scope=scope_key(**kwargs))
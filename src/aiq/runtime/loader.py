@@ -17,15 +17,24 @@ from __future__ import annotations
 
 import importlib.metadata
 import logging
+import os
 import time
 from contextlib import asynccontextmanager
 from enum import IntFlag
 from enum import auto
 from functools import reduce
+from importlib.metadata import EntryPoint
+
+from pydantic import ValidationError
 
 from aiq.builder.workflow_builder import WorkflowBuilder
 from aiq.cli.type_registry import GlobalTypeRegistry
 from aiq.data_models.config import AIQConfig
+from aiq.runtime.plugin_manifest import ManifestComponent
+from aiq.runtime.plugin_manifest import ManifestEntryPoint
+from aiq.runtime.plugin_manifest import PluginManifest
+from aiq.runtime.plugin_manifest import collect_type_names
+from aiq.runtime.plugin_manifest import snapshot_registry
 from aiq.runtime.session import AIQSessionManager
 from aiq.utils.data_models.schema_validator import validate_schema
 from aiq.utils.debugging_utils import is_debugger_attached
@@ -34,6 +43,12 @@ from aiq.utils.type_utils import StrPath
 
 logger = logging.getLogger(__name__)
 
+# Components registered by each loaded entry point, keyed by entry point group and name
+_loaded_entry_points: dict[tuple[str, str], list[ManifestComponent]] = {}
+
+# Entry points skipped by lazy plugin loading, loaded when a component is not found in the type registry
+_deferred_entry_points: dict[tuple[str, str], EntryPoint] = {}
+
 
 class PluginTypes(IntFlag):
     COMPONENT = auto()
@@ -67,8 +82,8 @@ class PluginTypes(IntFlag):
 
 def load_config(config_file: StrPath) -> AIQConfig:
     """
-    This is the primary entry point for loading an AIQ Toolkit configuration file. It ensures that all plugins are
-    loaded and then validates the configuration file against the AIQConfig schema.
+    This is the primary entry point for loading an AIQ Toolkit configuration file. It ensures that the plugins used by
+    the configuration file are loaded and then validates the configuration file against the AIQConfig schema.
 
     Parameters
     ----------
@@ -81,13 +96,13 @@ def load_config(config_file: StrPath) -> AIQConfig:
         The validated AIQConfig object
     """
 
-    # Ensure all of the plugins are loaded
-    discover_and_register_plugins(PluginTypes.CONFIG_OBJECT)
-
     config_yaml = yaml_load(config_file)
 
+    # Ensure the plugins used by the configuration are loaded
+    discover_and_register_plugins(PluginTypes.CONFIG_OBJECT, config=config_yaml)
+
     # Validate configuration adheres to AIQ Toolkit schemas
-    validated_aiq_config = validate_schema(config_yaml, AIQConfig)
+    validated_aiq_config = validate_config(config_yaml)
 
     return validated_aiq_config
 
@@ -143,52 +158,222 @@ def discover_entrypoints(plugin_type: PluginTypes):
     return aiq_plugins
 
 
-def discover_and_register_plugins(plugin_type: PluginTypes):
+def _lazy_loading_enabled() -> bool:
+    return os.getenv("AIQ_LAZY_PLUGIN_LOADING", "1").lower() not in ("0", "false", "no", "off")
+
+
+def _load_entry_point(entry_point: EntryPoint, count: int) -> None:
+    """
+    Load a single entry point, recording the components it registers for the plugin manifest.
+    """
+    registry = GlobalTypeRegistry.get()
+    registered_before = snapshot_registry(registry)
+
+    try:
+        logger.debug("Loading module '%s' from entry point '%s'...", entry_point.module, entry_point.name)
+
+        start_time = time.time()
+
+        entry_point.load()
+
+        elapsed_time = (time.time() - start_time) * 1000
+
+        logger.debug("Loading module '%s' from entry point '%s'...Complete (%f ms)",
+                     entry_point.module,
+                     entry_point.name,
+                     elapsed_time)
+
+        # Log a warning if the plugin took a long time to load. This can be useful for debugging slow imports.
+        # The threshold is 300 ms if no plugins have been loaded yet, and 100 ms otherwise. Triple the threshold
+        # if a debugger is attached.
+        if (elapsed_time > (300.0 if count == 0 else 100.0) * (3 if is_debugger_attached() else 1)):
+            logger.warning(
+                "Loading module '%s' from entry point '%s' took a long time (%f ms). "
+                "Ensure all imports are inside your registered functions.",
+                entry_point.module,
+                entry_point.name,
+                elapsed_time)
+
+    except ImportError:
+        logger.warning("Failed to import plugin '%s'", entry_point.name, exc_info=True)
+        # Optionally, you can mark the plugin as unavailable or take other actions
+
+    except Exception:
+        logger.exception("An error occurred while loading plugin '%s': {e}", entry_point.name, exc_info=True)
+
+    finally:
+        # Plugins failing to load are recorded with the components they registered before failing. If a component
+        # they should provide is requested later, the manifest is rebuilt (see `load_deferred_plugins`)
+        registered_after = snapshot_registry(registry)
+        _loaded_entry_points[(entry_point.group, entry_point.name)] = [
+            component for key, component in registered_after.items() if key not in registered_before
+        ]
+
+
+def _load_entry_points(entry_points: list[EntryPoint]) -> None:
+
+    # Pause registration hooks for performance. This is useful when loading a large number of plugins.
+    with GlobalTypeRegistry.get().pause_registration_changed_hooks():
+
+        for count, entry_point in enumerate(entry_points):
+            key = (entry_point.group, entry_point.name)
+
+            _deferred_entry_points.pop(key, None)
+
+            if (key in _loaded_entry_points):
+                continue
+
+            _load_entry_point(entry_point, count)
+
+
+def load_deferred_plugins() -> bool:
+    """
+    Load the plugins which were skipped by lazy plugin loading. This is the fallback used when a component which is not
+    in the plugin manifest is requested, in which case the manifest is removed to be rebuilt on the next start.
+
+    Returns
+    -------
+    bool
+        True if any plugin was loaded
+    """
+
+    if (not _deferred_entry_points):
+        return False
+
+    logger.info("A component was not found in the plugin manifest, loading the %d remaining plugins",
+                len(_deferred_entry_points))
+
+    PluginManifest.invalidate()
+
+    _load_entry_points(list(_deferred_entry_points.values()))
+
+    return True
+
+
+def _save_manifest(all_entry_points: list[EntryPoint], fingerprint: str | None = None) -> None:
+    """
+    Write the plugin manifest from the components recorded when loading the entry points, if every entry point was
+    loaded and the current manifest is out of date.
+    """
+
+    if (not all((entry_point.group, entry_point.name) in _loaded_entry_points for entry_point in all_entry_points)):
+        return
+
+    if (fingerprint is None):
+        fingerprint = PluginManifest.fingerprint_entry_points(all_entry_points)
+
+        if (PluginManifest.load(fingerprint) is not None):
+            return
+
+    PluginManifest(fingerprint=fingerprint,
+                   entry_points=[
+                       ManifestEntryPoint(group=entry_point.group,
+                                          name=entry_point.name,
+                                          value=entry_point.value,
+                                          components=_loaded_entry_points[(entry_point.group, entry_point.name)])
+                       for entry_point in all_entry_points
+                   ]).save()
+
+
+def discover_and_register_plugins(plugin_type: PluginTypes, config: dict | None = None):
     """
     Discover all the requested plugin types which were registered via an entry point group and register them into the
     GlobalTypeRegistry.
+
+    When a configuration dictionary is provided, only the plugins registering the components it references are loaded,
+    as listed by the plugin manifest. The other plugins are loaded on demand, when a component is not found in the type
+    registry. The manifest is rebuilt by loading every plugin whenever the installed plugins change. Set the
+    `AIQ_LAZY_PLUGIN_LOADING` environment variable to `0` to always load every plugin.
     """
 
     # Get the entry points for the specified groups
     aiq_plugins = discover_entrypoints(plugin_type)
 
-    count = 0
+    if (not _lazy_loading_enabled()):
+        _load_entry_points(aiq_plugins)
+        return
 
-    # Pause registration hooks for performance. This is useful when loading a large number of plugins.
-    with GlobalTypeRegistry.get().pause_registration_changed_hooks():
+    if (config is None):
+        _load_entry_points(aiq_plugins)
+
+        if (plugin_type == PluginTypes.ALL):
+            _save_manifest(aiq_plugins)
+
+        return
+
+    all_plugins = discover_entrypoints(PluginTypes.ALL)
+    fingerprint = PluginManifest.fingerprint_entry_points(all_plugins)
+
+    manifest = PluginManifest.load(fingerprint)
+
+    if (manifest is None):
+        # Loading every plugin builds the manifest for the next start
+        logger.debug("Building the plugin manifest")
+        _load_entry_points(all_plugins)
+        _save_manifest(all_plugins, fingerprint)
+        return
+
+    selected = manifest.select_entry_points(collect_type_names(config))
+
+    required_plugins = []
+    for entry_point in aiq_plugins:
+        key = (entry_point.group, entry_point.name)
 
-        for entry_point in aiq_plugins:
-            try:
-                logger.debug("Loading module '%s' from entry point '%s'...", entry_point.module, entry_point.name)
+        if (key in selected):
+            required_plugins.append(entry_point)
+        elif (key not in _loaded_entry_points):
+            _deferred_entry_points[key] = entry_point
 
-                start_time = time.time()
+    if (_deferred_entry_points):
+        GlobalTypeRegistry.get().set_missing_registration_hook(load_deferred_plugins)
 
-                entry_point.load()
+    logger.debug("Loading %d of %d plugins from the plugin manifest", len(required_plugins), len(aiq_plugins))
 
-                elapsed_time = (time.time() - start_time) * 1000
+    _load_entry_points(required_plugins)
 
-                logger.debug("Loading module '%s' from entry point '%s'...Complete (%f ms)",
-                             entry_point.module,
-                             entry_point.name,
-                             elapsed_time)
+    # Record the components of lazily loaded plugins from the manifest, so that a rebuilt manifest stays complete
+    for entry_point in required_plugins:
+        manifest_entry_point = manifest.get_entry_point(entry_point.group, entry_point.name)
+        if (manifest_entry_point is not None):
+            _loaded_entry_points.setdefault((entry_point.group, entry_point.name), manifest_entry_point.components)
 
-                # Log a warning if the plugin took a long time to load. This can be useful for debugging slow imports.
-                # The threshold is 300 ms if no plugins have been loaded yet, and 100 ms otherwise. Triple the threshold
-                # if a debugger is attached.
-                if (elapsed_time > (300.0 if count == 0 else 100.0) * (3 if is_debugger_attached() else 1)):
-                    logger.warning(
-                        "Loading module '%s' from entry point '%s' took a long time (%f ms). "
-                        "Ensure all imports are inside your registered functions.",
-                        entry_point.module,
-                        entry_point.name,
-                        elapsed_time)
 
-            except ImportError:
-                logger.warning("Failed to import plugin '%s'", entry_point.name, exc_info=True)
-                # Optionally, you can mark the plugin as unavailable or take other actions
+def load_plugin_manifest() -> PluginManifest | None:
+    """
+    Load the plugin manifest of the installed plugins, without loading any plugin.
+
+    Returns
+    -------
+    PluginManifest | None
+        The manifest, or None if lazy plugin loading is disabled or the manifest is missing or out of date
+    """
+
+    if (not _lazy_loading_enabled()):
+        return None
+
+    return PluginManifest.load(PluginManifest.fingerprint_entry_points(discover_entrypoints(PluginTypes.ALL)))
+
+
+def validate_config(config_dict: dict) -> AIQConfig:
+    """
+    Validate a configuration dictionary against the AIQConfig schema. If plugins were deferred by lazy plugin loading
+    and the validation fails, they are loaded and the validation is retried.
+
+    Parameters
+    ----------
+    config_dict : dict
+        The configuration dictionary
+
+    Returns
+    -------
+    AIQConfig
+        The validated AIQConfig object
+    """
 
-            except Exception:
-                logger.exception("An error occurred while loading plugin '%s': {e}", entry_point.name, exc_info=True)
+    if (_deferred_entry_points):
+        try:
+            return AIQConfig(**config_dict)
+        except ValidationError:
+            load_deferred_plugins()
 
-            finally:
-                count += 1
+    return validate_schema(config_dict, AIQConfig)
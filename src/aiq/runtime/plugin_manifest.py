@@ -0,0 +1,279 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import logging
+import os
+import sys
+import tempfile
+import typing
+from collections.abc import Iterable
+from importlib.metadata import EntryPoint
+from pathlib import Path
+
+from platformdirs import user_cache_dir
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import ValidationError
+
+from aiq.cli.type_registry import TypeRegistry
+from aiq.data_models.component import AIQComponentEnum
+from aiq.data_models.discovery_metadata import DiscoveryMetadata
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST_VERSION = 1
+
+# Components which are not referenced by `_type` in a configuration file, but looked up by config type and framework
+_CLIENT_COMPONENT_TYPES = frozenset(
+    (AIQComponentEnum.LLM_CLIENT, AIQComponentEnum.EMBEDDER_CLIENT, AIQComponentEnum.RETRIEVER_CLIENT))
+
+_IGNORED_COMPONENT_TYPES = frozenset((AIQComponentEnum.PACKAGE, AIQComponentEnum.UNDEFINED))
+
+ComponentKey = tuple[AIQComponentEnum, str, str | None]
+
+
+class ManifestComponent(BaseModel):
+    """
+    A component registered by a plugin.
+
+    Args:
+        component_type (AIQComponentEnum): The type of the component.
+        full_type (str): The full type (`module_name/local_name`) of the component config. Empty for tool wrappers.
+        framework (str | None): The LLM framework of clients and tool wrappers.
+        framework_wrappers (list[str]): The LLM frameworks a function is wrapped with.
+        discovery_metadata (DiscoveryMetadata): The discovery metadata of the component.
+    """
+
+    component_type: AIQComponentEnum
+    full_type: str = ""
+    framework: str | None = None
+    framework_wrappers: list[str] = Field(default_factory=list)
+    discovery_metadata: DiscoveryMetadata = DiscoveryMetadata()
+
+    @property
+    def local_name(self) -> str:
+        return self.full_type.split("/")[-1]
+
+    @property
+    def is_config_component(self) -> bool:
+        """Whether the component can be referenced by `_type` in a configuration file."""
+        return (self.component_type not in _CLIENT_COMPONENT_TYPES
+                and self.component_type != AIQComponentEnum.TOOL_WRAPPER)
+
+
+class ManifestEntryPoint(BaseModel):
+    """
+    An entry point of a plugin and the components registered when it is loaded.
+    """
+
+    group: str
+    name: str
+    value: str
+    components: list[ManifestComponent] = Field(default_factory=list)
+
+
+class PluginManifest(BaseModel):
+    """
+    Components registered by every installed plugin, persisted so that only the plugins referenced by a configuration
+    file need to be imported. The manifest is only valid for the set of installed entry points it was built from.
+    """
+
+    version: int = _MANIFEST_VERSION
+    fingerprint: str
+    entry_points: list[ManifestEntryPoint]
+
+    @staticmethod
+    def path() -> Path:
+        """
+        Location of the manifest of the running Python environment. The cache directory can be set with the
+        `AIQ_CACHE_DIR` environment variable.
+        """
+        cache_directory = os.getenv("AIQ_CACHE_DIR", user_cache_dir(appname="aiq"))
+        environment = hashlib.sha256(sys.prefix.encode("utf-8")).hexdigest()[:16]
+
+        return Path(cache_directory) / f"plugin_manifest_{environment}.json"
+
+    @staticmethod
+    def fingerprint_entry_points(entry_points: Iterable[EntryPoint]) -> str:
+        """
+        Fingerprint of the installed entry points, which changes whenever a plugin distribution is installed, removed,
+        upgraded or changes its entry points.
+        """
+        digest = hashlib.sha256()
+
+        for key in sorted((entry_point.group,
+                           entry_point.name,
+                           entry_point.value,
+                           entry_point.dist.name if entry_point.dist is not None else "",
+                           entry_point.dist.version if entry_point.dist is not None else "")
+                          for entry_point in entry_points):
+            digest.update("\0".join(key).encode("utf-8"))
+            digest.update(b"\n")
+
+        return digest.hexdigest()
+
+    @classmethod
+    def load(cls, fingerprint: str) -> "PluginManifest | None":
+        """
+        Load the manifest of the running Python environment, returning None if it does not exist, can not be read or
+        was built for different entry points.
+        """
+        path = cls.path()
+
+        try:
+            manifest = cls.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError, ValueError):
+            logger.debug("Ignoring unreadable plugin manifest '%s'", path, exc_info=True)
+            return None
+
+        if (manifest.version != _MANIFEST_VERSION or manifest.fingerprint != fingerprint):
+            logger.debug("Plugin manifest '%s' is out of date", path)
+            return None
+
+        return manifest
+
+    def save(self) -> None:
+        """
+        Atomically write the manifest of the running Python environment. Failures are logged and ignored, the manifest
+        is only a cache.
+        """
+        path = self.path()
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, delete=False) as f:
+                f.write(self.model_dump_json())
+
+            os.replace(f.name, path)
+        except OSError:
+            logger.debug("Failed to write the plugin manifest '%s'", path, exc_info=True)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Remove the manifest of the running Python environment, forcing it to be rebuilt by the next eager load.
+        """
+        try:
+            cls.path().unlink(missing_ok=True)
+        except OSError:
+            logger.debug("Failed to remove the plugin manifest", exc_info=True)
+
+    def get_entry_point(self, group: str, name: str) -> ManifestEntryPoint | None:
+
+        for entry_point in self.entry_points:
+            if (entry_point.group == group and entry_point.name == name):
+                return entry_point
+
+        return None
+
+    def select_entry_points(self, type_names: Iterable[str]) -> set[tuple[str, str]]:
+        """
+        Select the entry points registering the components referenced by `type_names`, either by full type or local
+        name, along with the clients and tool wrappers those components can be used with.
+
+        Returns:
+            set[tuple[str, str]]: The `(group, name)` of the selected entry points.
+        """
+        type_names = set(type_names)
+
+        selected: set[tuple[str, str]] = set()
+        full_types: set[str] = set()
+        frameworks: set[str] = set()
+
+        for entry_point in self.entry_points:
+            for component in entry_point.components:
+                if (component.is_config_component
+                        and (component.full_type in type_names or component.local_name in type_names)):
+                    selected.add((entry_point.group, entry_point.name))
+                    full_types.add(component.full_type)
+                    frameworks.update(component.framework_wrappers)
+
+        # Clients convert the selected providers to the frameworks of the selected functions, tool wrappers convert the
+        # selected functions
+        for entry_point in self.entry_points:
+            for component in entry_point.components:
+                if (component.component_type in _CLIENT_COMPONENT_TYPES):
+                    if (component.full_type in full_types
+                            and (component.framework is None or component.framework in frameworks)):
+                        selected.add((entry_point.group, entry_point.name))
+                elif (component.component_type == AIQComponentEnum.TOOL_WRAPPER):
+                    if (component.framework in frameworks):
+                        selected.add((entry_point.group, entry_point.name))
+
+        return selected
+
+    def get_discovery_metadata(self, component_type: AIQComponentEnum) -> list[DiscoveryMetadata]:
+        """
+        The discovery metadata of every component of a given type, as `aiq info components` lists them.
+        """
+        return [
+            component.discovery_metadata for entry_point in self.entry_points for component in entry_point.components
+            if component.component_type == component_type
+        ]
+
+
+def snapshot_registry(registry: TypeRegistry) -> dict[ComponentKey, ManifestComponent]:
+    """
+    The components currently registered in a type registry, keyed by component type, full type and framework. The
+    difference between two snapshots gives the components registered by a plugin.
+    """
+    components: dict[ComponentKey, ManifestComponent] = {}
+
+    for component_type in AIQComponentEnum:
+        if (component_type in _IGNORED_COMPONENT_TYPES):
+            continue
+
+        for info in registry.get_infos_by_type(component_type).values():
+            if (component_type == AIQComponentEnum.TOOL_WRAPPER):
+                full_type = ""
+            else:
+                full_type = info.full_type
+
+            framework = getattr(info, "llm_framework", None)
+            key = (component_type, full_type, framework)
+
+            components[key] = ManifestComponent(component_type=component_type,
+                                                full_type=full_type,
+                                                framework=framework,
+                                                framework_wrappers=list(getattr(info, "framework_wrappers", [])),
+                                                discovery_metadata=info.discovery_metadata)
+
+    return components
+
+
+def collect_type_names(config: typing.Any) -> set[str]:
+    """
+    Collect the component types (`_type` or `type` values) referenced anywhere in a configuration dictionary.
+    """
+    type_names: set[str] = set()
+    stack = [config]
+
+    while stack:
+        value = stack.pop()
+
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if (key in ("_type", "type") and isinstance(item, str)):
+                    type_names.add(item)
+                else:
+                    stack.append(item)
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+    return type_names
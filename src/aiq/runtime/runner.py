@@ -20,8 +20,11 @@ from enum import Enum
 from aiq.builder.context import AIQContext
 from aiq.builder.context import AIQContextState
 from aiq.builder.function import Function
+from aiq.data_models.event_stream import EventDeliveryMode
+from aiq.data_models.event_stream import EventStreamConfig
 from aiq.data_models.invocation_node import InvocationNode
 from aiq.observability.exporter_manager import ExporterManager
+from aiq.utils.reactive.buffered_subject import BufferedSubject
 from aiq.utils.reactive.subject import Subject
 
 logger = logging.getLogger(__name__)
@@ -48,7 +51,8 @@ class AIQRunner:
                  input_message: typing.Any,
                  entry_fn: Function,
                  context_state: AIQContextState,
-                 exporter_manager: ExporterManager):
+                 exporter_manager: ExporterManager,
+                 event_stream_config: EventStreamConfig | None = None):
         """
         The AIQRunner class is used to run a workflow. It handles converting input and output data types and running the
         workflow with the specified concurrency.
@@ -63,6 +67,8 @@ class AIQRunner:
             The context state to use
         exporter_manager : ExporterManager
             The exporter manager to use
+        event_stream_config : EventStreamConfig | None
+            How intermediate steps are delivered to subscribers. Defaults to synchronous delivery.
         """
 
         if (entry_fn is None):
@@ -81,6 +87,8 @@ class AIQRunner:
 
         self._exporter_manager = exporter_manager
 
+        self._event_stream_config = event_stream_config or EventStreamConfig()
+
     @property
     def context(self) -> AIQContext:
         return self._context
@@ -88,13 +96,24 @@ class AIQRunner:
     def convert(self, value: typing.Any, to_type: type[_T]) -> _T:
         return self._entry_fn.convert(value, to_type)
 
+    def _create_event_stream(self) -> Subject:
+        config = self._event_stream_config
+
+        if (config.delivery == EventDeliveryMode.ASYNC):
+            return BufferedSubject(buffer_size=config.buffer_size,
+                                   batch_size=config.batch_size,
+                                   overflow_policy=config.overflow_policy,
+                                   sample_rate=config.sample_rate)
+
+        return Subject()
+
     async def __aenter__(self):
 
         # Set the input message on the context
         self._input_message_token = self._context_state.input_message.set(self._input_message)
 
         # Create reactive event stream
-        self._context_state.event_stream.set(Subject())
+        self._context_state.event_stream.set(self._create_event_stream())
         self._context_state.active_function.set(InvocationNode(
             function_name="root",
             function_id="root",
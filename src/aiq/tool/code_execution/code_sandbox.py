@@ -13,14 +13,14 @@
 # limitations under the License.
 
 import abc
+import asyncio
 import json
 import logging
 import textwrap
 from typing import Any
 from urllib.parse import urljoin
 
-import requests
-import requests.adapters
+import httpx
 from pydantic import HttpUrl
 
 from aiq.utils.type_utils import override
@@ -41,35 +41,72 @@ class Sandbox(abc.ABC):
             Can also be specified through NEMO_SKILLS_SSH_SERVER env var.
         ssh_key_path: Optional[str] = None - Path to the ssh key for tunneling.
             Can also be specified through NEMO_SKILLS_SSH_KEY_PATH env var.
+        max_concurrency: int = 64 - Maximum number of requests in flight to the sandbox. Further requests wait for a
+            slot, without holding a connection. Keep-alive connections are pooled up to the same number.
+        connect_timeout: float = 5.0 - Seconds to wait for a connection to the sandbox server.
     """
 
     def __init__(
         self,
         *,
         uri: HttpUrl,
+        max_concurrency: int = 64,
+        connect_timeout: float = 5.0,
     ):
         self.url: str = self._get_execute_url(uri)
-        session = requests.Session()
-        adapter = requests.adapters.HTTPAdapter(pool_maxsize=1500, pool_connections=1500, max_retries=3)
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        self.http_session: requests.Session = session
-
-    def _send_request(self, request: dict[str, Any], timeout_seconds: float) -> dict[str, str]:
-        output = self.http_session.post(
-            url=self.url,
-            data=json.dumps(request),
-            timeout=timeout_seconds,
-            headers={"Content-Type": "application/json"},
-        )
+        self.max_concurrency = max(max_concurrency, 1)
+        self.connect_timeout = connect_timeout
+
+        # The client and the semaphore are bound to the event loop they are created on
+        self._http_client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_http_client(self) -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+
+        if self._http_client is None or self._loop is not loop:
+            limits = httpx.Limits(max_connections=self.max_concurrency,
+                                  max_keepalive_connections=self.max_concurrency,
+                                  keepalive_expiry=60.0)
+            # Connection errors are retried by the transport, as the previous session adapter did
+            self._http_client = httpx.AsyncClient(transport=httpx.AsyncHTTPTransport(retries=3, limits=limits),
+                                                  headers={"Content-Type": "application/json"})
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+
+        return self._http_client, self._semaphore
+
+    async def _send_request(self, request: dict[str, Any], timeout_seconds: float) -> dict[str, str]:
+        http_client, semaphore = self._get_http_client()
+
+        async with semaphore:
+            # Hard deadline on the whole request, the read timeout alone is reset by every chunk received. Cancelling
+            # the request closes its connection and releases the slot.
+            async with asyncio.timeout(timeout_seconds + self.connect_timeout):
+                output = await http_client.post(
+                    url=self.url,
+                    content=json.dumps(request),
+                    timeout=httpx.Timeout(timeout_seconds, connect=self.connect_timeout),
+                )
+
         # retrying 502 errors
         if output.status_code == 502:
-            raise requests.exceptions.Timeout
+            raise httpx.TimeoutException("Bad gateway")
 
         return self._parse_request_output(output)
 
+    async def aclose(self) -> None:
+        """Close the pooled connections to the sandbox server."""
+        if self._http_client is not None:
+            http_client = self._http_client
+            self._http_client = None
+            self._semaphore = None
+            self._loop = None
+            await http_client.aclose()
+
     @abc.abstractmethod
-    def _parse_request_output(self, output: requests.Response) -> dict[str, str]:
+    def _parse_request_output(self, output: httpx.Response) -> dict[str, str]:
         pass
 
     @abc.abstractmethod
@@ -134,23 +171,23 @@ class Sandbox(abc.ABC):
         """).strip()
         request = self._prepare_request(code_to_execute, timeout_seconds)
         try:
-            return self._send_request(request, timeout_seconds)
-        except requests.exceptions.Timeout:
+            return await self._send_request(request, timeout_seconds)
+        except (httpx.TimeoutException, TimeoutError):
             return {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
 
 
 class LocalSandbox(Sandbox):
     """Locally hosted sandbox."""
 
-    def __init__(self, *, uri: HttpUrl):
-        super().__init__(uri=uri)
+    def __init__(self, *, uri: HttpUrl, max_concurrency: int = 64, connect_timeout: float = 5.0):
+        super().__init__(uri=uri, max_concurrency=max_concurrency, connect_timeout=connect_timeout)
 
     @override
     def _get_execute_url(self, uri: HttpUrl) -> str:
         return urljoin(str(uri), "execute")
 
     @override
-    def _parse_request_output(self, output: requests.Response) -> dict[str, str]:
+    def _parse_request_output(self, output: httpx.Response) -> dict[str, str]:
         try:
             output_json = output.json()
             assert isinstance(output_json, dict)
@@ -218,8 +255,8 @@ class LocalSandbox(Sandbox):
         # Our server already handles stdout/stderr capture and error handling
         request = self._prepare_request(actual_code, timeout_seconds, language)
         try:
-            return self._send_request(request, timeout_seconds)
-        except requests.exceptions.Timeout:
+            return await self._send_request(request, timeout_seconds)
+        except (httpx.TimeoutException, TimeoutError):
             return {"process_status": "timeout", "stdout": "", "stderr": "Timed out\n"}
 
 
@@ -231,7 +268,7 @@ class PistonSandbox(Sandbox):
         return urljoin(str(uri), "execute")
 
     @override
-    def _parse_request_output(self, output: requests.Response) -> dict[str, str]:
+    def _parse_request_output(self, output: httpx.Response) -> dict[str, str]:
         output_json = output.json()
         assert isinstance(output_json, dict)
         assert 'run' in output_json
@@ -14,13 +14,17 @@
 
 from __future__ import annotations
 
+import atexit
 import contextlib
 import logging
 import multiprocessing
 import os
+import queue
 import resource
+import threading
 from enum import Enum
 from io import StringIO
+from multiprocessing.connection import Connection
 
 from flask import Flask
 from flask import Request
@@ -33,6 +37,17 @@ app = Flask(__name__)
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)
 
+# Number of warm worker processes executing code, per server process. 0 executes each snippet in a new process
+WORKER_POOL_SIZE = int(os.environ.get("SANDBOX_WORKER_POOL_SIZE", os.cpu_count() or 1))
+# Number of executions after which a worker is replaced by a fresh interpreter
+WORKER_MAX_EXECUTIONS = int(os.environ.get("SANDBOX_WORKER_MAX_EXECUTIONS", "100"))
+# Peak resident memory in MB above which a worker is replaced by a fresh interpreter after its execution
+WORKER_MAX_MEMORY_MB = int(os.environ.get("SANDBOX_WORKER_MAX_MEMORY_MB", "2048"))
+# Modules imported once by the fork server, so that workers start with them already imported
+WORKER_PRELOAD_MODULES = [
+    module for module in os.environ.get("SANDBOX_WORKER_PRELOAD_MODULES", "numpy,pandas,scipy").split(",") if module
+]
+
 
 class CodeExecutionStatus(str, Enum):
     """
@@ -79,7 +94,7 @@ def add_hsts_header(response):
 
 def execute_python(generated_code: str, timeout: float) -> CodeExecutionResult:
     """
-    Execute Python code in a subprocess.
+    Execute Python code in a subprocess, a warm worker of the pool unless the pool is disabled.
 
     Args:
         generated_code: The code to execute
@@ -88,7 +103,17 @@ def execute_python(generated_code: str, timeout: float) -> CodeExecutionResult:
     Returns:
         CodeExecutionResult object containing the execution result
     """
+    worker_pool = get_worker_pool()
+    if worker_pool is not None:
+        return worker_pool.execute(generated_code, timeout)
+
+    return execute_in_new_process(generated_code, timeout)
+
 
+def execute_in_new_process(generated_code: str, timeout: float) -> CodeExecutionResult:
+    """
+    Execute Python code in a new process, started for this snippet only.
+    """
     # running in a separate process to ensure any kind of crashes are properly handled
     queue = multiprocessing.Queue()
     process = multiprocessing.Process(target=execute_code_subprocess, args=(generated_code, queue))
@@ -105,6 +130,15 @@ def execute_python(generated_code: str, timeout: float) -> CodeExecutionResult:
 
 # need to memory-limit to avoid common errors of allocating too much
 # but this has to be done in a subprocess to not crush server itself
+def _set_resource_limits():
+    try:
+        limit = 1024 * 1024 * 1024 * 10  # 10gb - somehow with a smaller limit the server dies when numpy is used
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        resource.setrlimit(resource.RLIMIT_DATA, (limit, limit))
+    except Exception as e:
+        logger.error("Failed to set resource limits, PID: %s, error: %s", os.getpid(), e)
+
+
 def execute_code_subprocess(generated_code: str, queue):
     """
     Execute code in a subprocess.
@@ -115,30 +149,204 @@ def execute_code_subprocess(generated_code: str, queue):
     """
 
     logger.debug("execute_code_subprocess started, PID: %s", os.getpid())
+    _set_resource_limits()
+    queue.put(_execute_code(generated_code))
 
-    try:
-        limit = 1024 * 1024 * 1024 * 10  # 10gb - somehow with a smaller limit the server dies when numpy is used
-        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
-        resource.setrlimit(resource.RLIMIT_DATA, (limit, limit))
-    except Exception as e:
-        logger.error("Failed to set resource limits, PID: %s, error: %s", os.getpid(), e)
 
+def _execute_code(generated_code: str) -> CodeExecutionResult:
     stdout_capture = StringIO()
     stderr_capture = StringIO()
     try:
         with contextlib.redirect_stdout(stdout_capture), contextlib.redirect_stderr(stderr_capture):
             exec(generated_code, {})  # pylint: disable=W0122
         logger.debug("execute_code_subprocess finished, PID: %s", os.getpid())
-        queue.put(CodeExecutionResult(stdout=stdout_capture.getvalue(), stderr=stderr_capture.getvalue()))
+        return CodeExecutionResult(stdout=stdout_capture.getvalue(), stderr=stderr_capture.getvalue())
     except Exception as e:
         import traceback
         with contextlib.redirect_stderr(stderr_capture):
             traceback.print_exc()
         logger.debug("execute_code_subprocess failed, PID: %s, error: %s", os.getpid(), e)
-        queue.put(
-            CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
-                                stdout=stdout_capture.getvalue(),
-                                stderr=stderr_capture.getvalue()))
+        return CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
+                                   stdout=stdout_capture.getvalue(),
+                                   stderr=stderr_capture.getvalue())
+
+
+def worker_main(conn: Connection, max_executions: int, max_memory_mb: int):
+    """
+    Main loop of a pooled worker process, executing the code received on `conn` until it should be recycled.
+
+    Each snippet runs with fresh globals, but modules imported and process-wide changes made by a snippet are seen by
+    the next snippets of the worker, until it is recycled.
+
+    Args:
+        conn: The connection to receive code and send results on
+        max_executions: Number of executions after which the worker exits
+        max_memory_mb: Peak resident memory in MB above which the worker exits
+    """
+    _set_resource_limits()
+    cwd = os.getcwd()
+
+    for executions in range(1, max_executions + 1):
+        try:
+            generated_code = conn.recv()
+        except EOFError:
+            return
+        if generated_code is None:
+            return
+
+        result = _execute_code(generated_code)
+        with contextlib.suppress(OSError):
+            os.chdir(cwd)
+
+        # ru_maxrss is in kilobytes on Linux
+        peak_memory_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        recycle = executions >= max_executions or peak_memory_mb > max_memory_mb
+        conn.send((result, recycle))
+        if recycle:
+            logger.debug("Recycling worker PID %s after %d executions, peak memory %.0f MB",
+                         os.getpid(),
+                         executions,
+                         peak_memory_mb)
+            return
+
+
+class _Worker:
+
+    def __init__(self, context: multiprocessing.context.BaseContext, max_executions: int, max_memory_mb: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=worker_main,
+                                       args=(child_conn, max_executions, max_memory_mb),
+                                       daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        with contextlib.suppress(OSError, ValueError):
+            self.conn.send(None)
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class WorkerPool:
+    """
+    Pool of pre-forked worker processes executing code, avoiding the start of a new interpreter for each snippet.
+
+    Workers are forked from a fork server which has already imported the preloaded modules. A worker is replaced by a
+    fresh one after `max_executions` executions, when its peak memory exceeds `max_memory_mb`, when it times out or
+    when it crashes. Replacements are started in the background so that requests do not wait for them.
+    """
+
+    def __init__(self, size: int, max_executions: int, max_memory_mb: int, preload_modules: list[str]):
+        self._context = multiprocessing.get_context("forkserver")
+        self._context.set_forkserver_preload(preload_modules)
+        self._max_executions = max(max_executions, 1)
+        self._max_memory_mb = max_memory_mb
+        self._idle: queue.SimpleQueue[_Worker] = queue.SimpleQueue()
+        self._closed = False
+        # Number of replacements which failed to start, retried when no worker is available
+        self._failed_starts = 0
+        self._lock = threading.Lock()
+
+        for _ in range(size):
+            self._idle.put(self._start_worker())
+
+    def _start_worker(self) -> _Worker:
+        return _Worker(self._context, self._max_executions, self._max_memory_mb)
+
+    def _replace_worker(self):
+        if self._closed:
+            return
+
+        def _start():
+            try:
+                self._idle.put(self._start_worker())
+            except Exception as e:
+                logger.error("Failed to start a sandbox worker: %s", e)
+                with self._lock:
+                    self._failed_starts += 1
+
+        threading.Thread(target=_start, daemon=True).start()
+
+    def _retry_failed_starts(self):
+        with self._lock:
+            failed_starts, self._failed_starts = self._failed_starts, 0
+
+        for _ in range(failed_starts):
+            self._replace_worker()
+
+    def execute(self, generated_code: str, timeout: float) -> CodeExecutionResult:
+        try:
+            # Waiting longer than the execution timeout for a worker, the snippet runs in a process of its own instead
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            logger.warning("No sandbox worker available after %.1fs, executing the code in a new process", timeout)
+            self._retry_failed_starts()
+            return execute_in_new_process(generated_code, timeout)
+
+        try:
+            worker.conn.send(generated_code)
+            if not worker.conn.poll(timeout):
+                worker.kill()
+                self._replace_worker()
+                return CodeExecutionResult(process_status=CodeExecutionStatus.TIMEOUT, stdout="", stderr="Timed out\n")
+
+            result, recycle = worker.conn.recv()
+        except (EOFError, OSError):
+            # The worker died while executing the code
+            worker.kill()
+            self._replace_worker()
+            return CodeExecutionResult(process_status=CodeExecutionStatus.ERROR,
+                                       stdout="",
+                                       stderr=f"Process exited with code {worker.process.exitcode}\n")
+
+        if recycle:
+            worker.stop()
+            self._replace_worker()
+        else:
+            self._idle.put(worker)
+
+        return result
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                return
+
+
+_worker_pool: WorkerPool | None = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> WorkerPool | None:
+    """
+    Get the worker pool of the server process, created on first use so that each process of a pre-forking server
+    (uWSGI) has its own. Returns None if the pool is disabled.
+    """
+    global _worker_pool  # pylint: disable=global-statement
+
+    if WORKER_POOL_SIZE <= 0:
+        return None
+
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = WorkerPool(WORKER_POOL_SIZE,
+                                      max_executions=WORKER_MAX_EXECUTIONS,
+                                      max_memory_mb=WORKER_MAX_MEMORY_MB,
+                                      preload_modules=WORKER_PRELOAD_MODULES)
+            atexit.register(_worker_pool.close)
+
+    return _worker_pool
 
 
 def do_execute(request: Request) -> CodeExecutionResponse:
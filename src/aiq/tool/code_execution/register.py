@@ -37,6 +37,11 @@ class CodeExecutionToolConfig(FunctionBaseConfig, name="code_execution"):
     sandbox_type: Literal["local", "piston"] = Field(default="local", description="The type of code execution sandbox")
     timeout: float = Field(default=10.0, description="Number of seconds to wait for a code execution request")
     max_output_characters: int = Field(default=1000, description="Maximum number of characters that can be returned")
+    max_concurrency: int = Field(default=64,
+                                 gt=0,
+                                 description="Maximum number of code execution requests in flight to the sandbox, "
+                                 "further requests wait for a slot. Connections are kept alive and reused.")
+    connect_timeout: float = Field(default=5.0, gt=0, description="Number of seconds to wait for a connection")
 
 
 @register_function(config_type=CodeExecutionToolConfig)
@@ -47,7 +52,9 @@ async def code_execution_tool(config: CodeExecutionToolConfig, builder: Builder)
         generated_code: str = Field(description="String containing the code to be executed")
 
     # Create sandbox without working_directory
-    sandbox_kwargs = {"uri": config.uri}
+    sandbox_kwargs = {
+        "uri": config.uri, "max_concurrency": config.max_concurrency, "connect_timeout": config.connect_timeout
+    }
 
     sandbox = get_sandbox(sandbox_type=config.sandbox_type, **sandbox_kwargs)
     logger.info(f"[DEBUG] Created sandbox of type: {config.sandbox_type}")
@@ -66,9 +73,11 @@ async def code_execution_tool(config: CodeExecutionToolConfig, builder: Builder)
             return {"process_status": "error", "stdout": "", "stderr": str(e)}
         return output
 
-    yield FunctionInfo.from_fn(
-        fn=_execute_code,
-        input_schema=CodeExecutionInputSchema,
-        description="""Executes the provied 'generated_code' in a python sandbox environment and returns
+    description = """Executes the provied 'generated_code' in a python sandbox environment and returns
         a dictionary containing stdout, stderr, and the execution status, as well as a session_id. The
-        session_id can be used to append to code that was previously executed.""")
+        session_id can be used to append to code that was previously executed."""
+
+    try:
+        yield FunctionInfo.from_fn(fn=_execute_code, input_schema=CodeExecutionInputSchema, description=description)
+    finally:
+        await sandbox.aclose()
@@ -28,6 +28,7 @@ from pydantic import Field
 from pydantic import create_model
 
 from aiq.tool.mcp.exceptions import MCPToolNotFoundError
+from aiq.tool.mcp.mcp_session_pool import MCPSessionPool
 from aiq.utils.exception_handlers.mcp import mcp_exception_handler
 
 logger = logging.getLogger(__name__)
@@ -111,17 +112,30 @@ class MCPSSEClient:
     """
     Client for creating a session and connecting to an MCP server using SSE
 
+    Requests are sent through the session pool of the server, which is shared by every client of the server in the
+    process, so that they do not pay for a new connection and handshake.
+
     Args:
       url (str): The url of the MCP server
+      pool_options (dict | None): Options of the session pool (see `MCPSessionPool`), only used if the pool of the
+        server does not exist yet
     """
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, pool_options: dict | None = None):
         self.url = url
+        self._pool_options = pool_options or {}
+
+    @property
+    def pool(self) -> MCPSessionPool:
+        """
+        The session pool of the MCP server for the running event loop.
+        """
+        return MCPSessionPool.get(self.url, **self._pool_options)
 
     @asynccontextmanager
     async def connect_to_sse_server(self):
         """
-        Establish a session with an MCP SSE server within an aync context
+        Establish a dedicated session with an MCP SSE server within an aync context, bypassing the session pool
         """
         async with sse_client(url=self.url) as (read, write):
             async with ClientSession(read, write) as session:
@@ -135,10 +149,11 @@ class MCPBuilder(MCPSSEClient):
 
     Args:
         url (str): The url of the MCP server
+        pool_options (dict | None): Options of the session pool of the server
     """
 
-    def __init__(self, url):
-        super().__init__(url)
+    def __init__(self, url, pool_options: dict | None = None):
+        super().__init__(url, pool_options)
         self._tools = None
 
     @mcp_exception_handler
@@ -152,11 +167,15 @@ class MCPBuilder(MCPSSEClient):
         Raises:
             MCPError: If connection or tool retrieval fails
         """
-        async with self.connect_to_sse_server() as session:
-            response = await session.list_tools()
+        response = await self.pool.list_tools()
 
         return {
-            tool.name: MCPToolClient(self.url, tool.name, tool.description, tool_input_schema=tool.inputSchema)
+            tool.name:
+                MCPToolClient(self.url,
+                              tool.name,
+                              tool.description,
+                              tool_input_schema=tool.inputSchema,
+                              pool_options=self._pool_options)
             for tool in response.tools
         }
 
@@ -185,9 +204,7 @@ class MCPBuilder(MCPSSEClient):
 
     @mcp_exception_handler
     async def call_tool(self, tool_name: str, tool_args: dict | None):
-        async with self.connect_to_sse_server() as session:
-            result = await session.call_tool(tool_name, tool_args)
-            return result
+        return await self.pool.call_tool(tool_name, tool_args)
 
 
 class MCPToolClient(MCPSSEClient):
@@ -199,10 +216,16 @@ class MCPToolClient(MCPSSEClient):
         tool_name (str): The name of the tool to wrap
         tool_description (str): The description of the tool provided by the MCP server.
         tool_input_schema (dict): The input schema for the tool.
+        pool_options (dict | None): Options of the session pool of the server
     """
 
-    def __init__(self, url: str, tool_name: str, tool_description: str | None, tool_input_schema: dict | None = None):
-        super().__init__(url)
+    def __init__(self,
+                 url: str,
+                 tool_name: str,
+                 tool_description: str | None,
+                 tool_input_schema: dict | None = None,
+                 pool_options: dict | None = None):
+        super().__init__(url, pool_options)
         self._tool_name = tool_name
         self._tool_description = tool_description
         self._input_schema = model_from_mcp_schema(self._tool_name, tool_input_schema) if tool_input_schema else None
@@ -242,8 +265,7 @@ class MCPToolClient(MCPSSEClient):
         Args:
             tool_args (dict[str, Any]): A dictionary of key value pairs to serve as inputs for the MCP tool.
         """
-        async with self.connect_to_sse_server() as session:
-            result = await session.call_tool(self._tool_name, tool_args)
+        result = await self.pool.call_tool(self._tool_name, tool_args)
 
         output = []
         for res in result.content:
@@ -0,0 +1,373 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import anyio
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+from mcp.types import CallToolResult
+from mcp.types import ListToolsResult
+from mcp.types import ServerNotification
+from mcp.types import ToolListChangedNotification
+
+logger = logging.getLogger(__name__)
+
+# Pools are bound to the event loop their sessions run on, and shared by every client of a server on that loop
+# Errors of the connection to the server, after which the session is closed and a new one is opened
+_TRANSPORT_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError, httpx.TransportError, OSError)
+
+_POOLS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, MCPSessionPool]] = weakref.WeakKeyDictionary()
+
+
+@dataclasses.dataclass
+class MCPPoolMetrics:
+    """
+    Statistics of the session pool of a single MCP server.
+    """
+    url: str
+    open_sessions: int
+    connects: int
+    connection_failures: int
+    health_check_failures: int
+    requests: int
+    request_failures: int
+    in_flight: int
+    waiting: int
+    tool_list_cache_hits: int
+    tool_list_cache_misses: int
+
+
+def _is_session_error(exception: Exception) -> bool:
+    """
+    Whether an error raised by a request means the session is no longer usable: a transport error or a closed
+    connection. Errors returned by the server, raised by a tool or by the caller, such as a timeout, leave the session
+    open.
+    """
+    if isinstance(exception, McpError):
+        return exception.error.code == CONNECTION_CLOSED
+    # TimeoutError is an OSError, but a request timing out says nothing about the connection
+    return isinstance(exception, _TRANSPORT_ERRORS) and not isinstance(exception, TimeoutError)
+
+
+class _PooledSession:
+    """
+    A long-lived session to an MCP server.
+
+    The SSE connection and the MCP session are owned by a background task, since their context managers must be entered
+    and exited from the same task. The task performs the `initialize` handshake, then pings the server periodically
+    until the session is closed or a health check fails. Requests can be sent on the session from any task.
+    """
+
+    def __init__(self, pool: MCPSessionPool):
+        self._pool = pool
+        self.session: ClientSession | None = None
+        self.in_flight = 0
+
+        self._ready = asyncio.Event()
+        self._close_requested = asyncio.Event()
+        self._closed = False
+        self._error: Exception | None = None
+        self._task = asyncio.create_task(self._run(), name=f"mcp-session-{pool.url}")
+
+    @property
+    def closed(self) -> bool:
+        return self._closed or self._close_requested.is_set()
+
+    async def wait_ready(self) -> ClientSession:
+        """
+        Wait for the handshake to complete, raising the connection error if it failed.
+        """
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        if self.session is None or self._closed:
+            raise ConnectionError(f"Session to MCP server at {self._pool.url} is closed")
+        return self.session
+
+    def request_close(self) -> None:
+        self._close_requested.set()
+
+    async def aclose(self) -> None:
+        self.request_close()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        pool = self._pool
+        try:
+            async with sse_client(url=pool.url) as (read, write):
+                async with ClientSession(read, write, message_handler=self._handle_message) as session:
+                    await session.initialize()
+                    self.session = session
+                    pool._on_connect()
+                    self._ready.set()
+                    await self._monitor(session)
+        except Exception as e:
+            if not self._ready.is_set():
+                self._error = e
+                pool._connection_failures += 1
+            else:
+                logger.warning("Session to MCP server at %s was closed: %s", pool.url, e)
+        finally:
+            self._closed = True
+            self._ready.set()
+            pool._discard(self)
+
+    async def _handle_message(self, message: Any) -> None:
+        if isinstance(message, Exception):
+            # Errors of the transport are reported here, the session is replaced on next use
+            logger.warning("Error received from MCP server at %s, closing the session: %s", self._pool.url, message)
+            self.request_close()
+        else:
+            await self._pool._handle_message(message)
+
+    async def _monitor(self, session: ClientSession) -> None:
+        pool = self._pool
+        while True:
+            try:
+                await asyncio.wait_for(self._close_requested.wait(), timeout=pool.health_check_interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                await asyncio.wait_for(session.send_ping(), timeout=pool.health_check_timeout)
+            except Exception as e:
+                pool._health_check_failures += 1
+                logger.warning("Health check of MCP server at %s failed, reconnecting on next use: %r", pool.url, e)
+                return
+
+
+class MCPSessionPool:
+    """
+    Long-lived, reconnecting sessions to a single MCP server, shared by every client of the server in the process.
+
+    Requests are spread over up to `max_sessions` sessions, a new session being opened only when all the open ones have
+    requests in flight, and at most `max_concurrency` requests are in flight at once. Sessions failing a request or a
+    health check are closed and replaced on next use. The tool list is cached until the server sends a
+    `tools/list_changed` notification or the pool reconnects.
+
+    Use `MCPSessionPool.get` to obtain the pool of a server rather than creating one directly.
+    """
+
+    def __init__(self,
+                 url: str,
+                 max_sessions: int = 1,
+                 max_concurrency: int = 16,
+                 health_check_interval: float | None = 30.0,
+                 health_check_timeout: float = 10.0):
+        """
+        Args:
+            url (str): The url of the MCP server.
+            max_sessions (int): Maximum number of sessions opened to the server.
+            max_concurrency (int): Maximum number of requests in flight to the server.
+            health_check_interval (float | None): Seconds between pings of an open session, None to disable them.
+            health_check_timeout (float): Seconds to wait for a ping response before closing the session.
+        """
+        self.url = url
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self._max_sessions = max(max_sessions, 1)
+
+        self._sessions: list[_PooledSession] = []
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+        self._closed = False
+
+        self._tools: ListToolsResult | None = None
+        self._tools_version = 0
+        self._tools_lock = asyncio.Lock()
+
+        self._connects = 0
+        self._disconnected = False
+        self._connection_failures = 0
+        self._health_check_failures = 0
+        self._requests = 0
+        self._request_failures = 0
+        self._waiting = 0
+        self._tool_list_cache_hits = 0
+        self._tool_list_cache_misses = 0
+
+    @classmethod
+    def get(cls, url: str, **kwargs) -> MCPSessionPool:
+        """
+        Get the pool of the MCP server at `url` for the running event loop, creating it if needed. `kwargs` are only
+        used when the pool is created.
+        """
+        loop = asyncio.get_running_loop()
+        pools = _POOLS.setdefault(loop, {})
+
+        pool = pools.get(url)
+        if pool is None or pool._closed:
+            pool = pools[url] = cls(url, **kwargs)
+
+        return pool
+
+    def _on_connect(self) -> None:
+        if self._disconnected:
+            # Reconnecting after a session was lost, the server may have restarted with a different set of tools
+            self._disconnected = False
+            self.invalidate_tools()
+        self._connects += 1
+
+    def _discard(self, pooled: _PooledSession) -> None:
+        if pooled in self._sessions:
+            self._sessions.remove(pooled)
+            # Sessions opened to scale out do not invalidate the tool list, only reconnects after a lost session do
+            self._disconnected = self._disconnected or pooled.session is not None
+
+    async def _handle_message(self, message: Any) -> None:
+        if isinstance(message, ServerNotification) and isinstance(message.root, ToolListChangedNotification):
+            logger.debug("Tool list of MCP server at %s changed", self.url)
+            self.invalidate_tools()
+
+    def invalidate_tools(self) -> None:
+        """
+        Drop the cached tool list, the next call to `list_tools` fetches it from the server.
+        """
+        self._tools = None
+        self._tools_version += 1
+
+    async def _acquire(self) -> _PooledSession:
+        async with self._lock:
+            if self._closed:
+                raise RuntimeError(f"Session pool of MCP server at {self.url} is closed")
+
+            open_sessions = [pooled for pooled in self._sessions if not pooled.closed]
+            pooled = min(open_sessions, key=lambda s: s.in_flight, default=None)
+
+            if pooled is None or (pooled.in_flight > 0 and len(open_sessions) < self._max_sessions):
+                pooled = _PooledSession(self)
+                self._sessions.append(pooled)
+
+        await pooled.wait_ready()
+        return pooled
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[ClientSession]:
+        """
+        Borrow an open session for the duration of a request. Sessions are shared, they must not be closed by the
+        caller.
+        """
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        try:
+            pooled = await self._acquire()
+            pooled.in_flight += 1
+            self._requests += 1
+            try:
+                yield pooled.session
+            except Exception as e:
+                self._request_failures += 1
+                if _is_session_error(e):
+                    pooled.request_close()
+                raise
+            finally:
+                pooled.in_flight -= 1
+        finally:
+            self._semaphore.release()
+
+    async def list_tools(self) -> ListToolsResult:
+        """
+        List the tools served by the server, from the cache when it is valid.
+        """
+        if self._tools is not None:
+            self._tool_list_cache_hits += 1
+            return self._tools
+
+        async with self._tools_lock:
+            if self._tools is not None:
+                self._tool_list_cache_hits += 1
+                return self._tools
+
+            self._tool_list_cache_misses += 1
+            version = self._tools_version
+
+            try:
+                async with self.session() as session:
+                    result = await session.list_tools()
+            except Exception as e:
+                if not _is_session_error(e):
+                    raise
+                # Listing tools is idempotent, retry once on a new session
+                async with self.session() as session:
+                    result = await session.list_tools()
+
+            # Only cache the result if the tool list did not change while it was being fetched
+            if version == self._tools_version:
+                self._tools = result
+
+            return result
+
+    async def call_tool(self, tool_name: str, tool_args: dict | None) -> CallToolResult:
+        """
+        Call a tool of the server. Tool calls are not retried, they may not be idempotent.
+        """
+        async with self.session() as session:
+            return await session.call_tool(tool_name, tool_args)
+
+    def metrics(self) -> MCPPoolMetrics:
+        return MCPPoolMetrics(url=self.url,
+                              open_sessions=sum(1 for pooled in self._sessions if not pooled.closed),
+                              connects=self._connects,
+                              connection_failures=self._connection_failures,
+                              health_check_failures=self._health_check_failures,
+                              requests=self._requests,
+                              request_failures=self._request_failures,
+                              in_flight=sum(pooled.in_flight for pooled in self._sessions),
+                              waiting=self._waiting,
+                              tool_list_cache_hits=self._tool_list_cache_hits,
+                              tool_list_cache_misses=self._tool_list_cache_misses)
+
+    async def aclose(self) -> None:
+        """
+        Close every session of the pool. The pool can not be used afterwards, `MCPSessionPool.get` creates a new one.
+        """
+        async with self._lock:
+            self._closed = True
+            sessions = list(self._sessions)
+
+        await asyncio.gather(*(pooled.aclose() for pooled in sessions))
+
+
+def get_pool_metrics() -> list[MCPPoolMetrics]:
+    """
+    Metrics of the session pools of every MCP server used from the running event loop.
+    """
+    pools = _POOLS.get(asyncio.get_running_loop(), {})
+    return [pool.metrics() for pool in pools.values()]
+
+
+async def close_pools() -> None:
+    """
+    Close the session pools of every MCP server used from the running event loop.
+    """
+    pools = _POOLS.pop(asyncio.get_running_loop(), {})
+    await asyncio.gather(*(pool.aclose() for pool in pools.values()))
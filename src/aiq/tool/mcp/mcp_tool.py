@@ -45,6 +45,12 @@ class MCPToolConfig(FunctionBaseConfig, name="mcp_tool_wrapper"):
         If true, the tool will return the exception message if the tool call fails.
         If false, raise the exception.
         """)
+    max_sessions: int = Field(default=1,
+                              description="Maximum number of sessions opened to the MCP server, shared by every tool "
+                              "of the server in the process.")
+    max_concurrency: int = Field(default=16, description="Maximum number of requests in flight to the MCP server.")
+    health_check_interval: float | None = Field(
+        default=30.0, description="Seconds between health checks of an open session, or None to disable them.")
 
 
 @register_function(config_type=MCPToolConfig)
@@ -56,7 +62,12 @@ async def mcp_tool(config: MCPToolConfig, builder: Builder):  # pylint: disable=
     from aiq.tool.mcp.mcp_client import MCPBuilder
     from aiq.tool.mcp.mcp_client import MCPToolClient
 
-    client = MCPBuilder(url=str(config.url))
+    client = MCPBuilder(url=str(config.url),
+                        pool_options={
+                            "max_sessions": config.max_sessions,
+                            "max_concurrency": config.max_concurrency,
+                            "health_check_interval": config.health_check_interval,
+                        })
 
     tool: MCPToolClient = await client.get_tool(config.mcp_tool_name)
     if config.description:
@@ -90,7 +101,11 @@ async def mcp_tool(config: MCPToolConfig, builder: Builder):  # pylint: disable=
             # If the tool call fails, raise the exception.
             raise
 
-    yield FunctionInfo.create(single_fn=_response_fn,
-                              description=tool.description,
-                              input_schema=tool.input_schema,
-                              converters=[_convert_from_str])
+    try:
+        yield FunctionInfo.create(single_fn=_response_fn,
+                                  description=tool.description,
+                                  input_schema=tool.input_schema,
+                                  converters=[_convert_from_str])
+    finally:
+        # Close the sessions opened to the server from this event loop, the pool is recreated if it is used again
+        await client.pool.aclose()
@@ -13,19 +13,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import contextlib
 import copy
 import functools
 import inspect
 import logging
+import random
 import re
 import time
 import types
 from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import Sequence
+from email.utils import parsedate_to_datetime
 from typing import Any
 from typing import TypeVar
 
+from aiq.utils.exception_handlers.rate_limiter import AdaptiveRateLimiter
+from aiq.utils.exception_handlers.rate_limiter import RateLimitPermit
+from aiq.utils.exception_handlers.rate_limiter import estimate_tokens
+from aiq.utils.exception_handlers.rate_limiter import report_wait
+
 # pylint: disable=inconsistent-return-statements
 
 T = TypeVar("T")
@@ -33,6 +41,10 @@ Exc = tuple[type[BaseException], ...]  # exception classes
 CodePattern = int | str | range  # for retry_codes argument
 logger = logging.getLogger(__name__)
 
+# Methods fanning a call out to several calls of the same client. They do not take a rate limiter permit, each of the
+# calls they make does
+_FAN_OUT_METHODS = {"batch", "abatch", "batch_as_completed", "abatch_as_completed"}
+
 # ──────────────────────────────────────────────────────────────────────────────
 #  Helpers: status-code extraction & pattern matching
 # ──────────────────────────────────────────────────────────────────────────────
@@ -55,6 +67,26 @@ def _extract_status_code(exc: BaseException) -> int | None:
     return None
 
 
+def _extract_retry_after(exc: BaseException) -> float | None:
+    """Return the delay in seconds of a `Retry-After` header of the response attached to *exc*, else None."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or getattr(exc, "headers", None)
+    if not hasattr(headers, "get"):
+        return None
+
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+    try:  # HTTP date
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
 def _pattern_to_regex(pat: str) -> re.Pattern[str]:
     """
     Convert simple wildcard pattern (“4xx”, “5*”, “40x”) to a ^regex$.
@@ -108,6 +140,56 @@ def _want_retry(
     return False
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+#  Backoff & rate-limiter bookkeeping shared by the wrappers
+# ──────────────────────────────────────────────────────────────────────────────
+def _backoff_delay(delay: float, max_delay: float, exc: BaseException) -> float:
+    """
+    Jittered back-off before the next attempt: between half and all of *delay*, so that concurrent callers failing
+    together do not retry in lockstep, and at least the `Retry-After` delay requested by the service.
+    """
+    jittered = delay / 2 + random.uniform(0, delay / 2)
+    retry_after = _extract_retry_after(exc)
+    if retry_after is not None:
+        jittered = max(jittered, retry_after)
+    return min(jittered, max_delay)
+
+
+def _release(permit: RateLimitPermit | None, exc: BaseException | None, retryable: bool = False) -> None:
+    if permit is not None:
+        permit.release(exc,
+                       transient=retryable,
+                       status_code=_extract_status_code(exc) if exc is not None else None,
+                       retry_after=_extract_retry_after(exc) if exc is not None else None)
+
+
+def _backoff_report(limiter: AdaptiveRateLimiter | None, fn: Callable, exc: BaseException, wait: float):
+    """Report the back-off of a client call with a rate limiter to the intermediate step stream."""
+    if limiter is None:
+        return contextlib.nullcontext()
+    metadata = {
+        "function": getattr(fn, "__name__", str(fn)),
+        "status_code": _extract_status_code(exc),
+        "backoff_seconds": round(wait, 3),
+        **limiter.stats().model_dump(),
+    }
+    return report_wait(f"{limiter.name} retry back-off", metadata)
+
+
+def _sync_limiter(limiter: AdaptiveRateLimiter | None) -> AdaptiveRateLimiter | None:
+    """
+    The limiter of a synchronous call. Calls made from an event loop thread are not limited: waiting would block the
+    loop, and they are mostly local helpers (`bind_tools`, ...) rather than requests.
+    """
+    if limiter is None:
+        return None
+    try:
+        asyncio.get_running_loop()
+        return None
+    except RuntimeError:
+        return limiter
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 #  Core decorator factory (sync / async / (a)gen)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -116,85 +198,135 @@ def _retry_decorator(
     retries: int = 3,
     base_delay: float = 0.25,
     backoff: float = 2.0,
+    max_delay: float = 60.0,
     retry_on: Exc = (Exception, ),
     retry_codes: Sequence[CodePattern] | None = None,
     retry_on_messages: Sequence[str] | None = None,
     deepcopy: bool = False,
+    rate_limiter: AdaptiveRateLimiter | None = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
-    Build a decorator that retries with exponential back-off *iff*:
+    Build a decorator that retries with jittered exponential back-off *iff*:
 
       • the raised exception is an instance of one of `retry_on`
       • AND `_want_retry()` returns True (i.e. matches codes/messages filters)
 
     If both `retry_codes` and `retry_on_messages` are None, all exceptions are retried.
+    A `Retry-After` header of the error response extends the back-off, up to `max_delay`.
 
     deepcopy:
         If True, each retry receives deep‑copied *args and **kwargs* to avoid
         mutating shared state between attempts.
+    rate_limiter:
+        If set, each attempt waits for a permit of the limiter and reports its
+        outcome to it (see `AdaptiveRateLimiter`).
     """
 
     def decorate(fn: Callable[..., T]) -> Callable[..., T]:
         use_deepcopy = deepcopy
 
+        def _tokens(args, kw) -> int:
+            return estimate_tokens(args, kw) if rate_limiter.tokens_limited else 0
+
         async def _call_with_retry_async(*args, **kw) -> T:
             delay = base_delay
             for attempt in range(retries):
                 call_args = copy.deepcopy(args) if use_deepcopy else args
                 call_kwargs = copy.deepcopy(kw) if use_deepcopy else kw
+                permit = await rate_limiter.acquire(_tokens(args, kw)) if rate_limiter else None
                 try:
-                    return await fn(*call_args, **call_kwargs)
+                    result = await fn(*call_args, **call_kwargs)
                 except retry_on as exc:
-                    if (not _want_retry(exc, code_patterns=retry_codes, msg_substrings=retry_on_messages)
-                            or attempt == retries - 1):
+                    retryable = _want_retry(exc, code_patterns=retry_codes, msg_substrings=retry_on_messages)
+                    _release(permit, exc, retryable)
+                    if not retryable or attempt == retries - 1:
                         raise
-                    await asyncio.sleep(delay)
+                    wait = _backoff_delay(delay, max_delay, exc)
+                    with _backoff_report(rate_limiter, fn, exc, wait):
+                        await asyncio.sleep(wait)
                     delay *= backoff
+                    continue
+                except BaseException as exc:
+                    _release(permit, exc)
+                    raise
+                _release(permit, None)
+                return result
 
         async def _agen_with_retry(*args, **kw):
             delay = base_delay
             for attempt in range(retries):
                 call_args = copy.deepcopy(args) if use_deepcopy else args
                 call_kwargs = copy.deepcopy(kw) if use_deepcopy else kw
+                # The permit is held for the whole stream
+                permit = await rate_limiter.acquire(_tokens(args, kw)) if rate_limiter else None
                 try:
                     async for item in fn(*call_args, **call_kwargs):
                         yield item
-                    return
                 except retry_on as exc:
-                    if (not _want_retry(exc, code_patterns=retry_codes, msg_substrings=retry_on_messages)
-                            or attempt == retries - 1):
+                    retryable = _want_retry(exc, code_patterns=retry_codes, msg_substrings=retry_on_messages)
+                    _release(permit, exc, retryable)
+                    if not retryable or attempt == retries - 1:
                         raise
-                    await asyncio.sleep(delay)
+                    wait = _backoff_delay(delay, max_delay, exc)
+                    with _backoff_report(rate_limiter, fn, exc, wait):
+                        await asyncio.sleep(wait)
                     delay *= backoff
+                    continue
+                except BaseException as exc:
+                    _release(permit, exc)
+                    raise
+                _release(permit, None)
+                return
 
         def _gen_with_retry(*args, **kw) -> Iterable[Any]:
             delay = base_delay
+            limiter = _sync_limiter(rate_limiter)
             for attempt in range(retries):
                 call_args = copy.deepcopy(args) if use_deepcopy else args
                 call_kwargs = copy.deepcopy(kw) if use_deepcopy else kw
+                permit = limiter.acquire_sync(_tokens(args, kw)) if limiter else None
                 try:
                     yield from fn(*call_args, **call_kwargs)
-                    return
                 except retry_on as exc:
-                    if (not _want_retry(exc, code_patterns=retry_codes, msg_substrings=retry_on_messages)
-                            or attempt == retries - 1):
+                    retryable = _want_retry(exc, code_patterns=retry_codes, msg_substrings=retry_on_messages)
+                    _release(permit, exc, retryable)
+                    if not retryable or attempt == retries - 1:
                         raise
-                    time.sleep(delay)
+                    wait = _backoff_delay(delay, max_delay, exc)
+                    with _backoff_report(limiter, fn, exc, wait):
+                        time.sleep(wait)
                     delay *= backoff
+                    continue
+                except BaseException as exc:
+                    _release(permit, exc)
+                    raise
+                _release(permit, None)
+                return
 
         def _sync_with_retry(*args, **kw) -> T:
             delay = base_delay
+            limiter = _sync_limiter(rate_limiter)
             for attempt in range(retries):
                 call_args = copy.deepcopy(args) if use_deepcopy else args
                 call_kwargs = copy.deepcopy(kw) if use_deepcopy else kw
+                permit = limiter.acquire_sync(_tokens(args, kw)) if limiter else None
                 try:
-                    return fn(*call_args, **call_kwargs)
+                    result = fn(*call_args, **call_kwargs)
                 except retry_on as exc:
-                    if (not _want_retry(exc, code_patterns=retry_codes, msg_substrings=retry_on_messages)
-                            or attempt == retries - 1):
+                    retryable = _want_retry(exc, code_patterns=retry_codes, msg_substrings=retry_on_messages)
+                    _release(permit, exc, retryable)
+                    if not retryable or attempt == retries - 1:
                         raise
-                    time.sleep(delay)
+                    wait = _backoff_delay(delay, max_delay, exc)
+                    with _backoff_report(limiter, fn, exc, wait):
+                        time.sleep(wait)
                     delay *= backoff
+                    continue
+                except BaseException as exc:
+                    _release(permit, exc)
+                    raise
+                _release(permit, None)
+                return result
 
         # Decide which wrapper to return
         if inspect.iscoroutinefunction(fn):
@@ -224,6 +356,7 @@ def patch_with_retry(
     retry_codes: Sequence[CodePattern] | None = None,
     retry_on_messages: Sequence[str] | None = None,
     deepcopy: bool = False,
+    rate_limiter: AdaptiveRateLimiter | None = None,
 ) -> Any:
     """
     Patch *obj* instance-locally so **every public method** retries on failure.
@@ -238,8 +371,13 @@ def patch_with_retry(
     deepcopy:
         If True, each retry receives deep‑copied *args and **kwargs* to avoid
         mutating shared state between attempts.
+    rate_limiter:
+        Limiter shared by every client of the same configuration, see
+        `get_rate_limiter`. Batch methods are not limited, the calls they
+        make are.
     """
-    deco = _retry_decorator(
+    make_decorator = functools.partial(
+        _retry_decorator,
         retries=retries,
         base_delay=base_delay,
         backoff=backoff,
@@ -248,6 +386,8 @@ def patch_with_retry(
         retry_on_messages=retry_on_messages,
         deepcopy=deepcopy,
     )
+    deco = make_decorator(rate_limiter=rate_limiter)
+    fan_out_deco = make_decorator()
 
     # Choose attribute source: the *class* to avoid triggering __getattr__
     cls = obj if inspect.isclass(obj) else type(obj)
@@ -261,7 +401,7 @@ def patch_with_retry(
             continue
 
         original = descriptor.__func__ if isinstance(descriptor, types.MethodType) else descriptor
-        wrapped = deco(original)
+        wrapped = fan_out_deco(original) if name in _FAN_OUT_METHODS else deco(original)
 
         try:  # instance‑level first
             if not inspect.isclass(obj):
@@ -0,0 +1,511 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import contextvars
+import logging
+import math
+import threading
+import time
+import typing
+import weakref
+from collections import deque
+from collections.abc import Iterator
+
+from pydantic import BaseModel
+
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import TraceMetadata
+
+if typing.TYPE_CHECKING:
+    from aiq.data_models.retry_mixin import RetryMixin
+
+logger = logging.getLogger(__name__)
+
+# Status codes of the responses telling the client to slow down, which halve the concurrency limit
+_THROTTLE_CODES = {429, 503}
+
+# Bursts above the configured rates are allowed up to this many seconds of budget
+_BURST_SECONDS = 10.0
+
+# Approximate number of characters per token, used to estimate the tokens of a request before sending it
+_CHARS_PER_TOKEN = 4
+
+# Ids of the limiters whose permit is held by the current call. Nested calls, including the calls of the tasks and
+# threads it creates, which inherit the context, send their requests under that permit: waiting for another one could
+# deadlock once the concurrency limit is reached
+_held_limiters: contextvars.ContextVar[frozenset[int]] = contextvars.ContextVar("held_rate_limiters",
+                                                                                default=frozenset())
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a client whose circuit breaker is open."""
+
+
+class RateLimiterStats(BaseModel):
+    """
+    State and counters of an adaptive rate limiter.
+    """
+    name: str
+    in_flight: int = 0
+    queue_depth: int = 0
+    # None while the concurrency is not limited
+    concurrency_limit: float | None = None
+    throttled: int = 0
+    failures: int = 0
+    rejected: int = 0
+    circuit_state: typing.Literal["closed", "open", "half_open"] = "closed"
+
+
+class _TokenBucket:
+    """
+    Token bucket which lets callers go into debt: a reservation is always granted, with the time to wait until the
+    bucket is back to zero, so that concurrent callers are paced in arrival order.
+    """
+
+    def __init__(self, per_minute: float):
+        self._rate = per_minute / 60.0
+        self._capacity = max(self._rate * _BURST_SECONDS, 1.0)
+        self._level = self._capacity
+        self._updated = time.monotonic()
+
+    def reserve(self, cost: float, now: float) -> float:
+        self._level = min(self._capacity, self._level + (now - self._updated) * self._rate)
+        self._updated = now
+        self._level -= cost
+        return max(-self._level / self._rate, 0.0)
+
+
+class _Waiter:
+    """A caller waiting for a concurrency slot, from a thread or from an event loop."""
+
+    def __init__(self, limiter: "AdaptiveRateLimiter", loop: asyncio.AbstractEventLoop | None):
+        self._limiter = limiter
+        self._loop = loop
+        self.event = threading.Event() if loop is None else None
+        self.future = loop.create_future() if loop is not None else None
+
+    def grant(self) -> None:
+        if self._loop is None:
+            self.event.set()
+        else:
+            self._loop.call_soon_threadsafe(self._grant_future)
+
+    def _grant_future(self) -> None:
+        if self.future.done():
+            # Cancelled while the slot was being granted, it goes to the next waiter
+            self._limiter._release_slot()
+        else:
+            self.future.set_result(None)
+
+
+class RateLimitPermit:
+    """
+    Permission to send one request through a rate limiter. Releasing it reports the outcome of the request, which
+    adapts the concurrency limit and drives the circuit breaker.
+    """
+
+    def __init__(self, limiter: "AdaptiveRateLimiter | None", probe: bool = False):
+        self._limiter = limiter
+        self._probe = probe
+        self._sent_at = time.monotonic()
+        self._token: contextvars.Token | None = None
+        if limiter is not None:
+            self._token = _held_limiters.set(_held_limiters.get() | {id(limiter)})
+
+    def release(self,
+                error: BaseException | None = None,
+                *,
+                transient: bool = False,
+                status_code: int | None = None,
+                retry_after: float | None = None) -> None:
+        """
+        Args:
+            error (BaseException | None): The error raised by the request, None if it succeeded.
+            transient (bool): Whether the error is one the request is retried on.
+            status_code (int | None): The status code of the error response.
+            retry_after (float | None): The delay in seconds requested by the `Retry-After` header of the response.
+        """
+        limiter, self._limiter = self._limiter, None
+        if limiter is None:
+            return
+
+        if self._token is not None:
+            with contextlib.suppress(ValueError):
+                # Released from another context, as when an async generator is closed by the garbage collector
+                _held_limiters.reset(self._token)
+
+        limiter._record(error,
+                        transient=transient,
+                        status_code=status_code,
+                        retry_after=retry_after,
+                        probe=self._probe,
+                        sent_at=self._sent_at)
+        limiter._release_slot()
+
+
+class AdaptiveRateLimiter:
+    """
+    Limits the requests sent by every client built from the same LLM, embedder or memory configuration, across
+    frameworks, workflows and concurrent calls:
+
+    * token buckets pace the requests and the estimated input tokens per minute;
+    * the number of concurrent requests follows an AIMD (additive increase, multiplicative decrease) policy: it is
+      halved when the service responds 429 or 503, and grows by one every `limit` successful requests, up to
+      `max_concurrency`. Without a maximum, the concurrency is unlimited until the first throttled response;
+    * a `Retry-After` delay pauses every caller, not only the one that received it;
+    * a circuit breaker opens after `circuit_breaker_threshold` consecutive failures, failing calls fast with
+      `CircuitOpenError` for `circuit_breaker_reset_timeout` seconds before letting a single probe request through.
+
+    The limiter is thread-safe, callers wait without blocking their event loop.
+    """
+
+    def __init__(self,
+                 name: str,
+                 *,
+                 requests_per_minute: float | None = None,
+                 tokens_per_minute: float | None = None,
+                 max_concurrency: int | None = None,
+                 min_concurrency: int = 1,
+                 adaptive_concurrency: bool = False,
+                 circuit_breaker_threshold: int | None = None,
+                 circuit_breaker_reset_timeout: float = 30.0):
+        self.name = name
+        self._request_bucket = _TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._token_bucket = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._max_concurrency = max_concurrency or math.inf
+        self._min_concurrency = max(min_concurrency, 1)
+        self._adaptive = adaptive_concurrency
+        self._breaker_threshold = circuit_breaker_threshold
+        self._breaker_reset_timeout = circuit_breaker_reset_timeout
+
+        self._lock = threading.Lock()
+        self._limit: float = self._max_concurrency
+        self._in_flight = 0
+        self._waiters: deque[_Waiter] = deque()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+
+        self._stats = RateLimiterStats(name=name)
+
+    @property
+    def tokens_limited(self) -> bool:
+        return self._token_bucket is not None
+
+    def stats(self) -> RateLimiterStats:
+        with self._lock:
+            return self._stats.model_copy(
+                update={
+                    "in_flight": self._in_flight,
+                    "queue_depth": len(self._waiters),
+                    "concurrency_limit": None if math.isinf(self._limit) else round(self._limit, 2),
+                    "circuit_state": self._circuit_state(time.monotonic()),
+                })
+
+    def _circuit_state(self, now: float) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if now < self._opened_at + self._breaker_reset_timeout:
+            return "open"
+        return "half_open"
+
+    def _check_circuit(self) -> bool:
+        """
+        Returns:
+            bool: Whether the call is the probe of a half-open circuit.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe in flight.
+        """
+        with self._lock:
+            state = self._circuit_state(time.monotonic())
+            if state == "closed":
+                return False
+            if state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self._stats.rejected += 1
+
+        raise CircuitOpenError(f"The circuit breaker of {self.name} is open after {self._consecutive_failures} "
+                               "consecutive failures")
+
+    def _reserve(self, tokens: int) -> float:
+        """Reserve the request and its tokens, returning the time to wait before sending it."""
+        now = time.monotonic()
+        with self._lock:
+            delay = max(self._paused_until - now, 0.0)
+            if self._request_bucket is not None:
+                delay = max(delay, self._request_bucket.reserve(1, now))
+            if self._token_bucket is not None and tokens:
+                delay = max(delay, self._token_bucket.reserve(tokens, now))
+            return delay
+
+    def _take_slot_or_wait(self, loop: asyncio.AbstractEventLoop | None) -> _Waiter | None:
+        with self._lock:
+            if not self._waiters and self._in_flight < self._limit:
+                self._in_flight += 1
+                return None
+            waiter = _Waiter(self, loop)
+            self._waiters.append(waiter)
+            return waiter
+
+    def _dispatch_locked(self) -> list[_Waiter]:
+        granted = []
+        while self._waiters and self._in_flight < self._limit:
+            self._in_flight += 1
+            granted.append(self._waiters.popleft())
+        return granted
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            granted = self._dispatch_locked()
+        for waiter in granted:
+            waiter.grant()
+
+    def _record(self,
+                error: BaseException | None,
+                *,
+                transient: bool,
+                status_code: int | None,
+                retry_after: float | None,
+                probe: bool,
+                sent_at: float) -> None:
+        now = time.monotonic()
+        granted = []
+
+        with self._lock:
+            if probe:
+                self._probe_in_flight = False
+
+            if error is not None and not isinstance(error, Exception):
+                # Cancelled, the request tells nothing about the service
+                return
+
+            if error is None or not transient:
+                # The service answered, even if with an error which is not retried
+                self._consecutive_failures = 0
+                self._opened_at = None
+                if error is None and self._adaptive and not math.isinf(self._limit):
+                    self._limit = min(self._limit + 1 / self._limit, self._max_concurrency)
+                    granted = self._dispatch_locked()
+            else:
+                if status_code in _THROTTLE_CODES:
+                    self._stats.throttled += 1
+                    if retry_after:
+                        self._paused_until = max(self._paused_until, now + retry_after)
+                    # Requests sent before the last decrease saw the previous limit, a burst of throttled responses
+                    # is a single congestion event
+                    if self._adaptive and sent_at >= self._last_decrease:
+                        self._last_decrease = now
+                        self._limit = max(min(self._limit, self._in_flight) / 2, self._min_concurrency)
+                        logger.info("%s was throttled (%s), limiting the concurrency to %.1f requests",
+                                    self.name,
+                                    status_code,
+                                    self._limit)
+
+                if status_code != 429:
+                    self._stats.failures += 1
+                    self._consecutive_failures += 1
+                    if self._breaker_threshold and (probe or self._consecutive_failures >= self._breaker_threshold):
+                        if self._opened_at is None or probe:
+                            logger.warning("Opening the circuit breaker of %s for %.0fs after %d consecutive failures",
+                                           self.name,
+                                           self._breaker_reset_timeout,
+                                           self._consecutive_failures)
+                        self._opened_at = now
+
+        for waiter in granted:
+            waiter.grant()
+
+    def _needs_permit(self) -> bool:
+        return id(self) not in _held_limiters.get()
+
+    async def acquire(self, tokens: int = 0) -> RateLimitPermit:
+        """
+        Wait until a request estimated at `tokens` input tokens can be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+        """
+        if not self._needs_permit():
+            return RateLimitPermit(None)
+
+        probe = self._check_circuit()
+        try:
+            delay = self._reserve(tokens)
+            waiter = self._take_slot_or_wait(asyncio.get_running_loop()) if delay <= 0 else None
+            if delay > 0 or waiter is not None:
+                with self._wait_step(delay):
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                        waiter = self._take_slot_or_wait(asyncio.get_running_loop())
+                    if waiter is not None:
+                        try:
+                            await waiter.future
+                        except asyncio.CancelledError:
+                            self._cancel_wait(waiter)
+                            raise
+        except BaseException:
+            self._cancel_probe(probe)
+            raise
+
+        return RateLimitPermit(self, probe)
+
+    def acquire_sync(self, tokens: int = 0) -> RateLimitPermit:
+        """
+        Blocking version of `acquire`, for calls made from threads without an event loop.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+        """
+        if not self._needs_permit():
+            return RateLimitPermit(None)
+
+        probe = self._check_circuit()
+        try:
+            delay = self._reserve(tokens)
+            waiter = self._take_slot_or_wait(None) if delay <= 0 else None
+            if delay > 0 or waiter is not None:
+                with self._wait_step(delay):
+                    if delay > 0:
+                        time.sleep(delay)
+                        waiter = self._take_slot_or_wait(None)
+                    if waiter is not None:
+                        waiter.event.wait()
+        except BaseException:
+            self._cancel_probe(probe)
+            raise
+
+        return RateLimitPermit(self, probe)
+
+    def _cancel_probe(self, probe: bool) -> None:
+        if probe:
+            with self._lock:
+                self._probe_in_flight = False
+
+    def _cancel_wait(self, waiter: _Waiter) -> None:
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                return
+
+        # The slot was granted, the grant callback releases it if it has not run yet
+        if waiter.future.done() and not waiter.future.cancelled():
+            self._release_slot()
+
+    @contextlib.contextmanager
+    def _wait_step(self, delay: float) -> Iterator[None]:
+        """Report the time spent waiting for the limiter to the intermediate step stream."""
+        wait_stats = self.stats().model_dump()
+        wait_stats["rate_delay"] = round(delay, 3)
+        with report_wait(f"{self.name} rate limiter", wait_stats):
+            yield
+
+
+@contextlib.contextmanager
+def report_wait(name: str, metadata: dict[str, typing.Any]) -> Iterator[None]:
+    """
+    Report a wait, for a rate limiter or before retrying a throttled request, as a custom span of the intermediate
+    step stream of the current workflow run. Reporting errors never fail the call.
+    """
+    # Imported here, the intermediate step manager depends on the builder
+    from aiq.builder.context import AIQContext
+
+    try:
+        step_manager = AIQContext.get().intermediate_step_manager
+        start = IntermediateStepPayload(event_type=IntermediateStepType.CUSTOM_START,
+                                        name=name,
+                                        metadata=TraceMetadata(provided_metadata=metadata))
+        step_manager.push_intermediate_step(start)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.debug("Unable to report the wait of %s: %s", name, e)
+        yield
+        return
+
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        try:
+            step_manager.push_intermediate_step(
+                IntermediateStepPayload(event_type=IntermediateStepType.CUSTOM_END,
+                                        name=name,
+                                        UUID=start.UUID,
+                                        span_event_timestamp=start.event_timestamp,
+                                        metadata=TraceMetadata(provided_metadata={
+                                            **metadata, "waited_seconds": round(time.monotonic() - started, 3)
+                                        })))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.debug("Unable to report the wait of %s: %s", name, e)
+
+
+def estimate_tokens(*values: typing.Any) -> int:
+    """
+    Rough estimate of the number of tokens of the text in call arguments: strings, messages with a `content`
+    attribute and containers of them.
+    """
+    chars = 0
+    stack = list(values)
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            chars += len(value)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif hasattr(value, "content"):
+            stack.append(getattr(value, "content"))
+    return math.ceil(chars / _CHARS_PER_TOKEN)
+
+
+# Limiters by id of the configuration they were created for, removed when the configuration is garbage collected
+_limiters: dict[int, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(config: "RetryMixin") -> AdaptiveRateLimiter | None:
+    """
+    The process-wide rate limiter shared by every client built from `config`.
+
+    Returns:
+        AdaptiveRateLimiter | None: The limiter, None if the configuration does not enable any limit.
+    """
+    if not (config.rate_limit_requests_per_minute or config.rate_limit_tokens_per_minute
+            or config.max_concurrent_requests or config.adaptive_concurrency or config.circuit_breaker_threshold):
+        return None
+
+    with _limiters_lock:
+        limiter = _limiters.get(id(config))
+        if limiter is None:
+            name = getattr(config, "model_name", None) or type(config).__name__
+            limiter = AdaptiveRateLimiter(name,
+                                          requests_per_minute=config.rate_limit_requests_per_minute,
+                                          tokens_per_minute=config.rate_limit_tokens_per_minute,
+                                          max_concurrency=config.max_concurrent_requests,
+                                          adaptive_concurrency=config.adaptive_concurrency,
+                                          circuit_breaker_threshold=config.circuit_breaker_threshold,
+                                          circuit_breaker_reset_timeout=config.circuit_breaker_reset_timeout)
+            _limiters[id(config)] = limiter
+            weakref.finalize(config, _limiters.pop, id(config), None)
+
+        return limiter
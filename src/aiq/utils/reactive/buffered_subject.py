@@ -0,0 +1,333 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import dataclasses
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Generic
+from typing import TypeVar
+
+from aiq.utils.reactive.observer import Observer
+from aiq.utils.reactive.subject import Subject
+from aiq.utils.reactive.subscription import Subscription
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class OverflowPolicy(str, Enum):
+    """
+    What a BufferedSubject does when an observer's buffer is full.
+    """
+    BLOCK = "block"
+    """Deliver pending items to the observer on the producer's stack until there is room again (backpressure)."""
+    DROP_OLDEST = "drop_oldest"
+    """Evict the oldest pending item to make room for the new one."""
+    SAMPLE = "sample"
+    """Admit one out of every `sample_rate` overflowing items (evicting the oldest) and drop the rest."""
+
+
+@dataclasses.dataclass
+class ObserverMetrics:
+    """
+    Delivery statistics for a single observer of a BufferedSubject.
+    """
+    name: str
+    queued: int
+    delivered: int
+    dropped: int
+    lag_seconds: float
+
+
+class _ObserverChannel(Generic[T]):
+    """
+    Bounded ring buffer and drain task delivering items to a single observer.
+    """
+
+    def __init__(self,
+                 observer: Observer[T],
+                 loop: asyncio.AbstractEventLoop,
+                 buffer_size: int,
+                 batch_size: int,
+                 overflow_policy: OverflowPolicy,
+                 sample_rate: int):
+        self._observer = observer
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._buffer_size = buffer_size
+        self._batch_size = batch_size
+        self._overflow_policy = overflow_policy
+        self._sample_rate = max(sample_rate, 1)
+
+        # Items are stored alongside their enqueue time so the observer lag can be reported
+        self._items: deque[tuple[float, T]] = deque()
+        self._lock = threading.Lock()
+        # Serializes delivery so items reach the observer in order even when flushed from the producer
+        self._delivery_lock = threading.RLock()
+        self._wakeup = asyncio.Event()
+        self._completed = False
+        self._complete_signaled = False
+        self._overflow_count = 0
+
+        self.delivered = 0
+        self.dropped = 0
+
+        self._task = loop.create_task(self._drain())
+
+    @property
+    def name(self) -> str:
+        on_next = getattr(self._observer, "_on_next", None)
+        return getattr(on_next, "__qualname__", type(self._observer).__name__)
+
+    def metrics(self) -> ObserverMetrics:
+        with self._lock:
+            queued = len(self._items)
+            lag = time.monotonic() - self._items[0][0] if self._items else 0.0
+
+        return ObserverMetrics(name=self.name,
+                               queued=queued,
+                               delivered=self.delivered,
+                               dropped=self.dropped,
+                               lag_seconds=lag)
+
+    def put(self, value: T) -> None:
+        """
+        Enqueue an item, applying the overflow policy if the buffer is full.
+        """
+        with self._lock:
+            is_full = len(self._items) >= self._buffer_size
+
+            if is_full and self._overflow_policy == OverflowPolicy.SAMPLE:
+                self._overflow_count += 1
+                if self._overflow_count % self._sample_rate != 0:
+                    self.dropped += 1
+                    return
+
+            if is_full and self._overflow_policy != OverflowPolicy.BLOCK:
+                self._items.popleft()
+                self.dropped += 1
+                is_full = False
+
+            if not is_full:
+                self._items.append((time.monotonic(), value))
+
+        if is_full:
+            # Backpressure: make room by delivering on the producer's stack, then enqueue
+            self._deliver(self._buffer_size // 2 or 1)
+            with self._lock:
+                self._items.append((time.monotonic(), value))
+
+        self._notify()
+
+    def complete(self) -> None:
+        """
+        Mark the channel as complete. The drain task delivers the remaining items before calling on_complete.
+        """
+        self._completed = True
+        self._notify()
+
+    def close(self) -> None:
+        """
+        Deliver any pending items synchronously and stop the drain task. The observer is only completed if the channel
+        was already marked as complete.
+        """
+        self._task.cancel()
+        self._deliver()
+        self._signal_complete()
+
+    def _signal_complete(self) -> None:
+        with self._delivery_lock:
+            if self._completed and not self._complete_signaled:
+                self._complete_signaled = True
+                self._observer.on_complete()
+
+    def _notify(self) -> None:
+        if threading.get_ident() == self._loop_thread_id:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _deliver(self, max_items: int | None = None) -> int:
+        """
+        Deliver up to `max_items` pending items (all of them if None) to the observer.
+        """
+        delivered = 0
+
+        with self._delivery_lock:
+            while max_items is None or delivered < max_items:
+                with self._lock:
+                    if not self._items:
+                        break
+                    _, value = self._items.popleft()
+
+                try:
+                    self._observer.on_next(value)
+                except Exception as e:
+                    # A failing item must not stop the delivery of the following ones
+                    logger.error("Error delivering an item to observer %s: %s", self.name, e, exc_info=True)
+                    self._report_error(e)
+
+                delivered += 1
+
+            self.delivered += delivered
+
+        return delivered
+
+    def _report_error(self, exc: Exception) -> None:
+        try:
+            self._observer.on_error(exc)
+        except Exception as e:
+            logger.error("Error in on_error of observer %s: %s", self.name, e, exc_info=True)
+
+    async def _drain(self) -> None:
+        try:
+            while True:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+
+                # Deliver in batches, yielding to the event loop between batches
+                while self._deliver(self._batch_size) > 0:
+                    await asyncio.sleep(0)
+
+                if self._completed:
+                    self._signal_complete()
+                    return
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error("Error delivering items to observer %s: %s", self.name, e, exc_info=True)
+
+
+class BufferedSubject(Subject[T]):
+    """
+    A Subject which decouples producers from observers.
+
+    Each observer subscribed from within a running event loop gets its own bounded buffer and a drain task which
+    delivers items in batches. `on_next` only enqueues, so slow observers do not add latency to the producer. Observers
+    subscribed without a running event loop are delivered to synchronously, as with `Subject`.
+
+    Pending items are still delivered when an observer unsubscribes, and `on_complete` is signaled to each observer
+    after its remaining items have been delivered.
+    """
+
+    def __init__(self,
+                 buffer_size: int = 1024,
+                 batch_size: int = 64,
+                 overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 sample_rate: int = 10) -> None:
+        """
+        Args:
+            buffer_size (int): Maximum number of pending items per observer.
+            batch_size (int): Maximum number of items delivered per drain iteration.
+            overflow_policy (OverflowPolicy): What to do when an observer's buffer is full.
+            sample_rate (int): With the `sample` overflow policy, one out of every `sample_rate` overflowing items is
+                kept.
+        """
+        super().__init__()
+        self._buffer_size = buffer_size
+        self._batch_size = batch_size
+        self._overflow_policy = overflow_policy
+        self._sample_rate = sample_rate
+        self._channels: dict[Observer[T], _ObserverChannel[T]] = {}
+
+    def _subscribe_core(self, observer: Observer[T]) -> Subscription:
+        with self._lock:
+            if self._disposed:
+                return Subscription(self, None)
+
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+
+            if loop is not None:
+                self._channels[observer] = _ObserverChannel(observer,
+                                                            loop,
+                                                            buffer_size=self._buffer_size,
+                                                            batch_size=self._batch_size,
+                                                            overflow_policy=self._overflow_policy,
+                                                            sample_rate=self._sample_rate)
+
+            self._observers.append(observer)
+            return Subscription(self, observer)
+
+    def on_next(self, value: T) -> None:
+        """
+        Enqueue an item for every buffered observer and deliver it to the synchronous ones.
+        """
+        with self._lock:
+            if self._closed or self._disposed:
+                return
+            current_observers = [(obs, self._channels.get(obs)) for obs in self._observers]
+
+        for obs, channel in current_observers:
+            if channel is not None:
+                channel.put(value)
+            else:
+                obs.on_next(value)
+
+    def on_error(self, exc: Exception) -> None:
+        """
+        Deliver pending items, then notify all observers of the error.
+        """
+        with self._lock:
+            if self._closed or self._disposed:
+                return
+            current_observers = [(obs, self._channels.get(obs)) for obs in self._observers]
+
+        for obs, channel in current_observers:
+            if channel is not None:
+                channel.close()
+            obs.on_error(exc)
+
+    def on_complete(self) -> None:
+        """
+        Close the subject. Buffered observers are completed by their drain task once their pending items have been
+        delivered.
+        """
+        with self._lock:
+            if self._closed or self._disposed:
+                return
+            current_observers = [(obs, self._channels.get(obs)) for obs in self._observers]
+            self.dispose()
+
+        for obs, channel in current_observers:
+            if channel is not None:
+                channel.complete()
+            else:
+                obs.on_complete()
+
+    def _unsubscribe_observer(self, observer: Observer[T]) -> None:
+        with self._lock:
+            channel = self._channels.pop(observer, None)
+
+        if channel is not None:
+            channel.close()
+
+        super()._unsubscribe_observer(observer)
+
+    def get_observer_metrics(self) -> list[ObserverMetrics]:
+        """
+        Returns the queue depth, lag and drop counts for every buffered observer.
+        """
+        with self._lock:
+            channels = list(self._channels.values())
+
+        return [channel.metrics() for channel in channels]
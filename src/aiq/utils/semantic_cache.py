@@ -0,0 +1,394 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import copy
+import dataclasses
+import json
+import logging
+import time
+import typing
+from collections import OrderedDict
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+
+import numpy as np
+from pydantic import BaseModel
+
+from aiq.data_models.intermediate_step import IntermediateStepPayload
+from aiq.data_models.intermediate_step import IntermediateStepType
+from aiq.data_models.intermediate_step import TraceMetadata
+
+logger = logging.getLogger(__name__)
+
+T = typing.TypeVar("T")
+
+
+class SemanticCacheStats(BaseModel):
+    """
+    Counters of a semantic cache.
+    """
+    name: str
+    entries: int = 0
+    exact_hits: int = 0
+    similar_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    embedding_hits: int = 0
+    embedding_misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.exact_hits + self.similar_hits + self.misses
+        return (self.exact_hits + self.similar_hits) / lookups if lookups else 0.0
+
+    @property
+    def embedding_hit_rate(self) -> float:
+        lookups = self.embedding_hits + self.embedding_misses
+        return self.embedding_hits / lookups if lookups else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.name}: {self.entries} entries, hit rate {self.hit_rate:.1%} ({self.exact_hits} exact, "
+                f"{self.similar_hits} similar, {self.misses} misses), embedding hit rate "
+                f"{self.embedding_hit_rate:.1%}, {self.evictions} evicted, {self.expirations} expired, "
+                f"{self.invalidations} invalidated")
+
+
+@dataclasses.dataclass
+class _Entry:
+    value: typing.Any
+    scope: str
+    partition: str | None
+    expires_at: float
+    vector: np.ndarray | None = None
+
+
+def _copy_value(value: T) -> T:
+    """A copy of cached results, so that callers modifying the results they get do not modify the cache."""
+    if isinstance(value, BaseModel):
+        return value.model_copy(deep=True)
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    return copy.copy(value)
+
+
+def scope_key(**kwargs) -> str:
+    """
+    Key of the search arguments other than the query, only results searched with the same arguments are shared.
+    """
+    return json.dumps(kwargs, sort_keys=True, default=str)
+
+
+@contextlib.contextmanager
+def _report_lookup(name: str, metadata: dict[str, typing.Any]) -> Iterator[dict[str, typing.Any]]:
+    """
+    Report a cache lookup, and the search it falls through to on a miss, as a custom span of the intermediate step
+    stream of the current workflow run. The caller adds the outcome of the lookup to the yielded dictionary. Reporting
+    errors never fail the search.
+    """
+    # Imported here, the intermediate step manager depends on the builder
+    from aiq.builder.context import AIQContext
+
+    outcome: dict[str, typing.Any] = {}
+    try:
+        step_manager = AIQContext.get().intermediate_step_manager
+        start = IntermediateStepPayload(event_type=IntermediateStepType.CUSTOM_START,
+                                        name=name,
+                                        metadata=TraceMetadata(provided_metadata=metadata))
+        step_manager.push_intermediate_step(start)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.debug("Unable to report the lookup of %s: %s", name, e)
+        yield outcome
+        return
+
+    try:
+        yield outcome
+    finally:
+        try:
+            step_manager.push_intermediate_step(
+                IntermediateStepPayload(event_type=IntermediateStepType.CUSTOM_END,
+                                        name=name,
+                                        UUID=start.UUID,
+                                        span_event_timestamp=start.event_timestamp,
+                                        metadata=TraceMetadata(provided_metadata={
+                                            **metadata, **outcome
+                                        })))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.debug("Unable to report the lookup of %s: %s", name, e)
+
+
+class SemanticCache:
+    """
+    Read-through cache of search results, shared by the searches of a memory or retriever.
+
+    Results are looked up by exact match of the query and, when a similarity threshold and an embedder are given, by
+    cosine similarity between the embedding of the query and those of the cached queries. Only results searched with
+    the same arguments (see `scope_key`) are shared. Results expire after `ttl` seconds, and the least recently used
+    ones are evicted past `max_entries`. Results are tagged with a partition, the user of a memory for example, so that
+    writes only invalidate the results they may change. Callers get copies of the cached results, which they can
+    modify.
+
+    Every lookup is reported to the profiler as a custom span with its outcome and the hit rates of the cache.
+    """
+
+    def __init__(self,
+                 name: str,
+                 *,
+                 ttl: float | None = 300.0,
+                 max_entries: int = 1024,
+                 normalize_queries: bool = True,
+                 similarity_threshold: float | None = None,
+                 embedder: typing.Any = None,
+                 max_embeddings: int = 4096):
+        """
+        Args:
+            name (str): Name of the cache, used in the reported spans.
+            ttl (float | None): Number of seconds a result is cached for, None for no expiry.
+            max_entries (int): Maximum number of cached results.
+            normalize_queries (bool): Whether queries differing only in case and whitespace share their results.
+            similarity_threshold (float | None): Minimum cosine similarity of a cached query for its results to be
+                returned, None to only return exact matches.
+            embedder: Embedder with an `aembed_query` coroutine, required with a similarity threshold.
+            max_embeddings (int): Maximum number of cached query embeddings.
+        """
+        if similarity_threshold is not None and embedder is None:
+            raise ValueError("An embedder is required when similarity_threshold is set")
+
+        self._name = name
+        self._ttl = ttl
+        self._max_entries = max(max_entries, 1)
+        self._normalize_queries = normalize_queries
+        self._similarity_threshold = similarity_threshold
+        self._embedder = embedder
+        self._max_embeddings = max(max_embeddings, 1)
+
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+        # Keys of the entries with an embedding in each scope, and the stacked embeddings searched for similar queries
+        self._scope_keys: dict[str, dict[tuple[str, str], None]] = {}
+        self._scope_matrices: dict[str, tuple[list[tuple[str, str]], np.ndarray]] = {}
+        # Concurrent misses of the same query wait for a single search
+        self._in_flight: dict[tuple[str, str], asyncio.Future] = {}
+        # Incremented on every invalidation, results of searches which started before it are not cached
+        self._generation = 0
+
+        self._stats = SemanticCacheStats(name=name)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def stats(self) -> SemanticCacheStats:
+        return self._stats.model_copy(update={"entries": len(self._entries)})
+
+    async def get_or_search(self,
+                            query: str,
+                            search: Callable[[], Awaitable[T]],
+                            *,
+                            scope: str = "",
+                            partition: str | None = None) -> T:
+        """
+        Return the cached results of the query, or search and cache them.
+
+        Args:
+            query (str): The query searched.
+            search (Callable[[], Awaitable[T]]): Searches the backend on a miss.
+            scope (str): Key of the other search arguments.
+            partition (str | None): Partition of the results, for invalidation.
+        """
+        key = (scope, self._normalize(query))
+
+        with _report_lookup(f"{self._name} cache", {"cache": self._name}) as outcome:
+            entry = self._get(key)
+            if entry is not None:
+                self._stats.exact_hits += 1
+                self._record(outcome, "exact_hit")
+                return _copy_value(entry.value)
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None and in_flight.get_loop() is asyncio.get_running_loop():
+                try:
+                    value = await asyncio.shield(in_flight)
+                    self._stats.exact_hits += 1
+                    self._record(outcome, "exact_hit")
+                    return _copy_value(value)
+                except asyncio.CancelledError:
+                    # Only a cancelled search of another caller falls through to searching again
+                    if not in_flight.cancelled():
+                        raise
+
+            vector = None
+            if self._similarity_threshold is not None:
+                try:
+                    vector = await self._embed(key[1])
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    # The cache must not fail the search, it only skips looking up similar queries
+                    logger.warning("Unable to embed the query of %s, looking up exact matches only: %s", self._name, e)
+
+            if vector is not None:
+                entry, similarity = self._get_similar(scope, vector)
+                if entry is not None:
+                    self._stats.similar_hits += 1
+                    self._record(outcome, "similar_hit", similarity=round(similarity, 4))
+                    return _copy_value(entry.value)
+
+            self._stats.misses += 1
+            self._record(outcome, "miss")
+            return await self._search(key, search, partition, vector)
+
+    def invalidate(self, partitions: Iterable[str | None] | None = None) -> None:
+        """
+        Drop the cached results of the given partitions, and those without a partition, or every cached result when
+        `partitions` is None. Searches in flight are not cached.
+        """
+        self._generation += 1
+
+        if partitions is None:
+            keys = list(self._entries)
+        else:
+            partitions = set(partitions) | {None}
+            keys = [key for key, entry in self._entries.items() if entry.partition in partitions]
+
+        for key in keys:
+            self._remove(key)
+
+        self._stats.invalidations += len(keys)
+        logger.debug("Invalidated %d cached results of %s", len(keys), self._name)
+
+    def _normalize(self, query: str) -> str:
+        return " ".join(query.split()).casefold() if self._normalize_queries else query
+
+    def _record(self, outcome: dict[str, typing.Any], result: str, **extra) -> None:
+        outcome.update(outcome=result,
+                       hit_rate=round(self._stats.hit_rate, 4),
+                       embedding_hit_rate=round(self._stats.embedding_hit_rate, 4),
+                       **extra)
+
+    def _expired(self, entry: _Entry) -> bool:
+        return entry.expires_at <= time.monotonic()
+
+    def _get(self, key: tuple[str, str]) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if self._expired(entry):
+            self._remove(key)
+            self._stats.expirations += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def _get_similar(self, scope: str, vector: np.ndarray) -> tuple[_Entry | None, float]:
+        keys = self._scope_keys.get(scope)
+        if not keys:
+            return None, 0.0
+
+        matrix = self._scope_matrices.get(scope)
+        if matrix is None:
+            matrix = (list(keys), np.stack([self._entries[key].vector for key in keys]))
+            self._scope_matrices[scope] = matrix
+
+        scope_keys, vectors = matrix
+        similarities = vectors @ vector
+        for i in np.argsort(-similarities):
+            if similarities[i] < self._similarity_threshold:
+                break
+
+            entry = self._get(scope_keys[i])
+            if entry is not None:
+                return entry, float(similarities[i])
+
+            # An expired entry changes the stacked embeddings of the scope
+            return self._get_similar(scope, vector)
+
+        return None, 0.0
+
+    async def _embed(self, query: str) -> np.ndarray:
+        vector = self._embeddings.get(query)
+        if vector is not None:
+            self._stats.embedding_hits += 1
+            self._embeddings.move_to_end(query)
+            return vector
+
+        self._stats.embedding_misses += 1
+        vector = np.asarray(await self._embedder.aembed_query(query), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        vector = vector / norm if norm else vector
+
+        self._embeddings[query] = vector
+        if len(self._embeddings) > self._max_embeddings:
+            self._embeddings.popitem(last=False)
+
+        return vector
+
+    async def _search(self,
+                      key: tuple[str, str],
+                      search: Callable[[], Awaitable[T]],
+                      partition: str | None,
+                      vector: np.ndarray | None) -> T:
+        generation = self._generation
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+
+        try:
+            value = await search()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise the error, mark it as retrieved in case nobody is waiting
+            future.exception()
+            raise
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+        future.set_result(value)
+
+        if generation == self._generation:
+            self._put(key, _Entry(value, key[0], partition, time.monotonic() + (self._ttl or float("inf")), vector))
+
+        return _copy_value(value)
+
+    def _put(self, key: tuple[str, str], entry: _Entry) -> None:
+        self._remove(key)
+        self._entries[key] = entry
+
+        if entry.vector is not None:
+            self._scope_keys.setdefault(entry.scope, {})[key] = None
+            self._scope_matrices.pop(entry.scope, None)
+
+        while len(self._entries) > self._max_entries:
+            self._remove(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None or entry.vector is None:
+            return
+
+        keys = self._scope_keys[entry.scope]
+        del keys[key]
+        if not keys:
+            del self._scope_keys[entry.scope]
+        self._scope_matrices.pop(entry.scope, None)
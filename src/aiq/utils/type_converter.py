@@ -25,6 +25,23 @@ logger = logging.getLogger(__name__)
 
 _T = typing.TypeVar("_T")
 
+# Chain of converters, each with the type of data it converts
+_IndirectPath = tuple[tuple[type, Callable], ...]
+
+# Root types by type, computing them is the costliest part of a conversion lookup
+_root_types: dict[typing.Any, type] = {}
+
+
+def _root_type(type_: typing.Any) -> type:
+    try:
+        return _root_types[type_]
+    except KeyError:
+        root = _root_types[type_] = DecomposedType(type_).root
+        return root
+    except TypeError:
+        # Unhashable type annotation
+        return DecomposedType(type_).root
+
 
 class ConvertException(Exception):
     pass
@@ -43,6 +60,13 @@ class TypeConverter:
         self._converters: OrderedDict[type, OrderedDict[type, Callable]] = OrderedDict()
         self._indirect_warnings_shown: set[tuple[type, type]] = set()
 
+        # Conversion paths of this converter resolved by (source type, target type), including empty paths when no
+        # converter applies. Cleared when a converter is added, the parent converter has its own paths.
+        # dict[(from_type, target_root_type), ((from_root_type, converter), ...)]
+        self._direct_paths: dict[tuple[type, type], tuple[tuple[type, Callable], ...]] = {}
+        # dict[(from_type, to_type), chain of converters | None if there is none]
+        self._indirect_paths: dict[tuple[type, typing.Any], _IndirectPath | None] = {}
+
         for converter in converters:
             self.add_converter(converter)
 
@@ -70,17 +94,23 @@ class TypeConverter:
         self._converters.setdefault(to_type, OrderedDict())[from_type] = converter
         # to do(MDD): If needed, sort by specificity here.
 
+        self._clear_paths()
+
+    def _clear_paths(self) -> None:
+        self._direct_paths.clear()
+        self._indirect_paths.clear()
+
     def _convert(self, data, to_type: type[_T]) -> _T | None:
         """
         Attempts to convert `data` into `to_type`. Returns None if no path is found.
         """
-        decomposed = DecomposedType(to_type)
-
         # 1) If data is already correct type, return it
-        if to_type is None or decomposed.is_instance((data, to_type)):
+        if to_type is None:
             return data
 
-        root = decomposed.root
+        root = _root_type(to_type)
+        if isinstance((data, to_type), root):
+            return data
 
         # 2) Attempt direct in *this* converter
         direct_result = self._try_direct_conversion(data, root)
@@ -130,15 +160,12 @@ class TypeConverter:
         If no match here, we forward to parent's direct conversion
         for recursion up the chain.
         """
-        for convert_to_type, to_type_converters in self._converters.items():
-            # e.g. if Derived is a subclass of Base, this is valid
-            if issubclass(DecomposedType(convert_to_type).root, target_root_type):
-                for convert_from_type, from_type_converter in to_type_converters.items():
-                    if isinstance(data, DecomposedType(convert_from_type).root):
-                        try:
-                            return from_type_converter(data)
-                        except ConvertException:
-                            pass
+        for convert_from_root, from_type_converter in self._direct_path(data, target_root_type):
+            if isinstance(data, convert_from_root):
+                try:
+                    return from_type_converter(data)
+                except ConvertException:
+                    pass
 
         # If we can't convert directly here, try parent
         if self._parent is not None:
@@ -146,6 +173,25 @@ class TypeConverter:
 
         return None
 
+    def _direct_path(self, data, target_root_type: type) -> tuple[tuple[type, Callable], ...]:
+        """
+        The converters of *this* registry which can convert `data` to `target_root_type`, in the order they are tried.
+        """
+        key = (type(data), target_root_type)
+        path = self._direct_paths.get(key)
+        if path is None:
+            candidates = []
+            for convert_to_type, to_type_converters in self._converters.items():
+                # e.g. if Derived is a subclass of Base, this is valid
+                if issubclass(_root_type(convert_to_type), target_root_type):
+                    for convert_from_type, from_type_converter in to_type_converters.items():
+                        convert_from_root = _root_type(convert_from_type)
+                        if isinstance(data, convert_from_root):
+                            candidates.append((convert_from_root, from_type_converter))
+            path = self._direct_paths[key] = tuple(candidates)
+
+        return path
+
     # -------------------------------------------------
     # INTERNAL INDIRECT CONVERSION (with parent fallback)
     # -------------------------------------------------
@@ -172,8 +218,60 @@ class TypeConverter:
 
     def _try_indirect_conversion(self, data: typing.Any, to_type: type[_T], visited: set[type]) -> _T | None:
         """
+        Find a chain of conversions from type(data) to to_type, ignoring parent. If not found, returns None.
+
+        The chain found for a source type is replayed for the next data of that type, and the search only runs again
+        if one of its converters rejects the data. The absence of a chain is remembered too, but only when no converter
+        applied to the data: the outcome of a converter can depend on the value, and another value of the same type
+        could succeed.
+        """
+        key = (type(data), to_type)
+        try:
+            cached = self._indirect_paths.get(key, ())
+        except TypeError:
+            # Unhashable type annotation
+            key, cached = None, ()
+
+        if cached is None:
+            return None
+
+        if key in self._indirect_paths:
+            result = self._replay_indirect_path(data, to_type, cached)
+            if result is not None:
+                return result
+
+        path: list[tuple[type, Callable]] = []
+        tried: list[Callable] = []
+        result = self._search_indirect_path(data, to_type, visited, path, tried)
+
+        if key is not None and (result is not None or not tried):
+            self._indirect_paths[key] = tuple(path) if result is not None else None
+
+        return result
+
+    @staticmethod
+    def _replay_indirect_path(data: typing.Any, to_type: type[_T], path: _IndirectPath) -> _T | None:
+        try:
+            for convert_from_type, converter in path:
+                # The intermediate data of another value can have another type
+                if not isinstance(data, convert_from_type):
+                    return None
+                data = converter(data)
+        except ConvertException:
+            return None
+
+        return data if isinstance(data, to_type) else None
+
+    def _search_indirect_path(self,
+                              data: typing.Any,
+                              to_type: type[_T],
+                              visited: set[type],
+                              path: list[tuple[type, Callable]],
+                              tried: list[Callable]) -> _T | None:
+        """
         DFS attempt to find a chain of conversions from type(data) to to_type,
-        ignoring parent. If not found, returns None.
+        ignoring parent. The chain found is appended to `path`, and every
+        converter called during the search to `tried`.
         """
         # 1) If data is already correct type
         if isinstance(data, to_type):
@@ -189,14 +287,17 @@ class TypeConverter:
         for _, to_type_converters in self._converters.items():
             for convert_from_type, from_type_converter in to_type_converters.items():
                 if isinstance(data, convert_from_type):
+                    tried.append(from_type_converter)
                     try:
                         next_data = from_type_converter(data)
+                        path.append((convert_from_type, from_type_converter))
                         if isinstance(next_data, to_type):
                             return next_data
                         # else keep going
-                        deeper = self._try_indirect_conversion(next_data, to_type, visited)
+                        deeper = self._search_indirect_path(next_data, to_type, visited, path, tried)
                         if deeper is not None:
                             return deeper
+                        path.pop()
                     except ConvertException:
                         pass
 
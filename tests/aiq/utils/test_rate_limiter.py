@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from aiq.data_models.retry_mixin import RetryMixin
+from aiq.utils.exception_handlers.automatic_retries import patch_with_retry
+from aiq.utils.exception_handlers.rate_limiter import AdaptiveRateLimiter
+from aiq.utils.exception_handlers.rate_limiter import get_rate_limiter
+
+
+class _Client:
+    """A client recording the number of concurrent requests it receives."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ainvoke(self, value):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return value
+
+    def invoke(self, value):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        self.in_flight -= 1
+        return value
+
+    async def agenerate(self, value):
+        return await self.ainvoke(value)
+
+    async def amap(self, values):
+        return await asyncio.gather(*(self.ainvoke(value) for value in values))
+
+    async def abatch(self, values):
+        return await asyncio.gather(*(self.ainvoke(value) for value in values))
+
+    def batch(self, values):
+        with ThreadPoolExecutor(max_workers=len(values)) as executor:
+            return list(executor.map(self.invoke, values))
+
+
+def create_client(limiter: AdaptiveRateLimiter) -> _Client:
+    return patch_with_retry(_Client(), retries=1, rate_limiter=limiter)
+
+
+def throttle(limiter: AdaptiveRateLimiter, times: int) -> None:
+    for _ in range(times):
+        permit = limiter.acquire_sync()
+        permit.release(RuntimeError("Too Many Requests"), transient=True, status_code=429)
+
+
+async def test_nested_call_does_not_wait_for_a_second_permit():
+    limiter = AdaptiveRateLimiter("test", max_concurrency=1)
+    client = create_client(limiter)
+
+    assert await asyncio.wait_for(client.agenerate(1), timeout=5) == 1
+    assert limiter.stats().in_flight == 0
+
+
+async def test_fan_out_of_a_call_runs_under_its_permit():
+    limiter = AdaptiveRateLimiter("test", max_concurrency=1)
+    client = create_client(limiter)
+
+    assert await asyncio.wait_for(client.amap([1, 2, 3]), timeout=5) == [1, 2, 3]
+    assert limiter.stats().in_flight == 0
+
+
+async def test_batch_calls_are_limited_individually():
+    limiter = AdaptiveRateLimiter("test", max_concurrency=2)
+    client = create_client(limiter)
+
+    assert await asyncio.wait_for(client.abatch(list(range(6))), timeout=5) == list(range(6))
+    assert client.max_in_flight == 2
+    assert limiter.stats().in_flight == 0
+
+
+async def test_sync_batch_calls_are_limited_individually():
+    limiter = AdaptiveRateLimiter("test", max_concurrency=1)
+    client = create_client(limiter)
+
+    # Synchronous calls are limited outside of the event loop thread
+    assert await asyncio.wait_for(asyncio.to_thread(client.batch, [1, 2, 3]), timeout=5) == [1, 2, 3]
+    assert client.max_in_flight == 1
+    assert limiter.stats().in_flight == 0
+
+
+async def test_throttled_concurrency_stops_at_the_minimum():
+    limiter = AdaptiveRateLimiter("test", max_concurrency=8, min_concurrency=2, adaptive_concurrency=True)
+    throttle(limiter, 5)
+
+    stats = limiter.stats()
+    assert stats.throttled == 5
+    assert stats.concurrency_limit == 2
+
+    # Two requests are still sent concurrently, the third one waits. Each acquires from its own task, a call holding a
+    # permit does not acquire another one
+    permits = await asyncio.wait_for(asyncio.gather(limiter.acquire(), limiter.acquire()), timeout=1)
+    third = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0.01)
+    assert not third.done()
+
+    permits[0].release()
+    (await asyncio.wait_for(third, timeout=1)).release()
+    permits[1].release()
+    assert limiter.stats().in_flight == 0
+
+
+async def test_batch_completes_at_the_minimum_concurrency():
+    limiter = AdaptiveRateLimiter("test", adaptive_concurrency=True)
+    client = create_client(limiter)
+
+    # Unlimited until the first throttled response, then down to a single request
+    assert limiter.stats().concurrency_limit is None
+    throttle(limiter, 3)
+    assert limiter.stats().concurrency_limit == 1
+
+    assert await asyncio.wait_for(client.abatch([1, 2]), timeout=5) == [1, 2]
+    assert client.max_in_flight == 1
+
+
+def test_rate_limiter_is_opt_in():
+    assert get_rate_limiter(RetryMixin()) is None
+    assert get_rate_limiter(RetryMixin(adaptive_concurrency=True)) is not None
+    assert get_rate_limiter(RetryMixin(max_concurrent_requests=4)) is not None
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from aiq.utils.type_converter import GlobalTypeConverter
+from aiq.utils.type_converter import TypeConverter
+
+# pylint: disable=unused-argument
+
+
+class _Source:
+    pass
+
+
+class _Intermediate:
+    pass
+
+
+class _Target:
+    pass
+
+
+class _Other:
+    pass
+
+
+def _str_to_intermediate(data: str) -> _Intermediate:
+    # Only some values convert, the others give a type nothing converts to the target
+    return _Intermediate() if data.startswith("f") else _Other()
+
+
+def _intermediate_to_target(data: _Intermediate) -> _Target:
+    return _Target()
+
+
+def _source_to_intermediate(data: _Source) -> _Intermediate:
+    return _Intermediate()
+
+
+def test_indirect_conversion_depending_on_the_value():
+    converter = TypeConverter([_str_to_intermediate, _intermediate_to_target])
+
+    with pytest.raises(ValueError):
+        converter.convert("x", _Target)
+    assert isinstance(converter.convert("fine", _Target), _Target)
+
+    # The chain found for a value is not applied to the intermediate data of another one
+    with pytest.raises(ValueError):
+        converter.convert("y", _Target)
+    assert isinstance(converter.convert("fun", _Target), _Target)
+
+
+def test_add_converter_invalidates_missing_conversions():
+    converter = TypeConverter([_intermediate_to_target])
+
+    with pytest.raises(ValueError):
+        converter.convert(_Source(), _Target)
+
+    converter.add_converter(_source_to_intermediate)
+    assert isinstance(converter.convert(_Source(), _Target), _Target)
+
+
+def test_register_converter_invalidates_missing_conversions():
+
+    class _GlobalSource:
+        pass
+
+    class _GlobalTarget:
+        pass
+
+    def _intermediate_to_global_target(data: _Intermediate) -> _GlobalTarget:
+        return _GlobalTarget()
+
+    def _global_source_to_intermediate(data: _GlobalSource) -> _Intermediate:
+        return _Intermediate()
+
+    GlobalTypeConverter.register_converter(_intermediate_to_global_target)
+    with pytest.raises(ValueError):
+        GlobalTypeConverter.convert(_GlobalSource(), _GlobalTarget)
+
+    GlobalTypeConverter.register_converter(_global_source_to_intermediate)
+    assert isinstance(GlobalTypeConverter.convert(_GlobalSource(), _GlobalTarget), _GlobalTarget)